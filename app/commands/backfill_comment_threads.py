@@ -0,0 +1,42 @@
+"""
+기존 댓글 thread_id 채우기 (tb_article_comment.thread_id migration)
+
+    $ python -m app.commands.backfill_comment_threads
+    $ python -m app.commands.backfill_comment_threads --batch-size 5000
+
+최상위 댓글은 자신의 일련 번호, 답글은 부모 댓글의 thread_id 로 채운다.
+batch 단위로 commit 하며 thread_id 가 없는 댓글만 갱신하므로, 중단된 경우 다시 실행하면 이어서 처리한다.
+완료 후 board.sql 의 migration 에 따라 thread_id 를 not null 로 변경한다.
+"""
+import argparse
+import asyncio
+
+from app.container import Container
+from app.databases.async_rdb import dispose_async_engines
+from app.databases.rdb import dispose_engines
+
+def _print_progress(total: int):
+    print(f"[BACKFILL] comments={total}")
+
+async def backfill_comment_threads(batch_size: int = 1000) -> int:
+    """
+    :param batch_size: 한 transaction 에서 갱신하는 댓글 수
+    :return: 갱신한 댓글 수
+    """
+    comment_service = Container().comment_service()
+    try:
+        return await comment_service.backfill_thread_ids(batch_size=batch_size, on_batch=_print_progress)
+    finally:
+        await dispose_async_engines()
+        dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    total = asyncio.run(backfill_comment_threads(batch_size=args.batch_size))
+    print(f"[BACKFILL] done : {total} comments updated")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Article export (분석용, 작성자 / tag / 댓글 포함)
+
+    $ python -m app.commands.export_articles articles.ndjson
+    $ python -m app.commands.export_articles articles.csv --batch-size 5000
+
+DB cursor 에서 batch 단위로 읽어 바로 file 에 쓰므로 전체 건수와 무관하게 일정한 memory 를 사용한다.
+"""
+import argparse
+import asyncio
+import time
+
+from typing import AsyncIterator, List, Optional
+
+from app.common.config import get_config
+from app.container import Container
+from app.databases.async_rdb import dispose_async_engines
+from app.databases.rdb import dispose_engines
+from app.utils.common_utils import get_api_env, get_ttl_hash
+from app.utils.export_utils import encode_export, get_export_format
+
+async def export_articles(path: str, file_format: Optional[str] = None, batch_size: Optional[int] = None) -> int:
+    """
+    :param path: 저장할 file
+    :param file_format: ndjson / csv (없으면 확장자로 판단)
+    :param batch_size:
+    :return: export 한 article 수
+    """
+    file_format = get_export_format(filename=path, file_format=file_format)
+    if file_format is None:
+        raise ValueError(f"Unsupported export format : {path}")
+
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    rows = 0
+
+    async def _count(batches: AsyncIterator[List[dict]]) -> AsyncIterator[List[dict]]:
+        nonlocal rows
+        async for batch in batches:
+            rows += len(batch)
+            yield batch
+
+    article_service = Container().article_service()
+    try:
+        batches = article_service.iter_export(batch_size=batch_size or conf.ARTICLE_EXPORT_BATCH_SIZE)
+        with open(path, 'wb') as f:
+            async for chunk in encode_export(batches=_count(batches), file_format=file_format):
+                f.write(chunk)
+        return rows
+    finally:
+        await dispose_async_engines()
+        dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help="NDJSON / CSV file")
+    parser.add_argument('--format', dest='file_format', choices=["ndjson", "csv"], default=None)
+    parser.add_argument('--batch-size', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = asyncio.run(export_articles(**vars(args)))
+    elapsed = time.perf_counter() - start
+    print(f"[EXPORT] done : {rows} articles in {elapsed:.3f}s ({rows / elapsed:.0f} rows/sec)")
+
+if __name__ == "__main__":
+    main()
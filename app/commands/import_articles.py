@@ -0,0 +1,101 @@
+"""
+Article 대량 등록 (legacy 게시판 migration)
+
+    $ python -m app.commands.import_articles articles.ndjson --user-id 1
+    $ python -m app.commands.import_articles articles.csv --user-id 1 --batch-size 2000 --checkpoint /tmp/articles.checkpoint
+
+Record 의 user_id 가 있으면 해당 작성자로, 없으면 --user-id 로 등록한다.
+Batch 마다 commit 후 checkpoint file 에 처리한 record 수를 기록하며, 다시 실행하면 checkpoint 이후부터 이어서 등록한다.
+"""
+import argparse
+import asyncio
+import orjson
+import os
+
+from typing import Optional
+
+from app.common.config import get_config
+from app.container import Container
+from app.databases.async_rdb import dispose_async_engines
+from app.databases.rdb import dispose_engines
+from app.domains.board.exceptions import InvalidImportRecord
+from app.domains.board.schemas import ArticleImportResult
+from app.utils.common_utils import get_api_env, get_ttl_hash
+from app.utils.import_utils import get_import_format, iter_records
+
+def load_checkpoint(path: str, source: str) -> int:
+    """
+    :param path: checkpoint file
+    :param source: 등록할 file 경로 (다른 file 의 checkpoint 는 사용하지 않는다)
+    :return: 처리한 record 수
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as f:
+        checkpoint = orjson.loads(f.read())
+    if checkpoint.get('source') != os.path.abspath(source):
+        raise ValueError(f"Checkpoint {path} is for another file : {checkpoint.get('source')}")
+    return checkpoint['checkpoint']
+
+def save_checkpoint(path: str, source: str, result: ArticleImportResult):
+    """ 임시 file 에 쓴 뒤 교체하여 중간에 종료되어도 checkpoint 가 손상되지 않도록 한다 """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps({'source': os.path.abspath(source), **result.model_dump()}))
+    os.replace(tmp_path, path)
+
+async def import_articles(
+        path: str,
+        user_id: int,
+        file_format: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        checkpoint_path: Optional[str] = None
+) -> ArticleImportResult:
+    file_format = get_import_format(filename=path, file_format=file_format)
+    if file_format is None:
+        raise ValueError(f"Unsupported import format : {path}")
+
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    checkpoint_path = checkpoint_path or f"{path}.checkpoint"
+    skip = load_checkpoint(path=checkpoint_path, source=path)
+    if skip > 0:
+        print(f"[IMPORT] resume from checkpoint : {skip} records")
+
+    def _on_commit(result: ArticleImportResult):
+        save_checkpoint(path=checkpoint_path, source=path, result=result)
+        print(f"[IMPORT] {result.checkpoint} records committed ({result.rows_per_sec:.0f} rows/sec)")
+
+    article_service = Container().article_service()
+    try:
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            return await article_service.import_articles(
+                records=iter_records(f=f, file_format=file_format),
+                user_id=user_id,
+                batch_size=batch_size or conf.ARTICLE_IMPORT_BATCH_SIZE,
+                skip=skip,
+                allow_user_id=True,
+                on_commit=_on_commit
+            )
+    finally:
+        await dispose_async_engines()
+        dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('path', help="NDJSON / CSV file")
+    parser.add_argument('--user-id', type=int, required=True, help="record 에 user_id 가 없을 때 사용할 작성자")
+    parser.add_argument('--format', dest='file_format', choices=["ndjson", "csv"], default=None)
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--checkpoint', dest='checkpoint_path', default=None, help="기본값 : <path>.checkpoint")
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(import_articles(**vars(args)))
+    except InvalidImportRecord as ex:
+        # checkpoint 까지는 저장되어 있으므로 record 를 수정한 뒤 다시 실행하면 이어서 등록한다
+        print(f"[EX] {ex.detail}")
+        raise SystemExit(1)
+    print(f"[IMPORT] done : {result.rows} articles, {result.tags} tags in {result.elapsed}s ({result.rows_per_sec:.0f} rows/sec)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Article 검색 index 재생성 (SEARCH_BACKEND 가 sqlite 인 경우 index file 을 DB 기준으로 다시 채운다)
+
+    $ python -m app.commands.rebuild_search_index
+    $ python -m app.commands.rebuild_search_index --batch-size 5000
+
+처음 검색을 사용하거나, index 갱신이 실패한 경우([EX] ArticleSearchHandler) 실행한다.
+(index 를 비운 뒤 다시 채우므로 실행 중에는 검색 결과가 일부만 조회된다)
+"""
+import argparse
+import asyncio
+import time
+
+from typing import Optional
+
+from app.common.config import get_config
+from app.container import Container
+from app.databases.async_rdb import dispose_async_engines
+from app.databases.rdb import dispose_engines
+from app.utils.common_utils import get_api_env, get_ttl_hash
+
+async def rebuild_search_index(batch_size: Optional[int] = None) -> int:
+    """
+    :param batch_size: DB cursor 에서 한 번에 읽어 index 에 반영할 article 수
+    :return: index 한 article 수
+    """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    container = Container()
+    article_service = container.article_service()
+    article_search_repository = container.article_search_repository()
+    rows = 0
+    try:
+        # 오류를 감추지 않도록 handler 가 아닌 repository 를 직접 사용한다
+        article_search_repository.clear()
+        async for articles in article_service.iter_export(batch_size=batch_size or conf.ARTICLE_EXPORT_BATCH_SIZE):
+            article_search_repository.bulk_index(documents=[
+                {'article_id': article['id'], 'title': article['title'], 'content': article['content'], 'tags': article['tags']}
+                for article in articles
+            ])
+            rows += len(articles)
+            print(f"[SEARCH] {rows} articles indexed")
+        return rows
+    finally:
+        await dispose_async_engines()
+        dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batch-size', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = asyncio.run(rebuild_search_index(batch_size=args.batch_size))
+    print(f"[SEARCH] done : {rows} articles in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Article 댓글 / 첨부파일 / tag 수 재계산
+
+    $ python -m app.commands.reconcile_article_counts
+    $ python -m app.commands.reconcile_article_counts --batch-size 5000 --after-id 120000
+
+tb_article 의 comment_count / attachment_count / tag_count 를 실제 row 수와 비교하여 다른 article 만 수정한다.
+컬럼 추가 migration 이후, 또는 집계가 어긋난 경우(직접 DB 수정 등) 실행한다.
+중단되면 마지막으로 출력된 last_id 를 --after-id 로 지정하여 이어서 실행한다.
+"""
+import argparse
+import asyncio
+
+from typing import Optional
+
+from app.common.config import get_config
+from app.container import Container
+from app.databases.async_rdb import dispose_async_engines
+from app.databases.rdb import dispose_engines
+from app.domains.board.schemas import ArticleCountReconcileResult
+from app.utils.common_utils import get_api_env, get_ttl_hash
+
+def _print_progress(result: ArticleCountReconcileResult):
+    print(f"[RECONCILE] articles={result.articles} fixed={result.fixed} last_id={result.last_id}")
+
+async def reconcile_article_counts(batch_size: Optional[int] = None, after_id: int = 0) -> ArticleCountReconcileResult:
+    """
+    :param batch_size: 한 transaction 에서 처리하는 article 수
+    :param after_id: 이 일련 번호 다음 article 부터 확인
+    :return:
+    """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    article_service = Container().article_service()
+    try:
+        return await article_service.reconcile_counts(
+            batch_size=batch_size or conf.ARTICLE_COUNT_RECONCILE_BATCH_SIZE,
+            after_id=after_id,
+            on_batch=_print_progress
+        )
+    finally:
+        await dispose_async_engines()
+        dispose_engines()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--batch-size', type=int, default=None)
+    parser.add_argument('--after-id', type=int, default=0)
+    args = parser.parse_args()
+
+    result = asyncio.run(reconcile_article_counts(batch_size=args.batch_size, after_id=args.after_id))
+    print(f"[RECONCILE] done : {result.articles} articles checked, {result.fixed} fixed")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 from dataclasses import (
     dataclass,
@@ -6,9 +7,8 @@ from dataclasses import (
 )
 from dotwiz import DotWiz
 from functools import lru_cache
+from typing import Optional
 
-from app.common.constants import AWS_SECRET_NAME
-from app.utils.aws_utils import get_aws_secret_value
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -21,6 +21,38 @@ class Config:
     BASE_DIR = base_dir
 
     DB_POOL_RECYCLE: int = 900
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30 # connection checkout 대기 시간(초)
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 0 # Application 시작 시 미리 연결해 둘 connection 수
+    DB_REPLICA_ENABLED: bool = False # GET 조회를 read replica 로 분리
+    DB_REPLICA_POLICY: str = "round_robin" # round_robin / least_connections
+    RDB_MODE: str = "rdb" # rdb: 동기 SQLAlchemy session(event loop 를 막는다), async_rdb: AsyncSession(non-blocking)
+    ARTICLE_CACHE_TTL: int = 300 # Article 상세 cache 유지 시간(초), 0 이하이면 cache 사용 안함
+    AUTH_USER_CACHE_SIZE: int = 10000 # Access token -> 사용자 in-process cache 최대 건수, 0 이면 cache 사용 안함
+    AUTH_USER_CACHE_TTL: int = 60 # Access token -> 사용자 in-process cache 유지 시간(초)
+    STORAGE_BACKEND: str = "s3" # 첨부파일 저장소 - s3 / local / memory
+    LOCAL_STORAGE_DIR: str = os.path.join(tempfile.gettempdir(), "diboard-storage") # STORAGE_BACKEND 가 local 인 경우 저장 경로
+    S3_MAX_POOL_CONNECTIONS: int = 32 # S3 client connection pool 크기 (upload 동시 수 * part 동시 전송 수 + download 동시 수 이상)
+    S3_MAX_ATTEMPTS: int = 3 # S3 요청 재시도 포함 최대 시도 횟수
+    S3_CONNECT_TIMEOUT: int = 5 # S3 연결 timeout(초)
+    S3_READ_TIMEOUT: int = 60 # S3 응답 대기 timeout(초)
+    S3_UPLOAD_CONCURRENCY: int = 4 # Request 내 첨부파일 동시 upload 수
+    S3_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024 # 이 크기 이상의 file 은 multipart upload
+    S3_MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024 # Multipart part 크기 (file 당 memory 사용량 = chunk size * part 동시 전송 수)
+    S3_MULTIPART_CONCURRENCY: int = 2 # File 당 part 동시 전송 수
+    S3_DOWNLOAD_CHUNKSIZE: int = 1024 * 1024 # Download streaming chunk 크기 (download 당 memory 사용량)
+    ATTACHMENT_TRANSFER_MODE: str = "proxy" # proxy: API 서버를 통해 전송, presigned: presigned URL 로 S3 와 직접 전송
+    S3_PRESIGNED_URL_EXPIRES: int = 600 # Presigned URL 유효 시간(초)
+    ARTICLE_IMPORT_BATCH_SIZE: int = 500 # Article 대량 등록 시 transaction(commit) 단위 row 수
+    ARTICLE_EXPORT_BATCH_SIZE: int = 1000 # Article export 시 cursor 에서 한 번에 읽는 row 수
+    ARTICLE_COUNT_RECONCILE_BATCH_SIZE: int = 1000 # Article 댓글 / 첨부파일 / tag 수 재계산 시 한 transaction 에서 처리하는 article 수
+    SEARCH_BACKEND: str = "sqlite" # Article 검색 index - sqlite(FTS5 file) / memory(process 별 in-memory)
+    SEARCH_SQLITE_PATH: Optional[str] = os.getenv("SEARCH_SQLITE_PATH") or os.path.join(tempfile.gettempdir(), "diboard-search.db") # SEARCH_BACKEND 가 sqlite 인 경우 index file
+    TAG_TRENDING_DAYS: int = 7 # 인기 tag 집계 기간 (일)
+    SERVER_WORKERS: int = 0 # 운영 mode worker process 수 (0 이면 CPU 수)
+    SERVER_GRACEFUL_SHUTDOWN_TIMEOUT: int = 30 # 종료 시 처리 중인 request 를 기다리는 시간(초)
     DEBUG = True
     ALLOW_SITE = ["*"]
     TRUSTED_HOSTS = ["*"]
@@ -34,6 +66,12 @@ class ProductConfig(Config):
     DEBUG = False
     DB_ECHO = False
     PROJECT_RELOAD: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_WARMUP: int = 10
+    DB_REPLICA_ENABLED: bool = True
+    ATTACHMENT_TRANSFER_MODE: str = "presigned"
+    SEARCH_SQLITE_PATH: Optional[str] = os.getenv("SEARCH_SQLITE_PATH") # 임시 directory 가 아닌 영구 경로를 환경변수로 지정해야 한다
 
 @dataclass
 class StagingConfig(Config):
@@ -41,6 +79,11 @@ class StagingConfig(Config):
     DEBUG = True
     DB_ECHO = False
     PROJECT_RELOAD: bool = True
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_WARMUP: int = 5
+    ATTACHMENT_TRANSFER_MODE: str = "presigned"
+    SEARCH_SQLITE_PATH: Optional[str] = os.getenv("SEARCH_SQLITE_PATH") # 임시 directory 가 아닌 영구 경로를 환경변수로 지정해야 한다
 
 @dataclass
 class DevConfig(Config):
@@ -48,6 +91,9 @@ class DevConfig(Config):
     DEBUG = True
     DB_ECHO = True
     PROJECT_RELOAD: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    STORAGE_BACKEND: str = "local"
 
 @dataclass
 class TestConfig(Config):
@@ -55,6 +101,8 @@ class TestConfig(Config):
     DEBUG = True
     DB_ECHO = True
     PROJECT_RELOAD: bool = True
+    STORAGE_BACKEND: str = "memory"
+    SEARCH_BACKEND: str = "memory"
 
 @lru_cache(maxsize=1)
 def get_config(
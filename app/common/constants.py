@@ -6,7 +6,8 @@ API_KEY_HEADER = APIKeyHeader(name="Authorization", auto_error=False)
 AWS_REGION = "ap-northeast-2"
 AWS_SECRET_NAME = {
     "CACHE": "diboard/db/cache",
-    "RDB": "diboard/db/mariadb"
+    "RDB": "diboard/db/mariadb",
+    "RDB_REPLICA": "diboard/db/mariadb-replica"
 }
 
 S3_BUCKET = {
@@ -17,6 +18,13 @@ S3_KEY_PREFIX = {
     "BOARD": "diboard"
 }
 
+CACHE_KEY_PREFIX = {
+    "ARTICLE_DETAIL": "board:article:detail",
+    "ARTICLE_DETAIL_STATS": "board:article:detail:stats",
+    "ARTICLE_DETAIL_VERSION": "board:article:detail:version",
+    "AUTH_REVOKED_USER": "auth:revoked-user"
+}
+
 
 class StatusCode:
     """ Response 상태 코드 """
@@ -25,6 +33,7 @@ class StatusCode:
     HTTP_403 = status.HTTP_403_FORBIDDEN
     HTTP_404 = status.HTTP_404_NOT_FOUND
     HTTP_405 = status.HTTP_405_METHOD_NOT_ALLOWED
+    HTTP_416 = status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
     HTTP_422 = status.HTTP_422_UNPROCESSABLE_ENTITY
     HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
 
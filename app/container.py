@@ -1,8 +1,21 @@
 from dependency_injector import containers, providers
 
-from app.databases.cache import get_redis_client
-from app.databases.rdb import SessionLocal
-from app.databases.transactions import TransactionManager
+from app.common.config import get_config
+from app.databases.async_rdb import get_async_scoped_session
+from app.databases.cache import init_redis_client
+from app.databases.rdb import get_scoped_session
+from app.databases.transactions import AsyncTransactionManager, TransactionManager
+from app.domains.board.repositories.cache.cache_repository import ArticleCacheRedisRepository
+from app.domains.board.repositories.search.search_repository import (
+    ArticleSearchMemoryRepository,
+    ArticleSearchSqliteRepository
+)
+from app.domains.board.repositories.async_rdb.async_rdb_repository import (
+    ArticleAsyncRdbRepository,
+    AttachedFileAsyncRdbRepository,
+    CommentAsyncRdbRepository,
+    TagAsyncRdbRepository
+)
 from app.domains.board.repositories.rdb.rdb_repository import (
     ArticleRdbRepository,
     AttachedFileRdbRepository,
@@ -10,7 +23,9 @@ from app.domains.board.repositories.rdb.rdb_repository import (
     TagRdbRepository
 )
 from app.domains.board.handlers import (
+    ArticleCacheHandler,
     ArticleHandler,
+    ArticleSearchHandler,
     AttachedFileHandler,
     CommentHandler,
     TagHandler
@@ -28,33 +43,143 @@ from app.domains.user.services import UserService
 from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
 from app.domains.auth.handlers import AuthHandler
 from app.domains.auth.services import AuthService
+from app.storages.local_storage import LocalStorageBackend
+from app.storages.memory_storage import MemoryStorageBackend
+from app.storages.s3_storage import S3StorageBackend
+from app.utils.aws_utils import get_s3_client
+from app.utils.common_utils import get_api_env, get_ttl_hash
+
+def _get_rdb_mode() -> str:
+    """ Board repository 구현 선택 (rdb / async_rdb) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return conf.RDB_MODE
+
+def _get_article_cache_ttl() -> int:
+    """ Article 상세 cache 유지 시간(초) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return conf.ARTICLE_CACHE_TTL
+
+def _make_s3_client():
+    """ Process 에서 공유하는 S3 client """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return get_s3_client(
+        max_pool_connections=conf.S3_MAX_POOL_CONNECTIONS,
+        max_attempts=conf.S3_MAX_ATTEMPTS,
+        connect_timeout=conf.S3_CONNECT_TIMEOUT,
+        read_timeout=conf.S3_READ_TIMEOUT
+    )
+
+def _get_storage_backend() -> str:
+    """ 첨부파일 저장소 구현 선택 (s3 / local / memory) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return conf.STORAGE_BACKEND
+
+def _get_local_storage_dir() -> str:
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return conf.LOCAL_STORAGE_DIR
+
+def _get_search_backend() -> str:
+    """ Article 검색 index 구현 선택 (sqlite / memory) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return conf.SEARCH_BACKEND
+
+def _get_search_sqlite_path() -> str:
+    """ Index file 경로 - PRODUCT / STAGING 은 기본값(임시 directory) 없이 SEARCH_SQLITE_PATH 환경변수로 지정해야 한다 """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    if not conf.SEARCH_SQLITE_PATH:
+        raise RuntimeError(f"SEARCH_SQLITE_PATH is required for SEARCH_BACKEND=sqlite ({conf.API_ENV})")
+    return conf.SEARCH_SQLITE_PATH
+
+def _make_s3_transfer_config():
+    """ Multipart upload 설정 """
+    from boto3.s3.transfer import TransferConfig
+
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return TransferConfig(
+        multipart_threshold=conf.S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=conf.S3_MULTIPART_CHUNKSIZE,
+        max_concurrency=conf.S3_MULTIPART_CONCURRENCY
+    )
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(modules=[
+        "app.middlewares.db_session_middleware",
         "app.middlewares.token_validator_middleware",
         "app.domains.auth.apis",
         "app.domains.board.apis",
+        "app.domains.index.apis",
         "app.domains.user.apis"
     ])
 
     # Rdb session
-    redis_client = providers.Singleton(get_redis_client)
-    session = providers.Singleton(SessionLocal)
+    redis_client = providers.Resource(init_redis_client) # 처음 사용할 때 생성, 종료 시 shutdown_resources 로 정리
+    session = providers.Singleton(get_scoped_session)
+    async_session = providers.Singleton(get_async_scoped_session)
+    rdb_mode = providers.Callable(_get_rdb_mode)
+
+    # AWS client
+    s3_client = providers.Singleton(_make_s3_client)
+
+    # Attached file storage
+    storage_backend = providers.Callable(_get_storage_backend)
+    storage = providers.Selector(
+        storage_backend,
+        s3=providers.Singleton(S3StorageBackend, s3_client=s3_client, transfer_config=providers.Callable(_make_s3_transfer_config)),
+        local=providers.Singleton(LocalStorageBackend, root_dir=providers.Callable(_get_local_storage_dir)),
+        memory=providers.Singleton(MemoryStorageBackend)
+    )
 
     # Transaction manager
     transaction_manager = providers.Factory(TransactionManager, session=session)
+    board_transaction_manager = providers.Selector(
+        rdb_mode,
+        rdb=transaction_manager,
+        async_rdb=providers.Factory(AsyncTransactionManager, session=async_session)
+    )
 
     # Repositories
-    article_repository = providers.Singleton(ArticleRdbRepository, session=session)
-    attached_file_repository = providers.Singleton(AttachedFileRdbRepository, session=session)
+    article_cache_repository = providers.Singleton(ArticleCacheRedisRepository, redis_client=redis_client)
+    article_search_repository = providers.Selector(
+        providers.Callable(_get_search_backend),
+        sqlite=providers.Singleton(ArticleSearchSqliteRepository, path=providers.Callable(_get_search_sqlite_path)),
+        memory=providers.Singleton(ArticleSearchMemoryRepository)
+    )
+    article_repository = providers.Selector(
+        rdb_mode,
+        rdb=providers.Singleton(ArticleRdbRepository, session=session),
+        async_rdb=providers.Singleton(ArticleAsyncRdbRepository, session=async_session)
+    )
+    attached_file_repository = providers.Selector(
+        rdb_mode,
+        rdb=providers.Singleton(AttachedFileRdbRepository, session=session),
+        async_rdb=providers.Singleton(AttachedFileAsyncRdbRepository, session=async_session)
+    )
     auth_repository = providers.Factory(AuthCacheRepository, redis_client=redis_client)
-    comment_repository = providers.Singleton(CommentRdbRepository, session=session)
-    tag_repository = providers.Singleton(TagRdbRepository, session=session)
+    comment_repository = providers.Selector(
+        rdb_mode,
+        rdb=providers.Singleton(CommentRdbRepository, session=session),
+        async_rdb=providers.Singleton(CommentAsyncRdbRepository, session=async_session)
+    )
+    tag_repository = providers.Selector(
+        rdb_mode,
+        rdb=providers.Singleton(TagRdbRepository, session=session),
+        async_rdb=providers.Singleton(TagAsyncRdbRepository, session=async_session)
+    )
     user_repository = providers.Factory(UserRdbRepository, session=session)
 
     # Handlers
     article_handler = providers.Singleton(ArticleHandler, article_repository=article_repository)
-    attached_file_handler = providers.Singleton(AttachedFileHandler, attached_file_repository=attached_file_repository)
+    article_cache_handler = providers.Singleton(
+        ArticleCacheHandler,
+        article_cache_repository=article_cache_repository,
+        exp=providers.Callable(_get_article_cache_ttl)
+    )
+    article_search_handler = providers.Singleton(ArticleSearchHandler, article_search_repository=article_search_repository)
+    attached_file_handler = providers.Singleton(
+        AttachedFileHandler,
+        attached_file_repository=attached_file_repository,
+        storage=storage
+    )
     auth_handler = providers.Singleton(AuthHandler, auth_repository=auth_repository)
     comment_handler = providers.Singleton(CommentHandler, comment_repository=comment_repository)
     tag_handler = providers.Singleton(TagHandler, tag_repository=tag_repository)
@@ -64,16 +189,19 @@ class Container(containers.DeclarativeContainer):
     article_service = providers.Singleton(
         ArticleService,
         article_handler=article_handler,
+        article_cache_handler=article_cache_handler,
         attached_file_handler=attached_file_handler,
         comment_handler=comment_handler,
         tag_handler=tag_handler,
-        transaction_manager=transaction_manager
+        article_search_handler=article_search_handler,
+        transaction_manager=board_transaction_manager
     )
     attached_file_service = providers.Singleton(
         AttachedFileService,
         attached_file_handler=attached_file_handler,
         article_handler=article_handler,
-        transaction_manager=transaction_manager
+        article_cache_handler=article_cache_handler,
+        transaction_manager=board_transaction_manager
     )
     auth_service = providers.Factory(
         AuthService,
@@ -85,13 +213,20 @@ class Container(containers.DeclarativeContainer):
         CommentService,
         comment_handler=comment_handler,
         article_handler=article_handler,
-        transaction_manager=transaction_manager
+        transaction_manager=board_transaction_manager
     )
     tag_service = providers.Singleton(
         TagService,
         tag_handler=tag_handler,
         article_handler=article_handler,
+        article_cache_handler=article_cache_handler,
+        article_search_handler=article_search_handler,
+        transaction_manager=board_transaction_manager
+    )
+    user_service = providers.Factory(
+        UserService,
+        user_handler=user_handler,
+        auth_handler=auth_handler,
         transaction_manager=transaction_manager
     )
-    user_service = providers.Factory(UserService, user_handler=user_handler, transaction_manager=transaction_manager)
 
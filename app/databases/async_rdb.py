@@ -0,0 +1,78 @@
+from functools import lru_cache
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine
+)
+from typing import List
+
+from app.common.config import get_config
+from app.common.constants import AWS_SECRET_NAME
+from app.databases.pool import InstrumentedAsyncQueuePool, make_pool_options
+from app.databases.rdb import apply_secret_credentials, get_database_url, get_replica_database_urls
+from app.databases.routing import ReplicaSelector, RoutingSession
+from app.databases.scope import get_scope_id, register_scoped_session
+from app.utils.common_utils import get_api_env, get_ttl_hash
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Primary async engine - 동기 engine과 동일한 접속 정보를 async driver로 사용
+    (처음 사용할 때 생성)
+    :return:
+    """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    engine = create_async_engine(
+        make_url(get_database_url()).set(drivername="mysql+aiomysql"),
+        poolclass=InstrumentedAsyncQueuePool,
+        **make_pool_options(conf)
+    )
+    apply_secret_credentials(engine.sync_engine, secret_name=AWS_SECRET_NAME['RDB'])
+    return engine
+
+@lru_cache(maxsize=1)
+def get_async_replica_engines() -> List[AsyncEngine]:
+    """ Read replica async engine 목록 """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    replica_engines = [
+        create_async_engine(
+            make_url(replica_url).set(drivername="mysql+aiomysql"),
+            poolclass=InstrumentedAsyncQueuePool,
+            **make_pool_options(conf)
+        ) for replica_url in get_replica_database_urls()
+    ]
+    for replica_engine in replica_engines:
+        apply_secret_credentials(replica_engine.sync_engine, secret_name=AWS_SECRET_NAME['RDB_REPLICA'])
+    return replica_engines
+
+@lru_cache(maxsize=1)
+def get_async_session_factory() -> async_sessionmaker:
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    async_replica_engines = get_async_replica_engines()
+    async_replica_selector = ReplicaSelector(
+        engines=[replica_engine.sync_engine for replica_engine in async_replica_engines],
+        policy=conf.DB_REPLICA_POLICY
+    ) if async_replica_engines else None
+
+    return async_sessionmaker(
+        sync_session_class=RoutingSession,
+        replica_selector=async_replica_selector,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False, # commit 이후 attribute 접근 시 lazy load(IO)가 발생하지 않도록 한다
+        bind=get_async_engine()
+    )
+
+async def dispose_async_engines():
+    """ 생성된 async engine 의 connection 정리 (application 종료 시) """
+    if get_async_engine.cache_info().currsize > 0:
+        await get_async_engine().dispose()
+    if get_async_replica_engines.cache_info().currsize > 0:
+        for replica_engine in get_async_replica_engines():
+            await replica_engine.dispose()
+
+def get_async_scoped_session():
+    """ Request 단위로 AsyncSession을 분리하는 scoped session """
+    return register_scoped_session(async_scoped_session(get_async_session_factory(), scopefunc=get_scope_id))
@@ -1,11 +1,11 @@
 import redis
 
 from app.common.constants import AWS_SECRET_NAME
-from app.utils.aws_utils import get_aws_secret_value
+from app.utils.secret_utils import get_secret_value
 
 def get_redis_client():
 
-    secret_value = get_aws_secret_value(secret_name=AWS_SECRET_NAME['CACHE'])
+    secret_value = get_secret_value(secret_name=AWS_SECRET_NAME['CACHE'])
     host = secret_value['HOST']
     port = secret_value['PORT']
     password = secret_value['PASSWORD']
@@ -20,3 +20,14 @@ def get_redis_client():
 
     redis_client = redis.Redis(connection_pool=redis_connection_pool)
     return redis_client
+
+def init_redis_client():
+    """
+    Redis client resource - application 종료 시(Container.shutdown_resources) connection pool 을 정리한다
+    :return:
+    """
+    redis_client = get_redis_client()
+    yield redis_client
+
+    redis_client.close()
+    redis_client.connection_pool.disconnect()
@@ -2,6 +2,9 @@ create table tb_article (
     id int(11) primary key auto_increment,
     title varchar(255) not null,
     content text not null,
+    comment_count int(11) not null default 0,
+    attachment_count int(11) not null default 0,
+    tag_count int(11) not null default 0,
     is_deleted bool not null default false,
     created_at datetime not null default NOW(),
     updated_at datetime not null default NOW(),
@@ -12,23 +15,42 @@ create table tb_article_comment(
     id int(11) primary key auto_increment,
     article_id int(11) not null,
     comment_id int(11),
+    thread_id int(11) not null,
     content text not null,
-    level int(11) not null, default 0,
-    is_deletd bool not null default false,
+    level int(11) not null default 0,
+    is_deleted bool not null default false,
     created_at datetime not null default NOW(),
     updated_at datetime not null default NOW(),
     deleted_at datetime,
     foreign key (article_id) references tb_article(id)
 );
 
+-- Tag 이름 사전 (tb_article_tag.tagging 과 같이 대소문자를 구분한다)
+create table tb_tag(
+    id int(11) primary key auto_increment,
+    tagging varchar(255) collate utf8mb4_bin not null unique,
+    created_at datetime not null default NOW()
+);
+
 create table tb_article_tag(
     id int(11) primary key auto_increment,
     article_id int(11),
+    tag_id int(11),
     tagging varchar(255) not null,
     created_at datetime not null default NOW(),
     updated_at datetime not null default NOW(),
     deleted_at datetime,
-    foreign key (article_id) references tb_article(id)
+    foreign key (article_id) references tb_article(id),
+    foreign key (tag_id) references tb_tag(id)
+);
+
+-- 일자별 tag 가 붙은 article 수 (인기 tag 조회 용)
+create table tb_tag_count(
+    count_date date not null,
+    tag_id int(11) not null,
+    article_count int(11) not null default 0,
+    primary key (count_date, tag_id),
+    foreign key (tag_id) references tb_tag(id)
 );
 
 create table tb_article_attached_file(
@@ -39,8 +61,54 @@ create table tb_article_attached_file(
     filename varchar(255) not null,
     file_size int(11) not null default 0,
     file_type varchar(255) not null,
+    content_hash char(64),
     is_deleted bool not null default false,
     created_at datetime not null default NOW(),
     deleted_at datetime,
     foreign key (article_id) references tb_article(id)
-);
\ No newline at end of file
+);
+
+-- 내용(sha256)이 같은 첨부파일이 공유하는 object 와 참조 수
+create table tb_article_attached_file_blob(
+    content_hash char(64) primary key,
+    s3_bucket_name varchar(255) not null,
+    s3_key varchar(255) not null,
+    file_size int(11) not null default 0,
+    ref_count int(11) not null default 0,
+    created_at datetime not null default NOW()
+);
+
+-- Keyset pagination (article 목록) 용 index
+create index idx_article_is_deleted_id on tb_article (is_deleted, id);
+
+-- Thread 순서 comment 목록 (keyset pagination) 용 index
+create index idx_article_comment_thread on tb_article_comment (article_id, is_deleted, thread_id, id);
+
+-- Tag 별 article 목록 (keyset pagination) 용 index
+create index idx_article_tag_tag_article on tb_article_tag (tag_id, article_id);
+
+-- 저장소 key 로 첨부파일 확인 (presigned upload 중복 등록 방지) 용 index
+create index idx_article_attached_file_s3_key on tb_article_attached_file (s3_key);
+
+-- 기존 tb_article_comment 에 thread_id 추가 시 migration
+-- 1. column 추가 (nullable) 후 application 배포 (새 댓글은 thread_id 가 채워진다)
+-- alter table tb_article_comment add column thread_id int(11) after comment_id;
+-- 2. 기존 댓글 thread_id 채우기 : python -m app.commands.backfill_comment_threads
+-- 3. not null 변경 (thread_id 가 null 인 댓글이 남아 있으면 실패한다)
+-- alter table tb_article_comment modify column thread_id int(11) not null;
+
+-- 기존 tb_article_attached_file 에 content_hash 추가 시 migration (기존 file 은 content_hash 가 null 이며 참조 수 관리 대상이 아님)
+-- alter table tb_article_attached_file add column content_hash char(64) after file_type;
+
+-- 기존 tb_article_tag 에 tag_id 추가 시 migration (tag 사전 / 일자별 tag 수를 기존 tag 로 채운다)
+-- alter table tb_article_tag add column tag_id int(11) after article_id;
+-- insert ignore into tb_tag (tagging) select distinct tagging from tb_article_tag;
+-- update tb_article_tag a join tb_tag t on t.tagging = a.tagging set a.tag_id = t.id where a.tag_id is null;
+-- insert into tb_tag_count (count_date, tag_id, article_count)
+--     select date(created_at), tag_id, count(*) from tb_article_tag group by date(created_at), tag_id
+--     on duplicate key update article_count = values(article_count);
+
+-- 기존 tb_article 에 댓글 / 첨부파일 / tag 수 추가 시 migration (추가 후 python -m app.commands.reconcile_article_counts 실행)
+-- alter table tb_article add column comment_count int(11) not null default 0 after content,
+--     add column attachment_count int(11) not null default 0 after comment_count,
+--     add column tag_count int(11) not null default 0 after attachment_count;
@@ -0,0 +1,122 @@
+import threading
+import time
+
+from sqlalchemy import Engine, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+class _CheckoutTimingMixin:
+    """
+    Connection checkout 시 pool 에서 대기한 시간을 집계한다
+    Pool 이 비어 새 connection 을 만드는 경우 connect 시간은 대기 시간에서 제외한다.
+    """
+
+    def _init_checkout_stats(self):
+        self._checkout_lock = threading.Lock()
+        self._checkout_count = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        record = super()._create_connection()
+        record._connect_elapsed = time.perf_counter() - start
+        return record
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            # Pool timeout 은 대기 시간만으로 구성된다 (connect 실패 등은 집계하지 않음)
+            self._add_checkout_wait(time.perf_counter() - start)
+            raise
+        connect_elapsed = record.__dict__.pop('_connect_elapsed', 0.0)
+        self._add_checkout_wait(max(time.perf_counter() - start - connect_elapsed, 0.0))
+        return record
+
+    def _add_checkout_wait(self, elapsed: float):
+        with self._checkout_lock:
+            self._checkout_count += 1
+            self._checkout_wait_total += elapsed
+            self._checkout_wait_max = max(self._checkout_wait_max, elapsed)
+
+    def checkout_stats(self) -> dict:
+        with self._checkout_lock:
+            count = self._checkout_count
+            return {
+                'checkout_count': count,
+                'wait_avg_ms': round(self._checkout_wait_total / count * 1000, 3) if count > 0 else 0.0,
+                'wait_max_ms': round(self._checkout_wait_max * 1000, 3)
+            }
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_checkout_stats()
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._init_checkout_stats()
+
+
+def make_pool_options(conf) -> dict:
+    """
+    Config 로부터 create_engine / create_async_engine 의 pool 옵션 생성
+    :param conf:
+    :return:
+    """
+    return dict(
+        pool_size=conf.DB_POOL_SIZE,
+        max_overflow=conf.DB_MAX_OVERFLOW,
+        pool_timeout=conf.DB_POOL_TIMEOUT,
+        pool_recycle=conf.DB_POOL_RECYCLE,
+        pool_pre_ping=conf.DB_POOL_PRE_PING
+    )
+
+def get_pool_status(engine: Engine | AsyncEngine) -> dict:
+    """
+    Pool 상태 조회
+    :param engine:
+    :return:
+    """
+    pool = engine.pool
+    status = {'pool_class': pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            'size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+            'timeout': pool.timeout()
+        })
+    if isinstance(pool, _CheckoutTimingMixin):
+        status.update(pool.checkout_stats())
+    return status
+
+def warmup_pool(engine: Engine, count: int):
+    """
+    Connection 을 미리 생성해 pool 에 채워둔다 (첫 request 의 connect latency 제거)
+    :param engine:
+    :param count:
+    :return:
+    """
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+async def async_warmup_pool(engine: AsyncEngine, count: int):
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
@@ -1,25 +1,124 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+from sqlalchemy import Engine, create_engine, event
 # from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
+from typing import List
 
+from app.common.config import get_config
 from app.common.constants import AWS_SECRET_NAME
-from app.utils.aws_utils import get_aws_secret_value
+from app.databases.pool import InstrumentedQueuePool, make_pool_options
+from app.databases.routing import ReplicaSelector, RoutingSession
+from app.databases.scope import get_scope_id, register_scoped_session
+from app.utils.secret_utils import get_secret_value
+from app.utils.common_utils import get_api_env, get_ttl_hash
 
 def _make_rdb_dsn():
     """
     Make DSN for RDB with secrets manager
     :return:
     """
-    secret_value = get_aws_secret_value(secret_name=AWS_SECRET_NAME['RDB'])
+    secret_value = get_secret_value(secret_name=AWS_SECRET_NAME['RDB'])
 
     return f"mysql+pymysql://{secret_value['USERNAME']}:{secret_value['PASSWORD']}@{secret_value['HOST']}:{secret_value['PORT']}/{secret_value['DBNAME']}"
 
-SQLALCHEMY_DATABASE_URL = _make_rdb_dsn()
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+def _make_replica_dsn_list() -> List[str]:
+    """
+    Make DSN list for read replicas with secrets manager
+    Secret 의 HOSTS(list) 또는 HOST 를 사용하며, secret 이 없으면 replica 없이 primary 만 사용한다.
+    :return:
+    """
+    secret_value = get_secret_value(secret_name=AWS_SECRET_NAME['RDB_REPLICA'])
+    if secret_value is None:
+        print("[WARN] rdb._make_replica_dsn_list : replica secret is not found, use primary only")
+        return []
+
+    hosts = secret_value.get('HOSTS') or [secret_value['HOST']]
+    return [
+        f"mysql+pymysql://{secret_value['USERNAME']}:{secret_value['PASSWORD']}@{host}:{secret_value['PORT']}/{secret_value['DBNAME']}"
+        for host in hosts
+    ]
+
+def apply_secret_credentials(engine: Engine, secret_name: str):
+    """
+    새 connection 을 만들 때마다 secret cache 의 계정(USERNAME / PASSWORD)으로 접속하도록 한다.
+    Engine 은 처음 조회한 DSN 으로 한 번만 생성되므로, credential rotation 은 engine 을 다시 만들지 않고
+    이후 생성되는 connection(pool recycle 포함)부터 반영된다. (기존 connection 은 재사용)
+    HOST / PORT / DBNAME 이 바뀐 경우에는 application 을 재시작해야 한다.
+    :param engine: 동기 engine (async engine 은 sync_engine)
+    :param secret_name:
+    :return:
+    """
+    @event.listens_for(engine, "do_connect")
+    def _on_do_connect(dialect, connection_record, cargs, cparams):
+        secret_value = get_secret_value(secret_name=secret_name)
+        if secret_value is not None:
+            cparams['user'] = secret_value['USERNAME']
+            cparams['password'] = secret_value['PASSWORD']
+
+@lru_cache(maxsize=1)
+def get_database_url() -> str:
+    return _make_rdb_dsn()
+
+@lru_cache(maxsize=1)
+def get_replica_database_urls() -> List[str]:
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return _make_replica_dsn_list() if conf.DB_REPLICA_ENABLED else []
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """
+    Primary engine
+    Secret 조회와 engine 생성은 import 시점이 아니라 처음 사용할 때(또는 lifespan 에서) 수행한다.
+    :return:
+    """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    engine = create_engine(
+        get_database_url(),
+        poolclass=InstrumentedQueuePool,
+        **make_pool_options(conf)
+    )
+    apply_secret_credentials(engine, secret_name=AWS_SECRET_NAME['RDB'])
+    return engine
+
+@lru_cache(maxsize=1)
+def get_replica_engines() -> List[Engine]:
+    """ Read replica engine 목록 (replica 를 사용하지 않으면 빈 list) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    replica_engines = [
+        create_engine(
+            replica_url,
+            poolclass=InstrumentedQueuePool,
+            **make_pool_options(conf)
+        ) for replica_url in get_replica_database_urls()
+    ]
+    for replica_engine in replica_engines:
+        apply_secret_credentials(replica_engine, secret_name=AWS_SECRET_NAME['RDB_REPLICA'])
+    return replica_engines
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> sessionmaker:
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    replica_engines = get_replica_engines()
+    replica_selector = ReplicaSelector(engines=replica_engines, policy=conf.DB_REPLICA_POLICY) if replica_engines else None
+
+    return sessionmaker(
+        class_=RoutingSession,
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+        replica_selector=replica_selector
+    )
+
+def dispose_engines():
+    """ 생성된 engine 의 connection 정리 (application 종료 시) """
+    if get_engine.cache_info().currsize > 0:
+        get_engine().dispose()
+    if get_replica_engines.cache_info().currsize > 0:
+        for replica_engine in get_replica_engines():
+            replica_engine.dispose()
+
+def get_scoped_session():
+    """ Request 단위로 Session(connection)을 분리하는 scoped session """
+    return register_scoped_session(scoped_session(get_session_factory(), scopefunc=get_scope_id))
 
 Base = declarative_base()
@@ -0,0 +1,56 @@
+import itertools
+import threading
+
+from sqlalchemy import Delete, Engine, Insert, Update
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+# Session.info key - 설정된 session 은 이후 모든 조회를 primary 로 보낸다 (read-your-writes)
+USE_PRIMARY = "use_primary"
+_REPLICA = "replica"
+
+class ReplicaSelector:
+    """
+    Read replica engine 선택
+     - round_robin : 순서대로 선택
+     - least_connections : checked-out connection 이 가장 적은 engine 선택
+    """
+
+    def __init__(self, engines: List[Engine], policy: str = "round_robin"):
+        if policy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unsupported replica policy : {policy}")
+        self.engines = engines
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(engines)
+
+    def select(self) -> Engine:
+        if self.policy == "least_connections":
+            return min(self.engines, key=lambda e: e.pool.checkedout())
+        with self._lock:
+            return next(self._cycle)
+
+
+class RoutingSession(Session):
+    """
+    Read / Write 분리 Session
+    Transaction 밖의 조회는 replica 로, 쓰기 및 쓰기 이후의 조회는 primary(bind) 로 보낸다.
+    Replica 는 session 마다 하나를 골라 session 이 끝날 때까지 사용한다.
+    """
+
+    def __init__(self, replica_selector: Optional[ReplicaSelector] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.replica_selector = replica_selector
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        if self.replica_selector is None or self.info.get(USE_PRIMARY):
+            return primary
+
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            self.info[USE_PRIMARY] = True
+            return primary
+
+        if _REPLICA not in self.info:
+            self.info[_REPLICA] = self.replica_selector.select()
+        return self.info[_REPLICA]
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import uuid
+import weakref
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_request_scope: ContextVar[Optional[str]] = ContextVar("request_scope", default=None)
+
+# Task 단위 scope 의 session 을 task 종료 시 정리하기 위해 등록한 scoped session
+_scoped_sessions = weakref.WeakSet()
+_watched_tasks = weakref.WeakSet()
+
+def register_scoped_session(scoped):
+    """
+    get_scope_id 를 scopefunc 로 사용하는 scoped session(sync / async) 등록
+    Request scope 밖(CLI, background task 등)에서 task 단위로 생성된 session 은 task 가 끝나면 제거된다.
+    :param scoped: scoped_session 또는 async_scoped_session
+    :return:
+    """
+    _scoped_sessions.add(scoped)
+    return scoped
+
+def _remove_task_sessions(task: asyncio.Task):
+    """ 종료된 task 의 session 을 registry 에서 제거하고 닫는다 """
+    scope_id = id(task)
+    for scoped in list(_scoped_sessions):
+        session = scoped.registry.registry.pop(scope_id, None)
+        if session is None:
+            continue
+        close = session.close()
+        if asyncio.iscoroutine(close):
+            loop = task.get_loop()
+            if loop.is_closed():
+                close.close()
+            else:
+                loop.create_task(close)
+
+def get_scope_id():
+    """
+    Scoped session 의 scope key
+    Request 처리 중에는 request 단위 scope id, 그 외(CLI, test 등)에는 현재 task 또는 thread 단위로 구분한다.
+    Task 단위 session 은 task 종료 시 제거되므로 종료된 task 의 id 가 재사용되어도 session 을 공유하지 않는다.
+    :return:
+    """
+    scope_id = _request_scope.get()
+    if scope_id is not None:
+        return scope_id
+
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        if task not in _watched_tasks:
+            _watched_tasks.add(task)
+            task.add_done_callback(_remove_task_sessions)
+        return id(task)
+    return threading.get_ident()
+
+@contextmanager
+def request_scope():
+    """ 블록 내부(하위 task 포함)에서 동일한 scope id를 사용하도록 한다 """
+    token = _request_scope.set(str(uuid.uuid4()))
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
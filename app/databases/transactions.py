@@ -1,7 +1,10 @@
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Any, Callable, TypeVar
 
+from app.databases.routing import USE_PRIMARY
+
 T = TypeVar('T')
 
 class TransactionManager:
@@ -11,6 +14,8 @@ class TransactionManager:
     @contextmanager
     def transaction(self):
         """ 트랜잭션 컨텍스트 매니저 """
+        # 트랜잭션 내부 및 이후의 조회는 primary 를 사용 (read-your-writes)
+        self.session.info[USE_PRIMARY] = True
         try:
             yield self.session
             self.session.commit()
@@ -18,3 +23,26 @@ class TransactionManager:
         except Exception as ex:
             self.session.rollback()
             raise ex
+
+    @asynccontextmanager
+    async def async_transaction(self):
+        """ async service 용 트랜잭션 컨텍스트 매니저 (동기 session) """
+        with self.transaction() as session:
+            yield session
+
+
+class AsyncTransactionManager:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @asynccontextmanager
+    async def async_transaction(self):
+        """ 트랜잭션 컨텍스트 매니저 (AsyncSession) """
+        self.session.info[USE_PRIMARY] = True
+        try:
+            yield self.session
+            await self.session.commit()
+
+        except Exception as ex:
+            await self.session.rollback()
+            raise ex
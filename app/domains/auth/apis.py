@@ -1,7 +1,8 @@
 from dependency_injector.wiring import inject, Provide
 from fastapi import (
     APIRouter,
-    Depends
+    Depends,
+    Request
 )
 
 from app.domains.auth.schemas import AuthRequest, AuthResponse, ExecutionResp
@@ -32,9 +33,11 @@ async def signin_api(
 )
 @inject
 async def signout_api(
+        request: Request,
         auth_service: AuthService = Depends(Provide[Container.auth_service])
 ):
     """
     Signout API
     """
-    return auth_service.signout()
+    access_token = request.headers.get("authorization", "").replace("Bearer ", "")
+    return {'result': auth_service.signout(access_token=access_token)}
@@ -5,10 +5,14 @@ from datetime import (
 
 from jmespath.ast import identity
 from jose import jwt
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from app.common.config import get_config
+from app.common.constants import CACHE_KEY_PREFIX
 from app.domains.auth.repositories.repository import AuthRepository
+from app.domains.auth.schemas import AuthUser
+from app.domains.user.models import User
+from app.utils.cache_utils import LRUTTLCache
 from app.utils.common_utils import get_ttl_hash, get_api_env
 
 class AuthHandler:
@@ -17,6 +21,11 @@ class AuthHandler:
         ttl_hash = get_ttl_hash()
         self.config = get_config(ttl_hash=ttl_hash, api_env=api_env)
         self.auth_repository = auth_repository
+        # Access token -> 인증 사용자 cache (JWT decode 및 user 조회 생략)
+        self.auth_user_cache = LRUTTLCache(
+            maxsize=self.config.AUTH_USER_CACHE_SIZE,
+            ttl=self.config.AUTH_USER_CACHE_TTL
+        )
 
     def set_token(self, key: str, value: str, exp: int = 0) -> bool:
         try:
@@ -57,23 +66,96 @@ class AuthHandler:
         token = jwt.encode(claim, self.config.JWT_REFRESH_SECRET_KEY, self.config.JWT_ALGORITHM)
         return token
 
-    def decode_access_token(self, token: str, options=None):
-        payload = jwt.decode(
+    def decode_access_token_payload(self, token: str, options=None) -> dict:
+        return jwt.decode(
             token=token,
             key=self.config.JWT_ACCESS_SECRET_KEY,
             algorithms=self.config.JWT_ALGORITHM,
             options=options
         )
+
+    def decode_access_token(self, token: str, options=None):
+        payload = self.decode_access_token_payload(token=token, options=options)
         identity = payload['sub']
 
         return identity
 
-    def get_access_token_value(self, token: str):
-        get_token_value = self.get_token(key=token)
-        if get_token_value is None:
+    def set_tokens(self, tokens: List[Tuple[str, str, int]]) -> bool:
+        """
+        여러 token 을 한 번에 저장
+        :param tokens: (key, value, exp) 목록
+        :return:
+        """
+        try:
+            self.auth_repository.set_cache_many(items=tokens)
+            return True
+        except Exception as e:
+            print("[EX] AuthHandler.set_tokens : ", str(e.args))
+            return False
+
+    def get_access_token_value(self, token: str, cached_user_id: int = None):
+        """
+        Access token 의 사용자 id 조회
+        조회와 동시에 만료 시간을 갱신한다. (sliding expiration)
+        :param token:
+        :param cached_user_id: 인증 사용자 cache hit 인 경우 사용자 id - 다른 worker 에서 삭제(revoke)된 사용자인지 같은 round trip 으로 확인한다
+        :return: 유효하지 않거나 삭제된 사용자의 token 이면 None
+        """
+        try:
+            if cached_user_id is None:
+                return self.auth_repository.get_cache_and_expire(
+                    key=token,
+                    exp=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS
+                )
+
+            value, revoked = self.auth_repository.get_cache_and_expire_with_exists(
+                key=token,
+                exp=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS,
+                exists_key=self._revoked_user_key(cached_user_id)
+            )
+            if revoked:
+                self.invalidate_cached_user(user_id=cached_user_id)
+                return None
+            return value
+        except Exception as e:
+            print("[EX] AuthHandler.get_access_token_value : ", str(e.args))
             return None
-        self.auth_repository.set_expire(
-            key=token,
-            expired_at=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS
-        )
-        return get_token_value
+
+    def get_cached_user(self, token: str) -> Optional[AuthUser]:
+        return self.auth_user_cache.get(token)
+
+    def set_cached_user(self, token: str, user: User, expires_at: int = None) -> AuthUser:
+        """
+        인증 사용자 cache 저장
+        :param token: access token
+        :param user:
+        :param expires_at: token 만료 시각(epoch), 만료 이후에는 cache 에서 조회되지 않도록 유지 시간을 제한한다
+        :return:
+        """
+        auth_user = AuthUser(id=user.id, username=user.username, created_at=user.created_at)
+        ttl = expires_at - datetime.now().timestamp() if expires_at is not None else None
+        self.auth_user_cache.set(token, auth_user, ttl=ttl)
+        return auth_user
+
+    def invalidate_cached_user(self, token: str = None, user_id: int = None):
+        if token is not None:
+            self.auth_user_cache.delete(token)
+        if user_id is not None:
+            self.auth_user_cache.delete_if(lambda auth_user: auth_user.id == user_id)
+
+    @staticmethod
+    def _revoked_user_key(user_id: int) -> str:
+        return f"{CACHE_KEY_PREFIX['AUTH_REVOKED_USER']}:{user_id}"
+
+    def revoke_cached_user(self, user_id: int) -> bool:
+        """
+        삭제된 사용자의 인증 사용자 cache 를 모든 worker 에서 무효화
+        현재 worker 의 cache 는 바로 삭제하고, 다른 worker 는 cache hit 시 redis 의 revoke 표시를 확인해 삭제한다.
+        (표시는 cache 유지 시간 동안만 유지 - 이후에는 모든 worker 의 cache 가 만료되어 DB 에서 조회한다)
+        :param user_id:
+        :return:
+        """
+        self.invalidate_cached_user(user_id=user_id)
+        if self.config.AUTH_USER_CACHE_SIZE <= 0 or self.config.AUTH_USER_CACHE_TTL <= 0:
+            return True
+        return self.set_token(key=self._revoked_user_key(user_id), value="1", exp=self.config.AUTH_USER_CACHE_TTL)
@@ -1,4 +1,5 @@
 from redis import Redis
+from typing import List, Optional, Tuple
 
 from app.domains.auth.repositories.repository import AuthRepository
 
@@ -39,4 +40,31 @@ class AuthCacheRepository(AuthRepository):
             return True
         except Exception as e:
             print("[EX] AuthCacheRepository.set_expire : ", str(e.args))
-            return False
\ No newline at end of file
+            return False
+
+    def set_cache_many(self, items: List[Tuple[str, str, int]]):
+        """
+        여러 key 를 pipeline 으로 한 번의 round trip 에 저장
+        :param items: (key, value, exp) 목록, exp 가 0 이하이면 만료 없음
+        :return:
+        """
+        pipeline = self._redis_client.pipeline(transaction=False)
+        for key, value, exp in items:
+            pipeline.set(
+                name=key,
+                value=value,
+                ex=exp if exp > 0 else None
+            )
+        pipeline.execute()
+
+    def get_cache_and_expire(self, key: str, exp: int) -> Optional[str]:
+        """ 조회와 만료 시간 갱신을 한 번의 round trip 으로 처리 (GETEX) """
+        return self._redis_client.getex(name=key, ex=exp)
+
+    def get_cache_and_expire_with_exists(self, key: str, exp: int, exists_key: str) -> Tuple[Optional[str], bool]:
+        """ GETEX 와 exists_key 존재 여부 확인을 pipeline 으로 한 번의 round trip 에 처리 """
+        pipeline = self._redis_client.pipeline(transaction=False)
+        pipeline.getex(name=key, ex=exp)
+        pipeline.exists(exists_key)
+        value, exists = pipeline.execute()
+        return value, exists > 0
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 
 class AuthRepository(ABC):
 
@@ -16,4 +17,17 @@ class AuthRepository(ABC):
 
     @abstractmethod
     def set_expire(self, key, expired_at: int):
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def set_cache_many(self, items: List[Tuple[str, str, int]]):
+        pass
+
+    @abstractmethod
+    def get_cache_and_expire(self, key: str, exp: int) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def get_cache_and_expire_with_exists(self, key: str, exp: int, exists_key: str) -> Tuple[Optional[str], bool]:
+        """ key 조회 / 만료 시간 갱신과 exists_key 존재 여부 """
+        pass
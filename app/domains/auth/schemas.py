@@ -1,7 +1,10 @@
+from dataclasses import dataclass
+from datetime import datetime
 from pydantic import (
     BaseModel,
     Field
 )
+from typing import Optional
 
 class AuthRequest(BaseModel):
     signin_id: str = Field(title="signin ID")
@@ -13,3 +16,10 @@ class AuthResponse(BaseModel):
 
 class ExecutionResp(BaseModel):
     result: bool = Field(title="수행 결과")
+
+@dataclass(frozen=True)
+class AuthUser:
+    """ 인증된 사용자 snapshot - request 간 cache 되므로 ORM 객체(session)를 참조하지 않는다 """
+    id: int
+    username: str
+    created_at: Optional[datetime] = None
@@ -9,7 +9,7 @@ from app.domains.auth.errors import AuthErrors
 from app.domains.auth.schemas import AuthRequest
 from app.domains.auth.handlers import AuthHandler
 from app.domains.user.handlers import UserHandler
-from app.utils.crypto_utils import crypto_handler
+from app.utils.crypto_utils import get_crypto_handler
 from app.utils.common_utils import (
     get_api_env,
     get_ttl_hash
@@ -31,39 +31,34 @@ class AuthService:
             return AuthErrors.InvalidUsername
 
         # Compare password_hash to user data password hashed
-        password_hash = crypto_handler.encrypt_hash(plain_text=data.signin_pass)
+        password_hash = get_crypto_handler().encrypt_hash(plain_text=data.signin_pass)
         if password_hash != user.password:
             return AuthErrors.InvalidPassword
 
         # Create refresh token and set cache
         refresh_token_expires_at = datetime.now() + timedelta(seconds=self.config.JWT_REFRESH_TOKEN_EXPIRES_SECONDS)
         refresh_token = self.auth_handler.create_refresh_token(expires_at=refresh_token_expires_at, subject=str(user.id))
-        self.auth_handler.set_token(
-            key=refresh_token,
-            value=user.id,
-            exp=self.config.JWT_REFRESH_TOKEN_EXPIRES_SECONDS
-        )
 
-        # Create access token and set cache
+        # Create access token
         access_token_expires_at = datetime.now() + timedelta(seconds=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS)
         access_token = self.auth_handler.create_access_token(expires_at=access_token_expires_at, subject=str(user.id))
-        self.auth_handler.set_token(
-            key=access_token,
-            value=f"{user.id}",
-            exp=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS
-        )
-        self.auth_handler.set_token(
-            key=f"RT-{user.id}",
-            value=f"{user.id}",
-            exp=self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS
-        )
+
+        # Set cache - 한 번의 round trip 으로 저장
+        self.auth_handler.set_tokens(tokens=[
+            (refresh_token, f"{user.id}", self.config.JWT_REFRESH_TOKEN_EXPIRES_SECONDS),
+            (access_token, f"{user.id}", self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS),
+            (f"RT-{user.id}", f"{user.id}", self.config.JWT_ACCESS_TOKEN_EXPIRES_SECONDS)
+        ])
 
         return {
             "access_token": access_token,
             "refresh_token": refresh_token
         }
 
-    def signout(self, access_token: str, refresh_token: str):
+    def signout(self, access_token: str, refresh_token: str = None):
+        # 현재 worker 의 인증 사용자 cache 삭제
+        self.auth_handler.invalidate_cached_user(token=access_token)
+
         access_token_value = self.auth_handler.get_token(key=access_token)
         refresh_token_key = self.auth_handler.get_token(key=f"RT-{access_token_value}")
         result_flag = self.auth_handler.delete_token(key=refresh_token_key)
@@ -71,3 +66,4 @@ class AuthService:
             result_flag = self.auth_handler.delete_token(key=access_token)
 
         return result_flag
+
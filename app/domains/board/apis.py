@@ -1,3 +1,4 @@
+import io
 import urllib
 
 from dataclasses import asdict
@@ -5,17 +6,22 @@ from fastapi import (
     APIRouter,
     Depends,
     File,
+    Header,
     HTTPException,
     Path,
+    Query,
     Response,
     UploadFile
 )
+from fastapi.responses import RedirectResponse, StreamingResponse
 from fastapi_pagination import Params as PaginationParams
 from starlette.requests import Request
-from typing import List
+from typing import List, Optional
 
 from dependency_injector.wiring import inject, Provide
+from app.common.config import get_config
 from app.container import Container
+from app.domains.board.exceptions import InvalidExportFormat, InvalidImportFormat, InvalidRange
 from app.domains.board.services import (
     ArticleService,
     AttachedFileService,
@@ -27,49 +33,144 @@ from app.domains.board.models import (
     Comment
 )
 from app.domains.board.schemas import (
-    ArticleBase,
+    ArticleCursorPage,
     ArticleData,
+    ArticleImportResult,
+    ArticleSearchPage,
+    ArticleSummary,
     ArticleUpsert,
+    AttachedFileUploadConfirm,
+    AttachedFileUploadRequest,
+    AttachedFileUploadUrl,
     CommentCreate,
+    CommentCursorPage,
     CommentData,
-    ExecutionResult
+    ExecutionResult,
+    TagTrending
 )
+from app.utils.common_utils import get_api_env, get_ttl_hash
 from app.utils.debug_utils import dpp
+from app.utils.export_utils import EXPORT_MEDIA_TYPES, encode_export
+from app.utils.import_utils import get_import_format, iter_records
 
 board_router = APIRouter()
 
+def _make_article_list_response(articles: List[Article]) -> List[dict]:
+    articles_resp = []
+    for article in articles:
+        articles_resp.append({
+            'id': article.id,
+            'user_id': article.user_id,
+            'username': article.user.username,
+            'title': article.title,
+            'content': article.content,
+            'comment_count': article.comment_count,
+            'attachment_count': article.attachment_count,
+            'tag_count': article.tag_count,
+            'created_at': article.created_at,
+            'updated_at': article.updated_at
+        })
+    return articles_resp
+
+def _make_comment_list_response(comments: List[Comment]) -> List[dict]:
+    comments_resp = []
+    for comment in comments:
+        comments_resp.append({
+            'id': comment.id,
+            'user_id': comment.user_id,
+            'username': comment.user.username,
+            'article_id': comment.article_id,
+            'comment_id': comment.comment_id,
+            'content': comment.content,
+            'level': comment.level,
+            'created_at': comment.created_at,
+            'updated_at': comment.updated_at
+        })
+    return comments_resp
+
 @board_router.get(
     name="Article 목록 조회",
     path="/articles",
-    response_model=list[ArticleBase]
+    response_model=list[ArticleSummary]
 )
 @inject
 async def get_article_list_api(
         request: Request,
         pagination_param: PaginationParams = Depends(),
+        after_id: Optional[int] = Query(description="이 일련 번호 이전의 article부터 조회 (keyset, page 는 무시)", default=None),
         article_service: ArticleService = Depends(Provide[Container.article_service])
 ):
     """
     Article 목록 조회 API
+    after_id 를 지정하면 OFFSET 대신 keyset 으로 조회한다. (next_cursor 는 /articles/cursor API 에서 반환)
     """
-    result_service = article_service.get_article_list(
+    if after_id is not None:
+        result_service, _ = await article_service.get_article_cursor_list(size=pagination_param.size, after_id=after_id)
+    else:
+        result_service = await article_service.get_article_list(
+            page=pagination_param.page,
+            size=pagination_param.size
+        )
+
+    # Make response
+    return _make_article_list_response(articles=result_service)
+
+@board_router.get(
+    name="Article 목록 조회 (Cursor)",
+    path="/articles/cursor",
+    response_model=ArticleCursorPage
+)
+@inject
+async def get_article_cursor_list_api(
+        cursor: Optional[str] = Query(description="이전 응답의 next_cursor", default=None),
+        after_id: Optional[int] = Query(description="이 일련 번호 이전의 article부터 조회", default=None),
+        size: int = Query(description="Page size", default=50, ge=1, le=100),
+        article_service: ArticleService = Depends(Provide[Container.article_service])
+):
+    """
+    Article 목록 조회 API (Keyset pagination)
+    """
+    articles, next_cursor = await article_service.get_article_cursor_list(
+        size=size,
+        cursor=cursor,
+        after_id=after_id
+    )
+    return {
+        'items': _make_article_list_response(articles=articles),
+        'next_cursor': next_cursor
+    }
+
+@board_router.get(
+    name="Article 검색",
+    path="/articles/search",
+    response_model=ArticleSearchPage
+)
+@inject
+async def search_articles_api(
+        q: str = Query(description="검색어 (제목, 내용, tag)", default="", max_length=200),
+        tags: List[str] = Query(description="Tag filter (모두 포함하는 article)", default=[]),
+        pagination_param: PaginationParams = Depends(),
+        article_service: ArticleService = Depends(Provide[Container.article_service])
+):
+    """
+    Article 검색 API
+    검색어의 모든 단어를 포함하는 article 을 BM25 점수 순서로 조회한다. (검색어 없이 tag 로만 검색하면 최신 순)
+    """
+    total, hits = await article_service.search_articles(
+        query=q,
+        tags=tags,
         page=pagination_param.page,
         size=pagination_param.size
     )
-
-    # Make response
-    articles = []
-    for article in result_service:
-        articles.append({
-            'id': article.id,
-            'user_id': article.user_id,
-            'username': article.user.username,
-            'title': article.title,
-            'content': article.content,
-            'created_at': article.created_at,
-            'updated_at': article.updated_at
-        })
-    return articles
+    items = _make_article_list_response(articles=[article for article, _ in hits])
+    for item, (_, score) in zip(items, hits):
+        item['score'] = score
+    return {
+        'total': total,
+        'page': pagination_param.page,
+        'size': pagination_param.size,
+        'items': items
+    }
 
 @board_router.get(
     name="Article 상세 조회",
@@ -84,42 +185,7 @@ async def get_article_detail_api(
     """
     Article 상세 조회 API
     """
-    result_service = article_service.get_article_detail(article_id=article_id)
-
-    # Make response
-    tags = []
-    for tag_data in result_service.tags:
-        tags.append({
-            'id': tag_data.id,
-            'user_id': tag_data.user.id,
-            'username': tag_data.user.username,
-            'tagging': tag_data.tagging,
-            'created_at': tag_data.created_at,
-            'updated_at': tag_data.updated_at
-        })
-
-    files = []
-    for file_data in result_service.files:
-        files.append({
-            'id': file_data.id,
-            'user_id': file_data.user_id,
-            'filename': file_data.filename,
-            'file_size': file_data.file_size,
-            'file_type': file_data.file_type
-        })
-
-    article = {
-        'id': result_service.id,
-        'user_id': result_service.user_id,
-        'username': result_service.user.username,
-        'title': result_service.title,
-        'content': result_service.content,
-        'tags': tags,
-        'attached_files': files,
-        'created_at': result_service.created_at,
-        'updated_at': result_service.updated_at
-    }
-    return article
+    return await article_service.get_article_detail(article_id=article_id)
 
 @board_router.post(
     name="Article 등록",
@@ -150,6 +216,67 @@ async def create_article_api(
     return {'result': exec_result}
 
 
+@board_router.post(
+    name="Article 대량 등록",
+    path="/articles/import",
+    response_model=ArticleImportResult
+)
+@inject
+async def import_articles_api(
+        request: Request,
+        file: UploadFile = File(description="NDJSON / CSV file (title, content, tags, created_at)"),
+        file_format: Optional[str] = Query(description="ndjson / csv (없으면 file 확장자로 판단)", default=None, alias="format"),
+        skip: int = Query(description="건너뛸 record 수 (이전 등록 결과의 checkpoint)", default=0, ge=0),
+        article_service: ArticleService = Depends(Provide[Container.article_service])
+):
+    """
+    Article 대량 등록 API
+    Batch 단위로 commit 하며, 중간에 실패한 경우 응답의 checkpoint 를 skip 으로 전달하여 이어서 등록한다.
+    """
+    file_format = get_import_format(filename=file.filename, file_format=file_format)
+    if file_format is None:
+        raise InvalidImportFormat()
+
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    # Upload file 은 임시 file 에 저장되어 있으므로 record 단위로 읽는다
+    f = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+    try:
+        return await article_service.import_articles(
+            records=iter_records(f=f, file_format=file_format),
+            user_id=request.state.user.id,
+            batch_size=conf.ARTICLE_IMPORT_BATCH_SIZE,
+            skip=skip
+        )
+    finally:
+        f.detach()
+
+
+@board_router.get(
+    name="Article export",
+    path="/articles/export",
+    response_class=StreamingResponse
+)
+@inject
+async def export_articles_api(
+        file_format: str = Query(description="ndjson / csv", default="ndjson", alias="format"),
+        article_service: ArticleService = Depends(Provide[Container.article_service])
+):
+    """
+    Article export API (작성자, tag, 댓글 포함)
+    DB cursor 에서 읽은 batch 단위로 응답을 전송하므로 전체 건수와 무관하게 일정한 memory 를 사용한다.
+    """
+    if file_format not in EXPORT_MEDIA_TYPES:
+        raise InvalidExportFormat()
+
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    batches = article_service.iter_export(batch_size=conf.ARTICLE_EXPORT_BATCH_SIZE)
+    return StreamingResponse(
+        content=encode_export(batches=batches, file_format=file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={'Content-Disposition': f'attachment; filename="articles.{file_format}"'}
+    )
+
+
 @board_router.patch(
     name="Article 수정",
     path="/article/{article_id}",
@@ -190,7 +317,7 @@ async def delete_article_api(
     """
     Article 삭제
     """
-    result_service = article_service.delete_article(article_id=article_id, user_id=request.state.user.id)
+    result_service = await article_service.delete_article(article_id=article_id, user_id=request.state.user.id)
     return {'result': result_service}
 
 
@@ -211,27 +338,39 @@ async def get_comment_list_api(
     """
     Comment 목록 조회 API
     """
-    result_service = comment_service.get_comment_list(
+    result_service = await comment_service.get_comment_list(
         article_id=article_id,
         page=pagination_params.page,
         size=pagination_params.size
     )
 
     # Make response
-    comments = []
-    for comment in result_service:
-        comments.append({
-            'id': comment.id,
-            'user_id': comment.user_id,
-            'username': comment.user.username,
-            'article_id': comment.article_id,
-            'comment_id': comment.comment_id,
-            'content': comment.content,
-            'level': comment.level,
-            'created_at': comment.created_at,
-            'updated_at': comment.updated_at
-        })
-    return comments
+    return _make_comment_list_response(comments=result_service)
+
+@board_router.get(
+    name="Comment 목록 조회 (Cursor)",
+    path="/article/{article_id}/comments/cursor",
+    response_model=CommentCursorPage
+)
+@inject
+async def get_comment_cursor_list_api(
+        article_id: int = Path(description="Article 일련 번호"),
+        cursor: Optional[str] = Query(description="이전 응답의 next_cursor", default=None),
+        size: int = Query(description="Page size", default=50, ge=1, le=100),
+        comment_service: CommentService = Depends(Provide[Container.comment_service])
+):
+    """
+    Comment 목록 조회 API (Keyset pagination)
+    """
+    comments, next_cursor = await comment_service.get_comment_cursor_list(
+        article_id=article_id,
+        size=size,
+        cursor=cursor
+    )
+    return {
+        'items': _make_comment_list_response(comments=comments),
+        'next_cursor': next_cursor
+    }
 
 @board_router.get(
     name="Comment 상세 조회",
@@ -247,7 +386,7 @@ async def get_comment_detail_api(
     """
     Comment 상세 조회 API
     """
-    result_service = comment_service.get_comment_detail(comment_id=comment_id)
+    result_service = await comment_service.get_comment_detail(comment_id=comment_id)
 
     # Make response
     comment = {
@@ -285,7 +424,7 @@ async def create_comment_api(
         content=insert_data.content,
         level=0
     )
-    result_service = comment_service.create_comment(insert_comment=insert_comment, article_id=article_id)
+    result_service = await comment_service.create_comment(insert_comment=insert_comment, article_id=article_id)
     return {'result': result_service}
 
 @board_router.patch(
@@ -311,7 +450,7 @@ async def update_comment_api(
         content=update_data.content,
         level=0
     )
-    result_service = comment_service.update_comment(
+    result_service = await comment_service.update_comment(
         article_id=article_id,
         comment_id=comment_id,
         update_comment=update_comment
@@ -333,7 +472,7 @@ async def delete_comment_api(
     """
     Comment 삭제
     """
-    result_service = comment_service.delete_comment(article_id=article_id, comment_id=comment_id, user_id=request.state.user.id)
+    result_service = await comment_service.delete_comment(article_id=article_id, comment_id=comment_id, user_id=request.state.user.id)
     return {'result': result_service}
 
 @board_router.delete(
@@ -349,13 +488,53 @@ async def delete_comment_all_api(
     """
     Article 내 Comment 전체 삭제
     """
-    result_service = comment_service.delete_comment_all(article_id=article_id)
+    result_service = await comment_service.delete_comment_all(article_id=article_id)
     return {'result': result_service}
 
 
 ####################################################################################################################
 # Artcle tag apis
 ####################################################################################################################
+@board_router.get(
+    name="Tag 별 Article 목록 조회",
+    path="/tags/{tagging}/articles",
+    response_model=ArticleCursorPage
+)
+@inject
+async def get_tag_article_list_api(
+        tagging: str = Path(description="Tag 내용"),
+        cursor: Optional[str] = Query(description="이전 응답의 next_cursor", default=None),
+        size: int = Query(description="Page size", default=50, ge=1, le=100),
+        tag_service: TagService = Depends(Provide[Container.tag_service])
+):
+    """
+    Tag 가 붙은 Article 목록 조회 API (Keyset pagination, 최신 순)
+    """
+    articles, next_cursor = await tag_service.get_article_cursor_list(tagging=tagging, size=size, cursor=cursor)
+    return {
+        'items': _make_article_list_response(articles=articles),
+        'next_cursor': next_cursor
+    }
+
+
+@board_router.get(
+    name="인기 Tag 조회",
+    path="/tags/trending",
+    response_model=List[TagTrending]
+)
+@inject
+async def get_trending_tag_list_api(
+        days: Optional[int] = Query(description="집계 기간 (일, 기본 TAG_TRENDING_DAYS)", default=None, ge=1, le=365),
+        size: int = Query(description="조회 수", default=20, ge=1, le=100),
+        tag_service: TagService = Depends(Provide[Container.tag_service])
+):
+    """
+    최근 기간 동안 article 에 많이 붙은 tag 조회 API
+    """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
+    return await tag_service.get_trending_list(days=days or conf.TAG_TRENDING_DAYS, size=size)
+
+
 @board_router.delete(
     name="단일 Tag 삭제",
     path="/article/{article_id}/tag/{tag_id}",
@@ -371,7 +550,7 @@ async def delete_tag_api(
     """
     단일 Tag 삭제
     """
-    result_service = tag_service.delete(tag_id=tag_id, article_id=article_id, user_id=request.state.user.id)
+    result_service = await tag_service.delete(tag_id=tag_id, article_id=article_id, user_id=request.state.user.id)
     return {'result': result_service}
 
 
@@ -388,7 +567,7 @@ async def delete_tag_all_api(
     """
     Article의 전체 tag 삭제
     """
-    result_service = tag_service.delete_all(article_id=article_id)
+    result_service = await tag_service.delete_all(article_id=article_id)
     return {'result': result_service}
 
 
@@ -402,23 +581,82 @@ async def delete_tag_all_api(
 @inject
 async def get_attached_file_download_api(
         attached_file_id: int = Path(description="첨부 파일 일련 번호"),
+        range_header: Optional[str] = Header(alias="Range", description="Byte range (ex. bytes=0-1023)", default=None),
         attached_file_service: AttachedFileService = Depends(Provide[Container.attached_file_service])
 ):
     """
     첨부 파일 다운로드 API
+    File 을 chunk 단위로 streaming 하며, 단일 Range 요청(이어받기)을 지원한다.
+    Presigned URL 모드인 경우 S3 presigned URL 로 redirect 한다.
     """
-    contents, file_name = await attached_file_service.get_attached_file_download(
-        attached_file_id=attached_file_id
-    )
+    download_url = await attached_file_service.get_attached_file_download_url(attached_file_id=attached_file_id)
+    if download_url is not None:
+        return RedirectResponse(url=download_url, status_code=307)
 
-    return Response(
-        content=contents,
-        headers={
-            'Content-Disposition': f'attachment;filename={urllib.parse.quote(file_name)}',
-            'Content-Type': 'application/octet-stream;charset=UTF-8',
-        }
+    try:
+        attached_file_content = await attached_file_service.get_attached_file_download(
+            attached_file_id=attached_file_id,
+            byte_range=range_header
+        )
+    except InvalidRange as ex:
+        return Response(
+            status_code=ex.status_code,
+            headers={'Content-Range': f'bytes */{ex.file_size}'} if ex.file_size is not None else None
+        )
+
+    headers = {
+        'Content-Disposition': f'attachment;filename={urllib.parse.quote(attached_file_content.filename)}',
+        'Content-Length': str(attached_file_content.content_length),
+        'Accept-Ranges': 'bytes'
+    }
+    if attached_file_content.etag is not None:
+        headers['ETag'] = attached_file_content.etag
+    if attached_file_content.content_range is not None:
+        headers['Content-Range'] = attached_file_content.content_range
+
+    return StreamingResponse(
+        content=attached_file_content.content,
+        status_code=206 if attached_file_content.content_range is not None else 200,
+        media_type='application/octet-stream;charset=UTF-8',
+        headers=headers
     )
 
+@board_router.post(
+    name="첨부파일 upload URL 발급",
+    path="/article/{article_id}/attached-files/upload-urls",
+    response_model=List[AttachedFileUploadUrl]
+)
+@inject
+async def create_attached_file_upload_urls_api(
+        request: Request,
+        files: List[AttachedFileUploadRequest],
+        article_id: int = Path(description="Article 일련 번호"),
+        attached_file_service: AttachedFileService = Depends(Provide[Container.attached_file_service])
+):
+    """
+    첨부 파일 upload 용 presigned PUT URL 발급 (presigned 모드)
+    Client 는 발급된 URL 로 file 을 직접 upload 한 뒤 upload 확인 API 를 호출한다.
+    """
+    return await attached_file_service.create_upload_urls(article_id=article_id, user_id=request.state.user.id, files=files)
+
+@board_router.post(
+    name="첨부파일 upload 확인",
+    path="/article/{article_id}/attached-files/confirm",
+    response_model=ExecutionResult
+)
+@inject
+async def confirm_attached_file_upload_api(
+        request: Request,
+        data: AttachedFileUploadConfirm,
+        article_id: int = Path(description="Article 일련 번호"),
+        attached_file_service: AttachedFileService = Depends(Provide[Container.attached_file_service])
+):
+    """
+    Presigned URL 로 upload 완료된 file 을 첨부 파일로 등록 (presigned 모드)
+    """
+    result_service = await attached_file_service.confirm_upload(article_id=article_id, user_id=request.state.user.id, data=data)
+    return {'result': result_service}
+
 @board_router.delete(
     name="첨부 파일 삭제",
     path='/article/{article_id}/attached-file/{attached_file_id}',
@@ -434,5 +672,5 @@ async def delete_attached_file_api(
     """
     첨부 파일 삭제
     """
-    result_service = attached_file_service.delete(article_id=article_id, attached_file_id=attached_file_id, user_id=request.state.user.id)
+    result_service = await attached_file_service.delete(article_id=article_id, attached_file_id=attached_file_id, user_id=request.state.user.id)
     return {'result': result_service}
\ No newline at end of file
@@ -11,6 +11,53 @@ class NotExistArticle(APIException):
             ex=Exception(exception_detail)
         )
 
+class InvalidCursor(APIException):
+    def __init__(self):
+        exception_detail = "Invalid cursor"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class InvalidImportFormat(APIException):
+    def __init__(self):
+        exception_detail = "Invalid import format (ndjson / csv)"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class InvalidExportFormat(APIException):
+    def __init__(self):
+        exception_detail = "Invalid export format (ndjson / csv)"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class InvalidImportRecord(APIException):
+    def __init__(self, line: int, checkpoint: int, reason: str):
+        exception_detail = f"Invalid import record at line {line} (checkpoint: {checkpoint}) : {reason}"
+        self.line = line
+        self.checkpoint = checkpoint
+        super().__init__(
+            status_code=StatusCode.HTTP_422,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class InvalidSearchQuery(APIException):
+    def __init__(self):
+        exception_detail = "Search query or tags required"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
 ## For Comment
 class NotExistComment(APIException):
     def __init__(self):
@@ -31,6 +78,43 @@ class NotExistAttachedFile(APIException):
             ex=Exception(exception_detail)
         )
 
+class InvalidRange(APIException):
+    def __init__(self, file_size: int = None):
+        exception_detail = "Requested range not satisfiable"
+        self.file_size = file_size
+        super().__init__(
+            status_code=StatusCode.HTTP_416,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class PresignedUrlDisabled(APIException):
+    def __init__(self):
+        exception_detail = "Presigned url mode is disabled"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class NotUploadedAttachedFile(APIException):
+    def __init__(self):
+        exception_detail = "Attached file is not uploaded"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
+class DuplicateAttachedFile(APIException):
+    def __init__(self):
+        exception_detail = "Attached file is already registered"
+        super().__init__(
+            status_code=StatusCode.HTTP_400,
+            detail=exception_detail,
+            ex=Exception(exception_detail)
+        )
+
 class NotExistTag(APIException):
     def __init__(self):
         exception_detail = "Not exist tag"
@@ -1,12 +1,24 @@
+import asyncio
+import inspect
+import re
+
+from collections import Counter
+from contextlib import aclosing
+from datetime import date, datetime
 from fastapi import UploadFile
-from typing import List, Optional
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
+from app.common.config import get_config
 from app.common.constants import (
     S3_BUCKET,
     S3_KEY_PREFIX
 )
+from app.domains.board.exceptions import InvalidRange, NotExistAttachedFile, NotUploadedAttachedFile, PresignedUrlDisabled
 from app.domains.board.repositories.repository import (
+    ArticleCacheRepository,
     ArticleRepository,
+    ArticleSearchRepository,
     AttachedFileRepository,
     CommentRepository,
     TagRepository
@@ -14,16 +26,19 @@ from app.domains.board.repositories.repository import (
 from app.domains.board.models import (
     Article,
     AttachedFile,
+    AttachedFileBlob,
     Comment,
     Tag
 )
 from app.domains.board.schemas import (
     ArticleData,
     ArticleUpsert,
+    AttachedFileContent,
     CommentCreate,
     CommentData
 )
-from app.utils.aws_utils import s3_upload_file, s3_read_file
+from app.storages.storage import InvalidByteRange, PresignedUrlNotSupported, StorageBackend, get_content_hash
+from app.utils.common_utils import get_api_env, get_ttl_hash, get_uuid, resolve_awaitable
 from app.utils.debug_utils import dpp
 
 class ArticleHandler:
@@ -31,22 +46,60 @@ class ArticleHandler:
     def __init__(self, article_repository: ArticleRepository):
         self.article_repository = article_repository
 
-    def get_list(self, page: int = 1, size: int = 3):
-        article_list = self.article_repository.get_list(page=page, size=size)
+    async def get_list(self, page: int = 1, size: int = 3):
+        article_list = await resolve_awaitable(self.article_repository.get_list(page=page, size=size))
         return article_list
 
-    def get_detail(self, article_id: int):
-        article = self.article_repository.get_detail(article_id=article_id)
+    async def get_list_by_cursor(self, after_id: Optional[int], size: int):
+        return await resolve_awaitable(self.article_repository.get_list_by_cursor(after_id=after_id, size=size))
+
+    async def get_list_by_tag(self, tag_id: int, after_id: Optional[int], size: int):
+        return await resolve_awaitable(self.article_repository.get_list_by_tag(tag_id=tag_id, after_id=after_id, size=size))
+
+    async def get_detail(self, article_id: int):
+        article = await resolve_awaitable(self.article_repository.get_detail(article_id=article_id))
         return article
 
-    def create(self, insert_article: Article):
-        return self.article_repository.create(article=insert_article)
+    async def get_list_by_ids(self, article_ids: List[int]):
+        return await resolve_awaitable(self.article_repository.get_list_by_ids(article_ids=article_ids))
+
+    async def create(self, insert_article: Article):
+        return await resolve_awaitable(self.article_repository.create(article=insert_article))
+
+    async def bulk_create(self, articles: List[dict]) -> List[int]:
+        return await resolve_awaitable(self.article_repository.bulk_create(articles=articles))
+
+    async def update(self, article_id: int, update_article: Article):
+        await resolve_awaitable(self.article_repository.update(article_id=article_id, update_article=update_article))
+
+    async def delete(self, article: Article):
+        await resolve_awaitable(self.article_repository.delete(article=article))
 
-    def update(self, article_id: int, update_article: Article):
-        self.article_repository.update(article_id=article_id, update_article=update_article)
+    async def increase_counts(self, article_id: int, comment_count: int = 0, attachment_count: int = 0, tag_count: int = 0):
+        await resolve_awaitable(self.article_repository.increase_counts(
+            article_id=article_id,
+            comment_count=comment_count,
+            attachment_count=attachment_count,
+            tag_count=tag_count
+        ))
 
-    def delete(self, article: Article):
-        self.article_repository.delete(article=article)
+    async def reconcile_counts(self, after_id: int, size: int) -> Tuple[List[int], int]:
+        return await resolve_awaitable(self.article_repository.reconcile_counts(after_id=after_id, size=size))
+
+    async def iter_export(self, batch_size: int) -> AsyncIterator[List[dict]]:
+        """ 동기 repository 의 cursor 는 thread pool 에서 읽어 event loop 를 막지 않는다 """
+        batches = self.article_repository.iter_export(batch_size=batch_size)
+        if inspect.isasyncgen(batches):
+            async with aclosing(batches):
+                async for batch in batches:
+                    yield batch
+            return
+
+        try:
+            async for batch in iterate_in_threadpool(batches):
+                yield batch
+        finally:
+            batches.close() # 중간에 종료(client 연결 끊김 등)되어도 cursor / connection 을 정리한다
 
 
 class CommentHandler:
@@ -54,25 +107,34 @@ class CommentHandler:
     def __init__(self, comment_repository: CommentRepository):
         self.comment_repository = comment_repository
 
-    def get_list(self, article_id: int, page: int, size: int):
-        comment_list = self.comment_repository.get_list(article_id=article_id, page=page, size=size)
+    async def get_list(self, article_id: int, page: int, size: int):
+        comment_list = await resolve_awaitable(self.comment_repository.get_list(article_id=article_id, page=page, size=size))
         return comment_list
 
-    def get_detail(self, comment_id: int):
-        comment = self.comment_repository.get_detail(comment_id=comment_id)
+    async def get_list_by_cursor(self, article_id: int, after: Optional[List[int]], size: int):
+        return await resolve_awaitable(self.comment_repository.get_list_by_cursor(article_id=article_id, after=after, size=size))
+
+    async def get_detail(self, comment_id: int):
+        comment = await resolve_awaitable(self.comment_repository.get_detail(comment_id=comment_id))
         return comment
 
-    def create(self, insert_comment: Comment):
-        return self.comment_repository.create(comment=insert_comment)
+    async def create(self, insert_comment: Comment):
+        return await resolve_awaitable(self.comment_repository.create(comment=insert_comment))
+
+    async def update(self, comment_id: int, update_comment: Comment):
+        await resolve_awaitable(self.comment_repository.update(comment_id=comment_id, comment=update_comment))
 
-    def update(self, comment_id: int, update_comment: Comment):
-        self.comment_repository.update(comment_id=comment_id, comment=update_comment)
+    async def delete(self, comment: Comment) -> int:
+        return await resolve_awaitable(self.comment_repository.delete(comment=comment))
 
-    def delete(self, comment: Comment):
-        return self.comment_repository.delete(comment=comment)
+    async def delete_all(self, article_id: int) -> int:
+        return await resolve_awaitable(self.comment_repository.delete_all(article_id=article_id))
 
-    def delete_all(self, article_id: int):
-        return self.comment_repository.delete_all(article_id=article_id)
+    async def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        return await resolve_awaitable(self.comment_repository.get_export_list(article_ids=article_ids))
+
+    async def backfill_thread_ids(self, size: int) -> int:
+        return await resolve_awaitable(self.comment_repository.backfill_thread_ids(size=size))
 
 
 class TagHandler:
@@ -80,59 +142,377 @@ class TagHandler:
     def __init__(self, tag_repository: TagRepository):
         self.tag_repository = tag_repository
 
-    def get_list(self, article_id: int):
-        return self.tag_repository.get_list(article_id=article_id)
-
-    def get_detail(self, tag_id: int):
-        return self.tag_repository.get_detail(tag_id=tag_id)
-
-    def create(self, tags: List[dict]):
-        if len(tags) > 0:
-            self.tag_repository.create(tags)
-
-    def delete(self, tag: Tag):
-        self.tag_repository.delete(tag)
-
-    def delete_all(self, article_id: int):
-        self.tag_repository.delete_all(article_id=article_id)
-
+    async def get_list(self, article_id: int):
+        return await resolve_awaitable(self.tag_repository.get_list(article_id=article_id))
+
+    async def get_detail(self, tag_id: int):
+        return await resolve_awaitable(self.tag_repository.get_detail(tag_id=tag_id))
+
+    async def create(self, tags: List[dict]) -> int:
+        """
+        Tag 등록 - tag 사전 id 를 채우고 등록 일자의 tag 수를 증가시킨다.
+        같은 article 에 중복된 tag 와 이미 등록되어 있는 tag 는 한 번만 등록(집계)한다.
+        :return: 등록한 tag 수
+        """
+        tags = {(t['article_id'], t['tagging']): t for t in tags}
+        if len(tags) == 0:
+            return 0
+        attached_tags = await resolve_awaitable(self.tag_repository.get_export_list(article_ids=list({t['article_id'] for t in tags.values()})))
+        for attached_tag in attached_tags:
+            tags.pop((attached_tag['article_id'], attached_tag['tagging']), None)
+        tags = list(tags.values())
+        if len(tags) == 0:
+            return 0
+
+        tag_ids = await resolve_awaitable(self.tag_repository.get_or_create_tag_ids(taggings=[t['tagging'] for t in tags]))
+        created_at = datetime.now()
+        for tag in tags:
+            tag['tag_id'] = tag_ids[tag['tagging']]
+            tag['created_at'] = created_at
+        await resolve_awaitable(self.tag_repository.create(tags))
+        await resolve_awaitable(self.tag_repository.update_counts(
+            counts=Counter((created_at.date(), t['tag_id']) for t in tags)
+        ))
+        return len(tags)
+
+    async def delete(self, tag: Tag):
+        await resolve_awaitable(self.tag_repository.delete(tag))
+        await resolve_awaitable(self.tag_repository.update_counts(counts=self._get_delete_counts(tags=[tag])))
+
+    async def delete_all(self, article_id: int) -> int:
+        """ :return: 삭제한 tag 수 """
+        tags = await resolve_awaitable(self.tag_repository.get_list(article_id=article_id))
+        await resolve_awaitable(self.tag_repository.delete_all(article_id=article_id))
+        await resolve_awaitable(self.tag_repository.update_counts(counts=self._get_delete_counts(tags=tags)))
+        return len(tags)
+
+    @staticmethod
+    def _get_delete_counts(tags: List[Tag]) -> Dict[Tuple[date, int], int]:
+        # tag 사전 migration 이전에 등록된 tag 는 집계 대상이 아니다
+        counts = Counter((t.created_at.date(), t.tag_id) for t in tags if t.tag_id is not None and t.created_at is not None)
+        return {key: -count for key, count in counts.items()}
+
+    async def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        return await resolve_awaitable(self.tag_repository.get_export_list(article_ids=article_ids))
+
+    async def get_tag_id(self, tagging: str) -> Optional[int]:
+        return await resolve_awaitable(self.tag_repository.get_tag_id(tagging=tagging))
+
+    async def get_trending_list(self, since: date, size: int) -> List[dict]:
+        return await resolve_awaitable(self.tag_repository.get_trending_list(since=since, size=size))
+
+
+# 단일 byte range 만 지원 (ex. bytes=0-1023, bytes=1024-, bytes=-500)
+BYTE_RANGE_REGEX = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
 
 class AttachedFileHandler:
 
-    def __init__(self, attached_file_repository: AttachedFileRepository):
+    def __init__(self, attached_file_repository: AttachedFileRepository, storage: StorageBackend):
+        self.config = get_config(ttl_hash=get_ttl_hash(), api_env=get_api_env())
         self.attached_file_repository = attached_file_repository
-
-    def get_list(self, article_id: int):
-        return self.attached_file_repository.get_list(article_id=article_id)
-
-    def get_detail(self, attached_file_id: int):
-        return self.attached_file_repository.get_detail(attached_file_id=attached_file_id)
-
-    def get_content(self, attached_file: AttachedFile):
-        attached_file_content = s3_read_file(
-            s3_bucket_name=S3_BUCKET,
-            s3_key=attached_file.s3_key
+        self.storage = storage
+
+    async def get_list(self, article_id: int):
+        return await resolve_awaitable(self.attached_file_repository.get_list(article_id=article_id))
+
+    async def get_detail(self, attached_file_id: int):
+        return await resolve_awaitable(self.attached_file_repository.get_detail(attached_file_id=attached_file_id))
+
+    async def open_content(self, attached_file: AttachedFile, byte_range: Optional[str] = None) -> AttachedFileContent:
+        """
+        첨부파일 내용을 chunk 단위로 읽는 stream 생성
+        :param attached_file:
+        :param byte_range: HTTP Range header, 형식이 잘못되었거나 다중 range 인 경우 전체 file 을 반환 (RFC 9110)
+        :return:
+        """
+        if byte_range is not None:
+            byte_range = byte_range.replace(" ", "")
+            if BYTE_RANGE_REGEX.match(byte_range) is None:
+                byte_range = None
+
+        try:
+            storage_object = await self.storage.open(
+                bucket=attached_file.s3_bucket_name,
+                key=attached_file.s3_key,
+                byte_range=byte_range,
+                chunk_size=self.config.S3_DOWNLOAD_CHUNKSIZE
+            )
+        except InvalidByteRange:
+            raise InvalidRange(file_size=attached_file.file_size)
+        except FileNotFoundError:
+            # DB 에는 있지만 저장소에서 삭제된 object
+            raise NotExistAttachedFile()
+
+        return AttachedFileContent(
+            filename=attached_file.filename,
+            content=storage_object.content,
+            content_length=storage_object.content_length,
+            etag=storage_object.etag,
+            content_range=storage_object.content_range
         )
-        return attached_file_content
-
-    def create(self, attached_file: AttachedFile):
-        return self.attached_file_repository.create(attached_file=attached_file)
 
-    def delete(self, attached_file: AttachedFile):
-        return self.attached_file_repository.delete(attached_file=attached_file)
-
-    def delete_all(self, article_id: int):
-        return self.attached_file_repository.delete_all(article_id=article_id)
-
-    async def upload(self, f: UploadFile):
-        s3_key = f"{S3_KEY_PREFIX['BOARD']}/{f.filename}"
-        upload_result = await s3_upload_file(
-            upload_file_obj=f,
+    def is_presigned_mode(self) -> bool:
+        """ Presigned URL 은 지원하는 저장소(S3)인 경우에만 사용한다 """
+        return self.config.ATTACHMENT_TRANSFER_MODE == "presigned" and self.storage.supports_presigned_url
+
+    async def create_upload_url(self, article_id: int, filename: str, file_type: str) -> dict:
+        """
+        Presigned PUT URL 발급
+        Key 에 article 일련 번호와 uuid 를 포함하여 upload 확인 시 발급한 key 인지 검증하고, 같은 이름의 file 을 덮어쓰지 않도록 한다.
+        :param article_id:
+        :param filename:
+        :param file_type: PUT 요청의 Content-Type 과 일치해야 한다
+        :return:
+        """
+        s3_key = f"{S3_KEY_PREFIX['BOARD']}/{article_id}/{get_uuid()}/{filename}"
+        try:
+            upload_url = self.storage.create_upload_url(
+                bucket=S3_BUCKET['BOARD'],
+                key=s3_key,
+                content_type=file_type,
+                expires_in=self.config.S3_PRESIGNED_URL_EXPIRES
+            )
+        except PresignedUrlNotSupported:
+            raise PresignedUrlDisabled()
+        return {
+            'filename': filename,
+            's3_key': s3_key,
+            'upload_url': upload_url,
+            'headers': {'Content-Type': file_type},
+            'expires_in': self.config.S3_PRESIGNED_URL_EXPIRES
+        }
+
+    async def get_uploaded_file(self, article_id: int, user_id: int, s3_key: str, filename: str) -> Optional[AttachedFile]:
+        """
+        Presigned URL 로 upload 된 file 확인
+        :return: upload 된 object 정보로 만든 AttachedFile, 발급하지 않은 key 이거나 upload 되지 않은 경우 None
+        """
+        if not s3_key.startswith(f"{S3_KEY_PREFIX['BOARD']}/{article_id}/"):
+            return None
+
+        storage_object = await self.storage.head(bucket=S3_BUCKET['BOARD'], key=s3_key)
+        if storage_object is None:
+            return None
+
+        return AttachedFile(
+            article_id=article_id,
+            user_id=user_id,
             s3_bucket_name=S3_BUCKET['BOARD'],
-            s3_key=s3_key
+            s3_key=s3_key,
+            filename=filename,
+            file_size=storage_object.content_length,
+            file_type=storage_object.content_type or 'application/octet-stream'
         )
-        return upload_result
-
-
-
 
+    async def exists_by_s3_key(self, s3_key: str) -> bool:
+        return await resolve_awaitable(self.attached_file_repository.exists_by_s3_key(s3_key=s3_key))
+
+    async def create_download_url(self, attached_file: AttachedFile) -> str:
+        """ Presigned GET URL 발급 """
+        try:
+            return self.storage.create_download_url(
+                bucket=attached_file.s3_bucket_name,
+                key=attached_file.s3_key,
+                filename=attached_file.filename,
+                expires_in=self.config.S3_PRESIGNED_URL_EXPIRES
+            )
+        except PresignedUrlNotSupported:
+            raise PresignedUrlDisabled()
+
+    async def create(self, attached_file: AttachedFile):
+        """ 첨부파일 저장 - 내용 기준으로 저장된 file 은 blob 참조 수를 증가시킨다 """
+        if attached_file.content_hash is not None:
+            created = await resolve_awaitable(self.attached_file_repository.acquire_blob(blob=AttachedFileBlob(
+                content_hash=attached_file.content_hash,
+                s3_bucket_name=attached_file.s3_bucket_name,
+                s3_key=attached_file.s3_key,
+                file_size=attached_file.file_size
+            )))
+            # upload 시 있던 object 가 참조가 없어져 그 사이 삭제(delete_content)된 경우 - 다시 upload 해야 한다
+            if created and await self.storage.head(bucket=attached_file.s3_bucket_name, key=attached_file.s3_key) is None:
+                raise NotUploadedAttachedFile()
+        return await resolve_awaitable(self.attached_file_repository.create(attached_file=attached_file))
+
+    async def _release_blobs(self, attached_files: List[AttachedFile]) -> List[AttachedFile]:
+        """
+        Blob 참조 수 감소
+        :return: 삭제할 수 있는 저장소 object 의 첨부파일 목록 (참조가 없어진 blob, 내용 기준으로 저장하지 않은 file)
+        """
+        unreferenced_files = []
+        for attached_file in attached_files:
+            if attached_file.content_hash is None:
+                # presigned URL 로 upload 되었거나 blob 도입 이전의 file - 같은 key 의 첨부파일이 없으면 삭제
+                unreferenced_files.append(attached_file)
+            elif await resolve_awaitable(self.attached_file_repository.release_blob(content_hash=attached_file.content_hash)):
+                unreferenced_files.append(attached_file)
+        return unreferenced_files
+
+    async def delete(self, attached_file: AttachedFile) -> List[AttachedFile]:
+        """
+        첨부파일 삭제
+        :return: 참조가 없어진 저장소 object 의 첨부파일 목록 (commit 이후 delete_content 로 삭제)
+        """
+        unreferenced_files = await self._release_blobs(attached_files=[attached_file])
+        await resolve_awaitable(self.attached_file_repository.delete(attached_file=attached_file))
+        return unreferenced_files
+
+    async def delete_all(self, article_id: int) -> List[AttachedFile]:
+        """
+        Article 의 첨부파일 전체 삭제
+        :return: 참조가 없어진 저장소 object 의 첨부파일 목록 (commit 이후 delete_content 로 삭제)
+        """
+        attached_files = await self.get_list(article_id=article_id)
+        unreferenced_files = await self._release_blobs(attached_files=attached_files)
+        await resolve_awaitable(self.attached_file_repository.delete_all(article_id=article_id))
+        return unreferenced_files
+
+    async def delete_content(self, attached_file: AttachedFile) -> bool:
+        """
+        참조가 없어진 저장소 object 삭제
+        첨부파일 삭제가 commit 된 이후, file 마다 별도의 transaction 안에서 호출한다.
+        Blob row lock 을 잡고 참조 수를 다시 확인하므로, 그 사이 같은 내용 / key 로 다시 첨부된 object 는 삭제하지 않는다.
+        :param attached_file:
+        :return: object 를 삭제한 경우 True
+        """
+        try:
+            if attached_file.content_hash is not None:
+                blob = await resolve_awaitable(self.attached_file_repository.get_unreferenced_blob(content_hash=attached_file.content_hash))
+                if blob is None:
+                    return False
+                if not await self.storage.delete(bucket=blob.s3_bucket_name, key=blob.s3_key):
+                    return False
+                await resolve_awaitable(self.attached_file_repository.delete_blob(content_hash=blob.content_hash))
+                return True
+
+            if await self.exists_by_s3_key(s3_key=attached_file.s3_key):
+                return False
+            return await self.storage.delete(bucket=attached_file.s3_bucket_name, key=attached_file.s3_key)
+        except Exception as ex:
+            # 첨부파일 삭제는 이미 commit 되었으므로 예외를 전파하지 않는다 (참조 수 0 인 blob 은 남는다)
+            print("[EX] AttachedFileHandler.delete_content : ", str(ex.args))
+            return False
+
+    async def upload(self, f: UploadFile) -> Optional[AttachedFileBlob]:
+        """
+        첨부파일 upload
+        내용(sha256) 기준 key 에 저장하며, 같은 내용의 object 가 이미 있으면 전송하지 않는다.
+        Key 를 전송 전에 알아야 중복 전송을 생략할 수 있으므로 hash 계산(local spool file 읽기)과 전송을 나누어 file 을 두 번 읽는다.
+        :param f:
+        :return: 저장된 object 정보, upload 에 실패한 경우 None
+        """
+        try:
+            content_hash = await get_content_hash(upload_file_obj=f)
+        except Exception as ex:
+            print("[EX] AttachedFileHandler.upload : ", str(ex.args))
+            return None
+
+        blob = AttachedFileBlob(
+            content_hash=content_hash,
+            s3_bucket_name=S3_BUCKET['BOARD'],
+            s3_key=f"{S3_KEY_PREFIX['BOARD']}/blobs/{content_hash[:2]}/{content_hash}",
+            file_size=f.size
+        )
+        try:
+            if await self.storage.head(bucket=blob.s3_bucket_name, key=blob.s3_key) is not None:
+                return blob
+        except Exception as ex:
+            print("[EX] AttachedFileHandler.upload : ", str(ex.args))
+
+        upload_result = await self.storage.upload(upload_file_obj=f, bucket=blob.s3_bucket_name, key=blob.s3_key)
+        return blob if upload_result else None
+
+    async def upload_all(self, files: List[UploadFile]) -> List[Optional[AttachedFileBlob]]:
+        """
+        첨부파일 동시 upload (S3_UPLOAD_CONCURRENCY 만큼)
+        :param files:
+        :return: files 순서대로의 upload 결과 (upload 에 실패한 file 은 None)
+        """
+        semaphore = asyncio.Semaphore(self.config.S3_UPLOAD_CONCURRENCY)
+
+        async def _upload(f: UploadFile):
+            async with semaphore:
+                return await self.upload(f=f)
+
+        return list(await asyncio.gather(*[_upload(f) for f in files]))
+
+
+class ArticleCacheHandler:
+    """
+    Article 상세 read-through cache
+    Cache 장애 시에는 예외를 전파하지 않고 DB 조회로 대체한다.
+    """
+
+    def __init__(self, article_cache_repository: ArticleCacheRepository, exp: int = 0):
+        self.article_cache_repository = article_cache_repository
+        self.exp = exp
+
+    async def get_detail(self, article_id: int) -> Tuple[Optional[ArticleData], Optional[str]]:
+        """
+        Cache 조회
+        :return: (cache 된 ArticleData, cache miss 시 set_detail 에 전달할 version)
+        """
+        if self.exp <= 0:
+            return None, None
+        try:
+            value, version = self.article_cache_repository.get_detail(article_id=article_id)
+            return (ArticleData.model_validate_json(value) if value is not None else None), version
+        except Exception as e:
+            print("[EX] ArticleCacheHandler.get_detail : ", str(e.args))
+            return None, None
+
+    async def set_detail(self, article: ArticleData, version: Optional[str]):
+        if self.exp <= 0:
+            return
+        try:
+            self.article_cache_repository.set_detail(
+                article_id=article.id,
+                value=article.model_dump_json(),
+                version=version,
+                exp=self.exp
+            )
+        except Exception as e:
+            print("[EX] ArticleCacheHandler.set_detail : ", str(e.args))
+
+    async def delete_detail(self, article_id: int):
+        try:
+            self.article_cache_repository.delete_detail(article_id=article_id)
+        except Exception as e:
+            print("[EX] ArticleCacheHandler.delete_detail : ", str(e.args))
+
+    async def get_stats(self) -> dict:
+        return self.article_cache_repository.get_stats()
+
+
+class ArticleSearchHandler:
+    """
+    Article 검색 index
+    Index 갱신은 DB commit 이후 수행하며, 실패해도 예외를 전파하지 않는다. (rebuild_search_index 명령으로 다시 생성)
+    Index 조회 / 갱신은 CPU 사용 또는 file IO 이므로 thread pool 에서 수행한다.
+    """
+
+    def __init__(self, article_search_repository: ArticleSearchRepository):
+        self.article_search_repository = article_search_repository
+
+    async def index(self, article_id: int, title: str, content: str, tags: List[str]):
+        try:
+            await run_in_threadpool(self.article_search_repository.index, article_id=article_id, title=title, content=content, tags=tags)
+        except Exception as e:
+            print("[EX] ArticleSearchHandler.index : ", str(e.args))
+
+    async def bulk_index(self, documents: List[dict]):
+        try:
+            await run_in_threadpool(self.article_search_repository.bulk_index, documents=documents)
+        except Exception as e:
+            print("[EX] ArticleSearchHandler.bulk_index : ", str(e.args))
+
+    async def delete(self, article_id: int):
+        try:
+            await run_in_threadpool(self.article_search_repository.delete, article_id=article_id)
+        except Exception as e:
+            print("[EX] ArticleSearchHandler.delete : ", str(e.args))
+
+    async def clear(self):
+        await run_in_threadpool(self.article_search_repository.clear)
+
+    async def search(self, query: str, tags: List[str], offset: int, size: int) -> Tuple[int, List[Tuple[int, float]]]:
+        return await run_in_threadpool(self.article_search_repository.search, query=query, tags=tags, offset=offset, size=size)
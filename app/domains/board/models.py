@@ -2,8 +2,10 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text
@@ -19,6 +21,10 @@ class Article(Base):
     user_id = Column(Integer, ForeignKey('tb_user.id'))
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
+    # 목록 조회 용 집계 - 댓글 / 첨부파일 / tag 변경 시 같은 transaction 에서 증감한다 (reconcile_article_counts 로 재계산)
+    comment_count = Column(Integer, nullable=False, default=0)
+    attachment_count = Column(Integer, nullable=False, default=0)
+    tag_count = Column(Integer, nullable=False, default=0)
     is_deleted = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now)
@@ -38,6 +44,7 @@ class Comment(Base):
     user_id = Column(Integer, ForeignKey('tb_user.id'))
     article_id = Column(Integer, ForeignKey('tb_article.id'))
     comment_id = Column(Integer)
+    thread_id = Column(Integer, nullable=False) # 최상위 댓글의 일련 번호 (최상위 댓글은 자기 자신)
     content = Column(Text, nullable=False)
     level = Column(Integer, nullable=False, default=0)
     is_deleted = Column(Boolean, default=False)
@@ -50,11 +57,15 @@ class Comment(Base):
 
 class Tag(Base):
     __tablename__ = "tb_article_tag"
+    __table_args__ = (
+        Index('idx_article_tag_tag_article', 'tag_id', 'article_id'), # Tag 별 article 목록 (keyset pagination) 용 index
+    )
     __mapper_args__ = {'confirm_deleted_rows': False}
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey('tb_user.id'))
     article_id = Column(Integer, ForeignKey('tb_article.id'))
+    tag_id = Column(Integer, ForeignKey('tb_tag.id')) # TagDictionary.id (migration 이전에 등록된 tag 는 null)
     tagging = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now)
@@ -63,8 +74,30 @@ class Tag(Base):
     article = relationship("Article", back_populates='tags')
     user = relationship('User', back_populates='tags')
 
+class TagDictionary(Base):
+    """ Tag 이름 사전 - 같은 이름의 tag 는 하나의 id 를 공유한다. """
+    __tablename__ = "tb_tag"
+
+    id = Column(Integer, primary_key=True, index=True)
+    tagging = Column(String(255), nullable=False, unique=True)
+    created_at = Column(DateTime, default=datetime.now)
+
+class TagCount(Base):
+    """
+    일자별 tag 가 붙은 article 수 - 인기 tag 조회 용
+    Tag 등록 시 등록 일자의 수를 증가시키고, 삭제 시 해당 tag 를 등록한 일자의 수를 감소시킨다.
+    """
+    __tablename__ = "tb_tag_count"
+
+    count_date = Column(Date, primary_key=True)
+    tag_id = Column(Integer, ForeignKey('tb_tag.id'), primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)
+
 class AttachedFile(Base):
     __tablename__ = "tb_article_attached_file"
+    __table_args__ = (
+        Index('idx_article_attached_file_s3_key', 's3_key'), # 저장소 key 로 첨부파일 확인 (presigned upload 중복 등록 방지) 용 index
+    )
     __mapper_args__ = {'confirm_deleted_rows': False}
 
     id = Column(Integer, primary_key=True, index=True)
@@ -75,10 +108,25 @@ class AttachedFile(Base):
     filename = Column(String(255), nullable=False)
     file_size = Column(Integer, nullable=False, default=0)
     file_type = Column(String(255), nullable=False)
+    content_hash = Column(String(64)) # 내용(sha256) 기준으로 저장된 file 인 경우 AttachedFileBlob.content_hash
     is_deleted = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.now)
     deleted_at = Column(DateTime, default=datetime.now)
 
 
     article = relationship("Article", back_populates='files')
-    user = relationship('User', back_populates='files')
\ No newline at end of file
+    user = relationship('User', back_populates='files')
+
+class AttachedFileBlob(Base):
+    """
+    내용이 같은 첨부파일이 공유하는 저장소 object
+    ref_count 는 이 object 를 참조하는 AttachedFile 수이며, 0 이 되면 commit 이후 row lock 을 잡고 다시 확인한 뒤 row 와 object 를 삭제한다.
+    """
+    __tablename__ = "tb_article_attached_file_blob"
+
+    content_hash = Column(String(64), primary_key=True)
+    s3_bucket_name = Column(String(255), nullable=False)
+    s3_key = Column(String(255), nullable=False)
+    file_size = Column(Integer, nullable=False, default=0)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.now)
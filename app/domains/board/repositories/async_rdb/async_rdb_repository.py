@@ -0,0 +1,524 @@
+import inspect
+
+from collections import defaultdict
+from datetime import date, datetime
+from sqlalchemy import and_, case, delete, desc, func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import aliased, joinedload
+from typing import Dict, List, Optional, Tuple
+
+from app.domains.board.models import (
+    Article,
+    AttachedFile,
+    AttachedFileBlob,
+    Comment,
+    Tag,
+    TagCount,
+    TagDictionary
+)
+from app.domains.user.models import User
+from app.domains.board.repositories.repository import (
+    ArticleRepository,
+    AttachedFileRepository,
+    CommentRepository,
+    TagRepository
+)
+from app.domains.board.repositories.rdb.rdb_repository import (
+    LAST_ROW_ID_DIALECTS,
+    check_auto_increment_lock_mode,
+    make_inserted_ids
+)
+
+# AsyncSession 에서는 lazy load 를 할 수 없으므로 응답에 필요한 relationship 은 모두 eager load 한다
+
+class ArticleAsyncRdbRepository(ArticleRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_list(self, page: int, size: int):
+        offset = (page - 1) * size
+        query = (
+            select(Article)
+            .options(joinedload(Article.user))
+            .where(Article.is_deleted == False)
+            .order_by(desc(Article.id))
+            .offset(offset)
+            .limit(size)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_list_by_cursor(self, after_id: Optional[int], size: int):
+        query = (
+            select(Article)
+            .options(joinedload(Article.user))
+            .where(Article.is_deleted == False)
+        )
+        if after_id is not None:
+            query = query.where(Article.id < after_id)
+        result = await self.session.execute(query.order_by(desc(Article.id)).limit(size))
+        return result.scalars().all()
+
+    async def get_list_by_tag(self, tag_id: int, after_id: Optional[int], size: int):
+        query = (
+            select(Article)
+            .options(joinedload(Article.user))
+            .join(Tag, Tag.article_id == Article.id)
+            .where(Tag.tag_id == tag_id, Article.is_deleted == False)
+        )
+        if after_id is not None:
+            query = query.where(Tag.article_id < after_id)
+        result = await self.session.execute(query.order_by(desc(Tag.article_id)).limit(size))
+        return result.scalars().all()
+
+    async def get_detail(self, article_id: int):
+        query = select(Article).options(joinedload(Article.user)).where(Article.id == article_id)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def get_list_by_ids(self, article_ids: List[int]):
+        query = (
+            select(Article)
+            .options(joinedload(Article.user))
+            .where(Article.id.in_(article_ids))
+            .where(Article.is_deleted == False)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def create(self, article: Article):
+        self.session.add(article)
+        await self.session.flush() # 새로 생성되는 ID값 생성을 위해 flush
+        return article
+
+    async def bulk_create(self, articles: List[dict]) -> List[int]:
+        # ArticleRdbRepository.bulk_create 참고
+        query = insert(Article)
+        dialect = self.session.get_bind(clause=query).dialect
+        if dialect.name not in LAST_ROW_ID_DIALECTS:
+            result = await self.session.execute(query.returning(Article.id, sort_by_parameter_order=True), articles)
+            return list(result.scalars().all())
+
+        result = await self.session.execute(query.values(articles))
+        step = await self._get_auto_increment_step(dialect_name=dialect.name)
+        return make_inserted_ids(dialect_name=dialect.name, last_row_id=result.lastrowid, count=len(articles), step=step)
+
+    async def _get_auto_increment_step(self, dialect_name: str) -> int:
+        if dialect_name != 'mysql':
+            return 1
+        lock_mode, step = (await self.session.execute(text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment"))).one()
+        check_auto_increment_lock_mode(lock_mode=lock_mode)
+        return step
+
+    async def update(self, article_id: int, update_article: Article):
+        update_dict = {
+            'updated_at': datetime.now()
+        }
+        if update_article.title is not None and update_article.title != '':
+            update_dict.update({'title': update_article.title})
+        if update_article.content is not None and update_article.content != '':
+            update_dict.update({'content': update_article.content})
+
+        query = (
+            update(Article)
+            .where(Article.id == article_id)
+            .values(**update_dict)
+        )
+        await self.session.execute(query)
+
+    async def delete(self, article: Article):
+        query = (
+            update(Article)
+            .where(Article.id == article.id)
+            .values(
+                is_deleted=True,
+                deleted_at=datetime.now(),
+                # 댓글 / tag / 첨부파일은 article 과 함께 삭제된다
+                comment_count=0,
+                attachment_count=0,
+                tag_count=0
+            )
+        )
+        await self.session.execute(query)
+
+    async def increase_counts(self, article_id: int, comment_count: int = 0, attachment_count: int = 0, tag_count: int = 0):
+        values = {
+            column.key: column + delta
+            for column, delta in ((Article.comment_count, comment_count), (Article.attachment_count, attachment_count), (Article.tag_count, tag_count))
+            if delta != 0
+        }
+        if len(values) > 0:
+            await self.session.execute(update(Article).where(Article.id == article_id).values(**values))
+
+    @staticmethod
+    def _count_subqueries() -> dict:
+        """ Article 별 실제 댓글 / 첨부파일 / tag 수 (correlated subquery) """
+        return {
+            'comment_count': select(func.count(Comment.id)).where(Comment.article_id == Article.id, Comment.is_deleted == False).scalar_subquery(),
+            'attachment_count': select(func.count(AttachedFile.id)).where(AttachedFile.article_id == Article.id, AttachedFile.is_deleted == False).scalar_subquery(),
+            'tag_count': select(func.count(Tag.id)).where(Tag.article_id == Article.id).scalar_subquery()
+        }
+
+    async def reconcile_counts(self, after_id: int, size: int) -> Tuple[List[int], int]:
+        query = select(Article.id).where(Article.id > after_id).order_by(Article.id).limit(size)
+        article_ids = (await self.session.execute(query)).scalars().all()
+        if len(article_ids) == 0:
+            return [], 0
+
+        counts = self._count_subqueries()
+        query = select(Article.id).where(
+            Article.id.between(article_ids[0], article_ids[-1]),
+            or_(*[getattr(Article, key) != count for key, count in counts.items()])
+        )
+        fixed_ids = (await self.session.execute(query)).scalars().all()
+        if len(fixed_ids) > 0:
+            # 조회 이후 변경된 댓글 등이 반영되도록 UPDATE 시점에 다시 집계한다
+            await self.session.execute(update(Article).where(Article.id.in_(fixed_ids)).values(**counts))
+        return article_ids, len(fixed_ids)
+
+    async def iter_export(self, batch_size: int):
+        # ArticleRdbRepository.iter_export 참고 - session 의 bind(replica 포함)로 별도 connection 을 열어 stream 한다
+        query = (
+            select(Article.id, Article.user_id, User.username, Article.title, Article.content, Article.created_at, Article.updated_at)
+            .outerjoin(User, User.id == Article.user_id)
+            .where(Article.is_deleted == False)
+            .order_by(Article.id)
+        )
+        async with AsyncEngine(self.session.get_bind()).connect() as connection:
+            result = await connection.stream(query.execution_options(yield_per=batch_size))
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+
+class CommentAsyncRdbRepository(CommentRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _list_query(self, article_id: int):
+        return (
+            select(Comment)
+            .options(joinedload(Comment.user))
+            .where(Comment.article_id == article_id)
+            .where(Comment.is_deleted == False)
+            .order_by(Comment.thread_id, Comment.id)
+        )
+
+    async def get_list(self, article_id: int, page: int, size: int):
+        offset = (page - 1) * size
+        result = await self.session.execute(self._list_query(article_id=article_id).offset(offset).limit(size))
+        return result.scalars().all()
+
+    async def get_list_by_cursor(self, article_id: int, after: Optional[List[int]], size: int):
+        query = self._list_query(article_id=article_id)
+        if after is not None:
+            after_thread_id, after_id = after
+            query = query.where(
+                Comment.thread_id >= after_thread_id,
+                or_(Comment.thread_id > after_thread_id, Comment.id > after_id)
+            )
+        result = await self.session.execute(query.limit(size))
+        return result.scalars().all()
+
+    async def get_detail(self, comment_id: int):
+        query = select(Comment).options(joinedload(Comment.user)).where(Comment.id == comment_id)
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def create(self, comment: Comment):
+        if comment.thread_id is not None:
+            self.session.add(comment)
+            await self.session.flush()
+            return comment
+
+        # 최상위 댓글은 자신의 일련 번호가 thread_id 가 된다
+        # (thread_id 는 not null 이므로 insert 시에는 0 으로 저장한 뒤 같은 transaction 에서 갱신한다)
+        comment.thread_id = 0
+        self.session.add(comment)
+        await self.session.flush()
+        comment.thread_id = comment.id
+        await self.session.flush()
+        return comment
+
+    async def update(self, comment_id: int, comment: Comment):
+        query = (
+            update(Comment)
+            .where(Comment.id == comment_id)
+            .values(
+                content=comment.content,
+                updated_at=datetime.now()
+            )
+        )
+        await self.session.execute(query)
+
+    async def delete(self, comment: Comment) -> int:
+        query = (
+            update(Comment)
+            .where(Comment.id == comment.id, Comment.is_deleted == False)
+            .values(
+                is_deleted=True,
+                deleted_at=datetime.now()
+            )
+        )
+        return (await self.session.execute(query)).rowcount
+
+    async def delete_all(self, article_id: int) -> int:
+        query = (
+            update(Comment)
+            .where(Comment.article_id == article_id, Comment.is_deleted == False)
+            .values(
+                is_deleted=True,
+                deleted_at=datetime.now()
+            )
+        )
+        return (await self.session.execute(query)).rowcount
+
+    async def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        query = (
+            select(Comment.id, Comment.article_id, Comment.comment_id, Comment.thread_id, Comment.level, Comment.user_id, User.username, Comment.content, Comment.created_at, Comment.updated_at)
+            .outerjoin(User, User.id == Comment.user_id)
+            .where(Comment.article_id.in_(article_ids))
+            .where(Comment.is_deleted == False)
+            .order_by(Comment.article_id, Comment.thread_id, Comment.id)
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+    async def backfill_thread_ids(self, size: int) -> int:
+        """
+        최상위 댓글을 먼저 채운 뒤, thread_id 가 채워진 댓글의 답글에 부모 댓글의 thread_id 를 채운다.
+        (migration 이전에 등록된 대댓글의 답글은 호출을 반복하면서 한 단계씩 채워진다)
+        """
+        query = select(Comment.id).where(Comment.thread_id.is_(None), Comment.comment_id.is_(None)).order_by(Comment.id).limit(size)
+        comment_ids = (await self.session.execute(query)).scalars().all()
+        if len(comment_ids) > 0:
+            await self.session.execute(update(Comment).where(Comment.id.in_(comment_ids)).values(thread_id=Comment.id))
+            return len(comment_ids)
+
+        # 부모 댓글이 없는 답글은 부모 댓글 일련 번호를 thread_id 로 사용한다
+        parent = aliased(Comment)
+        query = (
+            select(Comment.id, func.coalesce(parent.thread_id, Comment.comment_id))
+            .outerjoin(parent, parent.id == Comment.comment_id)
+            .where(Comment.thread_id.is_(None))
+            .where(or_(parent.id.is_(None), parent.thread_id.is_not(None)))
+            .order_by(Comment.id)
+            .limit(size)
+        )
+        thread_ids = dict((await self.session.execute(query)).all())
+        if len(thread_ids) > 0:
+            await self.session.execute(
+                update(Comment).where(Comment.id.in_(thread_ids.keys())).values(thread_id=case(thread_ids, value=Comment.id))
+            )
+        return len(thread_ids)
+
+
+class TagAsyncRdbRepository(TagRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_list(self, article_id: int):
+        query = select(Tag).options(joinedload(Tag.user)).where(Tag.article_id == article_id)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_detail(self, tag_id: int):
+        result = await self.session.execute(select(Tag).where(Tag.id == tag_id))
+        return result.scalars().first()
+
+    async def create(self, tags: List[dict]):
+        await self.session.execute(insert(Tag), tags)
+
+    async def delete(self, tag: Tag):
+        await self.session.delete(tag)
+
+    async def delete_all(self, article_id: int):
+        await self.session.execute(delete(Tag).where(Tag.article_id == article_id))
+
+    async def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        query = select(Tag.article_id, Tag.tagging).where(Tag.article_id.in_(article_ids)).order_by(Tag.article_id, Tag.id)
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_tag_id(self, tagging: str) -> Optional[int]:
+        result = await self.session.execute(select(TagDictionary.id).where(TagDictionary.tagging == tagging))
+        return result.scalar()
+
+    async def get_or_create_tag_ids(self, taggings: List[str]) -> Dict[str, int]:
+        taggings = set(taggings)
+        query = select(TagDictionary.tagging, TagDictionary.id).where(TagDictionary.tagging.in_(taggings))
+        tag_ids = {row.tagging: row.id for row in await self.session.execute(query)}
+        missing = sorted(taggings - tag_ids.keys())
+        if len(missing) == 0:
+            return tag_ids
+
+        created_at = datetime.now()
+        try:
+            async with self.session.begin_nested():
+                await self.session.execute(insert(TagDictionary), [{'tagging': t, 'created_at': created_at} for t in missing])
+        except IntegrityError:
+            # 동시에 같은 이름의 tag 가 먼저 생성된 경우 - 없는 tag 만 하나씩 다시 생성한다
+            for tagging in missing:
+                try:
+                    async with self.session.begin_nested():
+                        await self.session.execute(insert(TagDictionary).values(tagging=tagging, created_at=created_at))
+                except IntegrityError:
+                    pass
+        # 다른 transaction 이 commit 한 row 도 읽도록 locking read 로 조회한다
+        query = select(TagDictionary.tagging, TagDictionary.id).where(TagDictionary.tagging.in_(missing)).with_for_update(read=True)
+        tag_ids.update({row.tagging: row.id for row in await self.session.execute(query)})
+        return tag_ids
+
+    async def _add_counts(self, count_date: date, deltas: Dict[int, int]) -> int:
+        result = await self.session.execute(
+            update(TagCount)
+            .where(TagCount.count_date == count_date, TagCount.tag_id.in_(deltas))
+            .values(article_count=TagCount.article_count + case(deltas, value=TagCount.tag_id))
+        )
+        return result.rowcount
+
+    async def update_counts(self, counts: Dict[Tuple[date, int], int]):
+        # 일자별로 한 번에 갱신한다 (한 statement 가 PK 순서로 lock 을 잡으므로 transaction 간 lock 순서가 같다)
+        deltas_by_date = defaultdict(dict)
+        for (count_date, tag_id), delta in counts.items():
+            if delta != 0:
+                deltas_by_date[count_date][tag_id] = delta
+
+        for count_date, deltas in sorted(deltas_by_date.items()):
+            if await self._add_counts(count_date=count_date, deltas=deltas) == len(deltas):
+                continue
+            query = select(TagCount.tag_id).where(TagCount.count_date == count_date, TagCount.tag_id.in_(deltas))
+            existing = set((await self.session.execute(query)).scalars())
+            missing = {tag_id: delta for tag_id, delta in deltas.items() if tag_id not in existing}
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(insert(TagCount), [
+                        {'count_date': count_date, 'tag_id': tag_id, 'article_count': delta} for tag_id, delta in sorted(missing.items())
+                    ])
+            except IntegrityError:
+                # 동시에 같은 일자 / tag 의 row 가 먼저 생성된 경우 - row 마다 다시 생성 또는 증감한다
+                for tag_id, delta in sorted(missing.items()):
+                    try:
+                        async with self.session.begin_nested():
+                            await self.session.execute(insert(TagCount).values(count_date=count_date, tag_id=tag_id, article_count=delta))
+                    except IntegrityError:
+                        await self._add_counts(count_date=count_date, deltas={tag_id: delta})
+
+    async def get_trending_list(self, since: date, size: int) -> List[dict]:
+        article_count = func.sum(TagCount.article_count).label('article_count')
+        query = (
+            select(TagDictionary.tagging, article_count)
+            .join(TagDictionary, TagDictionary.id == TagCount.tag_id)
+            .where(TagCount.count_date >= since)
+            .group_by(TagCount.tag_id, TagDictionary.tagging)
+            .having(func.sum(TagCount.article_count) > 0)
+            .order_by(desc(article_count), TagCount.tag_id)
+            .limit(size)
+        )
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
+
+
+class AttachedFileAsyncRdbRepository(AttachedFileRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_list(self, article_id: int):
+        query = select(AttachedFile).where(and_(
+            AttachedFile.article_id == article_id,
+            AttachedFile.is_deleted == False
+        ))
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_detail(self, attached_file_id: int):
+        result = await self.session.execute(select(AttachedFile).where(AttachedFile.id == attached_file_id))
+        return result.scalars().first()
+
+    async def create(self, attached_file: AttachedFile):
+        self.session.add(attached_file)
+        await self.session.flush()
+        return attached_file
+
+    async def delete(self, attached_file: AttachedFile):
+        try:
+            await self.session.delete(attached_file)
+        except Exception as ex:
+            class_name = self.__class__.__name__
+            method_name = inspect.currentframe().f_code.co_name
+            print(f'[EX] {class_name}.{method_name} : ', str(ex.args))
+            raise ex
+
+    async def delete_all(self, article_id: int):
+        try:
+            await self.session.execute(delete(AttachedFile).where(AttachedFile.article_id == article_id))
+        except Exception as ex:
+            class_name = self.__class__.__name__
+            method_name = inspect.currentframe().f_code.co_name
+            print(f'[EX] {class_name}.{method_name} : ', str(ex.args))
+            raise ex
+
+    async def exists_by_s3_key(self, s3_key: str) -> bool:
+        # 다른 transaction 에서 commit 된 row 도 확인하고, 같은 key 의 동시 등록은 대기하도록 locking read
+        query = select(AttachedFile.id).where(AttachedFile.s3_key == s3_key).limit(1).with_for_update()
+        return (await self.session.execute(query)).first() is not None
+
+    async def _increase_blob_ref_count(self, content_hash: str) -> int:
+        result = await self.session.execute(
+            update(AttachedFileBlob)
+            .where(AttachedFileBlob.content_hash == content_hash)
+            .values(ref_count=AttachedFileBlob.ref_count + 1)
+        )
+        return result.rowcount
+
+    async def acquire_blob(self, blob: AttachedFileBlob) -> bool:
+        """
+        Blob 참조 수 증가 (없으면 생성)
+        :return: row 를 새로 생성한 경우 True - 참조가 없어져 object 가 삭제된 직후일 수 있으므로 object 를 확인해야 한다
+        """
+        if await self._increase_blob_ref_count(content_hash=blob.content_hash) > 0:
+            return False
+
+        try:
+            async with self.session.begin_nested():
+                blob.ref_count = 1
+                self.session.add(blob)
+        except IntegrityError:
+            # 동시에 같은 내용의 file 이 첨부되어 먼저 생성된 경우
+            await self._increase_blob_ref_count(content_hash=blob.content_hash)
+            return False
+        return True
+
+    async def release_blob(self, content_hash: str) -> bool:
+        """
+        Blob 참조 수 감소
+        Row 는 바로 삭제하지 않고, commit 이후 get_unreferenced_blob 으로 lock 을 잡고 다시 확인한 뒤 object 와 함께 삭제한다.
+        :return: 더 이상 참조하는 첨부파일이 없는 경우 True
+        """
+        await self.session.execute(
+            update(AttachedFileBlob)
+            .where(AttachedFileBlob.content_hash == content_hash)
+            .values(ref_count=AttachedFileBlob.ref_count - 1)
+        )
+        ref_count = (await self.session.execute(
+            select(AttachedFileBlob.ref_count).where(AttachedFileBlob.content_hash == content_hash)
+        )).scalar()
+        return ref_count is not None and ref_count <= 0
+
+    async def get_unreferenced_blob(self, content_hash: str) -> Optional[AttachedFileBlob]:
+        """
+        참조가 없는 blob 을 row lock 을 잡고 조회
+        Lock 을 잡은 동안 같은 내용의 첨부파일은 참조 수를 증가시키지 못하며, 그 사이 다시 참조된 경우 None
+        """
+        query = select(AttachedFileBlob).where(and_(
+            AttachedFileBlob.content_hash == content_hash,
+            AttachedFileBlob.ref_count <= 0
+        )).with_for_update()
+        return (await self.session.execute(query)).scalars().first()
+
+    async def delete_blob(self, content_hash: str):
+        await self.session.execute(delete(AttachedFileBlob).where(AttachedFileBlob.content_hash == content_hash))
@@ -0,0 +1,72 @@
+import uuid
+
+from redis import Redis
+from redis.exceptions import WatchError
+from typing import Optional, Tuple
+
+from app.common.constants import CACHE_KEY_PREFIX
+from app.domains.board.repositories.repository import ArticleCacheRepository
+
+class ArticleCacheRedisRepository(ArticleCacheRepository):
+    """
+    Article 상세 조회 결과(ArticleData JSON) cache
+    hit / miss 건수는 worker 간 공유를 위해 redis hash 에 누적한다.
+
+    삭제(무효화) 시 article 별 version 을 새 값으로 바꾸고, 조회 시점의 version 이 그대로인 경우에만 저장한다.
+    (무효화 이전에 DB 에서 읽은 값이 무효화 이후에 저장되는 stale set 방지)
+    """
+
+    VERSION_EXPIRES = 60 * 60 * 24 # 무효화 version 유지 시간(초) - cache miss 시 DB 조회 시간보다 충분히 길어야 한다
+
+    def __init__(self, redis_client: Redis):
+        self._redis_client = redis_client
+
+    @staticmethod
+    def _detail_key(article_id: int) -> str:
+        return f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL']}:{article_id}"
+
+    @staticmethod
+    def _version_key(article_id: int) -> str:
+        return f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL_VERSION']}:{article_id}"
+
+    def get_detail(self, article_id: int) -> Tuple[Optional[str], Optional[str]]:
+        # 조회 / version / 조회 건수를 한 번의 round trip 으로 처리 (miss 건수는 miss 인 경우에만 추가로 누적)
+        # 조회 건수 - miss 건수로 hit 건수를 계산하며, 이전 hit / miss field 와 섞이지 않도록 별도 field 를 사용한다
+        pipeline = self._redis_client.pipeline(transaction=False)
+        pipeline.get(name=self._detail_key(article_id))
+        pipeline.get(name=self._version_key(article_id))
+        pipeline.hincrby(name=CACHE_KEY_PREFIX['ARTICLE_DETAIL_STATS'], key="lookup", amount=1)
+        value, version, _ = pipeline.execute()
+
+        if value is None:
+            self._redis_client.hincrby(name=CACHE_KEY_PREFIX['ARTICLE_DETAIL_STATS'], key="lookup_miss", amount=1)
+        return value, version
+
+    def set_detail(self, article_id: int, value: str, version: Optional[str], exp: int = 0) -> bool:
+        version_key = self._version_key(article_id)
+        with self._redis_client.pipeline() as pipeline:
+            try:
+                # 조회 이후 무효화되었거나 저장하는 동안 무효화되면 저장하지 않는다
+                pipeline.watch(version_key)
+                if pipeline.get(version_key) != version:
+                    return False
+                pipeline.multi()
+                pipeline.set(name=self._detail_key(article_id), value=value, ex=exp if exp > 0 else None)
+                pipeline.execute()
+                return True
+            except WatchError:
+                return False
+
+    def delete_detail(self, article_id: int):
+        pipeline = self._redis_client.pipeline(transaction=False)
+        pipeline.set(name=self._version_key(article_id), value=uuid.uuid4().hex, ex=self.VERSION_EXPIRES)
+        pipeline.delete(self._detail_key(article_id))
+        pipeline.execute()
+
+    def get_stats(self) -> dict:
+        stats = self._redis_client.hgetall(name=CACHE_KEY_PREFIX['ARTICLE_DETAIL_STATS'])
+        miss = int(stats.get('lookup_miss', 0))
+        return {
+            'hit': int(stats.get('lookup', 0)) - miss,
+            'miss': miss
+        }
@@ -1,18 +1,24 @@
 import inspect
 
-from datetime import datetime
-from sqlalchemy import select, and_, desc, update
+from collections import defaultdict
+from datetime import date, datetime
+from sqlalchemy import select, and_, case, delete, desc, func, insert, or_, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import (
     aliased,
+    joinedload,
     Session
 )
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from app.domains.board.models import (
     Article,
     AttachedFile,
+    AttachedFileBlob,
     Comment,
-    Tag
+    Tag,
+    TagCount,
+    TagDictionary
 )
 from app.domains.user.models import User
 from app.domains.board.repositories.repository import (
@@ -24,6 +30,26 @@ from app.domains.board.repositories.repository import (
 from app.domains.board.schemas import ArticleUpsert
 from app.utils.debug_utils import dpp
 
+# RETURNING 을 입력 순서대로 받으려면 row 단위 INSERT 로 바뀌는 DB - 마지막 INSERT id 로 생성된 id 를 계산한다
+LAST_ROW_ID_DIALECTS = ('mysql', 'sqlite')
+
+def check_auto_increment_lock_mode(lock_mode: int):
+    """
+    innodb_autoinc_lock_mode 가 2(interleaved)이면 한 INSERT 의 id 가 연속으로 할당되지 않을 수 있으므로 대량 등록을 중단한다.
+    (MariaDB 기본값 1, MySQL 8 기본값 2)
+    """
+    if lock_mode > 1:
+        raise RuntimeError(f"Bulk insert requires innodb_autoinc_lock_mode <= 1 (current: {lock_mode})")
+
+def make_inserted_ids(dialect_name: str, last_row_id: int, count: int, step: int) -> List[int]:
+    """
+    한 multi-row INSERT 로 생성된 id 목록 (입력 순서)
+    MySQL 의 LAST_INSERT_ID() 는 첫 row 의 id, SQLite 의 last_insert_rowid() 는 마지막 row 의 id 이다.
+    """
+    first_id = last_row_id if dialect_name == 'mysql' else last_row_id - step * (count - 1)
+    return [first_id + step * i for i in range(count)]
+
+
 class ArticleRdbRepository(ArticleRepository):
 
     def __init__(self, session: Session):
@@ -31,17 +57,83 @@ class ArticleRdbRepository(ArticleRepository):
 
     def get_list(self, page: int, size: int):
         offset = (page - 1) * size
-        return self.session.query(Article).filter(Article.is_deleted == False).order_by(desc(Article.id)).offset(offset).limit(size).all()
-
+        return self.session.query(Article) \
+            .options(joinedload(Article.user)) \
+            .filter(Article.is_deleted == False) \
+            .order_by(desc(Article.id)) \
+            .offset(offset) \
+            .limit(size) \
+            .all()
+
+    def get_list_by_cursor(self, after_id: Optional[int], size: int):
+        """
+        Keyset pagination - OFFSET 대신 PK 기준으로 seek 하므로 page 깊이와 무관하게 일정한 비용으로 조회된다.
+        :param after_id: 이전 page의 마지막 article id (None이면 첫 page)
+        :param size:
+        :return:
+        """
+        query = self.session.query(Article).options(joinedload(Article.user)).filter(Article.is_deleted == False)
+        if after_id is not None:
+            query = query.filter(Article.id < after_id)
+        return query.order_by(desc(Article.id)).limit(size).all()
+
+    def get_list_by_tag(self, tag_id: int, after_id: Optional[int], size: int):
+        """
+        Tag 별 article 목록 (Keyset pagination) - tb_article_tag (tag_id, article_id) index 를 article id 역순으로 seek 한다.
+        :param tag_id: TagDictionary.id
+        :param after_id: 이전 page의 마지막 article id (None이면 첫 page)
+        :param size:
+        :return:
+        """
+        query = (
+            self.session.query(Article)
+            .options(joinedload(Article.user))
+            .join(Tag, Tag.article_id == Article.id)
+            .filter(Tag.tag_id == tag_id, Article.is_deleted == False)
+        )
+        if after_id is not None:
+            query = query.filter(Tag.article_id < after_id)
+        return query.order_by(desc(Tag.article_id)).limit(size).all()
 
     def get_detail(self, article_id: int):
-        return self.session.query(Article).filter(Article.id == article_id).first()
+        return self.session.query(Article).options(joinedload(Article.user)).filter(Article.id == article_id).first()
+
+    def get_list_by_ids(self, article_ids: List[int]):
+        return self.session.query(Article) \
+            .options(joinedload(Article.user)) \
+            .filter(Article.id.in_(article_ids)) \
+            .filter(Article.is_deleted == False) \
+            .all()
 
     def create(self, article: Article):
         self.session.add(article)
         self.session.flush() # 새로 생성되는 ID값 생성을 위해 flush
         return article
 
+    def bulk_create(self, articles: List[dict]) -> List[int]:
+        """
+        Batch 를 하나의 multi-row INSERT 로 저장한다.
+        MySQL / SQLite 는 한 INSERT 안에서 연속으로 할당된 auto increment id 를 계산하고,
+        그 외 DB 는 RETURNING 으로 입력(parameter) 순서대로 id 를 받는다.
+        """
+        query = insert(Article)
+        dialect = self.session.get_bind(clause=query).dialect
+        if dialect.name not in LAST_ROW_ID_DIALECTS:
+            result = self.session.execute(query.returning(Article.id, sort_by_parameter_order=True), articles)
+            return list(result.scalars().all())
+
+        result = self.session.execute(query.values(articles))
+        step = self._get_auto_increment_step(dialect_name=dialect.name)
+        return make_inserted_ids(dialect_name=dialect.name, last_row_id=result.lastrowid, count=len(articles), step=step)
+
+    def _get_auto_increment_step(self, dialect_name: str) -> int:
+        """ 한 INSERT 안에서 할당되는 auto increment id 간격 (INSERT 이후 호출 - primary 에서 조회) """
+        if dialect_name != 'mysql':
+            return 1
+        lock_mode, step = self.session.execute(text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")).one()
+        check_auto_increment_lock_mode(lock_mode=lock_mode)
+        return step
+
     def update(self, article_id: int, update_article: Article):
         update_dict = {
             'updated_at': datetime.now()
@@ -64,30 +156,121 @@ class ArticleRdbRepository(ArticleRepository):
             .where(Article.id == article.id)
             .values(
                 is_deleted=True,
-                deleted_at=datetime.now()
+                deleted_at=datetime.now(),
+                # 댓글 / tag / 첨부파일은 article 과 함께 삭제된다
+                comment_count=0,
+                attachment_count=0,
+                tag_count=0
             )
         )
         self.session.execute(query)
 
+    def increase_counts(self, article_id: int, comment_count: int = 0, attachment_count: int = 0, tag_count: int = 0):
+        values = {
+            column.key: column + delta
+            for column, delta in ((Article.comment_count, comment_count), (Article.attachment_count, attachment_count), (Article.tag_count, tag_count))
+            if delta != 0
+        }
+        if len(values) > 0:
+            self.session.execute(update(Article).where(Article.id == article_id).values(**values))
+
+    @staticmethod
+    def _count_subqueries() -> dict:
+        """ Article 별 실제 댓글 / 첨부파일 / tag 수 (correlated subquery) """
+        return {
+            'comment_count': select(func.count(Comment.id)).where(Comment.article_id == Article.id, Comment.is_deleted == False).scalar_subquery(),
+            'attachment_count': select(func.count(AttachedFile.id)).where(AttachedFile.article_id == Article.id, AttachedFile.is_deleted == False).scalar_subquery(),
+            'tag_count': select(func.count(Tag.id)).where(Tag.article_id == Article.id).scalar_subquery()
+        }
+
+    def reconcile_counts(self, after_id: int, size: int) -> Tuple[List[int], int]:
+        query = select(Article.id).where(Article.id > after_id).order_by(Article.id).limit(size)
+        article_ids = self.session.execute(query).scalars().all()
+        if len(article_ids) == 0:
+            return [], 0
+
+        counts = self._count_subqueries()
+        query = select(Article.id).where(
+            Article.id.between(article_ids[0], article_ids[-1]),
+            or_(*[getattr(Article, key) != count for key, count in counts.items()])
+        )
+        fixed_ids = self.session.execute(query).scalars().all()
+        if len(fixed_ids) > 0:
+            # 조회 이후 변경된 댓글 등이 반영되도록 UPDATE 시점에 다시 집계한다
+            self.session.execute(update(Article).where(Article.id.in_(fixed_ids)).values(**counts))
+        return article_ids, len(fixed_ids)
+
+    def iter_export(self, batch_size: int):
+        """
+        Server-side cursor(stream_results) 로 batch_size 건씩 읽으므로 전체 건수와 무관하게 일정한 memory 를 사용한다.
+        Cursor 를 읽는 동안 같은 connection 으로 다른 query 를 실행할 수 없으므로(MySQL) session 과 별도의 connection 을 사용한다.
+        """
+        query = (
+            select(Article.id, Article.user_id, User.username, Article.title, Article.content, Article.created_at, Article.updated_at)
+            .outerjoin(User, User.id == Article.user_id)
+            .where(Article.is_deleted == False)
+            .order_by(Article.id)
+        )
+        with self.session.get_bind().connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(query)
+            for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
 
 class CommentRdbRepository(CommentRepository):
 
     def __init__(self, session: Session):
         self.session = session
 
-    def get_list(self, article_id: int, page: int, size: int):
-        query = self.session.query(Comment) \
+    def _list_query(self, article_id: int):
+        """
+        Thread 단위 정렬 - 최상위 댓글 다음에 해당 댓글의 대댓글이 작성 순서대로 위치한다.
+        (article_id, is_deleted, thread_id, id) index를 그대로 타도록 정렬 key는 실제 column만 사용한다.
+        """
+        return self.session.query(Comment) \
+            .options(joinedload(Comment.user)) \
             .filter(Comment.article_id == article_id) \
             .filter(Comment.is_deleted == False) \
-            .order_by(desc(Comment.article_id), Comment.level)
-        return query.all()
+            .order_by(Comment.thread_id, Comment.id)
+
+    def get_list(self, article_id: int, page: int, size: int):
+        offset = (page - 1) * size
+        return self._list_query(article_id=article_id).offset(offset).limit(size).all()
+
+    def get_list_by_cursor(self, article_id: int, after: Optional[List[int]], size: int):
+        """
+        Keyset pagination
+        :param article_id:
+        :param after: 이전 page 마지막 댓글의 [thread_id, id] (None이면 첫 page)
+        :param size:
+        :return:
+        """
+        query = self._list_query(article_id=article_id)
+        if after is not None:
+            after_thread_id, after_id = after
+            # thread_id >= 조건을 선행시켜 index range scan 이 되도록 한다
+            query = query.filter(
+                Comment.thread_id >= after_thread_id,
+                or_(Comment.thread_id > after_thread_id, Comment.id > after_id)
+            )
+        return query.limit(size).all()
 
     def get_detail(self, comment_id: int):
-        return self.session.query(Comment).filter(Comment.id == comment_id).first()
+        return self.session.query(Comment).options(joinedload(Comment.user)).filter(Comment.id == comment_id).first()
 
     def create(self, comment: Comment):
+        if comment.thread_id is not None:
+            self.session.add(comment)
+            self.session.flush()
+            return comment
+
+        # 최상위 댓글은 자신의 일련 번호가 thread_id 가 된다
+        # (thread_id 는 not null 이므로 insert 시에는 0 으로 저장한 뒤 같은 transaction 에서 갱신한다)
+        comment.thread_id = 0
         self.session.add(comment)
         self.session.flush()
+        comment.thread_id = comment.id
+        self.session.flush()
         return comment
 
     def update(self, comment_id: int, comment: Comment):
@@ -101,27 +284,63 @@ class CommentRdbRepository(CommentRepository):
         )
         self.session.execute(query)
 
-    def delete(self, comment: Comment):
+    def delete(self, comment: Comment) -> int:
         query = (
             update(Comment)
-            .where(Comment.id == comment.id)
+            .where(Comment.id == comment.id, Comment.is_deleted == False)
             .values(
                 is_deleted=True,
                 deleted_at=datetime.now()
             )
         )
-        self.session.execute(query)
+        return self.session.execute(query).rowcount
 
-    def delete_all(self, article_id: int):
+    def delete_all(self, article_id: int) -> int:
         query = (
             update(Comment)
-            .where(Comment.article_id == article_id)
+            .where(Comment.article_id == article_id, Comment.is_deleted == False)
             .values(
                 is_deleted=True,
                 deleted_at=datetime.now()
             )
         )
-        self.session.execute(query)
+        return self.session.execute(query).rowcount
+
+    def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        query = (
+            select(Comment.id, Comment.article_id, Comment.comment_id, Comment.thread_id, Comment.level, Comment.user_id, User.username, Comment.content, Comment.created_at, Comment.updated_at)
+            .outerjoin(User, User.id == Comment.user_id)
+            .where(Comment.article_id.in_(article_ids))
+            .where(Comment.is_deleted == False)
+            .order_by(Comment.article_id, Comment.thread_id, Comment.id)
+        )
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
+    def backfill_thread_ids(self, size: int) -> int:
+        """
+        최상위 댓글을 먼저 채운 뒤, thread_id 가 채워진 댓글의 답글에 부모 댓글의 thread_id 를 채운다.
+        (migration 이전에 등록된 대댓글의 답글은 호출을 반복하면서 한 단계씩 채워진다)
+        """
+        query = select(Comment.id).where(Comment.thread_id.is_(None), Comment.comment_id.is_(None)).order_by(Comment.id).limit(size)
+        comment_ids = self.session.execute(query).scalars().all()
+        if len(comment_ids) > 0:
+            self.session.execute(update(Comment).where(Comment.id.in_(comment_ids)).values(thread_id=Comment.id))
+            return len(comment_ids)
+
+        # 부모 댓글이 없는 답글은 부모 댓글 일련 번호를 thread_id 로 사용한다
+        parent = aliased(Comment)
+        query = (
+            select(Comment.id, func.coalesce(parent.thread_id, Comment.comment_id))
+            .outerjoin(parent, parent.id == Comment.comment_id)
+            .where(Comment.thread_id.is_(None))
+            .where(or_(parent.id.is_(None), parent.thread_id.is_not(None)))
+            .order_by(Comment.id)
+            .limit(size)
+        )
+        thread_ids = dict(self.session.execute(query).all())
+        if len(thread_ids) > 0:
+            self.session.execute(update(Comment).where(Comment.id.in_(thread_ids.keys())).values(thread_id=case(thread_ids, value=Comment.id)))
+        return len(thread_ids)
 
 class TagRdbRepository(TagRepository):
 
@@ -129,7 +348,7 @@ class TagRdbRepository(TagRepository):
         self.session = session
 
     def get_list(self, article_id: int):
-        return self.session.query(Tag).filter(Tag.article_id == article_id).all()
+        return self.session.query(Tag).options(joinedload(Tag.user)).filter(Tag.article_id == article_id).all()
 
     def get_detail(self, tag_id: int):
         return self.session.query(Tag).filter(Tag.id == tag_id).first()
@@ -143,6 +362,86 @@ class TagRdbRepository(TagRepository):
     def delete_all(self, article_id: int):
         self.session.query(Tag).filter(Tag.article_id == article_id).delete()
 
+    def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        query = select(Tag.article_id, Tag.tagging).where(Tag.article_id.in_(article_ids)).order_by(Tag.article_id, Tag.id)
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
+    def get_tag_id(self, tagging: str) -> Optional[int]:
+        return self.session.execute(select(TagDictionary.id).where(TagDictionary.tagging == tagging)).scalar()
+
+    def get_or_create_tag_ids(self, taggings: List[str]) -> Dict[str, int]:
+        taggings = set(taggings)
+        query = select(TagDictionary.tagging, TagDictionary.id).where(TagDictionary.tagging.in_(taggings))
+        tag_ids = {row.tagging: row.id for row in self.session.execute(query)}
+        missing = sorted(taggings - tag_ids.keys())
+        if len(missing) == 0:
+            return tag_ids
+
+        created_at = datetime.now()
+        try:
+            with self.session.begin_nested():
+                self.session.execute(insert(TagDictionary), [{'tagging': t, 'created_at': created_at} for t in missing])
+        except IntegrityError:
+            # 동시에 같은 이름의 tag 가 먼저 생성된 경우 - 없는 tag 만 하나씩 다시 생성한다
+            for tagging in missing:
+                try:
+                    with self.session.begin_nested():
+                        self.session.execute(insert(TagDictionary).values(tagging=tagging, created_at=created_at))
+                except IntegrityError:
+                    pass
+        # 다른 transaction 이 commit 한 row 도 읽도록 locking read 로 조회한다
+        query = select(TagDictionary.tagging, TagDictionary.id).where(TagDictionary.tagging.in_(missing)).with_for_update(read=True)
+        tag_ids.update({row.tagging: row.id for row in self.session.execute(query)})
+        return tag_ids
+
+    def _add_counts(self, count_date: date, deltas: Dict[int, int]) -> int:
+        result = self.session.execute(
+            update(TagCount)
+            .where(TagCount.count_date == count_date, TagCount.tag_id.in_(deltas))
+            .values(article_count=TagCount.article_count + case(deltas, value=TagCount.tag_id))
+        )
+        return result.rowcount
+
+    def update_counts(self, counts: Dict[Tuple[date, int], int]):
+        # 일자별로 한 번에 갱신한다 (한 statement 가 PK 순서로 lock 을 잡으므로 transaction 간 lock 순서가 같다)
+        deltas_by_date = defaultdict(dict)
+        for (count_date, tag_id), delta in counts.items():
+            if delta != 0:
+                deltas_by_date[count_date][tag_id] = delta
+
+        for count_date, deltas in sorted(deltas_by_date.items()):
+            if self._add_counts(count_date=count_date, deltas=deltas) == len(deltas):
+                continue
+            query = select(TagCount.tag_id).where(TagCount.count_date == count_date, TagCount.tag_id.in_(deltas))
+            existing = set(self.session.execute(query).scalars())
+            missing = {tag_id: delta for tag_id, delta in deltas.items() if tag_id not in existing}
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(TagCount), [
+                        {'count_date': count_date, 'tag_id': tag_id, 'article_count': delta} for tag_id, delta in sorted(missing.items())
+                    ])
+            except IntegrityError:
+                # 동시에 같은 일자 / tag 의 row 가 먼저 생성된 경우 - row 마다 다시 생성 또는 증감한다
+                for tag_id, delta in sorted(missing.items()):
+                    try:
+                        with self.session.begin_nested():
+                            self.session.execute(insert(TagCount).values(count_date=count_date, tag_id=tag_id, article_count=delta))
+                    except IntegrityError:
+                        self._add_counts(count_date=count_date, deltas={tag_id: delta})
+
+    def get_trending_list(self, since: date, size: int) -> List[dict]:
+        article_count = func.sum(TagCount.article_count).label('article_count')
+        query = (
+            select(TagDictionary.tagging, article_count)
+            .join(TagDictionary, TagDictionary.id == TagCount.tag_id)
+            .where(TagCount.count_date >= since)
+            .group_by(TagCount.tag_id, TagDictionary.tagging)
+            .having(func.sum(TagCount.article_count) > 0)
+            .order_by(desc(article_count), TagCount.tag_id)
+            .limit(size)
+        )
+        return [dict(row) for row in self.session.execute(query).mappings()]
+
 
 class AttachedFileRdbRepository(AttachedFileRepository):
 
@@ -181,3 +480,64 @@ class AttachedFileRdbRepository(AttachedFileRepository):
             method_name = inspect.currentframe().f_code.co_name
             print(f'[EX] {class_name}.{method_name} : ', str(ex.args))
             raise ex
+
+    def exists_by_s3_key(self, s3_key: str) -> bool:
+        # 다른 transaction 에서 commit 된 row 도 확인하고, 같은 key 의 동시 등록은 대기하도록 locking read
+        query = select(AttachedFile.id).where(AttachedFile.s3_key == s3_key).limit(1).with_for_update()
+        return self.session.execute(query).first() is not None
+
+    def _increase_blob_ref_count(self, content_hash: str) -> int:
+        result = self.session.execute(
+            update(AttachedFileBlob)
+            .where(AttachedFileBlob.content_hash == content_hash)
+            .values(ref_count=AttachedFileBlob.ref_count + 1)
+        )
+        return result.rowcount
+
+    def acquire_blob(self, blob: AttachedFileBlob) -> bool:
+        """
+        Blob 참조 수 증가 (없으면 생성)
+        :return: row 를 새로 생성한 경우 True - 참조가 없어져 object 가 삭제된 직후일 수 있으므로 object 를 확인해야 한다
+        """
+        if self._increase_blob_ref_count(content_hash=blob.content_hash) > 0:
+            return False
+
+        try:
+            with self.session.begin_nested():
+                blob.ref_count = 1
+                self.session.add(blob)
+        except IntegrityError:
+            # 동시에 같은 내용의 file 이 첨부되어 먼저 생성된 경우
+            self._increase_blob_ref_count(content_hash=blob.content_hash)
+            return False
+        return True
+
+    def release_blob(self, content_hash: str) -> bool:
+        """
+        Blob 참조 수 감소
+        Row 는 바로 삭제하지 않고, commit 이후 get_unreferenced_blob 으로 lock 을 잡고 다시 확인한 뒤 object 와 함께 삭제한다.
+        :return: 더 이상 참조하는 첨부파일이 없는 경우 True
+        """
+        self.session.execute(
+            update(AttachedFileBlob)
+            .where(AttachedFileBlob.content_hash == content_hash)
+            .values(ref_count=AttachedFileBlob.ref_count - 1)
+        )
+        ref_count = self.session.execute(
+            select(AttachedFileBlob.ref_count).where(AttachedFileBlob.content_hash == content_hash)
+        ).scalar()
+        return ref_count is not None and ref_count <= 0
+
+    def get_unreferenced_blob(self, content_hash: str) -> Optional[AttachedFileBlob]:
+        """
+        참조가 없는 blob 을 row lock 을 잡고 조회
+        Lock 을 잡은 동안 같은 내용의 첨부파일은 참조 수를 증가시키지 못하며, 그 사이 다시 참조된 경우 None
+        """
+        query = select(AttachedFileBlob).where(and_(
+            AttachedFileBlob.content_hash == content_hash,
+            AttachedFileBlob.ref_count <= 0
+        )).with_for_update()
+        return self.session.execute(query).scalars().first()
+
+    def delete_blob(self, content_hash: str):
+        self.session.execute(delete(AttachedFileBlob).where(AttachedFileBlob.content_hash == content_hash))
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
 from app.domains.board.models import (
     Article,
     AttachedFile,
+    AttachedFileBlob,
     Comment,
     Tag
 )
@@ -14,14 +16,34 @@ class ArticleRepository(ABC):
     def get_list(self, page: int, size: int):
         pass
 
+    @abstractmethod
+    def get_list_by_cursor(self, after_id: Optional[int], size: int):
+        pass
+
+    @abstractmethod
+    def get_list_by_tag(self, tag_id: int, after_id: Optional[int], size: int):
+        pass
+
     @abstractmethod
     def get_detail(self, article_id: int):
         pass
 
+    @abstractmethod
+    def get_list_by_ids(self, article_ids: List[int]):
+        pass
+
     @abstractmethod
     def create(self, article: Article):
         pass
 
+    @abstractmethod
+    def bulk_create(self, articles: List[dict]) -> List[int]:
+        """
+        :param articles: tb_article column 값 dict list (모든 dict 의 key 가 같아야 한 batch 로 저장된다)
+        :return: 입력 순서대로 생성된 article id
+        """
+        pass
+
     @abstractmethod
     def update(self, article_id: int, update_article: Article):
         pass
@@ -30,6 +52,27 @@ class ArticleRepository(ABC):
     def delete(self, article: Article):
         pass
 
+    @abstractmethod
+    def increase_counts(self, article_id: int, comment_count: int = 0, attachment_count: int = 0, tag_count: int = 0):
+        """ 댓글 / 첨부파일 / tag 수 증감 """
+        pass
+
+    @abstractmethod
+    def reconcile_counts(self, after_id: int, size: int) -> Tuple[List[int], int]:
+        """
+        after_id 다음 article 부터 size 건의 댓글 / 첨부파일 / tag 수를 실제 row 수로 재계산
+        :return: (확인한 article id 목록, 수정한 article 수)
+        """
+        pass
+
+    @abstractmethod
+    def iter_export(self, batch_size: int):
+        """
+        삭제되지 않은 article(+ 작성자 username)을 id 순서로 batch_size 건씩 반환
+        :return: dict list iterator (비동기 repository 는 async iterator)
+        """
+        pass
+
 
 class CommentRepository(ABC):
 
@@ -37,6 +80,10 @@ class CommentRepository(ABC):
     def get_list(self, article_id: int, page: int, size: int):
         pass
 
+    @abstractmethod
+    def get_list_by_cursor(self, article_id: int, after: Optional[List[int]], size: int):
+        pass
+
     @abstractmethod
     def get_detail(self, comment_id: int):
         pass
@@ -50,11 +97,25 @@ class CommentRepository(ABC):
         pass
 
     @abstractmethod
-    def delete(self, comment: Comment):
+    def delete(self, comment: Comment) -> int:
+        """ :return: 삭제한 댓글 수 (이미 삭제된 댓글이면 0) """
         pass
 
     @abstractmethod
-    def delete_all(self, article_id: int):
+    def delete_all(self, article_id: int) -> int:
+        """ :return: 삭제한 댓글 수 """
+        pass
+
+    @abstractmethod
+    def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def backfill_thread_ids(self, size: int) -> int:
+        """
+        thread_id 가 없는(migration 이전) 댓글 size 건의 thread_id 를 채운다
+        :return: 갱신한 댓글 수 (0 이면 완료)
+        """
         pass
 
 
@@ -80,6 +141,28 @@ class TagRepository(ABC):
     def delete_all(self, article_id: int):
         pass
 
+    @abstractmethod
+    def get_export_list(self, article_ids: List[int]) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def get_tag_id(self, tagging: str) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    def get_or_create_tag_ids(self, taggings: List[str]) -> Dict[str, int]:
+        """ Tag 사전 id 조회 (없으면 생성) """
+        pass
+
+    @abstractmethod
+    def update_counts(self, counts: Dict[Tuple[date, int], int]):
+        """ 일자별 tag 수 증감 - {(count_date, tag_id): 증감 수} """
+        pass
+
+    @abstractmethod
+    def get_trending_list(self, since: date, size: int) -> List[dict]:
+        pass
+
 
 class AttachedFileRepository(ABC):
 
@@ -101,3 +184,79 @@ class AttachedFileRepository(ABC):
     @abstractmethod
     def delete_all(self, article_id: int):
         pass
+
+    @abstractmethod
+    def exists_by_s3_key(self, s3_key: str) -> bool:
+        """ 같은 저장소 key 의 첨부파일이 있는지 (locking read) """
+        pass
+
+    @abstractmethod
+    def acquire_blob(self, blob: AttachedFileBlob) -> bool:
+        """ 참조 수 증가 (없으면 생성), row 를 새로 생성한 경우 True """
+        pass
+
+    @abstractmethod
+    def release_blob(self, content_hash: str) -> bool:
+        """ 참조 수 감소, 참조가 없어진 경우 True """
+        pass
+
+    @abstractmethod
+    def get_unreferenced_blob(self, content_hash: str) -> Optional[AttachedFileBlob]:
+        """ 참조가 없는 blob 을 lock 을 잡고 조회 (SELECT ... FOR UPDATE) """
+        pass
+
+    @abstractmethod
+    def delete_blob(self, content_hash: str):
+        pass
+
+
+class ArticleCacheRepository(ABC):
+
+    @abstractmethod
+    def get_detail(self, article_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """ (cache 값, 조회 시점의 version) """
+        pass
+
+    @abstractmethod
+    def set_detail(self, article_id: int, value: str, version: Optional[str], exp: int = 0) -> bool:
+        """ version 이 get_detail 조회 시점과 같은 경우에만 저장 """
+        pass
+
+    @abstractmethod
+    def delete_detail(self, article_id: int):
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        pass
+
+
+class ArticleSearchRepository(ABC):
+
+    @abstractmethod
+    def index(self, article_id: int, title: str, content: str, tags: List[str]):
+        """ 추가 또는 교체 """
+        pass
+
+    @abstractmethod
+    def bulk_index(self, documents: List[dict]):
+        """
+        :param documents: article_id, title, content, tags dict list
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, article_id: int):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    @abstractmethod
+    def search(self, query: str, tags: List[str], offset: int, size: int) -> Tuple[int, List[Tuple[int, float]]]:
+        """
+        검색어의 모든 term 과 모든 tag 를 포함하는 article 을 BM25 점수 순서로 반환 (검색어가 없으면 최신 순)
+        :return: (전체 건수, [(article_id, score)])
+        """
+        pass
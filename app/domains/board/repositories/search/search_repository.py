@@ -0,0 +1,190 @@
+import heapq
+import os
+import sqlite3
+import threading
+
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from app.domains.board.repositories.repository import ArticleSearchRepository
+from app.utils.search_utils import SEARCH_FIELD_WEIGHTS, bm25_idf, bm25_score, tokenize
+
+class ArticleSearchMemoryRepository(ArticleSearchRepository):
+    """
+    In-process 역색인 - test 및 local 개발 용 (process 마다 별도 index, 종료 시 삭제)
+    Handler 가 thread pool 에서 호출하므로 lock 으로 보호한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict) # term -> {article_id: 가중치 적용 term 등장 횟수}
+        self.tag_postings: Dict[str, Set[int]] = defaultdict(set) # tag -> article_id
+        self.documents: Dict[int, Tuple[List[str], List[str], int]] = {} # article_id -> (term 목록, tag 목록, token 수)
+        self.total_length = 0
+
+    def _delete(self, article_id: int):
+        if article_id not in self.documents:
+            return
+        terms, tags, length = self.documents.pop(article_id)
+        for term in terms:
+            self.postings[term].pop(article_id, None)
+            if len(self.postings[term]) == 0:
+                del self.postings[term]
+        for tag in tags:
+            self.tag_postings[tag].discard(article_id)
+            if len(self.tag_postings[tag]) == 0:
+                del self.tag_postings[tag]
+        self.total_length -= length
+
+    def _index(self, article_id: int, title: str, content: str, tags: List[str]):
+        self._delete(article_id=article_id)
+
+        term_freqs, length = defaultdict(float), 0
+        for weight, text in zip(SEARCH_FIELD_WEIGHTS, (title, content, " ".join(tags))):
+            tokens = tokenize(text)
+            length += len(tokens)
+            for token in tokens:
+                term_freqs[token] += weight
+
+        for term, term_freq in term_freqs.items():
+            self.postings[term][article_id] = term_freq
+        for tag in set(tags):
+            self.tag_postings[tag].add(article_id)
+        self.documents[article_id] = (list(term_freqs), list(set(tags)), length)
+        self.total_length += length
+
+    def index(self, article_id: int, title: str, content: str, tags: List[str]):
+        with self._lock:
+            self._index(article_id=article_id, title=title, content=content, tags=tags)
+
+    def bulk_index(self, documents: List[dict]):
+        with self._lock:
+            for document in documents:
+                self._index(**document)
+
+    def delete(self, article_id: int):
+        with self._lock:
+            self._delete(article_id=article_id)
+
+    def clear(self):
+        with self._lock:
+            self.postings.clear()
+            self.tag_postings.clear()
+            self.documents.clear()
+            self.total_length = 0
+
+    def search(self, query: str, tags: List[str], offset: int, size: int) -> Tuple[int, List[Tuple[int, float]]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            # 등장 문서가 적은 posting 부터 교집합을 구한다
+            postings = sorted([self.postings.get(term, {}) for term in terms], key=len)
+            postings += sorted([self.tag_postings.get(tag, set()) for tag in set(tags)], key=len)
+            if len(postings) == 0:
+                return 0, []
+
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+
+            scores = dict.fromkeys(candidates, 0.0)
+            if len(terms) > 0 and len(candidates) > 0:
+                avg_length = (self.total_length / len(self.documents)) or 1
+                for term in terms:
+                    posting = self.postings[term]
+                    idf = bm25_idf(total_docs=len(self.documents), doc_freq=len(posting))
+                    for article_id in candidates:
+                        scores[article_id] += bm25_score(
+                            idf=idf,
+                            term_freq=posting[article_id],
+                            doc_length=self.documents[article_id][2],
+                            avg_doc_length=avg_length
+                        )
+
+        # 점수가 같으면 최신 article 우선
+        ranked = heapq.nsmallest(offset + size, scores.items(), key=lambda item: (-item[1], -item[0]))
+        return len(candidates), ranked[offset:]
+
+
+class ArticleSearchSqliteRepository(ArticleSearchRepository):
+    """
+    SQLite FTS5 역색인 - file 에 저장되므로 같은 host 의 worker process 가 index 를 공유한다.
+    Term 은 tokenize() 결과를 공백으로 이어 저장하여 memory 역색인과 같은 기준으로 검색하고, 점수는 FTS5 bm25() 를 사용한다.
+    """
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS article_search "
+                "USING fts5(title, content, tags, tokenize='unicode61 remove_diacritics 0')"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS article_search_tag ("
+                "tag TEXT NOT NULL, article_id INTEGER NOT NULL, PRIMARY KEY (tag, article_id)) WITHOUT ROWID"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_article_search_tag_article_id ON article_search_tag (article_id)")
+
+    def _delete(self, article_id: int):
+        self._conn.execute("DELETE FROM article_search WHERE rowid = ?", (article_id,))
+        self._conn.execute("DELETE FROM article_search_tag WHERE article_id = ?", (article_id,))
+
+    def _index(self, article_id: int, title: str, content: str, tags: List[str]):
+        self._delete(article_id=article_id)
+        self._conn.execute(
+            "INSERT INTO article_search (rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+            (article_id, " ".join(tokenize(title)), " ".join(tokenize(content)), " ".join(tokenize(" ".join(tags))))
+        )
+        self._conn.executemany(
+            "INSERT INTO article_search_tag (tag, article_id) VALUES (?, ?)",
+            [(tag, article_id) for tag in set(tags)]
+        )
+
+    def index(self, article_id: int, title: str, content: str, tags: List[str]):
+        with self._lock, self._conn:
+            self._index(article_id=article_id, title=title, content=content, tags=tags)
+
+    def bulk_index(self, documents: List[dict]):
+        with self._lock, self._conn:
+            for document in documents:
+                self._index(**document)
+
+    def delete(self, article_id: int):
+        with self._lock, self._conn:
+            self._delete(article_id=article_id)
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM article_search")
+            self._conn.execute("DELETE FROM article_search_tag")
+
+    def search(self, query: str, tags: List[str], offset: int, size: int) -> Tuple[int, List[Tuple[int, float]]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        tags = list(set(tags))
+        if len(terms) == 0 and len(tags) == 0:
+            return 0, []
+
+        conditions, params = [], []
+        if len(terms) > 0:
+            # term 은 문자 / 숫자만으로 이루어져 있으므로 그대로 phrase 로 감싸 FTS5 query 문법과 충돌하지 않는다
+            conditions.append("article_search MATCH ?")
+            params.append(" ".join(f'"{term}"' for term in terms))
+        if len(tags) > 0:
+            conditions.append(
+                f"rowid IN (SELECT article_id FROM article_search_tag WHERE tag IN ({', '.join('?' * len(tags))}) "
+                f"GROUP BY article_id HAVING COUNT(*) = ?)"
+            )
+            params += tags + [len(tags)]
+        where = " AND ".join(conditions)
+        score = f"-bm25(article_search, {', '.join(str(w) for w in SEARCH_FIELD_WEIGHTS)})" if len(terms) > 0 else "0.0"
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM article_search WHERE {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT rowid, {score} AS score FROM article_search WHERE {where} ORDER BY score DESC, rowid DESC LIMIT ? OFFSET ?",
+                params + [size, offset]
+            ).fetchall()
+        return total, [(article_id, score) for article_id, score in rows]
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 from fastapi import Form
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import AsyncIterator, List, Optional
 
 from app.domains.board.models import Article
 
@@ -28,6 +28,24 @@ class ArticleBase(BaseModel):
     created_at: datetime = Field(title="작성일시")
     updated_at: datetime = Field(title="수정일시")
 
+class ArticleSummary(ArticleBase):
+    comment_count: int = Field(title="댓글 수")
+    attachment_count: int = Field(title="첨부파일 수")
+    tag_count: int = Field(title="Tag 수")
+
+class ArticleCursorPage(BaseModel):
+    items: List[ArticleSummary] = Field(title="Article 목록")
+    next_cursor: Optional[str] = Field(title="다음 page cursor", default=None)
+
+class ArticleSearchItem(ArticleSummary):
+    score: float = Field(title="검색 점수 (BM25, 검색어 없이 tag 로만 검색한 경우 0)")
+
+class ArticleSearchPage(BaseModel):
+    total: int = Field(title="전체 검색 건수")
+    page: int = Field(title="Page")
+    size: int = Field(title="Page size")
+    items: List[ArticleSearchItem] = Field(title="Article 목록")
+
 class TagBase(BaseModel):
     id: int = Field(title="일련 번호")
     user_id: int = Field(title="작성자 일련 번호")
@@ -35,6 +53,10 @@ class TagBase(BaseModel):
     username: str = Field(title="작성자 ID")
     created_at: datetime = Field(title="작성일시")
 
+class TagTrending(BaseModel):
+    tagging: str = Field(title="Tag 내용")
+    article_count: int = Field(title="집계 기간 동안 tag 가 붙은 article 수")
+
 class AttachedFileBase(BaseModel):
     id: int = Field(title="일련 번호")
     user_id: int = Field(title="작성자 일련 번호")
@@ -47,6 +69,38 @@ class ArticleData(ArticleBase):
     tags: List[TagBase] = Field(title="Tags", default=None)
     attached_files: List[AttachedFileBase] = Field(title="Attached_files", default=None)
 
+class ArticleImportRecord(BaseModel):
+    """ 대량 등록 file(NDJSON / CSV)의 article 1건 """
+    title: str = Field(title="제목", min_length=1, max_length=255)
+    content: str = Field(title="내용", min_length=1)
+    tags: List[str] = Field(title="Tag (CSV 는 ',' 로 구분)", default=[])
+    user_id: Optional[int] = Field(title="작성자 일련 번호 (CLI 에서만 사용)", default=None)
+    created_at: Optional[datetime] = Field(title="작성일시 (없으면 등록 시각)", default=None)
+
+    @field_validator('tags', mode='before')
+    @classmethod
+    def split_tags(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = value.split(",")
+        if isinstance(value, list):
+            # 빈 tag 는 저장하지 않는다 (NDJSON 의 tag list 포함)
+            return [t.strip() if isinstance(t, str) else t for t in value if not isinstance(t, str) or t.strip() != '']
+        return value
+
+class ArticleImportResult(BaseModel):
+    rows: int = Field(title="등록한 article 수")
+    tags: int = Field(title="등록한 tag 수")
+    checkpoint: int = Field(title="처리한 record 수 (skip 포함) - 이어서 등록할 때 skip 으로 전달")
+    elapsed: float = Field(title="소요 시간(초)")
+    rows_per_sec: float = Field(title="초당 등록 article 수")
+
+class ArticleCountReconcileResult(BaseModel):
+    articles: int = Field(title="확인한 article 수")
+    fixed: int = Field(title="집계를 수정한 article 수")
+    last_id: int = Field(title="마지막으로 확인한 article 일련 번호")
+
 ## For Comment
 class CommentCreate(BaseModel):
     content: str = Field(title="댓글 내용")
@@ -64,3 +118,31 @@ class CommentData(BaseModel):
     level: int = Field(title="댓글 레벨")
     created_at: datetime = Field(title="작성일")
     updated_at: datetime = Field(title="수정일")
+
+class CommentCursorPage(BaseModel):
+    items: List[CommentData] = Field(title="Comment 목록")
+    next_cursor: Optional[str] = Field(title="다음 page cursor", default=None)
+
+## For Attached file
+@dataclass
+class AttachedFileContent:
+    filename: str
+    content: AsyncIterator[bytes] # chunk 단위 file 내용
+    content_length: int
+    etag: Optional[str] = None
+    content_range: Optional[str] = None # Range 요청인 경우 (ex. bytes 0-1023/4096)
+
+class AttachedFileUploadRequest(BaseModel):
+    filename: str = Field(title="File name")
+    file_type: str = Field(title="File type", default="application/octet-stream")
+
+class AttachedFileUploadUrl(BaseModel):
+    filename: str = Field(title="File name")
+    s3_key: str = Field(title="Upload 확인 요청 시 전달할 S3 key")
+    upload_url: str = Field(title="Presigned PUT URL")
+    headers: dict = Field(title="PUT 요청 시 함께 보내야 하는 header")
+    expires_in: int = Field(title="URL 유효 시간(초)")
+
+class AttachedFileUploadConfirm(BaseModel):
+    s3_key: str = Field(title="Presigned URL 발급 시 받은 S3 key")
+    filename: str = Field(title="File name")
@@ -1,15 +1,27 @@
+import itertools
+import time
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from fastapi import UploadFile
-from typing import List
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
 
-from app.common.constants import S3_BUCKET, S3_KEY_PREFIX
-from app.databases.transactions import TransactionManager
+from app.databases.transactions import AsyncTransactionManager, TransactionManager
 from app.domains.board.exceptions import (
+    DuplicateAttachedFile,
+    InvalidCursor,
+    InvalidImportRecord,
+    InvalidSearchQuery,
     NotDeleteAuth,
     NotExistArticle,
     NotExistAttachedFile,
     NotExistComment,
     NotExistTag,
-    NotUpdateAuth
+    NotUpdateAuth,
+    NotUploadedAttachedFile,
+    PresignedUrlDisabled
 )
 from app.domains.board.models import (
     Article,
@@ -18,82 +30,312 @@ from app.domains.board.models import (
     Tag
 )
 from app.domains.board.handlers import (
+    ArticleCacheHandler,
     ArticleHandler,
+    ArticleSearchHandler,
     AttachedFileHandler,
     CommentHandler,
     TagHandler
 )
 from app.domains.board.schemas import (
+    ArticleCountReconcileResult,
+    ArticleData,
+    ArticleImportRecord,
+    ArticleImportResult,
     ArticleUpsert,
+    AttachedFileContent,
+    AttachedFileUploadConfirm,
+    AttachedFileUploadRequest,
     CommentCreate
 )
 from app.utils.debug_utils import dpp
+from app.utils.import_utils import ImportRecordError
+from app.utils.pagination_utils import decode_cursor, encode_cursor
+from app.utils.search_utils import tokenize
 
 class ArticleService:
 
     def __init__(
             self,
             article_handler: ArticleHandler,
+            article_cache_handler: ArticleCacheHandler,
             attached_file_handler: AttachedFileHandler,
             comment_handler: CommentHandler,
             tag_handler: TagHandler,
-            transaction_manager: TransactionManager):
+            article_search_handler: ArticleSearchHandler,
+            transaction_manager: TransactionManager | AsyncTransactionManager):
         self.article_handler = article_handler
+        self.article_cache_handler = article_cache_handler
         self.attached_file_handler = attached_file_handler
         self.comment_handler = comment_handler
         self.tag_handler = tag_handler
+        self.article_search_handler = article_search_handler
         self.transaction_manager = transaction_manager
 
-    def get_article_list(self, page: int, size: int):
-        return self.article_handler.get_list(page=page, size=size)
-
-    def get_article_detail(self, article_id: int):
-        # Get article data
-        article = self.article_handler.get_detail(article_id=article_id)
-        if article is None:
-            raise NotExistArticle()
-
-        # Get tag list for article
-        tags = self.tag_handler.get_list(article_id=article.id)
-        article.tags = tags
-
-        # Get attached file list for article
-        attached_files = self.attached_file_handler.get_list(article_id=article.id)
-        article.attached_files = attached_files
+    async def _attach_files(self, article: Article, files: Optional[List[UploadFile]]) -> int:
+        """
+        첨부파일을 동시에 upload 한 뒤, upload 에 성공한 file 만 요청 순서대로 저장
+        (DB session 은 동시 사용할 수 없으므로 row 생성은 순차 처리)
+        이미 저장된 내용과 같은 file 은 전송하지 않고 row 만 추가한다.
+        :return: 저장한 첨부파일 수
+        """
+        if files is None or len(files) == 0:
+            return 0
+
+        attachment_count = 0
+        blobs = await self.attached_file_handler.upload_all(files=files)
+        for f, blob in zip(files, blobs):
+            if blob is not None:
+                attached_file = AttachedFile(
+                    article_id=article.id,
+                    user_id=article.user_id,
+                    s3_bucket_name=blob.s3_bucket_name,
+                    s3_key=blob.s3_key,
+                    filename=f.filename,
+                    file_size=f.size,
+                    file_type=f.content_type,
+                    content_hash=blob.content_hash
+                )
+                await self.attached_file_handler.create(attached_file=attached_file)
+                attachment_count += 1
+        return attachment_count
+
+    async def _delete_contents(self, attached_files: List[AttachedFile]):
+        """ 첨부파일 삭제 commit 이후 참조가 없어진 저장소 object 삭제 (file 마다 별도의 transaction 에서 참조 수를 다시 확인) """
+        for attached_file in attached_files:
+            async with self.transaction_manager.async_transaction():
+                await self.attached_file_handler.delete_content(attached_file=attached_file)
+
+    async def get_article_list(self, page: int, size: int):
+        return await self.article_handler.get_list(page=page, size=size)
+
+    async def get_article_cursor_list(self, size: int, cursor: Optional[str] = None, after_id: Optional[int] = None):
+        """
+        Keyset pagination 방식의 article 목록 조회
+        cursor(opaque)가 after_id보다 우선하며, 다음 page가 있는 경우에만 next_cursor를 반환한다.
+        """
+        if cursor is not None:
+            try:
+                after_id = decode_cursor(cursor=cursor)[0]
+            except (ValueError, TypeError):
+                raise InvalidCursor()
+
+        # 다음 page 존재 여부 확인을 위해 1건 더 조회
+        articles = await self.article_handler.get_list_by_cursor(after_id=after_id, size=size + 1)
+        next_cursor = None
+        if len(articles) > size:
+            articles = articles[:size]
+            next_cursor = encode_cursor(articles[-1].id)
+
+        return articles, next_cursor
+
+    async def get_article_detail(self, article_id: int) -> ArticleData:
+        """
+        Article 상세 조회 (read-through cache)
+        Cache miss 인 경우 article / tag / 첨부파일을 조회하여 ArticleData 로 조립한 뒤 cache 에 저장한다.
+        """
+        article_data, cache_version = await self.article_cache_handler.get_detail(article_id=article_id)
+        if article_data is not None:
+            return article_data
+
+        # Cache 에 replica 지연 데이터가 저장되지 않도록 primary 에서 조회
+        async with self.transaction_manager.async_transaction():
+            # Get article data
+            article = await self.article_handler.get_detail(article_id=article_id)
+            if article is None:
+                raise NotExistArticle()
 
-        return article
+            # Get tag list for article
+            tags = await self.tag_handler.get_list(article_id=article.id)
+
+            # Get attached file list for article
+            attached_files = await self.attached_file_handler.get_list(article_id=article.id)
+
+            article_data = ArticleData(
+                id=article.id,
+                user_id=article.user_id,
+                username=article.user.username,
+                title=article.title,
+                content=article.content,
+                tags=[{
+                    'id': t.id,
+                    'user_id': t.user_id,
+                    'username': t.user.username,
+                    'tagging': t.tagging,
+                    'created_at': t.created_at
+                } for t in tags],
+                attached_files=[{
+                    'id': f.id,
+                    'user_id': f.user_id,
+                    'filename': f.filename,
+                    'file_size': f.file_size,
+                    'file_type': f.file_type
+                } for f in attached_files],
+                created_at=article.created_at,
+                updated_at=article.updated_at
+            )
+
+        # 조회하는 동안 article 이 변경(cache 무효화)되었으면 저장하지 않는다
+        await self.article_cache_handler.set_detail(article=article_data, version=cache_version)
+        return article_data
 
     async def create_article(self, insert_article: Article, tag_data: List[str], files: List[UploadFile] = None) -> bool:
-        with self.transaction_manager.transaction():
+        tag_data = list(dict.fromkeys(d for d in tag_data if d != ''))
+        async with self.transaction_manager.async_transaction():
             # create article
-            article = self.article_handler.create(insert_article=insert_article)
+            insert_article.tag_count = len(tag_data)
+            article = await self.article_handler.create(insert_article=insert_article)
 
             # create tags
             if len(tag_data) > 0:
-                tag_list = [{'article_id': article.id, 'user_id': article.user_id, 'tagging': d} for d in tag_data if d != '']
-                self.tag_handler.create(tags=tag_list)
+                tag_list = [{'article_id': article.id, 'user_id': article.user_id, 'tagging': d} for d in tag_data]
+                await self.tag_handler.create(tags=tag_list)
 
             # Upload file
-            if files is not None and len(files) > 0:
-                for f in files:
-                    result_flag = await self.attached_file_handler.upload(f=f)
-                    if result_flag is True:
-                        attached_file = AttachedFile(
-                            article_id=article.id,
-                            user_id=article.user_id,
-                            s3_bucket_name=S3_BUCKET['BOARD'],
-                            s3_key=f"{S3_KEY_PREFIX['BOARD']}/{f.filename}",
-                            filename=f.filename,
-                            file_size=f.size,
-                            file_type=f.content_type
-                        )
-                        _ = self.attached_file_handler.create(attached_file=attached_file)
-            return True
+            attachment_count = await self._attach_files(article=article, files=files)
+            await self.article_handler.increase_counts(article_id=article.id, attachment_count=attachment_count)
+            document = {'article_id': article.id, 'title': article.title, 'content': article.content, 'tags': tag_data}
+
+        # Commit 이후 검색 index 반영
+        await self.article_search_handler.index(**document)
+        return True
+
+    async def import_articles(
+            self,
+            records: Iterator[Tuple[int, dict]],
+            user_id: int,
+            batch_size: int = 500,
+            skip: int = 0,
+            allow_user_id: bool = False,
+            on_commit: Callable[[ArticleImportResult], None] = None
+    ) -> ArticleImportResult:
+        """
+        Article 대량 등록
+        batch_size 건씩 multi-row INSERT 로 저장하고 batch 마다 commit 한다.
+        오류가 발생해도 이전 batch 까지는 저장되어 있으므로, checkpoint(처리한 record 수)를 skip 으로 지정하여 이어서 등록한다.
+        :param records: (line 번호, record) iterator - file 읽기는 thread pool 에서 수행한다
+        :param user_id: 작성자
+        :param batch_size: transaction(commit) 단위 record 수
+        :param skip: 건너뛸 record 수 (이전 등록의 checkpoint)
+        :param allow_user_id: record 의 user_id 사용 여부 (migration CLI 용)
+        :param on_commit: batch commit 마다 진행 상황을 전달받는 callback
+        :return:
+        """
+        start = time.perf_counter()
+        result = ArticleImportResult(rows=0, tags=0, checkpoint=skip, elapsed=0, rows_per_sec=0)
+
+        def _next_batch() -> List[Tuple[int, dict]]:
+            return list(itertools.islice(records, batch_size))
+
+        def _update_result(rows: int, tags: int):
+            result.rows += rows
+            result.tags += tags
+            result.checkpoint += rows
+            result.elapsed = round(time.perf_counter() - start, 3)
+            result.rows_per_sec = round(result.rows / result.elapsed, 1) if result.elapsed > 0 else 0
+
+        try:
+            await run_in_threadpool(lambda: sum(1 for _ in itertools.islice(records, skip)))
+            while True:
+                batch = await run_in_threadpool(_next_batch)
+                if len(batch) == 0:
+                    break
+
+                articles, tag_data = [], []
+                now = datetime.now()
+                for line_no, record in batch:
+                    try:
+                        import_record = ArticleImportRecord.model_validate(record)
+                    except ValidationError as ex:
+                        raise ImportRecordError(line=line_no, reason=str(ex.errors(include_url=False)))
+                    created_at = import_record.created_at or now
+                    tags = list(dict.fromkeys(import_record.tags))
+                    articles.append({
+                        'user_id': import_record.user_id if allow_user_id and import_record.user_id is not None else user_id,
+                        'title': import_record.title,
+                        'content': import_record.content,
+                        'tag_count': len(tags),
+                        'is_deleted': False,
+                        'created_at': created_at,
+                        'updated_at': created_at
+                    })
+                    tag_data.append(tags)
+
+                async with self.transaction_manager.async_transaction():
+                    article_ids = await self.article_handler.bulk_create(articles=articles)
+                    tag_list = [
+                        {'article_id': article_id, 'user_id': article['user_id'], 'tagging': tagging}
+                        for article_id, article, tags in zip(article_ids, articles, tag_data)
+                        for tagging in tags
+                    ]
+                    await self.tag_handler.create(tags=tag_list)
+
+                await self.article_search_handler.bulk_index(documents=[
+                    {'article_id': article_id, 'title': article['title'], 'content': article['content'], 'tags': tags}
+                    for article_id, article, tags in zip(article_ids, articles, tag_data)
+                ])
+                _update_result(rows=len(articles), tags=len(tag_list))
+                if on_commit is not None:
+                    on_commit(result)
+
+        except ImportRecordError as ex:
+            raise InvalidImportRecord(line=ex.line, checkpoint=result.checkpoint, reason=ex.reason)
+
+        _update_result(rows=0, tags=0)
+        return result
+
+    async def reconcile_counts(
+            self,
+            batch_size: int = 1000,
+            after_id: int = 0,
+            on_batch: Callable[[ArticleCountReconcileResult], None] = None
+    ) -> ArticleCountReconcileResult:
+        """
+        Article 의 댓글 / 첨부파일 / tag 수를 실제 row 수로 재계산 (migration 이후 또는 집계가 어긋난 경우)
+        Article id 순서로 batch_size 건씩 commit 하므로, 중단된 경우 결과의 last_id 를 after_id 로 지정하여 이어서 실행한다.
+        :param batch_size: transaction(commit) 단위 article 수
+        :param after_id: 이 일련 번호 다음 article 부터 확인
+        :param on_batch: batch commit 마다 진행 상황을 전달받는 callback
+        :return:
+        """
+        result = ArticleCountReconcileResult(articles=0, fixed=0, last_id=after_id)
+        while True:
+            async with self.transaction_manager.async_transaction():
+                article_ids, fixed = await self.article_handler.reconcile_counts(after_id=result.last_id, size=batch_size)
+            if len(article_ids) == 0:
+                return result
+
+            result.articles += len(article_ids)
+            result.fixed += fixed
+            result.last_id = article_ids[-1]
+            if on_batch is not None:
+                on_batch(result)
+
+    async def iter_export(self, batch_size: int = 1000) -> AsyncIterator[List[dict]]:
+        """
+        Article export (작성자, tag, 댓글 포함)
+        Article 은 cursor 로 batch_size 건씩 읽고, batch 마다 tag / 댓글을 article id 로 한 번에 조회하여 합친다.
+        (article 과 tag, 댓글을 join 하면 row 가 곱으로 늘어나므로 join 하지 않는다)
+        :param batch_size:
+        :return: batch 단위 article dict list
+        """
+        async for articles in self.article_handler.iter_export(batch_size=batch_size):
+            article_ids = [article['id'] for article in articles]
+            tags, comments = defaultdict(list), defaultdict(list)
+            for tag in await self.tag_handler.get_export_list(article_ids=article_ids):
+                tags[tag['article_id']].append(tag['tagging'])
+            for comment in await self.comment_handler.get_export_list(article_ids=article_ids):
+                comments[comment.pop('article_id')].append(comment)
+
+            for article in articles:
+                article['tags'] = tags.get(article['id'], [])
+                article['comments'] = comments.get(article['id'], [])
+            yield articles
 
     async def update_article(self, article_id: int, update_article: Article, tag_data: List[str] = None, files: List[UploadFile] = None ):
-        with self.transaction_manager.transaction():
+        async with self.transaction_manager.async_transaction():
             # Check article
-            article = self.article_handler.get_detail(article_id=article_id)
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
 
@@ -101,44 +343,50 @@ class ArticleService:
                 raise NotUpdateAuth() # 본인이 작성하지 않은 게시물은 수정 권한이 없음
 
             # Update article
-            self.article_handler.update(article_id=article.id, update_article=update_article)
+            await self.article_handler.update(article_id=article.id, update_article=update_article)
 
             # Update tags
+            tag_count = 0
+            removed_tag_ids = set()
             if tag_data is not None and len(tag_data) > 0:
-                origin_tag_list = sorted([t.tagging for t in article.tags])
-                if origin_tag_list is not None and len(origin_tag_list) > 0:
-                    if origin_tag_list != sorted(tag_data):
-                        # 기존에 입력되어 있던 Tag와 수정 데이터로 받은 tag 리스트가 다른 경우
-                        # 기존 Tag 삭제
-                        self.tag_handler.delete_all(article_id=article.id)
-
-                # 신규 Tag 입력
-                tag_list = [{'article_id': article.id, 'user_id': article.user_id, 'tagging': d} for d in tag_data if d != '']
-                self.tag_handler.create(tags=tag_list)
+                # 기존 Tag 와 비교하여 빠진 tag 만 삭제하고 새로운 tag 만 입력한다 (같은 tag 로 수정하면 변경 없음)
+                origin_tags = await self.tag_handler.get_list(article_id=article.id)
+                new_tag_list = [d for d in dict.fromkeys(tag_data) if d != '']
+                for origin_tag in origin_tags:
+                    if origin_tag.tagging not in new_tag_list:
+                        await self.tag_handler.delete(tag=origin_tag)
+                        removed_tag_ids.add(origin_tag.id)
+                tag_count -= len(removed_tag_ids)
+
+                origin_tag_list = {t.tagging for t in origin_tags}
+                tag_list = [{'article_id': article.id, 'user_id': article.user_id, 'tagging': d} for d in new_tag_list if d not in origin_tag_list]
+                tag_count += await self.tag_handler.create(tags=tag_list)
 
             # Upload files 처리
             # Upload file은 기존 첨부 파일의 다음 순서로 업로드 순서대로 새로 첨부된다.
             # 기존 첨부되었던 파일의 삭제는 attached_file API의 삭제 API를 호출하여 처리한다.
-            if files is not None and len(files) > 0:
-                for f in files:
-                    result_flag = await self.attached_file_handler.upload(f=f)
-                    if result_flag is True:
-                        attached_file = AttachedFile(
-                            article_id=article.id,
-                            user_id=article.user_id,
-                            s3_bucket_name=S3_BUCKET['BOARD'],
-                            s3_key=f"{S3_KEY_PREFIX['BOARD']}/{f.filename}",
-                            filename=f.filename,
-                            file_size=f.size,
-                            file_type=f.content_type
-                        )
-                        self.attached_file_handler.create(attached_file=attached_file)
-            return True
-
-    def delete_article(self, article_id: int, user_id: int):
-        with self.transaction_manager.transaction():
+            attachment_count = await self._attach_files(article=article, files=files)
+            await self.article_handler.increase_counts(article_id=article.id, attachment_count=attachment_count, tag_count=tag_count)
+
+            # 검색 index 갱신용 - 수정하지 않은 field 는 기존 값을 사용한다 (ArticleRdbRepository.update 와 같은 기준)
+            # 삭제는 commit(flush) 시 반영되므로 삭제한 tag 를 제외한다
+            tags = await self.tag_handler.get_list(article_id=article.id)
+            document = {
+                'article_id': article.id,
+                'title': update_article.title if update_article.title else article.title,
+                'content': update_article.content if update_article.content else article.content,
+                'tags': [t.tagging for t in tags if t.id not in removed_tag_ids]
+            }
+
+        # Commit 이후 cache 삭제 - 다음 조회에서 변경된 데이터로 다시 채워진다
+        await self.article_cache_handler.delete_detail(article_id=article_id)
+        await self.article_search_handler.index(**document)
+        return True
+
+    async def delete_article(self, article_id: int, user_id: int):
+        async with self.transaction_manager.async_transaction():
             # Check target article
-            article = self.article_handler.get_detail(article_id=article_id)
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
 
@@ -146,121 +394,249 @@ class ArticleService:
                 raise NotDeleteAuth() # 본인이 작성하지 않은 게시물은 삭제 권한이 없음
 
             # Delete comment for article
-            self.comment_handler.delete_all(article_id=article.id)
+            await self.comment_handler.delete_all(article_id=article.id)
 
             # Delete all tags for article
-            self.tag_handler.delete_all(article_id=article.id)
+            await self.tag_handler.delete_all(article_id=article.id)
 
             # Delete all attached_file for article
-            self.attached_file_handler.delete_all(article_id=article.id)
+            unreferenced_files = await self.attached_file_handler.delete_all(article_id=article.id)
 
             # Delete article
-            self.article_handler.delete(article=article)
-
-            return True
+            await self.article_handler.delete(article=article)
+
+        await self._delete_contents(attached_files=unreferenced_files)
+        await self.article_cache_handler.delete_detail(article_id=article_id)
+        await self.article_search_handler.delete(article_id=article_id)
+        return True
+
+    async def search_articles(self, query: str, tags: List[str], page: int, size: int) -> Tuple[int, List[Tuple[Article, float]]]:
+        """
+        Article 검색 (제목, 내용, tag)
+        :param query: 검색어 - 모든 term 을 포함하는 article 을 BM25 점수 순서로 반환
+        :param tags: 모두 포함해야 하는 tag
+        :param page:
+        :param size:
+        :return: (전체 건수, [(article, score)])
+        """
+        if len(tokenize(query)) == 0 and len(tags) == 0:
+            raise InvalidSearchQuery()
+
+        total, hits = await self.article_search_handler.search(query=query, tags=tags, offset=(page - 1) * size, size=size)
+        if len(hits) == 0:
+            return total, []
+
+        articles = {article.id: article for article in await self.article_handler.get_list_by_ids(article_ids=[article_id for article_id, _ in hits])}
+        # Index 반영 전에 삭제된 article 은 제외한다
+        return total, [(articles[article_id], score) for article_id, score in hits if article_id in articles]
 
 
 class CommentService:
 
-    def __init__(self, comment_handler: CommentHandler, article_handler: ArticleHandler, transaction_manager: TransactionManager):
+    def __init__(self, comment_handler: CommentHandler, article_handler: ArticleHandler, transaction_manager: TransactionManager | AsyncTransactionManager):
         self.comment_handler = comment_handler
         self.article_handler = article_handler
         self.transaction_manager = transaction_manager
 
-    def get_comment_list(self, article_id: int, page: int, size: int):
-        article = self.article_handler.get_detail(article_id=article_id)
+    async def get_comment_list(self, article_id: int, page: int, size: int):
+        article = await self.article_handler.get_detail(article_id=article_id)
         if article is None:
             raise NotExistArticle()
-        result_service = self.comment_handler.get_list(article_id=article.id, page=page, size=size)
+        result_service = await self.comment_handler.get_list(article_id=article.id, page=page, size=size)
         return result_service
 
-    def get_comment_detail(self, comment_id: int):
-        return self.comment_handler.get_detail(comment_id=comment_id)
+    async def get_comment_cursor_list(self, article_id: int, size: int, cursor: Optional[str] = None):
+        """
+        Keyset pagination 방식의 comment 목록 조회 (thread 순서)
+        """
+        article = await self.article_handler.get_detail(article_id=article_id)
+        if article is None:
+            raise NotExistArticle()
 
-    def create_comment(self, insert_comment: Comment, article_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+        try:
+            after = decode_cursor(cursor=cursor, size=2)
+        except (ValueError, TypeError):
+            raise InvalidCursor()
+
+        # 다음 page 존재 여부 확인을 위해 1건 더 조회
+        comments = await self.comment_handler.get_list_by_cursor(article_id=article.id, after=after, size=size + 1)
+        next_cursor = None
+        if len(comments) > size:
+            comments = comments[:size]
+            next_cursor = encode_cursor(comments[-1].thread_id, comments[-1].id)
+
+        return comments, next_cursor
+
+    async def get_comment_detail(self, comment_id: int):
+        return await self.comment_handler.get_detail(comment_id=comment_id)
+
+    async def backfill_thread_ids(self, batch_size: int = 1000, on_batch: Callable[[int], None] = None) -> int:
+        """
+        thread_id 가 없는(migration 이전) 댓글의 thread_id 채우기 - batch_size 건씩 commit 한다
+        :param batch_size: transaction(commit) 단위 댓글 수
+        :param on_batch: batch commit 마다 누적 갱신 건수를 전달받는 callback
+        :return: 갱신한 댓글 수
+        """
+        total = 0
+        while True:
+            async with self.transaction_manager.async_transaction():
+                count = await self.comment_handler.backfill_thread_ids(size=batch_size)
+            if count == 0:
+                return total
+
+            total += count
+            if on_batch is not None:
+                on_batch(total)
+
+    async def create_comment(self, insert_comment: Comment, article_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
             insert_comment.article_id = article.id
 
             if insert_comment.comment_id is not None and insert_comment.comment_id > 0:
-                comment = self.comment_handler.get_detail(comment_id=insert_comment.comment_id)
-                if comment is None:
+                comment = await self.comment_handler.get_detail(comment_id=insert_comment.comment_id)
+                if comment is None or comment.article_id != article.id:
                     raise NotExistComment()
-                insert_comment.comment_id = comment.id
+                # 대댓글은 Depth=1까지만 지원하므로 대댓글에 대한 답글은 최상위 댓글의 thread로 묶는다
+                root_comment_id = comment.id if comment.level == 0 else comment.comment_id
+                insert_comment.comment_id = root_comment_id
+                insert_comment.thread_id = comment.thread_id
                 insert_comment.level = 1
 
-            _ = self.comment_handler.create(insert_comment=insert_comment)
+            _ = await self.comment_handler.create(insert_comment=insert_comment)
+            await self.article_handler.increase_counts(article_id=article.id, comment_count=1)
             return True
 
-    def update_comment(self, article_id: int, comment_id: int, update_comment: Comment):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+    async def update_comment(self, article_id: int, comment_id: int, update_comment: Comment):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
-            comment = self.comment_handler.get_detail(comment_id=comment_id)
+            comment = await self.comment_handler.get_detail(comment_id=comment_id)
             if comment is None:
                 raise NotExistComment()
             if comment.user_id != update_comment.user_id:
                 raise NotUpdateAuth()
 
             update_comment.level = comment.level
-            self.comment_handler.update(comment_id=comment_id, update_comment=update_comment)
+            await self.comment_handler.update(comment_id=comment_id, update_comment=update_comment)
             return True
 
-    def delete_comment(self, article_id: int, comment_id: int, user_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+    async def delete_comment(self, article_id: int, comment_id: int, user_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
-            comment = self.comment_handler.get_detail(comment_id=comment_id)
+            comment = await self.comment_handler.get_detail(comment_id=comment_id)
             if comment is None:
                 raise NotExistComment()
 
             if comment.user_id != user_id:
                 raise NotDeleteAuth()
 
-            self.comment_handler.delete(comment=comment)
+            deleted = await self.comment_handler.delete(comment=comment)
+            await self.article_handler.increase_counts(article_id=comment.article_id, comment_count=-deleted)
             return True
 
-    def delete_comment_all(self, article_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+    async def delete_comment_all(self, article_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
 
-            self.comment_handler.delete_all(article_id=article_id)
+            deleted = await self.comment_handler.delete_all(article_id=article_id)
+            await self.article_handler.increase_counts(article_id=article.id, comment_count=-deleted)
             return True
 
 class TagService:
 
-    def __init__(self, tag_handler: TagHandler, article_handler: ArticleHandler, transaction_manager: TransactionManager):
+    def __init__(
+            self,
+            tag_handler: TagHandler,
+            article_handler: ArticleHandler,
+            article_cache_handler: ArticleCacheHandler,
+            article_search_handler: ArticleSearchHandler,
+            transaction_manager: TransactionManager | AsyncTransactionManager
+    ):
         self.tag_handler = tag_handler
         self.article_handler = article_handler
+        self.article_cache_handler = article_cache_handler
+        self.article_search_handler = article_search_handler
         self.transaction_manager = transaction_manager
 
-    def delete(self, tag_id: int, article_id: int, user_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+    async def get_article_cursor_list(self, tagging: str, size: int, cursor: Optional[str] = None):
+        """
+        Tag 별 article 목록 조회 (Keyset pagination, 최신 순)
+        다음 page가 있는 경우에만 next_cursor를 반환한다.
+        """
+        after_id = None
+        if cursor is not None:
+            try:
+                after_id = decode_cursor(cursor=cursor)[0]
+            except (ValueError, TypeError):
+                raise InvalidCursor()
+
+        tag_id = await self.tag_handler.get_tag_id(tagging=tagging)
+        if tag_id is None:
+            return [], None
+
+        # 다음 page 존재 여부 확인을 위해 1건 더 조회
+        articles = await self.article_handler.get_list_by_tag(tag_id=tag_id, after_id=after_id, size=size + 1)
+        next_cursor = None
+        if len(articles) > size:
+            articles = articles[:size]
+            next_cursor = encode_cursor(articles[-1].id)
+
+        return articles, next_cursor
+
+    async def get_trending_list(self, days: int, size: int) -> List[dict]:
+        """
+        최근 days 일 동안 article 에 많이 붙은 tag 조회
+        :return: [{'tagging': ..., 'article_count': ...}] (article 수 역순)
+        """
+        since = date.today() - timedelta(days=days - 1)
+        return await self.tag_handler.get_trending_list(since=since, size=size)
+
+    async def delete(self, tag_id: int, article_id: int, user_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
-            tag = self.tag_handler.get_detail(tag_id=tag_id)
-            if tag is None:
+            tag = await self.tag_handler.get_detail(tag_id=tag_id)
+            if tag is None or tag.article_id != article.id:
                 raise NotExistTag()
             if tag.user_id != user_id:
                 raise NotDeleteAuth()
 
-            self.tag_handler.delete(tag=tag)
-            return True
-
-    def delete_all(self, article_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+            await self.tag_handler.delete(tag=tag)
+            await self.article_handler.increase_counts(article_id=article.id, tag_count=-1)
+            # 삭제는 commit 시 반영되므로 삭제한 tag 를 제외하고 검색 index 를 갱신한다
+            tags = await self.tag_handler.get_list(article_id=article.id)
+            document = {
+                'article_id': article.id,
+                'title': article.title,
+                'content': article.content,
+                'tags': [t.tagging for t in tags if t.id != tag.id]
+            }
+
+        await self.article_cache_handler.delete_detail(article_id=article.id)
+        await self.article_search_handler.index(**document)
+        return True
+
+    async def delete_all(self, article_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
-            self.tag_handler.delete_all(article_id=article_id)
-            return True
+            deleted = await self.tag_handler.delete_all(article_id=article_id)
+            await self.article_handler.increase_counts(article_id=article.id, tag_count=-deleted)
+            document = {'article_id': article.id, 'title': article.title, 'content': article.content, 'tags': []}
+
+        await self.article_cache_handler.delete_detail(article_id=article_id)
+        await self.article_search_handler.index(**document)
+        return True
 
 
 class AttachedFileService:
@@ -269,33 +645,105 @@ class AttachedFileService:
             self,
             attached_file_handler: AttachedFileHandler,
             article_handler: ArticleHandler,
-            transaction_manager: TransactionManager
+            article_cache_handler: ArticleCacheHandler,
+            transaction_manager: TransactionManager | AsyncTransactionManager
     ):
         self.attached_file_handler = attached_file_handler
         self.article_handler = article_handler
+        self.article_cache_handler = article_cache_handler
         self.transaction_manager = transaction_manager
 
-    def get_attached_file_download(self, attached_file_id: int):
-        attached_file = self.attached_file_handler.get_detail(attached_file_id=attached_file_id)
+    async def _delete_contents(self, attached_files: List[AttachedFile]):
+        """ 첨부파일 삭제 commit 이후 참조가 없어진 저장소 object 삭제 (file 마다 별도의 transaction 에서 참조 수를 다시 확인) """
+        for attached_file in attached_files:
+            async with self.transaction_manager.async_transaction():
+                await self.attached_file_handler.delete_content(attached_file=attached_file)
+
+    async def get_attached_file_download(self, attached_file_id: int, byte_range: Optional[str] = None) -> AttachedFileContent:
+        attached_file = await self.attached_file_handler.get_detail(attached_file_id=attached_file_id)
         if attached_file is None:
             raise NotExistAttachedFile()
 
-        contents = self.attached_file_handler.get_content(attached_file=attached_file)
-        filename = attached_file.file_name
+        return await self.attached_file_handler.open_content(attached_file=attached_file, byte_range=byte_range)
+
+    async def get_attached_file_download_url(self, attached_file_id: int) -> Optional[str]:
+        """
+        Presigned URL 모드인 경우 download URL 발급
+        :param attached_file_id:
+        :return: proxy 모드인 경우 None
+        """
+        if not self.attached_file_handler.is_presigned_mode():
+            return None
 
-        return contents, filename
+        attached_file = await self.attached_file_handler.get_detail(attached_file_id=attached_file_id)
+        if attached_file is None:
+            raise NotExistAttachedFile()
+
+        return await self.attached_file_handler.create_download_url(attached_file=attached_file)
+
+    async def create_upload_urls(self, article_id: int, user_id: int, files: List[AttachedFileUploadRequest]) -> List[dict]:
+        """ 첨부파일 upload 용 presigned URL 발급 (article 작성자만 가능) """
+        if not self.attached_file_handler.is_presigned_mode():
+            raise PresignedUrlDisabled()
+
+        article = await self.article_handler.get_detail(article_id=article_id)
+        if article is None:
+            raise NotExistArticle()
+        if article.user_id != user_id:
+            raise NotUpdateAuth()
 
-    def delete(self, article_id: int, attached_file_id: int, user_id: int):
-        with self.transaction_manager.transaction():
-            article = self.article_handler.get_detail(article_id=article_id)
+        return [
+            await self.attached_file_handler.create_upload_url(article_id=article.id, filename=f.filename, file_type=f.file_type)
+            for f in files
+        ]
+
+    async def confirm_upload(self, article_id: int, user_id: int, data: AttachedFileUploadConfirm):
+        """ Presigned URL 로 upload 완료된 file 을 첨부파일로 등록 """
+        if not self.attached_file_handler.is_presigned_mode():
+            raise PresignedUrlDisabled()
+
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
             if article is None:
                 raise NotExistArticle()
+            if article.user_id != user_id:
+                raise NotUpdateAuth()
 
-            attached_file = self.attached_file_handler.get_detail(attached_file_id=attached_file_id)
+            # 같은 key 를 여러 번 확인 요청하면 하나의 object 를 여러 첨부파일이 참조하게 되므로 거부
+            # (먼저 article 집계를 갱신해 같은 article 의 동시 확인 요청은 row lock 으로 순서대로 처리된다)
+            await self.article_handler.increase_counts(article_id=article.id, attachment_count=1)
+            if await self.attached_file_handler.exists_by_s3_key(s3_key=data.s3_key):
+                raise DuplicateAttachedFile()
+
+            attached_file = await self.attached_file_handler.get_uploaded_file(
+                article_id=article.id,
+                user_id=user_id,
+                s3_key=data.s3_key,
+                filename=data.filename
+            )
             if attached_file is None:
+                raise NotUploadedAttachedFile()
+
+            await self.attached_file_handler.create(attached_file=attached_file)
+
+        await self.article_cache_handler.delete_detail(article_id=article_id)
+        return True
+
+    async def delete(self, article_id: int, attached_file_id: int, user_id: int):
+        async with self.transaction_manager.async_transaction():
+            article = await self.article_handler.get_detail(article_id=article_id)
+            if article is None:
+                raise NotExistArticle()
+
+            attached_file = await self.attached_file_handler.get_detail(attached_file_id=attached_file_id)
+            if attached_file is None or attached_file.article_id != article.id:
                 raise NotExistAttachedFile()
             if attached_file.user_id != user_id:
                 raise NotDeleteAuth()
 
-            self.attached_file_handler.delete(attached_file=attached_file)
-            return True
+            unreferenced_files = await self.attached_file_handler.delete(attached_file=attached_file)
+            await self.article_handler.increase_counts(article_id=article.id, attachment_count=-1)
+
+        await self._delete_contents(attached_files=unreferenced_files)
+        await self.article_cache_handler.delete_detail(article_id=article.id)
+        return True
@@ -1,8 +1,18 @@
 import os
 
-from fastapi import APIRouter
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import PlainTextResponse
 
+from app.common.config import get_config
+from app.container import Container
+from app.databases.async_rdb import get_async_engine, get_async_replica_engines
+from app.databases.pool import get_pool_status
+from app.databases.rdb import get_engine, get_replica_engines
+from app.domains.auth.handlers import AuthHandler
+from app.domains.board.handlers import ArticleCacheHandler
+from app.utils.common_utils import get_ttl_hash
+
 index_router = APIRouter()
 
 @index_router.get(
@@ -23,3 +33,40 @@ async def index_api():
 async def application_health_check_api():
     """ Application health check api """
     return "OK"
+
+@index_router.get(
+    path="/internal/db-pool",
+    name="DB connection pool status api"
+)
+async def db_pool_status_api(request: Request):
+    """ DB connection pool 상태 (checked-out, overflow, checkout 대기 시간) """
+    conf = get_config(ttl_hash=get_ttl_hash(), api_env=request.app.state.api_env)
+    use_async_rdb = conf.RDB_MODE == 'async_rdb' # 사용하지 않는 async engine 은 생성하지 않는다
+    return {
+        'rdb': get_pool_status(get_engine()),
+        'async_rdb': get_pool_status(get_async_engine()) if use_async_rdb else None,
+        'rdb_replicas': [get_pool_status(e) for e in get_replica_engines()],
+        'async_rdb_replicas': [get_pool_status(e) for e in get_async_replica_engines()] if use_async_rdb else []
+    }
+
+@index_router.get(
+    path="/internal/article-cache",
+    name="Article detail cache status api"
+)
+@inject
+async def article_cache_status_api(
+        article_cache_handler: ArticleCacheHandler = Depends(Provide[Container.article_cache_handler])
+):
+    """ Article 상세 cache hit / miss 건수 """
+    return await article_cache_handler.get_stats()
+
+@index_router.get(
+    path="/internal/auth-cache",
+    name="Authenticated user cache status api"
+)
+@inject
+async def auth_cache_status_api(
+        auth_handler: AuthHandler = Depends(Provide[Container.auth_handler])
+):
+    """ 인증 사용자 in-process cache 상태 (현재 worker 기준) """
+    return auth_handler.auth_user_cache.stats()
@@ -1,12 +1,14 @@
 from app.databases.transactions import TransactionManager
+from app.domains.auth.handlers import AuthHandler
 from app.domains.user.handlers import UserHandler
 from app.domains.user.models import User
-from app.utils.crypto_utils import crypto_handler
+from app.utils.crypto_utils import get_crypto_handler
 
 class UserService():
 
-    def __init__(self, user_handler: UserHandler, transaction_manager: TransactionManager):
+    def __init__(self, user_handler: UserHandler, auth_handler: AuthHandler, transaction_manager: TransactionManager):
         self.user_handler = user_handler
+        self.auth_handler = auth_handler
         self.transaction_manager = transaction_manager
 
     def get_list(self, page: int, size: int):
@@ -17,9 +19,13 @@ class UserService():
 
     def create_user(self, user: User):
         with self.transaction_manager.transaction():
-            user.password = crypto_handler.encrypt_hash(plain_text=user.password)
+            user.password = get_crypto_handler().encrypt_hash(plain_text=user.password)
             return self.user_handler.create(user=user)
 
     def delete_user(self, user_id) -> bool:
         with self.transaction_manager.transaction():
-            return self.user_handler.delete(user_id)
\ No newline at end of file
+            result = self.user_handler.delete(user_id)
+
+        # 삭제된 사용자의 token 으로 인증되지 않도록 모든 worker 의 인증 사용자 cache 무효화
+        self.auth_handler.revoke_cached_user(user_id=user_id)
+        return result
@@ -7,30 +7,42 @@ from fastapi import (
 )
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.common.config import get_config
 from app.container import Container
+from app.databases.async_rdb import dispose_async_engines, get_async_engine
+from app.databases.pool import async_warmup_pool, warmup_pool
+from app.databases.rdb import dispose_engines, get_engine
 from app.domains.domain_routers import domain_router
 from app.domains.index.apis import index_router
+from app.middlewares.db_session_middleware import DBSessionMiddleware
 from app.middlewares.token_validator_middleware import AccessControl
 # from app.middlewares.token_validator_middleware import access_control
 from app.utils.common_utils import get_ttl_hash, get_api_env
 
-# @asynccontextmanager
-# async def lifespan(app: FastAPI):
-#     # Container setup
-#     container = Container()
-#     container.wire(modules=[__name__])
-#
-#     # Add container to app state
-#     app.container = container
-#
-#     yield
-#
-#     # Cleanup
-#     container.unwire()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    conf = get_config(api_env=app.state.api_env, ttl_hash=get_ttl_hash())
 
+    # Engine 은 import 시점이 아니라 여기서 생성 (secret 조회 포함)
+    engine = get_engine()
+    async_engine = get_async_engine() if conf.RDB_MODE == 'async_rdb' else None
+
+    # 배포 직후 첫 request 가 connect latency 를 부담하지 않도록 connection pool warm-up
+    if conf.DB_POOL_WARMUP > 0:
+        warmup_pool(engine, count=conf.DB_POOL_WARMUP)
+        if async_engine is not None:
+            await async_warmup_pool(async_engine, count=conf.DB_POOL_WARMUP)
+
+    # 첨부파일 저장소(S3 client 포함)는 생성 비용이 크므로 첫 request 전에 생성
+    app.container.storage()
+
+    yield
+
+    # Graceful shutdown - 처리 중인 request 가 끝난 뒤 connection pool 정리
+    await dispose_async_engines()
+    dispose_engines()
+    app.container.shutdown_resources()
 
 
 def create_app(api_env: str = None):
@@ -56,10 +68,11 @@ def create_app(api_env: str = None):
         redoc_url="/redoc",
         debug=True,
         swagger_ui_parameters={"persistAuthorization": True},
-        # lifespan=lifespan
+        lifespan=lifespan
     )
 
     app.container = container
+    app.state.api_env = api_env # lifespan / 내부 API 는 create_app 에 전달된 환경의 config 를 사용한다
 
     ## 미들웨어 등록
     app.add_middleware(
@@ -76,6 +89,9 @@ def create_app(api_env: str = None):
 
     app.add_middleware(AccessControl)
 
+    # Request 단위 DB session scope - 가장 바깥쪽에서 감싸도록 마지막에 등록
+    app.add_middleware(DBSessionMiddleware)
+
     ## Router 등록
     app.include_router(index_router)
     app.include_router(domain_router)
@@ -0,0 +1,35 @@
+from dependency_injector.wiring import inject, Provide
+from sqlalchemy.ext.asyncio import async_scoped_session
+from sqlalchemy.orm import scoped_session
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.container import Container
+from app.databases.scope import request_scope
+
+class DBSessionMiddleware:
+    """
+    Request 단위 DB session scope 관리
+    Request 처리 중 생성된 scoped session은 request 종료 시 정리(connection 반환)된다.
+    """
+    @inject
+    def __init__(
+            self,
+            app: ASGIApp,
+            session: scoped_session = Provide[Container.session],
+            async_session: async_scoped_session = Provide[Container.async_session]
+    ):
+        self.app = app
+        self.session = session
+        self.async_session = async_session
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope():
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                self.session.remove()
+                await self.async_session.remove()
@@ -1,13 +1,20 @@
+EXCEPT_PATH_LIST = [
+    '/docs',
+    '/favicon/ico',
+    '/openapi.json',
+    '/health',
+    '/membership',
+    '/auth'
+]
+
 def except_path_regex_string():
-    path_list = [
-        '/docs',
-        '/favicon/ico',
-        '/openapi.json',
-        '/health',
-        '/membership',
-        '/auth'
-    ]
-
-    return "|".join(path_list)
-
-EXCEPT_PATH_REGEX = "^({})".format(except_path_regex_string())
\ No newline at end of file
+    return "|".join(EXCEPT_PATH_LIST)
+
+EXCEPT_PATH_REGEX = "^({})".format(except_path_regex_string())
+
+# EXCEPT_PATH_REGEX 와 같은 prefix 일치 - request 마다 regex 를 해석하지 않도록 tuple 로 미리 구성
+EXCEPT_PATH_PREFIXES = tuple(EXCEPT_PATH_LIST)
+
+def is_except_path(path: str) -> bool:
+    """ 인증이 필요 없는 API 인지 확인 """
+    return path.startswith(EXCEPT_PATH_PREFIXES)
@@ -1,98 +1,108 @@
-import inspect
-import re
 import time
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import Depends, FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.requests import Request
 from starlette.responses import JSONResponse
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.common.exceptions import exception_handler, APIException
 from app.container import Container
 from app.domains.auth.handlers import AuthHandler
 from app.domains.user.handlers import UserHandler
-from app.middlewares import except_paths
+from app.middlewares.except_paths import is_except_path
 from app.utils.log_utils import api_logger
 
-async def url_pattern_match(path: str, pattern: str):
-    result = re.match(pattern, path)
-    if result:
-        return True
-    return False
-
-class AccessControl(BaseHTTPMiddleware):
+class AccessControl:
+    """
+    인증 / API logging middleware (pure ASGI)
+    BaseHTTPMiddleware 와 달리 request 마다 task / stream 을 만들지 않고, response 는 그대로 전달한다.
+    """
     @inject
     def __init__(
             self,
-            app: FastAPI,
+            app: ASGIApp,
             auth_handler: AuthHandler = Provide[Container.auth_handler],
             user_handler: UserHandler = Provide[Container.user_handler]
     ):
-        super().__init__(app)
+        self.app = app
         self.auth_handler = auth_handler
         self.user_handler = user_handler
 
-    async def dispatch(
-            self,
-            request: Request,
-            call_next: Callable
-    ):
-        request.state.start_time = time.time()
-
-        ip = request.headers['x-forwarded-for'] if "x-forwarded-for" in request.headers.keys() else request.client.host
-        request.state.ip = ip.split(",")[0] if "," in ip else ip
-
-        headers = request.headers
-        url = request.url.path
-
-        # Root 접근은 bypass
-        if url == "/":
-            response = await call_next(request)
+    def authenticate(self, headers: Headers):
+        """
+        Authorization header 의 access token 검증
+        :param headers:
+        :return: 인증된 user
+        """
+        tmp_token = headers.get("authorization")
+        if tmp_token is None:
+            raise Exception("Authorization required")
+        if not tmp_token.startswith("Bearer "):
+            raise Exception("Invalid token type - not Bearer token")
+        raw_token = tmp_token.replace("Bearer ", "")
+
+        # Cache hit 인 경우 JWT decode 및 user 조회를 생략한다
+        # Token 폐기(signout) / 사용자 삭제 여부는 worker 간 공유되는 cache(redis)로 매번 확인
+        user = self.auth_handler.get_cached_user(token=raw_token)
+        if user is None:
+            payload = self.auth_handler.decode_access_token_payload(token=raw_token)
+            user_id = payload['sub']
         else:
+            user_id = str(user.id)
+        token_value = self.auth_handler.get_access_token_value(
+            token=raw_token,
+            cached_user_id=user.id if user is not None else None
+        )
+        if token_value is None:
+            raise Exception("Invalid access token")
+        if user_id != token_value:
+            raise Exception("Invalid access token")
+        if user is None:
+            user = self.user_handler.get_detail(user_id = token_value)
+            if user is not None:
+                user = self.auth_handler.set_cached_user(token=raw_token, user=user, expires_at=payload.get('exp'))
+        return user
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Root 접근은 bypass
+        if scope['type'] != 'http' or scope['path'] == "/":
+            await self.app(scope, receive, send)
+            return
 
-            # 인증이 필요 없는 API의 경우에 대한 처리
-            if await url_pattern_match(url, except_paths.EXCEPT_PATH_REGEX):
-                try:
-                    response = await call_next(request)
-                    await api_logger(request=request, response=response)
-                except Exception as ex:
-                    error = await exception_handler(ex) if type(ex) is not APIException else ex
-                    response = JSONResponse(status_code=error.status_code, content=error.detail)
-                    await api_logger(request=request, error=error)
-
-            else:
-                # 인증이 필요한 API의 경우에 대한 처리
-                try:
-                    if "authorization" in headers.keys():
-                        tmp_token = headers.get("authorization")
-                        if tmp_token is None:
-                            raise Exception("Access token required")
-                        if not tmp_token.startswith("Bearer "):
-                            raise Exception("Invalid token type - not Bearer token")
-                        raw_token = tmp_token.replace("Bearer ", "")
-                        user_id = self.auth_handler.decode_access_token(token=raw_token)
-                        token_value = self.auth_handler.get_access_token_value(token=raw_token)
-                        if token_value is None:
-                            raise Exception("Invalid access token")
-                        if user_id != token_value:
-                            raise Exception("Invalid access token")
-                        user = self.user_handler.get_detail(user_id = token_value)
-                        request.state.user = user
-
-                    else:
-                        raise Exception("Authorization required")
-
-                    response = await call_next(request)
-                    await api_logger(request=request, response=response)
+        # scope['state'] 를 공유하므로 endpoint 의 request.state 에서도 조회된다
+        request = Request(scope)
+        request.state.start_time = time.time()
 
-                except Exception as ex:
-                    error = await exception_handler(ex) if type(ex) is not APIException else ex
-                    response = JSONResponse(status_code=error.status_code, content=error.detail)
-                    await api_logger(request=request, error=error)
+        ip = request.headers['x-forwarded-for'] if "x-forwarded-for" in request.headers else request.client.host
+        request.state.ip = ip.split(",")[0] if "," in ip else ip
 
-        return response
+        response_started = False
+        status_code = None
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started, status_code
+            if message['type'] == 'http.response.start':
+                response_started = True
+                status_code = message['status']
+            await send(message)
+
+        try:
+            # 인증이 필요한 API의 경우에 대한 처리
+            if not is_except_path(scope['path']):
+                request.state.user = self.authenticate(headers=request.headers)
+
+            await self.app(scope, receive, send_wrapper)
+            await api_logger(request=request, status_code=status_code)
+
+        except Exception as ex:
+            error = await exception_handler(ex) if type(ex) is not APIException else ex
+            await api_logger(request=request, error=error)
+            if response_started:
+                # 이미 response 를 보내기 시작한 경우 (streaming 중 오류) 새 response 를 보낼 수 없다
+                raise ex
+            response = JSONResponse(status_code=error.status_code, content=error.detail)
+            await response(scope, receive, send)
 
 
 # class AccessControl:
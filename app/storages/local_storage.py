@@ -0,0 +1,110 @@
+import mimetypes
+import mmap
+import os
+import shutil
+import tempfile
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Optional
+
+from app.storages.storage import StorageBackend, StorageObject, parse_byte_range
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Local disk 저장소 - object 는 {root_dir}/{bucket}/{key} 경로에 저장한다.
+    Download 는 file 을 mmap 하여 chunk 마다 read() 를 호출하지 않고 page cache 에서 slice 로 만든다.
+    (slice 할 때 chunk 크기만큼 bytes 로 한 번 복사되므로 zero-copy 는 아니다)
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = os.path.abspath(root_dir)
+
+    def _get_path(self, bucket: str, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root_dir, bucket, key))
+        if not path.startswith(self.root_dir + os.sep):
+            raise ValueError(f"Invalid storage key : {bucket}/{key}")
+        return path
+
+    def _write(self, upload_file_obj: UploadFile, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 같은 디렉토리의 임시 file 에 쓴 뒤 교체하여, download 중인 file 이 덮어써지지 않도록 한다
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(upload_file_obj.file, f, 1024 * 1024)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    async def upload(self, upload_file_obj: UploadFile, bucket: str, key: str) -> bool:
+        file_upload_result = False
+        try:
+            path = self._get_path(bucket=bucket, key=key)
+            await upload_file_obj.seek(0)
+            await run_in_threadpool(self._write, upload_file_obj, path)
+            file_upload_result = True
+        except Exception as ex:
+            print("[EX] LocalStorageBackend.upload : ", str(ex.args))
+
+        return file_upload_result
+
+    async def _iter_mmap(self, f, start: int, end: int, chunk_size: int) -> AsyncIterator[bytes]:
+        try:
+            if end < start:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                position = start
+                while position <= end:
+                    # page fault 로 disk I/O 가 발생할 수 있으므로 thread pool 에서 읽는다
+                    chunk = await run_in_threadpool(mm.__getitem__, slice(position, min(position + chunk_size, end + 1)))
+                    position += len(chunk)
+                    yield chunk
+        finally:
+            f.close()
+
+    async def open(self, bucket: str, key: str, byte_range: Optional[str] = None, chunk_size: int = 1024 * 1024) -> StorageObject:
+        f = open(self._get_path(bucket=bucket, key=key), 'rb')
+        try:
+            stat_result = os.fstat(f.fileno())
+            size = stat_result.st_size
+            content_range = None
+            start, end = 0, size - 1
+            byte_range = parse_byte_range(byte_range=byte_range, size=size)
+            if byte_range is not None:
+                start, end = byte_range
+                content_range = f"bytes {start}-{end}/{size}"
+        except Exception:
+            f.close()
+            raise
+
+        return StorageObject(
+            content_length=end - start + 1,
+            content_type=mimetypes.guess_type(key)[0],
+            etag=f'"{stat_result.st_mtime_ns:x}-{size:x}"',
+            content_range=content_range,
+            content=self._iter_mmap(f, start=start, end=end, chunk_size=chunk_size)
+        )
+
+    async def head(self, bucket: str, key: str) -> Optional[StorageObject]:
+        try:
+            stat_result = os.stat(self._get_path(bucket=bucket, key=key))
+        except (FileNotFoundError, ValueError):
+            return None
+
+        return StorageObject(
+            content_length=stat_result.st_size,
+            content_type=mimetypes.guess_type(key)[0],
+            etag=f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+        )
+
+    async def delete(self, bucket: str, key: str) -> bool:
+        try:
+            await run_in_threadpool(os.unlink, self._get_path(bucket=bucket, key=key))
+            return True
+        except FileNotFoundError:
+            return True
+        except Exception as ex:
+            print("[EX] LocalStorageBackend.delete : ", str(ex.args))
+            return False
@@ -0,0 +1,62 @@
+import hashlib
+
+from fastapi import UploadFile
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from app.storages.storage import StorageBackend, StorageObject, parse_byte_range
+
+class MemoryStorageBackend(StorageBackend):
+    """
+    In-memory 저장소 - test 및 benchmark 용 (process 종료 시 삭제)
+    """
+
+    def __init__(self):
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, Optional[str], str]] = {} # (bucket, key) -> (내용, content type, etag)
+
+    async def upload(self, upload_file_obj: UploadFile, bucket: str, key: str) -> bool:
+        file_upload_result = False
+        try:
+            await upload_file_obj.seek(0)
+            body = await upload_file_obj.read()
+            self.objects[(bucket, key)] = (body, upload_file_obj.content_type, f'"{hashlib.md5(body).hexdigest()}"')
+            file_upload_result = True
+        except Exception as ex:
+            print("[EX] MemoryStorageBackend.upload : ", str(ex.args))
+
+        return file_upload_result
+
+    @staticmethod
+    async def _iter_body(body: memoryview, chunk_size: int) -> AsyncIterator[bytes]:
+        for position in range(0, len(body), chunk_size):
+            yield bytes(body[position:position + chunk_size])
+
+    async def open(self, bucket: str, key: str, byte_range: Optional[str] = None, chunk_size: int = 1024 * 1024) -> StorageObject:
+        if (bucket, key) not in self.objects:
+            raise FileNotFoundError(f"{bucket}/{key}")
+
+        body, content_type, etag = self.objects[(bucket, key)]
+        content_range = None
+        start, end = 0, len(body) - 1
+        byte_range = parse_byte_range(byte_range=byte_range, size=len(body))
+        if byte_range is not None:
+            start, end = byte_range
+            content_range = f"bytes {start}-{end}/{len(body)}"
+
+        return StorageObject(
+            content_length=end - start + 1,
+            content_type=content_type,
+            etag=etag,
+            content_range=content_range,
+            content=self._iter_body(body=memoryview(body)[start:end + 1], chunk_size=chunk_size)
+        )
+
+    async def head(self, bucket: str, key: str) -> Optional[StorageObject]:
+        if (bucket, key) not in self.objects:
+            return None
+
+        body, content_type, etag = self.objects[(bucket, key)]
+        return StorageObject(content_length=len(body), content_type=content_type, etag=etag)
+
+    async def delete(self, bucket: str, key: str) -> bool:
+        self.objects.pop((bucket, key), None)
+        return True
@@ -0,0 +1,91 @@
+import urllib
+
+from fastapi import UploadFile
+from typing import TYPE_CHECKING, Optional
+
+from app.storages.storage import InvalidByteRange, StorageBackend, StorageObject
+from app.utils.aws_utils import (
+    s3_delete_object,
+    s3_generate_presigned_url,
+    s3_get_object,
+    s3_head_object,
+    s3_iter_body,
+    s3_upload_file
+)
+
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.client import BaseClient
+
+class S3StorageBackend(StorageBackend):
+
+    supports_presigned_url = True
+
+    def __init__(self, s3_client: "BaseClient", transfer_config: "TransferConfig" = None):
+        self.s3_client = s3_client
+        self.transfer_config = transfer_config
+
+    async def upload(self, upload_file_obj: UploadFile, bucket: str, key: str) -> bool:
+        return await s3_upload_file(
+            s3_client=self.s3_client,
+            upload_file_obj=upload_file_obj,
+            s3_bucket_name=bucket,
+            s3_key=key,
+            transfer_config=self.transfer_config
+        )
+
+    async def open(self, bucket: str, key: str, byte_range: Optional[str] = None, chunk_size: int = 1024 * 1024) -> StorageObject:
+        from botocore.exceptions import ClientError
+
+        try:
+            s3_object = await s3_get_object(s3_client=self.s3_client, s3_bucket_name=bucket, s3_key=key, byte_range=byte_range)
+        except ClientError as ex:
+            error_code = ex.response.get('Error', {}).get('Code')
+            if error_code == 'InvalidRange':
+                raise InvalidByteRange()
+            if error_code in ('NoSuchKey', '404'):
+                raise FileNotFoundError(f"{bucket}/{key}")
+            print("[EX] S3StorageBackend.open : ", str(ex.args))
+            raise ex
+
+        return StorageObject(
+            content_length=s3_object['ContentLength'],
+            content_type=s3_object.get('ContentType'),
+            etag=s3_object.get('ETag'),
+            content_range=s3_object.get('ContentRange'),
+            content=s3_iter_body(body=s3_object['Body'], chunk_size=chunk_size)
+        )
+
+    async def head(self, bucket: str, key: str) -> Optional[StorageObject]:
+        s3_object = await s3_head_object(s3_client=self.s3_client, s3_bucket_name=bucket, s3_key=key)
+        if s3_object is None:
+            return None
+
+        return StorageObject(
+            content_length=s3_object['ContentLength'],
+            content_type=s3_object.get('ContentType'),
+            etag=s3_object.get('ETag')
+        )
+
+    async def delete(self, bucket: str, key: str) -> bool:
+        return await s3_delete_object(s3_client=self.s3_client, s3_bucket_name=bucket, s3_key=key)
+
+    def create_upload_url(self, bucket: str, key: str, content_type: str, expires_in: int) -> str:
+        return s3_generate_presigned_url(
+            s3_client=self.s3_client,
+            client_method='put_object',
+            params={'Bucket': bucket, 'Key': key, 'ContentType': content_type},
+            expires_in=expires_in
+        )
+
+    def create_download_url(self, bucket: str, key: str, filename: str, expires_in: int) -> str:
+        return s3_generate_presigned_url(
+            s3_client=self.s3_client,
+            client_method='get_object',
+            params={
+                'Bucket': bucket,
+                'Key': key,
+                'ResponseContentDisposition': f"attachment;filename*=UTF-8''{urllib.parse.quote(filename)}"
+            },
+            expires_in=expires_in
+        )
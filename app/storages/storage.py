@@ -0,0 +1,100 @@
+import hashlib
+import re
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Optional, Tuple
+
+BYTE_RANGE_REGEX = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+@dataclass
+class StorageObject:
+    content_length: int
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    content_range: Optional[str] = None # Range 요청인 경우 (ex. bytes 0-1023/4096)
+    content: Optional[AsyncIterator[bytes]] = None # chunk 단위 object 내용, head 조회인 경우 None
+
+
+class InvalidByteRange(Exception):
+    """ 요청한 byte range 가 object 크기를 벗어난 경우 """
+    pass
+
+
+class PresignedUrlNotSupported(Exception):
+    """ Presigned URL 을 발급할 수 없는 저장소인 경우 """
+    pass
+
+
+def parse_byte_range(byte_range: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 byte range 를 (start, end) 로 변환 (end 포함)
+    :param byte_range: HTTP Range header 형식 (ex. bytes=0-1023, bytes=1024-, bytes=-10)
+    :param size: object 크기
+    :return: 형식이 잘못된 경우 None (전체 object), 만족할 수 없는 range 인 경우 InvalidByteRange
+    """
+    matched = BYTE_RANGE_REGEX.match(byte_range) if byte_range is not None else None
+    if matched is None or matched.group(1) == matched.group(2) == "":
+        return None
+
+    start, end = matched.group(1), matched.group(2)
+    if start == "":
+        # suffix range - 마지막 n byte
+        if int(end) == 0 or size == 0:
+            raise InvalidByteRange()
+        return max(size - int(end), 0), size - 1
+
+    start = int(start)
+    if end != "" and start > int(end):
+        return None
+    if start >= size:
+        raise InvalidByteRange()
+    return start, min(int(end), size - 1) if end != "" else size - 1
+
+
+async def get_content_hash(upload_file_obj: UploadFile) -> str:
+    """
+    Upload file 내용의 sha256 (hex)
+    Request body 는 이미 spool file 로 받아져 있으므로 저장소로 전송하기 전에 local 에서 읽어 계산한다.
+    (전송하면서 계산하면 같은 내용의 object 가 있는지 전송 전에 확인할 수 없으므로, network 없이 한 번 더 읽는 비용을 감수한다)
+    """
+    await upload_file_obj.seek(0)
+    digest = await run_in_threadpool(hashlib.file_digest, upload_file_obj.file, "sha256")
+    await upload_file_obj.seek(0)
+    return digest.hexdigest()
+
+
+class StorageBackend(ABC):
+    """
+    첨부파일 저장소
+    Object 는 bucket / key 로 구분하며, presigned URL 은 지원하는 backend(S3) 에서만 사용할 수 있다.
+    """
+
+    supports_presigned_url: bool = False
+
+    @abstractmethod
+    async def upload(self, upload_file_obj: UploadFile, bucket: str, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def open(self, bucket: str, key: str, byte_range: Optional[str] = None, chunk_size: int = 1024 * 1024) -> StorageObject:
+        """ Object 가 없으면 FileNotFoundError """
+        pass
+
+    @abstractmethod
+    async def head(self, bucket: str, key: str) -> Optional[StorageObject]:
+        pass
+
+    @abstractmethod
+    async def delete(self, bucket: str, key: str) -> bool:
+        pass
+
+    def create_upload_url(self, bucket: str, key: str, content_type: str, expires_in: int) -> str:
+        """ supports_presigned_url 이 False 인 저장소는 PresignedUrlNotSupported """
+        raise PresignedUrlNotSupported()
+
+    def create_download_url(self, bucket: str, key: str, filename: str, expires_in: int) -> str:
+        """ supports_presigned_url 이 False 인 저장소는 PresignedUrlNotSupported """
+        raise PresignedUrlNotSupported()
@@ -1,4 +1,4 @@
-from app.utils.aws_utils import get_aws_secret_value
+from app.utils.secret_utils import get_secret_value
 
 
 class TestBase:
@@ -6,7 +6,7 @@ class TestBase:
     ACCESS_TOKEN = None
 
     def signin(self, client):
-        test_user = get_aws_secret_value(secret_name="diboard/test-user")
+        test_user = get_secret_value(secret_name="diboard/test-user")
 
         url = '/auth/signin'
         request_params = {
@@ -1,7 +1,36 @@
+import asyncio
 import pytest
 
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
+from app.databases.rdb import Base
+from app.databases.transactions import AsyncTransactionManager, TransactionManager
+from app.domains.board.models import (
+    Article,
+    AttachedFile,
+    AttachedFileBlob,
+    Comment,
+    Tag,
+    TagCount,
+    TagDictionary
+)
+from app.domains.board.repositories.async_rdb.async_rdb_repository import (
+    ArticleAsyncRdbRepository,
+    AttachedFileAsyncRdbRepository,
+    CommentAsyncRdbRepository,
+    TagAsyncRdbRepository
+)
+from app.domains.board.repositories.rdb.rdb_repository import (
+    ArticleRdbRepository,
+    AttachedFileRdbRepository,
+    CommentRdbRepository,
+    TagRdbRepository
+)
+from app.domains.user.models import User
 from app.main import create_app
 
 @pytest.fixture(scope="session")
@@ -11,3 +40,54 @@ def app():
 @pytest.fixture(scope="session")
 def client(app):
     return TestClient(app=app)
+
+
+class BoardDB:
+    """
+    RDB_MODE 별 board repository 구성 (SQLite file DB)
+    rdb 는 동기 Session, async_rdb 는 aiosqlite AsyncSession 을 사용하며
+    test 데이터 준비 / 확인은 mode 와 무관하게 동기 session 으로 한다.
+    """
+
+    def __init__(self, mode: str, path: str):
+        self.mode = mode
+        self.engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(
+            self.engine,
+            tables=[t.__table__ for t in (User, Article, Comment, TagDictionary, Tag, TagCount, AttachedFile, AttachedFileBlob)]
+        )
+        self.session = Session(self.engine)
+
+        if mode == 'async_rdb':
+            # test 마다 asyncio.run 으로 event loop 가 바뀌므로 connection 을 pool 에 보관하지 않는다
+            self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+            self.async_session = AsyncSession(self.async_engine, autoflush=False, expire_on_commit=False)
+            self.repository_engine = self.async_engine.sync_engine
+            self.transaction_manager = AsyncTransactionManager(session=self.async_session)
+            self.article_repository = ArticleAsyncRdbRepository(session=self.async_session)
+            self.comment_repository = CommentAsyncRdbRepository(session=self.async_session)
+            self.tag_repository = TagAsyncRdbRepository(session=self.async_session)
+            self.attached_file_repository = AttachedFileAsyncRdbRepository(session=self.async_session)
+        else:
+            self.repository_engine = self.engine
+            self.transaction_manager = TransactionManager(session=self.session)
+            self.article_repository = ArticleRdbRepository(session=self.session)
+            self.comment_repository = CommentRdbRepository(session=self.session)
+            self.tag_repository = TagRdbRepository(session=self.session)
+            self.attached_file_repository = AttachedFileRdbRepository(session=self.session)
+
+    def close(self):
+        if self.mode == 'async_rdb':
+            async def _close():
+                await self.async_session.close()
+                await self.async_engine.dispose()
+            asyncio.run(_close())
+        self.session.close()
+        self.engine.dispose()
+
+@pytest.fixture(params=['rdb', 'async_rdb'])
+def board_db(request, tmp_path):
+    """ 동기 / async repository 양쪽으로 실행하는 board DB """
+    board_db = BoardDB(mode=request.param, path=str(tmp_path / "board.db"))
+    yield board_db
+    board_db.close()
@@ -0,0 +1,115 @@
+import fakeredis
+import pytest
+import re
+
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from app.domains.auth.handlers import AuthHandler
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+from app.domains.user.models import User
+from app.middlewares.except_paths import EXCEPT_PATH_REGEX, is_except_path
+from app.middlewares.token_validator_middleware import AccessControl
+
+class _StubUserHandler:
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_detail(self, user_id: str):
+        self.calls += 1
+        return User(id=int(user_id), username="access-user", created_at=datetime.now())
+
+
+@pytest.fixture
+def client():
+    """ AccessControl 만 등록한 app 과 access token """
+    auth_handler = AuthHandler(auth_repository=AuthCacheRepository(redis_client=fakeredis.FakeRedis(decode_responses=True)))
+    access_token = auth_handler.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+    auth_handler.set_token(key=access_token, value="1", exp=3600)
+
+    app = FastAPI()
+
+    @app.get("/health", response_class=PlainTextResponse)
+    async def health_api():
+        return "OK"
+
+    @app.get("/board/me")
+    async def me_api(request: Request):
+        return {'user_id': request.state.user.id, 'ip': request.state.ip}
+
+    @app.get("/board/stream")
+    async def stream_api():
+        async def _iter():
+            for i in range(3):
+                yield f"chunk{i};".encode()
+        return StreamingResponse(_iter(), media_type="application/octet-stream")
+
+    @app.get("/board/error")
+    async def error_api():
+        raise ValueError("unexpected error")
+
+    app.add_middleware(AccessControl, auth_handler=auth_handler, user_handler=_StubUserHandler())
+    with TestClient(app) as test_client:
+        test_client.headers['authorization'] = f"Bearer {access_token}"
+        yield test_client
+
+
+class TestAccessControl:
+
+    def test100_except_path_without_token(self, client):
+        resp = client.get("/health", headers={'authorization': ""})
+        assert resp.status_code == 200
+        assert resp.text == "OK"
+
+    def test110_except_path_matches_regex(self):
+        for path in ("/docs", "/auth/signin", "/healthz", "/board/articles", "/", "/api/health"):
+            assert is_except_path(path) == bool(re.match(EXCEPT_PATH_REGEX, path))
+
+    def test200_authenticated_request(self, client):
+        resp = client.get("/board/me", headers={'x-forwarded-for': "10.0.0.1, 10.0.0.2"})
+        assert resp.status_code == 200
+        assert resp.json() == {'user_id': 1, 'ip': "10.0.0.1"}
+
+    def test210_reject_without_token(self, client):
+        resp = client.get("/board/me", headers={'authorization': "Token abc"})
+        assert resp.status_code == 400
+        assert resp.json() == "Invalid token type - not Bearer token"
+
+        del client.headers['authorization']
+        resp = client.get("/board/me")
+        assert resp.status_code == 400
+        assert resp.json() == "Authorization required"
+
+    def test300_streaming_response_passes_through(self, client):
+        with client.stream("GET", "/board/stream") as resp:
+            chunks = list(resp.iter_bytes())
+        assert resp.status_code == 200
+        assert b"".join(chunks) == b"chunk0;chunk1;chunk2;"
+
+    def test400_endpoint_error_to_json(self, client):
+        resp = client.get("/board/error")
+        assert resp.status_code == 400
+        assert resp.json() == "unexpected error"
+
+    def test500_deleted_user_rejected_on_other_worker(self):
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        worker_a = AuthHandler(auth_repository=AuthCacheRepository(redis_client=redis_client))
+        worker_b = AuthHandler(auth_repository=AuthCacheRepository(redis_client=redis_client))
+        access_token = worker_b.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+        worker_b.set_token(key=access_token, value="1", exp=3600)
+
+        user_handler = _StubUserHandler()
+        access_control = AccessControl(app=None, auth_handler=worker_b, user_handler=user_handler)
+        headers = Headers({'authorization': f"Bearer {access_token}"})
+        assert access_control.authenticate(headers=headers).id == 1
+        assert access_control.authenticate(headers=headers).id == 1 # cache hit
+        assert user_handler.calls == 1
+
+        # 다른 worker 에서 사용자 삭제
+        worker_a.revoke_cached_user(user_id=1)
+        with pytest.raises(Exception, match="Invalid access token"):
+            access_control.authenticate(headers=headers)
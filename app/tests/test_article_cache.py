@@ -0,0 +1,180 @@
+import asyncio
+import fakeredis
+import pytest
+
+from datetime import datetime
+from sqlalchemy import event
+
+from app.common.constants import CACHE_KEY_PREFIX
+from app.domains.board.handlers import (
+    ArticleCacheHandler,
+    ArticleHandler,
+    ArticleSearchHandler,
+    AttachedFileHandler,
+    CommentHandler,
+    TagHandler
+)
+from app.domains.board.models import Article, AttachedFile, Tag
+from app.domains.board.repositories.cache.cache_repository import ArticleCacheRedisRepository
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import (
+    ArticleService,
+    AttachedFileService,
+    TagService
+)
+from app.domains.user.models import User
+from app.storages.memory_storage import MemoryStorageBackend
+
+CACHE_TTL = 60
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite(article 1건, tag 2건, 첨부파일 1건) + fakeredis 로 구성한 board service """
+    session = board_db.session
+    user = User(username="cache-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.flush()
+    article = Article(id=1, user_id=user.id, title="title", content="content")
+    session.add(article)
+    session.add_all([
+        Tag(id=1, user_id=user.id, article_id=1, tagging="tag 1"),
+        Tag(id=2, user_id=user.id, article_id=1, tagging="tag 2"),
+        AttachedFile(
+            id=1,
+            user_id=user.id,
+            article_id=1,
+            s3_bucket_name="bucket",
+            s3_key="key",
+            filename="file.txt",
+            file_size=10,
+            file_type="text/plain"
+        )
+    ])
+    session.commit()
+
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    article_handler = ArticleHandler(article_repository=board_db.article_repository)
+    article_cache_handler = ArticleCacheHandler(
+        article_cache_repository=ArticleCacheRedisRepository(redis_client=redis_client),
+        exp=CACHE_TTL
+    )
+    attached_file_handler = AttachedFileHandler(
+        attached_file_repository=board_db.attached_file_repository,
+        storage=MemoryStorageBackend()
+    )
+    tag_handler = TagHandler(tag_repository=board_db.tag_repository)
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    transaction_manager = board_db.transaction_manager
+
+    return {
+        'engine': board_db.repository_engine,
+        'user_id': user.id,
+        'redis_client': redis_client,
+        'article_service': ArticleService(
+            article_handler=article_handler,
+            article_cache_handler=article_cache_handler,
+            attached_file_handler=attached_file_handler,
+            comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+            tag_handler=tag_handler,
+            article_search_handler=article_search_handler,
+            transaction_manager=transaction_manager
+        ),
+        'tag_service': TagService(
+            tag_handler=tag_handler,
+            article_handler=article_handler,
+            article_cache_handler=article_cache_handler,
+            article_search_handler=article_search_handler,
+            transaction_manager=transaction_manager
+        ),
+        'attached_file_service': AttachedFileService(
+            attached_file_handler=attached_file_handler,
+            article_handler=article_handler,
+            article_cache_handler=article_cache_handler,
+            transaction_manager=transaction_manager
+        ),
+        'article_cache_handler': article_cache_handler
+    }
+
+
+def _get_detail(board):
+    return asyncio.run(board['article_service'].get_article_detail(article_id=1))
+
+
+class TestArticleCache:
+
+    def test100_read_through(self, board):
+        statements = []
+        event.listen(board['engine'], "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        first = _get_detail(board)
+        miss_count = len(statements)
+        second = _get_detail(board)
+
+        assert miss_count > 0
+        assert len(statements) == miss_count # cache hit 시 DB 조회 없음
+        assert second == first
+        assert [t.tagging for t in second.tags] == ["tag 1", "tag 2"]
+        assert second.attached_files[0].filename == "file.txt"
+        assert asyncio.run(board['article_cache_handler'].get_stats()) == {'hit': 1, 'miss': 1}
+
+    def test110_cache_ttl(self, board):
+        _get_detail(board)
+        ttl = board['redis_client'].ttl(f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL']}:1")
+        assert 0 < ttl <= CACHE_TTL
+
+    def test120_skip_stale_set(self, board):
+        article_handler = board['article_service'].article_handler
+        get_detail = article_handler.get_detail
+
+        async def _get_detail_with_concurrent_update(article_id: int):
+            article = await get_detail(article_id=article_id)
+            # DB 조회 직후 다른 request 가 article 을 수정하고 cache 를 무효화
+            await board['article_cache_handler'].delete_detail(article_id=article_id)
+            return article
+
+        article_handler.get_detail = _get_detail_with_concurrent_update
+        _get_detail(board)
+        # 무효화 이전에 읽은 값은 cache 에 저장하지 않는다
+        assert board['redis_client'].exists(f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL']}:1") == 0
+
+        article_handler.get_detail = get_detail
+        _get_detail(board)
+        assert board['redis_client'].exists(f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL']}:1") == 1
+
+    def test200_update_article_invalidates(self, board):
+        _get_detail(board)
+        asyncio.run(board['article_service'].update_article(
+            article_id=1,
+            update_article=Article(user_id=board['user_id'], title="updated title", content="updated content")
+        ))
+
+        assert _get_detail(board).title == "updated title"
+
+    def test210_delete_article_invalidates(self, board):
+        _get_detail(board)
+        asyncio.run(board['article_service'].delete_article(article_id=1, user_id=board['user_id']))
+
+        assert board['redis_client'].exists(f"{CACHE_KEY_PREFIX['ARTICLE_DETAIL']}:1") == 0
+
+    def test300_delete_tag_invalidates(self, board):
+        _get_detail(board)
+        asyncio.run(board['tag_service'].delete(tag_id=1, article_id=1, user_id=board['user_id']))
+
+        assert [t.tagging for t in _get_detail(board).tags] == ["tag 2"]
+
+    def test310_delete_all_tags_invalidates(self, board):
+        _get_detail(board)
+        asyncio.run(board['tag_service'].delete_all(article_id=1))
+
+        assert _get_detail(board).tags == []
+
+    def test400_delete_attached_file_invalidates(self, board):
+        _get_detail(board)
+        asyncio.run(board['attached_file_service'].delete(article_id=1, attached_file_id=1, user_id=board['user_id']))
+
+        assert _get_detail(board).attached_files == []
+
+    def test500_cache_unavailable(self, board):
+        # Redis 장애 시에도 DB 조회 결과를 반환
+        board['redis_client'].connected = False
+        assert _get_detail(board).title == "title"
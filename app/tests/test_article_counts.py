@@ -0,0 +1,188 @@
+import asyncio
+import io
+import pytest
+
+from datetime import datetime
+from fastapi import UploadFile
+from sqlalchemy import select, update
+from starlette.datastructures import Headers
+
+from app.domains.board.exceptions import NotExistTag
+from app.domains.board.handlers import (
+    ArticleHandler,
+    ArticleSearchHandler,
+    AttachedFileHandler,
+    CommentHandler,
+    TagHandler
+)
+from app.domains.board.models import Article, Comment, Tag
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import ArticleService, AttachedFileService, CommentService, TagService
+from app.domains.user.models import User
+from app.storages.memory_storage import MemoryStorageBackend
+
+def _make_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename, size=len(content), headers=Headers({'content-type': 'text/plain'}))
+
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite + memory 저장소로 구성한 board service """
+    session = board_db.session
+    user = User(username="count-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.commit()
+
+    article_handler = ArticleHandler(article_repository=board_db.article_repository)
+    comment_handler = CommentHandler(comment_repository=board_db.comment_repository)
+    tag_handler = TagHandler(tag_repository=board_db.tag_repository)
+    attached_file_handler = AttachedFileHandler(attached_file_repository=board_db.attached_file_repository, storage=MemoryStorageBackend())
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    transaction_manager = board_db.transaction_manager
+    return {
+        'session': session,
+        'user_id': user.id,
+        'article_service': ArticleService(
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            attached_file_handler=attached_file_handler,
+            comment_handler=comment_handler,
+            tag_handler=tag_handler,
+            article_search_handler=article_search_handler,
+            transaction_manager=transaction_manager
+        ),
+        'comment_service': CommentService(comment_handler=comment_handler, article_handler=article_handler, transaction_manager=transaction_manager),
+        'tag_service': TagService(
+            tag_handler=tag_handler,
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            article_search_handler=article_search_handler,
+            transaction_manager=transaction_manager
+        ),
+        'attached_file_service': AttachedFileService(
+            attached_file_handler=attached_file_handler,
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            transaction_manager=transaction_manager
+        )
+    }
+
+class _NoCacheHandler:
+
+    async def delete_detail(self, article_id: int):
+        pass
+
+
+def _get_counts(board, article_id: int) -> tuple:
+    board['session'].expire_all()
+    article = board['session'].get(Article, article_id)
+    return article.comment_count, article.attachment_count, article.tag_count
+
+def _create_comment(board, article_id: int, content: str, comment_id: int = None):
+    asyncio.run(board['comment_service'].create_comment(
+        insert_comment=Comment(user_id=board['user_id'], content=content, comment_id=comment_id),
+        article_id=article_id
+    ))
+
+
+class TestArticleCounts:
+
+    def test100_counts_updated_with_children(self, board):
+        user_id = board['user_id']
+        asyncio.run(board['article_service'].create_article(
+            insert_article=Article(user_id=user_id, title="title", content="content"),
+            tag_data=["a", "b", "a", ""],
+            files=[_make_upload_file("a.txt", b"a"), _make_upload_file("b.txt", b"b")]
+        ))
+        assert _get_counts(board, article_id=1) == (0, 2, 2)
+
+        _create_comment(board, article_id=1, content="root")
+        _create_comment(board, article_id=1, content="reply", comment_id=1)
+        _create_comment(board, article_id=1, content="root 2")
+        assert _get_counts(board, article_id=1) == (3, 2, 2)
+
+        # 이미 삭제된 댓글을 다시 삭제해도 한 번만 감소한다
+        for _ in range(2):
+            asyncio.run(board['comment_service'].delete_comment(article_id=1, comment_id=2, user_id=user_id))
+        asyncio.run(board['attached_file_service'].delete(article_id=1, attached_file_id=1, user_id=user_id))
+        tag = board['session'].scalars(select(Tag).where(Tag.article_id == 1)).first()
+        asyncio.run(board['tag_service'].delete(tag_id=tag.id, article_id=1, user_id=user_id))
+        assert _get_counts(board, article_id=1) == (2, 1, 1)
+
+        asyncio.run(board['article_service'].update_article(
+            article_id=1,
+            update_article=Article(user_id=user_id, title="title", content=""),
+            tag_data=["c", "d", "e"],
+            files=[_make_upload_file("c.txt", b"c")]
+        ))
+        asyncio.run(board['comment_service'].delete_comment_all(article_id=1))
+        assert _get_counts(board, article_id=1) == (0, 2, 3)
+
+        asyncio.run(board['tag_service'].delete_all(article_id=1))
+        assert _get_counts(board, article_id=1) == (0, 2, 0)
+
+        # 목록 조회는 article row 만 읽는다
+        articles = asyncio.run(board['article_service'].get_article_list(page=1, size=10))
+        assert [(a.comment_count, a.attachment_count, a.tag_count) for a in articles] == [(0, 2, 0)]
+
+    def test110_delete_tag_of_other_article(self, board):
+        user_id = board['user_id']
+        for tag_data in (["a"], ["b"]):
+            asyncio.run(board['article_service'].create_article(
+                insert_article=Article(user_id=user_id, title="title", content="content"),
+                tag_data=tag_data
+            ))
+        tag = board['session'].scalars(select(Tag).where(Tag.article_id == 1)).one()
+
+        # 다른 article 의 tag 는 삭제하지 않으며 어느 article 의 tag 수도 바뀌지 않는다
+        with pytest.raises(NotExistTag):
+            asyncio.run(board['tag_service'].delete(tag_id=tag.id, article_id=2, user_id=user_id))
+        assert (_get_counts(board, article_id=1)[2], _get_counts(board, article_id=2)[2]) == (1, 1)
+        assert board['session'].get(Tag, tag.id) is not None
+
+    def test120_update_with_same_tags(self, board):
+        user_id = board['user_id']
+        asyncio.run(board['article_service'].create_article(
+            insert_article=Article(user_id=user_id, title="title", content="content"),
+            tag_data=["a", "b"]
+        ))
+
+        def _update(tag_data: list):
+            asyncio.run(board['article_service'].update_article(
+                article_id=1,
+                update_article=Article(user_id=user_id, title="title", content=""),
+                tag_data=tag_data
+            ))
+            return [(t.id, t.tagging) for t in board['session'].scalars(select(Tag).where(Tag.article_id == 1).order_by(Tag.id))]
+
+        tags = _update(["a", "b"])
+        # 같은 tag 로 수정하면 tag row 와 tag 수가 바뀌지 않는다
+        assert _update(["b", "a"]) == tags
+        assert _get_counts(board, article_id=1)[2] == 2
+
+        # 빠진 tag 만 삭제하고 새로운 tag 만 추가한다
+        assert _update(["b", "c", "c"]) == [tags[1], (tags[1][0] + 1, "c")]
+        assert _get_counts(board, article_id=1)[2] == 2
+
+    def test200_reconcile(self, board):
+        user_id = board['user_id']
+        for i in range(5):
+            asyncio.run(board['article_service'].create_article(
+                insert_article=Article(user_id=user_id, title=f"title {i}", content="content"),
+                tag_data=[f"tag {i}"]
+            ))
+            _create_comment(board, article_id=i + 1, content="comment")
+        asyncio.run(board['article_service'].delete_article(article_id=5, user_id=user_id))
+
+        session = board['session']
+        session.execute(update(Article).where(Article.id.in_([2, 4])).values(comment_count=0, attachment_count=7, tag_count=0))
+        session.commit()
+
+        progress = []
+        result = asyncio.run(board['article_service'].reconcile_counts(batch_size=2, on_batch=lambda r: progress.append(r.last_id)))
+        assert (result.articles, result.fixed, result.last_id) == (5, 2, 5)
+        assert progress == [2, 4, 5]
+        assert [_get_counts(board, article_id=i) for i in range(1, 6)] == [(1, 0, 1)] * 4 + [(0, 0, 0)]
+
+        result = asyncio.run(board['article_service'].reconcile_counts(batch_size=2, after_id=2))
+        assert (result.articles, result.fixed) == (3, 0)
@@ -0,0 +1,87 @@
+import base64
+import fakeredis
+import pytest
+
+from datetime import datetime, timedelta
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+import app.main
+
+from app.databases.scope import get_scope_id
+from app.domains.board.models import Article
+from app.domains.user.models import User
+from app.utils.pagination_utils import encode_cursor
+
+ARTICLE_COUNT = 5
+
+@pytest.fixture
+def client(board_db):
+    """ SQLite(article 5건) + fakeredis 로 구성한 application 과 access token (RDB_MODE 별) """
+    session = board_db.session
+    session.add(User(id=1, username="cursor-user", password="pw", created_at=datetime.now()))
+    session.add_all([Article(id=i, user_id=1, title=f"title {i}", content="content") for i in range(1, ARTICLE_COUNT + 1)])
+    session.commit()
+
+    async_engine = board_db.async_engine if board_db.mode == 'async_rdb' else create_async_engine("sqlite+aiosqlite://")
+    application = app.main.create_app(api_env='TEST')
+    container = application.container
+    with container.rdb_mode.override(providers.Object(board_db.mode)), \
+            container.redis_client.override(providers.Object(fakeredis.FakeRedis(decode_responses=True))), \
+            container.session.override(providers.Object(scoped_session(sessionmaker(bind=board_db.engine, autoflush=False), scopefunc=get_scope_id))), \
+            container.async_session.override(providers.Object(async_scoped_session(
+                async_sessionmaker(bind=async_engine, expire_on_commit=False),
+                scopefunc=get_scope_id
+            ))):
+        auth_handler = container.auth_handler()
+        access_token = auth_handler.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+        auth_handler.set_token(key=access_token, value="1", exp=3600)
+
+        test_client = TestClient(app=application)
+        test_client.headers['authorization'] = f"Bearer {access_token}"
+        yield test_client
+
+def _get_page(client, **params) -> dict:
+    resp = client.get("/board/articles/cursor", params=params)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+class TestArticleCursorApi:
+
+    def test100_first_next_last_page(self, client):
+        first = _get_page(client, size=2)
+        assert [a['id'] for a in first['items']] == [5, 4]
+        assert first['items'][0]['comment_count'] == 0
+        assert first['next_cursor'] is not None
+
+        second = _get_page(client, size=2, cursor=first['next_cursor'])
+        assert [a['id'] for a in second['items']] == [3, 2]
+
+        # 마지막 page 는 next_cursor 가 없다
+        last = _get_page(client, size=2, cursor=second['next_cursor'])
+        assert ([a['id'] for a in last['items']], last['next_cursor']) == ([1], None)
+
+        # 남은 건수와 size 가 같으면 다음 page 가 없으므로 next_cursor 를 반환하지 않는다
+        assert _get_page(client, size=ARTICLE_COUNT)['next_cursor'] is None
+
+    def test110_after_id(self, client):
+        assert [a['id'] for a in _get_page(client, size=2, after_id=4)['items']] == [3, 2]
+
+        # 목록 API 도 after_id 를 지정하면 keyset 으로 조회한다
+        resp = client.get("/board/articles", params={'after_id': 3, 'size': 10})
+        assert resp.status_code == 200
+        assert [a['id'] for a in resp.json()] == [2, 1]
+
+    @pytest.mark.parametrize("cursor", [
+        "invalid",
+        base64.urlsafe_b64encode(b'["abc"]').decode().rstrip('='),
+        base64.urlsafe_b64encode(b'[{}]').decode().rstrip('='),
+        base64.urlsafe_b64encode(b'[true]').decode().rstrip('='),
+        encode_cursor(1, 2)
+    ], ids=["not-base64-json", "string", "object", "bool", "too-many-keys"])
+    def test200_malformed_cursor(self, client, cursor):
+        resp = client.get("/board/articles/cursor", params={'size': 2, 'cursor': cursor})
+        assert resp.status_code == 400
@@ -0,0 +1,78 @@
+import asyncio
+import io
+import orjson
+import pytest
+
+from datetime import datetime
+
+from app.domains.board.handlers import ArticleHandler, ArticleSearchHandler, CommentHandler, TagHandler
+from app.domains.board.models import Article, Comment, Tag
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import ArticleService
+from app.domains.user.models import User
+from app.utils.export_utils import encode_export
+from app.utils.import_utils import iter_csv
+
+@pytest.fixture
+def board(board_db):
+    """
+    article 5건(1건 삭제) - 짝수 id 에 tag 2개, article 1 에 댓글 / 대댓글
+    """
+    session = board_db.session
+    created_at = datetime(2024, 1, 2, 3, 4, 5)
+    session.add(User(id=1, username="export-user", password="pw", created_at=created_at))
+    for i in range(1, 6):
+        session.add(Article(id=i, user_id=1, title=f"title {i}", content=f"content\n{i}", is_deleted=(i == 3), created_at=created_at, updated_at=created_at))
+        if i % 2 == 0:
+            session.add_all([Tag(article_id=i, user_id=1, tagging=f"tag{i}"), Tag(article_id=i, user_id=1, tagging="common")])
+    session.add_all([
+        Comment(id=1, article_id=1, user_id=1, thread_id=1, level=0, content="root", created_at=created_at, updated_at=created_at),
+        Comment(id=2, article_id=1, user_id=1, comment_id=1, thread_id=1, level=1, content="reply", created_at=created_at, updated_at=created_at)
+    ])
+    session.commit()
+
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    return ArticleService(
+        article_handler=ArticleHandler(article_repository=board_db.article_repository),
+        article_cache_handler=None,
+        attached_file_handler=None,
+        comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+        tag_handler=TagHandler(tag_repository=board_db.tag_repository),
+        article_search_handler=article_search_handler,
+        transaction_manager=board_db.transaction_manager
+    )
+
+def _export(article_service, file_format: str, batch_size: int) -> bytes:
+    async def _run():
+        batches = article_service.iter_export(batch_size=batch_size)
+        return b"".join([chunk async for chunk in encode_export(batches=batches, file_format=file_format)])
+    return asyncio.run(_run())
+
+
+class TestArticleExport:
+
+    def test100_iter_export_batches(self, board):
+        async def _run():
+            return [batch async for batch in board.iter_export(batch_size=2)]
+
+        batches = asyncio.run(_run())
+        assert [[article['id'] for article in batch] for batch in batches] == [[1, 2], [4, 5]]
+        assert batches[0][0]['username'] == "export-user"
+        assert batches[0][1]['tags'] == ["tag2", "common"]
+        assert [(c['content'], c['level']) for c in batches[0][0]['comments']] == [("root", 0), ("reply", 1)]
+
+    def test200_export_ndjson(self, board):
+        records = [orjson.loads(line) for line in _export(board, "ndjson", batch_size=3).splitlines()]
+        assert [r['id'] for r in records] == [1, 2, 4, 5]
+        assert records[3] == {
+            'id': 5, 'user_id': 1, 'username': "export-user", 'title': "title 5", 'content': "content\n5",
+            'created_at': "2024-01-02T03:04:05", 'updated_at': "2024-01-02T03:04:05", 'tags': [], 'comments': []
+        }
+
+    def test300_export_csv_readable_by_import(self, board):
+        data = _export(board, "csv", batch_size=3).decode()
+        records = [record for _, record in iter_csv(io.StringIO(data, newline=''))]
+        assert [r['title'] for r in records] == ["title 1", "title 2", "title 4", "title 5"]
+        assert records[1]['content'] == "content\n2"
+        assert records[1]['tags'] == "tag2,common"
+        assert [c['content'] for c in orjson.loads(records[0]['comments'])] == ["root", "reply"]
@@ -0,0 +1,141 @@
+import asyncio
+import io
+import orjson
+import pytest
+
+from datetime import datetime
+from sqlalchemy import event
+
+from app.commands.import_articles import load_checkpoint, save_checkpoint
+from app.domains.board.exceptions import InvalidImportRecord
+from app.domains.board.handlers import ArticleHandler, ArticleSearchHandler, TagHandler
+from app.domains.board.models import Article, Tag
+from app.domains.board.repositories.rdb.rdb_repository import check_auto_increment_lock_mode, make_inserted_ids
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.schemas import ArticleImportResult
+from app.domains.board.services import ArticleService
+from app.domains.user.models import User
+from app.utils.import_utils import iter_records
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite 로 구성한 article service (user 1명) """
+    session = board_db.session
+    user = User(username="import-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.commit()
+
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    article_service = ArticleService(
+        article_handler=ArticleHandler(article_repository=board_db.article_repository),
+        article_cache_handler=None,
+        attached_file_handler=None,
+        comment_handler=None,
+        tag_handler=TagHandler(tag_repository=board_db.tag_repository),
+        article_search_handler=article_search_handler,
+        transaction_manager=board_db.transaction_manager
+    )
+    return session, article_service, user.id
+
+def _import(article_service, user_id: int, text: str, file_format: str, **kwargs):
+    f = io.StringIO(text, newline='')
+    return asyncio.run(article_service.import_articles(records=iter_records(f=f, file_format=file_format), user_id=user_id, **kwargs))
+
+def _get_tags(session) -> dict:
+    tags = {}
+    for tag in session.query(Tag).order_by(Tag.id):
+        tags.setdefault(tag.article.title, []).append(tag.tagging)
+    return tags
+
+
+class TestArticleImport:
+
+    def test100_import_ndjson(self, board):
+        session, article_service, user_id = board
+        lines = [orjson.dumps({'title': f"title {i}", 'content': "content", 'tags': [f"tag{i}", "common"]}).decode() for i in range(7)]
+
+        result = _import(article_service, user_id, "\n".join(lines), "ndjson", batch_size=3)
+
+        assert (result.rows, result.tags, result.checkpoint) == (7, 14, 7)
+        assert [a.title for a in session.query(Article).order_by(Article.id)] == [f"title {i}" for i in range(7)]
+        assert _get_tags(session)["title 5"] == ["tag5", "common"]
+
+    def test101_import_skips_empty_tags(self, board):
+        session, article_service, user_id = board
+        lines = [orjson.dumps({'title': "title", 'content': "content", 'tags': ["", " a ", "  ", "a"]}).decode()]
+
+        result = _import(article_service, user_id, "\n".join(lines), "ndjson")
+
+        assert result.tags == 1
+        assert _get_tags(session) == {"title": ["a"]}
+        assert session.query(Article).one().tag_count == 1
+
+    def test110_import_csv(self, board):
+        session, article_service, user_id = board
+        text = 'title,content,tags,created_at\n' \
+               'first,"multi\nline content","a, b",2020-01-02T03:04:05\n' \
+               'second,content,,\n'
+
+        result = _import(article_service, user_id, text, "csv")
+
+        assert (result.rows, result.tags) == (2, 2)
+        first = session.query(Article).filter(Article.title == "first").one()
+        assert first.content == "multi\nline content"
+        assert first.created_at == datetime(2020, 1, 2, 3, 4, 5)
+        assert _get_tags(session) == {"first": ["a", "b"]}
+
+    def test120_one_insert_per_batch(self, board, board_db):
+        # 한 INSERT 로 저장하고 연속으로 할당된 id 를 계산한다
+        session, article_service, user_id = board
+        session.add(Article(user_id=user_id, title="existing", content="content"))
+        session.commit()
+        article_inserts = []
+
+        @event.listens_for(board_db.repository_engine, "before_cursor_execute")
+        def _count_insert(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO tb_article "):
+                article_inserts.append(statement)
+
+        lines = [orjson.dumps({'title': f"title {i}", 'content': "content", 'tags': [f"tag{i}"]}).decode() for i in range(5)]
+        result = _import(article_service, user_id, "\n".join(lines), "ndjson", batch_size=2)
+        event.remove(board_db.repository_engine, "before_cursor_execute", _count_insert)
+
+        assert len(article_inserts) == 3 # batch 당 INSERT 1건
+        assert (result.rows, result.tags) == (5, 5)
+        assert _get_tags(session) == {f"title {i}": [f"tag{i}"] for i in range(5)}
+
+    def test130_inserted_ids(self):
+        # MySQL 은 첫 row, SQLite 는 마지막 row 의 id 를 반환한다
+        assert make_inserted_ids(dialect_name='mysql', last_row_id=11, count=3, step=2) == [11, 13, 15]
+        assert make_inserted_ids(dialect_name='sqlite', last_row_id=13, count=3, step=1) == [11, 12, 13]
+        check_auto_increment_lock_mode(lock_mode=1)
+        with pytest.raises(RuntimeError):
+            check_auto_increment_lock_mode(lock_mode=2)
+
+    def test200_resume_from_checkpoint(self, board):
+        session, article_service, user_id = board
+        lines = [orjson.dumps({'title': f"title {i}", 'content': "content"}).decode() for i in range(5)]
+        lines[3] = orjson.dumps({'title': "", 'content': "content"}).decode()
+        committed = []
+
+        with pytest.raises(InvalidImportRecord) as ex:
+            _import(article_service, user_id, "\n".join(lines), "ndjson", batch_size=2, on_commit=lambda r: committed.append(r.checkpoint))
+        assert (ex.value.line, ex.value.checkpoint) == (4, 2)
+        assert committed == [2]
+        assert session.query(Article).count() == 2 # 실패한 batch 는 저장되지 않음
+
+        # record 수정 후 checkpoint 부터 이어서 등록
+        lines[3] = orjson.dumps({'title': "title 3", 'content': "content"}).decode()
+        result = _import(article_service, user_id, "\n".join(lines), "ndjson", batch_size=2, skip=ex.value.checkpoint)
+        assert (result.rows, result.checkpoint) == (3, 5)
+        assert [a.title for a in session.query(Article).order_by(Article.id)] == [f"title {i}" for i in range(5)]
+
+    def test300_checkpoint_file(self, tmp_path):
+        source = tmp_path / "articles.ndjson"
+        path = str(tmp_path / "articles.checkpoint")
+        assert load_checkpoint(path=path, source=str(source)) == 0
+
+        save_checkpoint(path=path, source=str(source), result=ArticleImportResult(rows=10, tags=3, checkpoint=12, elapsed=1, rows_per_sec=10))
+        assert load_checkpoint(path=path, source=str(source)) == 12
+        with pytest.raises(ValueError):
+            load_checkpoint(path=path, source=str(tmp_path / "other.ndjson"))
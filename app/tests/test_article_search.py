@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+
+from datetime import datetime
+
+import app.common.config
+import app.container
+
+from app.domains.board.exceptions import InvalidSearchQuery
+from app.domains.board.handlers import (
+    ArticleHandler,
+    ArticleSearchHandler,
+    AttachedFileHandler,
+    CommentHandler,
+    TagHandler
+)
+from app.domains.board.models import Article
+from app.domains.board.repositories.search.search_repository import (
+    ArticleSearchMemoryRepository,
+    ArticleSearchSqliteRepository
+)
+from app.domains.board.services import ArticleService, TagService
+from app.domains.user.models import User
+from app.storages.memory_storage import MemoryStorageBackend
+
+DOCUMENTS = [
+    {'article_id': 1, 'title': "FastAPI 게시판", 'content': "Python 으로 만든 게시판 API", 'tags': ["python", "api"]},
+    {'article_id': 2, 'title': "검색 기능", 'content': "python search engine, BM25 ranking. Python!", 'tags': ["search"]},
+    {'article_id': 3, 'title': "Python tips", 'content': "list comprehension", 'tags': ["python"]},
+    {'article_id': 4, 'title': "공지사항", 'content': "점검 안내", 'tags': []}
+]
+
+@pytest.fixture(params=["memory", "sqlite"])
+def search_repository(request, tmp_path):
+    if request.param == "memory":
+        repository = ArticleSearchMemoryRepository()
+    else:
+        repository = ArticleSearchSqliteRepository(path=str(tmp_path / "search.db"))
+    repository.bulk_index(documents=DOCUMENTS)
+    return repository
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite 로 구성한 article / tag service 와 memory 검색 index """
+    session = board_db.session
+    user = User(username="search-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.commit()
+
+    article_handler = ArticleHandler(article_repository=board_db.article_repository)
+    tag_handler = TagHandler(tag_repository=board_db.tag_repository)
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    return {
+        'user_id': user.id,
+        'article_service': ArticleService(
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            attached_file_handler=AttachedFileHandler(attached_file_repository=board_db.attached_file_repository, storage=MemoryStorageBackend()),
+            comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+            tag_handler=tag_handler,
+            article_search_handler=article_search_handler,
+            transaction_manager=board_db.transaction_manager
+        ),
+        'tag_service': TagService(
+            tag_handler=tag_handler,
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            article_search_handler=article_search_handler,
+            transaction_manager=board_db.transaction_manager
+        )
+    }
+
+class _NoCacheHandler:
+
+    async def delete_detail(self, article_id: int):
+        pass
+
+
+def _search(board, query: str, tags: list = None) -> list:
+    total, hits = asyncio.run(board['article_service'].search_articles(query=query, tags=tags or [], page=1, size=10))
+    return [article.title for article, _ in hits]
+
+
+class TestArticleSearchRepository:
+
+    def test100_bm25_ranking(self, search_repository):
+        total, hits = search_repository.search(query="python", tags=[], offset=0, size=10)
+        assert total == 3
+        # 제목 + tag 에 등장하고 문서가 짧은 article 3 이 가장 높고, 내용에만 등장하는 article 은 낮다
+        assert [article_id for article_id, _ in hits] == [3, 1, 2]
+        assert hits[0][1] > hits[1][1] > hits[2][1] > 0
+
+    def test110_all_terms_and_tags(self, search_repository):
+        assert search_repository.search(query="Python 게시판", tags=[], offset=0, size=10)[0] == 1
+        total, hits = search_repository.search(query="python", tags=["api"], offset=0, size=10)
+        assert (total, [article_id for article_id, _ in hits]) == (1, [1])
+        # 검색어 없이 tag 로만 검색하면 최신(id 역순) 순서
+        assert search_repository.search(query="", tags=["python"], offset=0, size=10) == (2, [(3, 0.0), (1, 0.0)])
+        assert search_repository.search(query="없는단어", tags=[], offset=0, size=10) == (0, [])
+
+    def test120_pagination(self, search_repository):
+        _, first = search_repository.search(query="python", tags=[], offset=0, size=2)
+        total, second = search_repository.search(query="python", tags=[], offset=2, size=2)
+        assert total == 3
+        assert [article_id for article_id, _ in first + second] == [3, 1, 2]
+
+    def test200_reindex_and_delete(self, search_repository):
+        search_repository.index(article_id=3, title="Go tips", content="goroutine", tags=["go"])
+        search_repository.delete(article_id=1)
+        assert [article_id for article_id, _ in search_repository.search(query="python", tags=[], offset=0, size=10)[1]] == [2]
+        assert search_repository.search(query="", tags=["python"], offset=0, size=10) == (0, [])
+        assert search_repository.search(query="goroutine", tags=["go"], offset=0, size=10)[0] == 1
+
+    def test300_same_score_for_all_backends(self, tmp_path):
+        memory = ArticleSearchMemoryRepository()
+        sqlite = ArticleSearchSqliteRepository(path=str(tmp_path / "search.db"))
+        for repository in (memory, sqlite):
+            repository.bulk_index(documents=DOCUMENTS)
+        for query in ("python", "python 게시판", "search bm25"):
+            memory_hits = memory.search(query=query, tags=[], offset=0, size=10)[1]
+            sqlite_hits = sqlite.search(query=query, tags=[], offset=0, size=10)[1]
+            assert [h[0] for h in memory_hits] == [h[0] for h in sqlite_hits]
+            assert [h[1] for h in memory_hits] == pytest.approx([h[1] for h in sqlite_hits])
+
+    def test400_production_requires_index_path(self, monkeypatch, tmp_path):
+        # 임시 directory 기본값 없이 환경변수로 지정한 경로만 사용한다
+        monkeypatch.setattr(app.container, "get_api_env", lambda: "PRODUCT")
+        monkeypatch.setattr(app.common.config.ProductConfig, "SEARCH_SQLITE_PATH", None)
+        with pytest.raises(RuntimeError):
+            app.container._get_search_sqlite_path()
+
+        monkeypatch.setattr(app.common.config.ProductConfig, "SEARCH_SQLITE_PATH", str(tmp_path / "search.db"))
+        assert app.container._get_search_sqlite_path() == str(tmp_path / "search.db")
+
+
+class TestArticleSearchService:
+
+    def test100_index_on_create_update_delete(self, board):
+        article_service = board['article_service']
+        asyncio.run(article_service.create_article(
+            insert_article=Article(user_id=board['user_id'], title="첫 글", content="hello search"),
+            tag_data=["intro", ""]
+        ))
+        assert _search(board, "hello") == ["첫 글"]
+        assert _search(board, "", tags=["intro"]) == ["첫 글"]
+
+        # 제목만 수정하면 내용 / tag 는 유지된다
+        asyncio.run(article_service.update_article(article_id=1, update_article=Article(user_id=board['user_id'], title="수정한 글", content="")))
+        assert _search(board, "수정한 hello") == ["수정한 글"]
+        assert _search(board, "", tags=["intro"]) == ["수정한 글"]
+
+        asyncio.run(article_service.delete_article(article_id=1, user_id=board['user_id']))
+        assert _search(board, "hello") == []
+
+    def test110_reindex_on_tag_delete(self, board):
+        asyncio.run(board['article_service'].create_article(
+            insert_article=Article(user_id=board['user_id'], title="tag 글", content="content"),
+            tag_data=["a", "b"]
+        ))
+        asyncio.run(board['tag_service'].delete(tag_id=1, article_id=1, user_id=board['user_id']))
+        assert _search(board, "", tags=["a"]) == []
+        assert _search(board, "", tags=["b"]) == ["tag 글"]
+
+        asyncio.run(board['tag_service'].delete_all(article_id=1))
+        assert _search(board, "", tags=["b"]) == []
+        assert _search(board, "content") == ["tag 글"]
+
+    def test200_query_required(self, board):
+        with pytest.raises(InvalidSearchQuery):
+            _search(board, " !? ")
@@ -0,0 +1,228 @@
+import asyncio
+import fakeredis
+import io
+import pytest
+
+from datetime import datetime
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.common.constants import S3_BUCKET
+from app.domains.board.handlers import (
+    ArticleCacheHandler,
+    ArticleHandler,
+    ArticleSearchHandler,
+    AttachedFileHandler,
+    CommentHandler,
+    TagHandler
+)
+from app.domains.board.exceptions import DuplicateAttachedFile, NotExistAttachedFile, NotUploadedAttachedFile
+from app.domains.board.models import Article, AttachedFile, AttachedFileBlob
+from app.domains.board.repositories.cache.cache_repository import ArticleCacheRedisRepository
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.schemas import AttachedFileUploadConfirm
+from app.domains.board.services import ArticleService, AttachedFileService
+from app.domains.user.models import User
+from app.storages.memory_storage import MemoryStorageBackend
+
+PDF = b"%PDF-1.7 " + bytes(range(256)) * 64
+
+def _make_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        size=len(content),
+        headers=Headers({'content-type': 'application/pdf'})
+    )
+
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite + memory 저장소로 구성한 board service (article 2건) """
+    session = board_db.session
+    user = User(username="dedup-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.flush()
+    session.add_all([Article(id=i, user_id=user.id, title=f"title {i}", content="content") for i in (1, 2)])
+    session.commit()
+
+    storage = MemoryStorageBackend()
+    uploaded = []
+    storage_upload = storage.upload
+
+    async def _upload(upload_file_obj, bucket, key):
+        uploaded.append(key)
+        return await storage_upload(upload_file_obj=upload_file_obj, bucket=bucket, key=key)
+    storage.upload = _upload
+
+    article_handler = ArticleHandler(article_repository=board_db.article_repository)
+    article_cache_handler = ArticleCacheHandler(
+        article_cache_repository=ArticleCacheRedisRepository(redis_client=fakeredis.FakeRedis(decode_responses=True)),
+        exp=0
+    )
+    attached_file_handler = AttachedFileHandler(attached_file_repository=board_db.attached_file_repository, storage=storage)
+    attached_file_handler.is_presigned_mode = lambda: True
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    transaction_manager = board_db.transaction_manager
+
+    return {
+        'session': session,
+        'user_id': user.id,
+        'storage': storage,
+        'uploaded': uploaded,
+        'article_service': ArticleService(
+            article_handler=article_handler,
+            article_cache_handler=article_cache_handler,
+            attached_file_handler=attached_file_handler,
+            comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+            tag_handler=TagHandler(tag_repository=board_db.tag_repository),
+            article_search_handler=article_search_handler,
+            transaction_manager=transaction_manager
+        ),
+        'attached_file_service': AttachedFileService(
+            attached_file_handler=attached_file_handler,
+            article_handler=article_handler,
+            article_cache_handler=article_cache_handler,
+            transaction_manager=transaction_manager
+        )
+    }
+
+
+def _attach(board, article_id: int, files):
+    asyncio.run(board['article_service'].update_article(
+        article_id=article_id,
+        update_article=Article(user_id=board['user_id'], title=f"title {article_id}", content="content"),
+        files=files
+    ))
+
+def _get_ref_count(board) -> int:
+    blob = board['session'].query(AttachedFileBlob).first()
+    return blob.ref_count if blob is not None else 0
+
+
+class TestAttachedFileDedup:
+
+    def test100_duplicate_upload_is_not_transferred(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF)])
+        _attach(board, 2, [_make_upload_file("b.pdf", PDF)])
+
+        attached_files = board['session'].query(AttachedFile).order_by(AttachedFile.id).all()
+        assert [f.filename for f in attached_files] == ["a.pdf", "b.pdf"]
+        assert attached_files[0].s3_key == attached_files[1].s3_key
+        assert len(board['uploaded']) == 1
+        assert _get_ref_count(board) == 2
+
+    def test110_same_filename_different_content(self, board):
+        _attach(board, 1, [_make_upload_file("report.pdf", PDF)])
+        _attach(board, 2, [_make_upload_file("report.pdf", PDF + b"v2")])
+
+        s3_keys = {f.s3_key for f in board['session'].query(AttachedFile).all()}
+        assert len(s3_keys) == 2
+        assert len(board['storage'].objects) == 2
+
+    def test200_delete_keeps_shared_content(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF)])
+        _attach(board, 2, [_make_upload_file("b.pdf", PDF)])
+
+        asyncio.run(board['attached_file_service'].delete(article_id=1, attached_file_id=1, user_id=board['user_id']))
+
+        assert _get_ref_count(board) == 1
+        assert len(board['storage'].objects) == 1
+
+    def test210_delete_last_reference_removes_content(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF), _make_upload_file("a-copy.pdf", PDF)])
+        _attach(board, 2, [_make_upload_file("b.pdf", PDF)])
+
+        asyncio.run(board['article_service'].delete_article(article_id=1, user_id=board['user_id']))
+        assert _get_ref_count(board) == 1
+        assert len(board['storage'].objects) == 1
+
+        asyncio.run(board['attached_file_service'].delete(article_id=2, attached_file_id=3, user_id=board['user_id']))
+        assert board['session'].query(AttachedFileBlob).count() == 0
+        assert board['storage'].objects == {}
+
+    def test215_delete_through_other_article(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF)])
+
+        # 다른 article 의 URL 로는 첨부파일을 삭제할 수 없다
+        with pytest.raises(NotExistAttachedFile):
+            asyncio.run(board['attached_file_service'].delete(article_id=2, attached_file_id=1, user_id=board['user_id']))
+        board['session'].expire_all()
+        assert board['session'].query(AttachedFile).count() == 1
+        assert _get_ref_count(board) == 1
+        assert len(board['storage'].objects) == 1
+
+    def test220_reattached_content_is_kept(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF)])
+        article_service = board['article_service']
+        attached_file_handler = article_service.attached_file_handler
+
+        async def _delete():
+            async with article_service.transaction_manager.async_transaction():
+                attached_file = await attached_file_handler.get_detail(attached_file_id=1)
+                return await attached_file_handler.delete(attached_file=attached_file)
+
+        unreferenced_files = asyncio.run(_delete())
+        assert len(unreferenced_files) == 1
+        # 저장소 object 를 삭제하기 전에 같은 내용이 다시 첨부된 경우
+        _attach(board, 2, [_make_upload_file("b.pdf", PDF)])
+        asyncio.run(article_service._delete_contents(attached_files=unreferenced_files))
+        board['session'].expire_all()
+        assert _get_ref_count(board) == 1
+        assert len(board['storage'].objects) == 1
+
+    def test230_create_after_content_deleted(self, board):
+        _attach(board, 1, [_make_upload_file("a.pdf", PDF)])
+        article_service = board['article_service']
+        attached_file_handler = article_service.attached_file_handler
+
+        # 같은 내용의 object 가 있어 전송을 생략한 뒤, row 저장 전에 object 가 삭제된 경우
+        blob = asyncio.run(attached_file_handler.upload(f=_make_upload_file("b.pdf", PDF)))
+        asyncio.run(article_service.delete_article(article_id=1, user_id=board['user_id']))
+        assert board['storage'].objects == {}
+
+        async def _create():
+            async with article_service.transaction_manager.async_transaction():
+                await attached_file_handler.create(attached_file=AttachedFile(
+                    article_id=2,
+                    user_id=board['user_id'],
+                    s3_bucket_name=blob.s3_bucket_name,
+                    s3_key=blob.s3_key,
+                    filename="b.pdf",
+                    file_size=len(PDF),
+                    file_type="application/pdf",
+                    content_hash=blob.content_hash
+                ))
+
+        with pytest.raises(NotUploadedAttachedFile):
+            asyncio.run(_create())
+        board['session'].expire_all()
+        assert board['session'].query(AttachedFileBlob).count() == 0
+        assert len(board['uploaded']) == 1
+
+    def test300_confirm_same_key_once(self, board):
+        # Presigned URL 로 upload 된 object
+        s3_key = "diboard/1/uuid/presigned.pdf"
+        asyncio.run(board['storage'].upload(upload_file_obj=_make_upload_file("presigned.pdf", PDF), bucket=S3_BUCKET['BOARD'], key=s3_key))
+        data = AttachedFileUploadConfirm(s3_key=s3_key, filename="presigned.pdf")
+        attached_file_service = board['attached_file_service']
+
+        assert asyncio.run(attached_file_service.confirm_upload(article_id=1, user_id=board['user_id'], data=data)) is True
+        with pytest.raises(DuplicateAttachedFile):
+            asyncio.run(attached_file_service.confirm_upload(article_id=1, user_id=board['user_id'], data=data))
+
+        board['session'].expire_all()
+        assert board['session'].query(AttachedFile).filter(AttachedFile.s3_key == s3_key).count() == 1
+        assert board['session'].get(Article, 1).attachment_count == 1
+
+    def test310_delete_confirmed_content(self, board):
+        s3_key = "diboard/1/uuid/presigned.pdf"
+        asyncio.run(board['storage'].upload(upload_file_obj=_make_upload_file("presigned.pdf", PDF), bucket=S3_BUCKET['BOARD'], key=s3_key))
+        attached_file_service = board['attached_file_service']
+        data = AttachedFileUploadConfirm(s3_key=s3_key, filename="presigned.pdf")
+        asyncio.run(attached_file_service.confirm_upload(article_id=1, user_id=board['user_id'], data=data))
+
+        # content_hash 가 없는 file 도 같은 key 의 첨부파일이 없으면 저장소 object 를 삭제한다
+        attached_file_id = board['session'].query(AttachedFile.id).filter(AttachedFile.s3_key == s3_key).scalar()
+        asyncio.run(attached_file_service.delete(article_id=1, attached_file_id=attached_file_id, user_id=board['user_id']))
+        assert board['storage'].objects == {}
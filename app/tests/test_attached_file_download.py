@@ -0,0 +1,89 @@
+import asyncio
+import boto3
+import pytest
+
+from moto import mock_aws
+
+from app.common.constants import AWS_REGION, S3_BUCKET
+from app.domains.board.exceptions import InvalidRange, NotExistAttachedFile
+from app.domains.board.handlers import AttachedFileHandler
+from app.domains.board.models import AttachedFile
+from app.storages.s3_storage import S3StorageBackend
+from app.utils.aws_utils import get_s3_client
+
+CONTENT = bytes(range(256)) * 1024 # 256KB
+CHUNK_SIZE = 64 * 1024
+
+@pytest.fixture
+def attached_file():
+    with mock_aws():
+        s3_client = boto3.client('s3', region_name=AWS_REGION)
+        s3_client.create_bucket(
+            Bucket=S3_BUCKET['BOARD'],
+            CreateBucketConfiguration={'LocationConstraint': AWS_REGION}
+        )
+        s3_client.put_object(Bucket=S3_BUCKET['BOARD'], Key="download/file.bin", Body=CONTENT)
+        yield AttachedFile(
+            id=1,
+            s3_bucket_name=S3_BUCKET['BOARD'],
+            s3_key="download/file.bin",
+            filename="file.bin",
+            file_size=len(CONTENT),
+            file_type="application/octet-stream"
+        )
+
+
+@pytest.fixture
+def handler(attached_file, monkeypatch):
+    handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+    monkeypatch.setattr(handler.config, "S3_DOWNLOAD_CHUNKSIZE", CHUNK_SIZE)
+    return handler
+
+
+def _open(handler, attached_file, byte_range=None):
+    async def _read():
+        attached_file_content = await handler.open_content(attached_file=attached_file, byte_range=byte_range)
+        chunks = [chunk async for chunk in attached_file_content.content]
+        return attached_file_content, chunks
+
+    return asyncio.run(_read())
+
+
+class TestAttachedFileDownload:
+
+    def test100_stream_in_chunks(self, handler, attached_file):
+        attached_file_content, chunks = _open(handler, attached_file)
+
+        assert b"".join(chunks) == CONTENT
+        assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+        assert attached_file_content.content_length == len(CONTENT)
+        assert attached_file_content.etag is not None
+        assert attached_file_content.content_range is None
+
+    @pytest.mark.parametrize("byte_range, expected", [
+        ("bytes=100-199", CONTENT[100:200]),
+        ("bytes=262000-", CONTENT[262000:]),
+        ("bytes=-10", CONTENT[-10:])
+    ], ids=["range", "open-ended", "suffix"])
+    def test200_byte_range(self, handler, attached_file, byte_range, expected):
+        attached_file_content, chunks = _open(handler, attached_file, byte_range=byte_range)
+
+        assert b"".join(chunks) == expected
+        assert attached_file_content.content_length == len(expected)
+        assert attached_file_content.content_range.endswith(f"/{len(CONTENT)}")
+
+    def test210_multiple_range_returns_whole_file(self, handler, attached_file):
+        attached_file_content, chunks = _open(handler, attached_file, byte_range="bytes=0-1,5-6")
+
+        assert b"".join(chunks) == CONTENT
+        assert attached_file_content.content_range is None
+
+    def test220_unsatisfiable_range(self, handler, attached_file):
+        with pytest.raises(InvalidRange) as ex:
+            _open(handler, attached_file, byte_range=f"bytes={len(CONTENT) + 1}-")
+        assert ex.value.file_size == len(CONTENT)
+
+    def test300_missing_object(self, handler, attached_file):
+        attached_file.s3_key = "download/missing.bin"
+        with pytest.raises(NotExistAttachedFile):
+            _open(handler, attached_file)
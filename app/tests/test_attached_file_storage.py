@@ -0,0 +1,108 @@
+import asyncio
+import io
+import pytest
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.common.constants import S3_BUCKET
+from app.domains.board.exceptions import InvalidRange, NotExistAttachedFile, PresignedUrlDisabled
+from app.domains.board.handlers import AttachedFileHandler
+from app.domains.board.models import AttachedFile, AttachedFileBlob
+from app.storages.local_storage import LocalStorageBackend
+from app.storages.memory_storage import MemoryStorageBackend
+
+CONTENT = bytes(range(256)) * 1024 # 256KB
+CHUNK_SIZE = 64 * 1024
+
+def _make_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        size=len(content),
+        headers=Headers({'content-type': 'application/octet-stream'})
+    )
+
+def _make_attached_file(blob: AttachedFileBlob) -> AttachedFile:
+    return AttachedFile(
+        id=1,
+        s3_bucket_name=blob.s3_bucket_name,
+        s3_key=blob.s3_key,
+        filename="file.bin",
+        file_size=len(CONTENT),
+        file_type="application/octet-stream"
+    )
+
+def _read(handler, attached_file, byte_range=None):
+    async def _read_all():
+        attached_file_content = await handler.open_content(attached_file=attached_file, byte_range=byte_range)
+        chunks = [chunk async for chunk in attached_file_content.content]
+        return attached_file_content, chunks
+
+    return asyncio.run(_read_all())
+
+
+@pytest.fixture(params=["local", "memory"])
+def handler(request, tmp_path, monkeypatch):
+    storage = LocalStorageBackend(root_dir=str(tmp_path)) if request.param == "local" else MemoryStorageBackend()
+    handler = AttachedFileHandler(attached_file_repository=None, storage=storage)
+    monkeypatch.setattr(handler.config, "S3_DOWNLOAD_CHUNKSIZE", CHUNK_SIZE)
+    monkeypatch.setattr(handler.config, "ATTACHMENT_TRANSFER_MODE", "presigned")
+    return handler
+
+
+@pytest.fixture
+def attached_file(handler):
+    blob = asyncio.run(handler.upload(f=_make_upload_file("file.bin", CONTENT)))
+    return _make_attached_file(blob)
+
+
+class TestAttachedFileStorage:
+
+    def test100_upload_and_download(self, handler, attached_file):
+        attached_file_content, chunks = _read(handler, attached_file)
+
+        assert b"".join(chunks) == CONTENT
+        assert max(len(chunk) for chunk in chunks) <= CHUNK_SIZE
+        assert attached_file_content.content_length == len(CONTENT)
+        assert attached_file_content.etag is not None
+        assert attached_file_content.content_range is None
+
+    @pytest.mark.parametrize("byte_range, expected", [
+        ("bytes=100-199", CONTENT[100:200]),
+        ("bytes=262000-", CONTENT[262000:]),
+        ("bytes=-10", CONTENT[-10:]),
+        ("bytes=0-1,5-6", CONTENT)
+    ], ids=["range", "open-ended", "suffix", "multiple"])
+    def test200_byte_range(self, handler, attached_file, byte_range, expected):
+        attached_file_content, chunks = _read(handler, attached_file, byte_range=byte_range)
+
+        assert b"".join(chunks) == expected
+        assert attached_file_content.content_length == len(expected)
+        if expected != CONTENT:
+            assert attached_file_content.content_range.endswith(f"/{len(CONTENT)}")
+
+    def test210_unsatisfiable_range(self, handler, attached_file):
+        with pytest.raises(InvalidRange) as ex:
+            _read(handler, attached_file, byte_range=f"bytes={len(CONTENT)}-")
+        assert ex.value.file_size == len(CONTENT)
+
+    def test220_missing_object(self, handler, attached_file):
+        asyncio.run(handler.storage.delete(bucket=attached_file.s3_bucket_name, key=attached_file.s3_key))
+        with pytest.raises(NotExistAttachedFile):
+            _read(handler, attached_file)
+
+    def test300_presigned_mode_not_supported(self, handler, attached_file):
+        # presigned 설정이어도 URL 을 발급할 수 없는 저장소는 proxy 방식으로 전송
+        assert handler.is_presigned_mode() is False
+        with pytest.raises(PresignedUrlDisabled):
+            asyncio.run(handler.create_upload_url(article_id=1, filename="file.bin", file_type="application/octet-stream"))
+        with pytest.raises(PresignedUrlDisabled):
+            asyncio.run(handler.create_download_url(attached_file=attached_file))
+
+    def test400_reject_key_outside_root(self, tmp_path):
+        storage = LocalStorageBackend(root_dir=str(tmp_path / "storage"))
+        upload_file = _make_upload_file("escape.bin", CONTENT)
+
+        assert asyncio.run(storage.upload(upload_file_obj=upload_file, bucket=S3_BUCKET['BOARD'], key="../../escape.bin")) is False
+        assert not (tmp_path / "escape.bin").exists()
@@ -0,0 +1,127 @@
+import asyncio
+import boto3
+import hashlib
+import io
+import pytest
+import requests
+import urllib
+
+from boto3.s3.transfer import TransferConfig
+from fastapi import UploadFile
+from moto import mock_aws
+from starlette.datastructures import Headers
+
+from app.common.constants import AWS_REGION, S3_BUCKET, S3_KEY_PREFIX
+from app.domains.board.handlers import AttachedFileHandler
+from app.domains.board.models import AttachedFile
+from app.storages.s3_storage import S3StorageBackend
+from app.utils.aws_utils import get_s3_client
+
+MB = 1024 * 1024
+
+def _make_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        filename=filename,
+        size=len(content),
+        headers=Headers({'content-type': 'application/octet-stream'})
+    )
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        s3_client = boto3.client('s3', region_name=AWS_REGION)
+        s3_client.create_bucket(
+            Bucket=S3_BUCKET['BOARD'],
+            CreateBucketConfiguration={'LocationConstraint': AWS_REGION}
+        )
+        yield s3_client
+
+
+class TestAttachedFileUpload:
+
+    def test100_upload_all(self, s3_client):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+        files = [_make_upload_file(f"upload-{i}.txt", f"content {i}".encode()) for i in range(5)]
+
+        blobs = asyncio.run(handler.upload_all(files=files))
+
+        for i, blob in enumerate(blobs):
+            assert blob.content_hash == hashlib.sha256(f"content {i}".encode()).hexdigest()
+            s3_object = s3_client.get_object(Bucket=S3_BUCKET['BOARD'], Key=blob.s3_key)
+            assert s3_object['Body'].read() == f"content {i}".encode()
+            assert s3_object['ContentType'] == 'application/octet-stream'
+
+    def test110_multipart_upload(self, s3_client):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+        handler.storage.transfer_config = TransferConfig(multipart_threshold=5 * MB, multipart_chunksize=5 * MB)
+        content = bytes(range(256)) * (11 * MB // 256)
+
+        blobs = asyncio.run(handler.upload_all(files=[_make_upload_file("large.bin", content)]))
+
+        assert blobs[0].s3_key == f"{S3_KEY_PREFIX['BOARD']}/blobs/{blobs[0].content_hash[:2]}/{blobs[0].content_hash}"
+        s3_object = s3_client.get_object(Bucket=S3_BUCKET['BOARD'], Key=blobs[0].s3_key)
+        assert s3_object['Body'].read() == content
+        assert s3_object['ETag'].strip('"').endswith("-3") # 5MB + 5MB + 1MB part
+
+    def test200_bounded_concurrency(self, monkeypatch):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=None)
+        monkeypatch.setattr(handler.config, "S3_UPLOAD_CONCURRENCY", 2)
+        running = {'current': 0, 'max': 0}
+
+        async def _upload(f):
+            running['current'] += 1
+            running['max'] = max(running['max'], running['current'])
+            await asyncio.sleep(0.01)
+            running['current'] -= 1
+            return f.filename != "fail"
+
+        monkeypatch.setattr(handler, "upload", _upload)
+        files = [_make_upload_file(name, b"") for name in ("a", "fail", "c", "d", "e")]
+
+        results = asyncio.run(handler.upload_all(files=files))
+
+        assert results == [True, False, True, True, True]
+        assert running['max'] == 2
+
+
+class TestAttachedFilePresigned:
+
+    def test100_presigned_upload(self, s3_client):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+        upload_url = asyncio.run(handler.create_upload_url(article_id=1, filename="presigned.txt", file_type="text/plain"))
+
+        assert upload_url['s3_key'].startswith(f"{S3_KEY_PREFIX['BOARD']}/1/")
+        assert asyncio.run(handler.get_uploaded_file(
+            article_id=1, user_id=1, s3_key=upload_url['s3_key'], filename="presigned.txt"
+        )) is None # upload 전
+
+        resp = requests.put(upload_url['upload_url'], data=b"presigned content", headers=upload_url['headers'])
+        assert resp.status_code == 200
+
+        attached_file = asyncio.run(handler.get_uploaded_file(
+            article_id=1, user_id=1, s3_key=upload_url['s3_key'], filename="presigned.txt"
+        ))
+        assert attached_file.file_size == len(b"presigned content")
+        assert attached_file.file_type == "text/plain"
+
+    def test110_reject_key_of_other_article(self, s3_client):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+        upload_url = asyncio.run(handler.create_upload_url(article_id=1, filename="presigned.txt", file_type="text/plain"))
+        requests.put(upload_url['upload_url'], data=b"presigned content", headers=upload_url['headers'])
+
+        assert asyncio.run(handler.get_uploaded_file(
+            article_id=2, user_id=1, s3_key=upload_url['s3_key'], filename="presigned.txt"
+        )) is None
+
+    def test200_presigned_download(self, s3_client):
+        handler = AttachedFileHandler(attached_file_repository=None, storage=S3StorageBackend(s3_client=get_s3_client()))
+        s3_client.put_object(Bucket=S3_BUCKET['BOARD'], Key="download/file.txt", Body=b"download content")
+        attached_file = AttachedFile(s3_bucket_name=S3_BUCKET['BOARD'], s3_key="download/file.txt", filename="파일.txt")
+
+        download_url = asyncio.run(handler.create_download_url(attached_file=attached_file))
+
+        assert "response-content-disposition" in download_url
+        assert urllib.parse.quote("파일.txt") in urllib.parse.unquote(download_url)
+        assert requests.get(download_url).content == b"download content"
@@ -0,0 +1,27 @@
+import fakeredis
+
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+
+class TestAuthCacheRepository:
+
+    def test100_set_cache_many(self):
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        repository = AuthCacheRepository(redis_client=redis_client)
+        repository.set_cache_many(items=[
+            ("refresh-token", "1", 600),
+            ("access-token", "1", 60),
+            ("no-expire", "1", 0)
+        ])
+
+        assert redis_client.get("refresh-token") == "1"
+        assert 0 < redis_client.ttl("access-token") <= 60
+        assert redis_client.ttl("no-expire") == -1
+
+    def test200_get_cache_and_expire(self):
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        repository = AuthCacheRepository(redis_client=redis_client)
+        redis_client.set("access-token", "1", ex=10)
+
+        assert repository.get_cache_and_expire(key="access-token", exp=600) == "1"
+        assert redis_client.ttl("access-token") > 10
+        assert repository.get_cache_and_expire(key="unknown-token", exp=600) is None
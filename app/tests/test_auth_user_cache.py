@@ -0,0 +1,101 @@
+import fakeredis
+import time
+
+from datetime import datetime, timedelta
+
+from app.domains.auth.handlers import AuthHandler
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+from app.domains.user.models import User
+from app.utils.cache_utils import LRUTTLCache
+
+def _make_auth_handler(redis_client=None):
+    redis_client = redis_client or fakeredis.FakeRedis(decode_responses=True)
+    return AuthHandler(auth_repository=AuthCacheRepository(redis_client=redis_client))
+
+
+class TestLRUTTLCache:
+
+    def test100_lru_eviction(self):
+        cache = LRUTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1 # a 사용 -> b 가 가장 오래 사용되지 않은 항목
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()['size'] == 2
+
+    def test110_ttl_expire(self):
+        cache = LRUTTLCache(maxsize=10, ttl=0.05)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        time.sleep(0.06)
+
+        assert cache.get("a") is None
+        assert cache.stats()['hit'] == 1
+        assert cache.stats()['miss'] == 1
+
+    def test120_disabled(self):
+        cache = LRUTTLCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+class TestAuthUserCache:
+
+    def test100_cache_user_snapshot(self):
+        auth_handler = _make_auth_handler()
+        user = User(id=1, username="cache-user", created_at=datetime.now())
+        auth_handler.set_cached_user(token="token", user=user)
+
+        auth_user = auth_handler.get_cached_user(token="token")
+        assert auth_user.id == 1
+        assert auth_user.username == "cache-user"
+        assert not isinstance(auth_user, User)
+
+    def test110_not_cached_after_token_expired(self):
+        auth_handler = _make_auth_handler()
+        user = User(id=1, username="cache-user")
+        expires_at = int((datetime.now() - timedelta(seconds=1)).timestamp())
+        auth_handler.set_cached_user(token="token", user=user, expires_at=expires_at)
+
+        assert auth_handler.get_cached_user(token="token") is None
+
+    def test200_invalidate_by_token(self):
+        auth_handler = _make_auth_handler()
+        auth_handler.set_cached_user(token="token-1", user=User(id=1, username="user-1"))
+        auth_handler.set_cached_user(token="token-2", user=User(id=1, username="user-1"))
+        auth_handler.invalidate_cached_user(token="token-1")
+
+        assert auth_handler.get_cached_user(token="token-1") is None
+        assert auth_handler.get_cached_user(token="token-2") is not None
+
+    def test210_invalidate_by_user(self):
+        auth_handler = _make_auth_handler()
+        auth_handler.set_cached_user(token="token-1", user=User(id=1, username="user-1"))
+        auth_handler.set_cached_user(token="token-2", user=User(id=1, username="user-1"))
+        auth_handler.set_cached_user(token="token-3", user=User(id=2, username="user-2"))
+        auth_handler.invalidate_cached_user(user_id=1)
+
+        assert auth_handler.get_cached_user(token="token-1") is None
+        assert auth_handler.get_cached_user(token="token-2") is None
+        assert auth_handler.get_cached_user(token="token-3").id == 2
+
+    def test220_revoke_user_across_workers(self):
+        # 같은 redis 를 사용하는 두 worker
+        redis_client = fakeredis.FakeRedis(decode_responses=True)
+        worker_a, worker_b = _make_auth_handler(redis_client), _make_auth_handler(redis_client)
+        worker_b.set_token(key="token-1", value="1", exp=3600)
+        worker_b.set_token(key="token-2", value="2", exp=3600)
+        worker_b.set_cached_user(token="token-1", user=User(id=1, username="user-1"))
+        worker_b.set_cached_user(token="token-2", user=User(id=2, username="user-2"))
+
+        worker_a.revoke_cached_user(user_id=1)
+
+        # 다른 worker 의 cache hit 도 revoke 표시로 거부되고 cache 에서 삭제된다
+        assert worker_b.get_access_token_value(token="token-1", cached_user_id=1) is None
+        assert worker_b.get_cached_user(token="token-1") is None
+        assert worker_b.get_access_token_value(token="token-2", cached_user_id=2) == "2"
+        assert 0 < redis_client.ttl("auth:revoked-user:1") <= worker_a.config.AUTH_USER_CACHE_TTL
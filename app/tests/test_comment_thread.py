@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+
+from datetime import datetime
+from sqlalchemy import MetaData, insert, select
+
+from app.domains.board.exceptions import NotExistComment
+from app.domains.board.handlers import ArticleHandler, CommentHandler
+from app.domains.board.models import Article, Comment
+from app.domains.board.services import CommentService
+from app.domains.user.models import User
+
+def _make_board(board_db) -> dict:
+    session = board_db.session
+    session.add(User(id=1, username="thread-user", password="pw", created_at=datetime.now()))
+    session.add(Article(id=1, user_id=1, title="title", content="content"))
+    session.commit()
+
+    return {
+        'session': session,
+        'comment_service': CommentService(
+            comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+            article_handler=ArticleHandler(article_repository=board_db.article_repository),
+            transaction_manager=board_db.transaction_manager
+        )
+    }
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite 로 구성한 comment service (article 1건) """
+    return _make_board(board_db=board_db)
+
+@pytest.fixture
+def legacy_board(board_db):
+    """ thread_id 가 nullable 인(migration 이전) 댓글 table """
+    metadata = MetaData()
+    for model in (User, Article, Comment):
+        model.__table__.to_metadata(metadata)
+    legacy_table = metadata.tables[Comment.__tablename__]
+    legacy_table.c.thread_id.nullable = True
+    Comment.__table__.drop(board_db.engine)
+    legacy_table.create(board_db.engine)
+    return _make_board(board_db=board_db)
+
+
+def _create_comment(board, content: str, comment_id: int = None):
+    asyncio.run(board['comment_service'].create_comment(
+        insert_comment=Comment(user_id=1, content=content, comment_id=comment_id),
+        article_id=1
+    ))
+
+def _get_threads(session) -> dict:
+    session.expire_all()
+    return {c.content: (c.comment_id, c.thread_id, c.level) for c in session.scalars(select(Comment))}
+
+def _get_all_pages(board, size: int) -> list:
+    comment_service = board['comment_service']
+    comments, cursor = asyncio.run(comment_service.get_comment_cursor_list(article_id=1, size=size))
+    contents = [c.content for c in comments]
+    while cursor is not None:
+        comments, cursor = asyncio.run(comment_service.get_comment_cursor_list(article_id=1, size=size, cursor=cursor))
+        contents += [c.content for c in comments]
+    return contents
+
+
+class TestCommentThread:
+
+    def test100_thread_id_on_create(self, board):
+        _create_comment(board, content="root 1")
+        _create_comment(board, content="root 2")
+        _create_comment(board, content="reply 1-1", comment_id=1)
+        # 대댓글에 대한 답글은 최상위 댓글의 thread 로 묶인다
+        _create_comment(board, content="reply 1-2", comment_id=3)
+
+        assert _get_threads(board['session']) == {
+            "root 1": (None, 1, 0),
+            "root 2": (None, 2, 0),
+            "reply 1-1": (1, 1, 1),
+            "reply 1-2": (1, 1, 1)
+        }
+
+    def test110_reply_to_other_article(self, board):
+        _create_comment(board, content="root 1")
+        board['session'].add(Article(id=2, user_id=1, title="title 2", content="content"))
+        board['session'].commit()
+
+        # 다른 article 의 댓글에는 답글을 달 수 없다
+        with pytest.raises(NotExistComment):
+            asyncio.run(board['comment_service'].create_comment(
+                insert_comment=Comment(user_id=1, content="reply", comment_id=1),
+                article_id=2
+            ))
+        assert list(_get_threads(board['session'])) == ["root 1"]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 10])
+    def test200_thread_order_across_pages(self, board, size):
+        _create_comment(board, content="root 1")
+        _create_comment(board, content="root 2")
+        _create_comment(board, content="reply 2-1", comment_id=2)
+        _create_comment(board, content="reply 1-1", comment_id=1)
+        _create_comment(board, content="reply 1-2", comment_id=4)
+        _create_comment(board, content="root 3")
+        _create_comment(board, content="reply 2-2", comment_id=3)
+
+        # page 경계와 무관하게 최상위 댓글 다음에 해당 thread 의 답글이 작성 순서대로 위치한다
+        assert _get_all_pages(board, size=size) == [
+            "root 1", "reply 1-1", "reply 1-2",
+            "root 2", "reply 2-1", "reply 2-2",
+            "root 3"
+        ]
+
+    def test300_backfill_legacy_comments(self, legacy_board):
+        session = legacy_board['session']
+        # migration 이전 댓글 - 대댓글에 대한 답글(id 3)과 부모 댓글이 없는 답글(id 5) 포함
+        session.execute(insert(Comment), [
+            {'id': 1, 'article_id': 1, 'user_id': 1, 'content': "root 1", 'level': 0},
+            {'id': 2, 'article_id': 1, 'user_id': 1, 'comment_id': 1, 'content': "reply 1-1", 'level': 1},
+            {'id': 3, 'article_id': 1, 'user_id': 1, 'comment_id': 2, 'content': "reply 1-1-1", 'level': 1},
+            {'id': 4, 'article_id': 1, 'user_id': 1, 'content': "root 2", 'level': 0},
+            {'id': 5, 'article_id': 1, 'user_id': 1, 'comment_id': 100, 'content': "orphan", 'level': 1}
+        ])
+        session.commit()
+
+        progress = []
+        total = asyncio.run(legacy_board['comment_service'].backfill_thread_ids(batch_size=2, on_batch=progress.append))
+        assert total == 5
+        assert progress[-1] == 5
+        assert {content: thread_id for content, (_, thread_id, _) in _get_threads(session).items()} == {
+            "root 1": 1, "reply 1-1": 1, "reply 1-1-1": 1, "root 2": 4, "orphan": 100
+        }
+        assert _get_all_pages(legacy_board, size=2) == ["root 1", "reply 1-1", "reply 1-1-1", "root 2", "orphan"]
+
+        # 다시 실행해도 갱신할 댓글이 없다
+        assert asyncio.run(legacy_board['comment_service'].backfill_thread_ids(batch_size=2)) == 0
@@ -0,0 +1,116 @@
+import asyncio
+import fakeredis
+import threading
+import time
+
+from datetime import datetime, timedelta
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+import app.common.config
+import app.domains.index.apis
+import app.main
+
+from app.databases.rdb import Base
+from app.databases.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, async_warmup_pool, warmup_pool
+from app.databases.scope import get_scope_id
+from app.domains.user.models import User
+
+def _make_engine(path, pool_size: int = 1, connect_delay: float = 0.0):
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=5
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        time.sleep(connect_delay)
+
+    return engine
+
+
+class TestDBPool:
+
+    def test100_checkout_wait_excludes_connect(self, tmp_path):
+        engine = _make_engine(tmp_path / "pool.db", connect_delay=0.2)
+
+        # Pool 이 비어 새로 연결하는 시간은 대기 시간이 아니다
+        connection = engine.connect()
+        assert engine.pool.checkout_stats()['wait_max_ms'] < 100
+
+        # 다른 request 가 connection 을 반환할 때까지 기다린 시간은 대기 시간으로 집계한다
+        waiter = threading.Thread(target=lambda: engine.connect().close())
+        waiter.start()
+        time.sleep(0.2)
+        connection.close()
+        waiter.join()
+
+        stats = engine.pool.checkout_stats()
+        assert stats['checkout_count'] == 2
+        assert 150 <= stats['wait_max_ms'] < 1000
+        engine.dispose()
+
+    def test200_warmup(self, tmp_path):
+        engine = _make_engine(tmp_path / "pool.db", pool_size=3)
+        warmup_pool(engine, count=3)
+        assert engine.pool.checkedin() == 3
+        engine.dispose()
+
+        async def _async_warmup():
+            async_engine = create_async_engine(
+                f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+                poolclass=InstrumentedAsyncQueuePool,
+                pool_size=3
+            )
+            await async_warmup_pool(async_engine, count=3)
+            checked_in = async_engine.pool.checkedin()
+            await async_engine.dispose()
+            return checked_in
+
+        assert asyncio.run(_async_warmup()) == 3
+
+    def test300_lifespan_warmup_and_status_api(self, tmp_path, monkeypatch):
+        engine = _make_engine(tmp_path / "pool.db", pool_size=2)
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        with engine.begin() as conn:
+            conn.execute(User.__table__.insert(), [{'id': 1, 'username': "pool-user", 'password': "pw", 'created_at': datetime.now()}])
+        engine.dispose() # warm-up 전 상태로 되돌린다
+        monkeypatch.setattr(app.common.config.TestConfig, "DB_POOL_WARMUP", 2)
+        monkeypatch.setattr(app.main, "get_engine", lambda: engine)
+        monkeypatch.setattr(app.main, "dispose_engines", lambda: None)
+        monkeypatch.setattr(app.domains.index.apis, "get_engine", lambda: engine)
+        monkeypatch.setattr(app.domains.index.apis, "get_replica_engines", lambda: [])
+
+        application = app.main.create_app(api_env='TEST')
+        # Lifespan / 상태 API 는 환경변수가 아니라 create_app 에 전달된 환경의 config 를 사용한다
+        monkeypatch.setenv("API_ENV", "DEV")
+
+        container = application.container
+        with container.redis_client.override(providers.Object(fakeredis.FakeRedis(decode_responses=True))), \
+                container.session.override(providers.Object(scoped_session(sessionmaker(bind=engine), scopefunc=get_scope_id))), \
+                container.async_session.override(providers.Object(async_scoped_session(
+                    async_sessionmaker(bind=create_async_engine("sqlite+aiosqlite://")),
+                    scopefunc=get_scope_id
+                ))):
+            auth_handler = container.auth_handler()
+            access_token = auth_handler.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+            auth_handler.set_token(key=access_token, value="1", exp=3600)
+
+            with TestClient(app=application) as client:
+                assert engine.pool.checkedin() == 2
+
+                resp = client.get("/internal/db-pool", headers={'authorization': f"Bearer {access_token}"})
+                assert resp.status_code == 200
+                status = resp.json()
+                assert status['rdb']['pool_class'] == "InstrumentedQueuePool"
+                # warm-up 2건 + 인증 시 사용자 조회 session 이 request 종료 전까지 connection 을 사용 중
+                assert (status['rdb']['size'], status['rdb']['checked_out'], status['rdb']['checkout_count']) == (2, 1, 3)
+                assert (status['async_rdb'], status['rdb_replicas'], status['async_rdb_replicas']) == (None, [], [])
+        engine.dispose()
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+# app.main 누적 import 시간 budget (ms) - CI 환경에 맞게 IMPORT_TIME_BUDGET_MS 로 조정
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", 3000))
+
+def _run_python(code: str, *options) -> subprocess.CompletedProcess:
+    # secret 을 조회할 수 없는 환경 - import / app 생성 중 secret 조회, DB 연결을 하면 실패한다
+    env = dict(os.environ, SECRET_PROVIDERS="", API_ENV="TEST")
+    return subprocess.run([sys.executable, *options, "-c", code], env=env, capture_output=True, text=True)
+
+
+class TestImportTime:
+
+    def test100_import_without_secrets(self):
+        result = _run_python(
+            "import sys\n"
+            "from app.databases.async_rdb import get_async_engine\n"
+            "from app.databases.rdb import get_engine\n"
+            "from app.main import create_app\n"
+            "create_app(api_env='TEST')\n"
+            "assert get_engine.cache_info().currsize == 0\n"
+            "assert get_async_engine.cache_info().currsize == 0\n"
+            "assert 'boto3' not in sys.modules\n"
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test200_import_time_budget(self):
+        result = _run_python("import app.main", "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+
+        cumulative_us = next(
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.split("|")[2].strip() == "app.main"
+        )
+        assert cumulative_us / 1000 < IMPORT_TIME_BUDGET_MS
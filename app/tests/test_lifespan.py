@@ -0,0 +1,39 @@
+import fakeredis
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+import app.main
+
+def _fake_redis_resource(closed: list):
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    yield redis_client
+    closed.append(True)
+
+
+class TestLifespan:
+
+    def test100_shutdown_releases_resources(self, monkeypatch):
+        disposed = []
+        closed = []
+
+        async def _dispose_async_engines():
+            disposed.append('async_rdb')
+
+        monkeypatch.setattr(app.main, "get_engine", lambda: create_engine("sqlite://"))
+        monkeypatch.setattr(app.main, "dispose_engines", lambda: disposed.append('rdb'))
+        monkeypatch.setattr(app.main, "dispose_async_engines", _dispose_async_engines)
+
+        application = app.main.create_app(api_env='TEST')
+        # Middleware 생성 시 Redis client, DB session 을 주입받는다 (request 는 보내지 않음)
+        container = application.container
+        with container.redis_client.override(providers.Resource(_fake_redis_resource, closed)), \
+                container.session.override(providers.Object(None)), \
+                container.async_session.override(providers.Object(None)):
+            with TestClient(app=application):
+                container.redis_client().set("key", "value")
+                assert disposed == [] and closed == []
+
+        assert sorted(disposed) == ['async_rdb', 'rdb']
+        assert closed == [True]
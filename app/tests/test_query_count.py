@@ -0,0 +1,123 @@
+import pytest
+
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.databases.rdb import Base
+from app.domains.board.models import (
+    Article,
+    AttachedFile,
+    Comment,
+    Tag
+)
+from app.domains.board.repositories.rdb.rdb_repository import (
+    ArticleRdbRepository,
+    CommentRdbRepository,
+    TagRdbRepository
+)
+from app.domains.user.models import User
+
+ROW_COUNT = 100
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(
+        engine,
+        tables=[t.__table__ for t in (User, Article, Comment, Tag, AttachedFile)]
+    )
+
+    # 작성자가 모두 다른 article / comment / tag 생성 - lazy load 시 row 마다 user 조회가 발생하는 조건
+    now = datetime.now()
+    with Session(engine) as session:
+        users = [User(username=f"query-count-user-{i}", password="pw", created_at=now) for i in range(ROW_COUNT)]
+        session.add_all(users)
+        session.flush()
+
+        article = Article(user_id=users[0].id, title="title 0", content="content 0")
+        session.add(article)
+        session.flush()
+        session.add_all([
+            Article(user_id=users[i].id, title=f"title {i}", content=f"content {i}")
+            for i in range(1, ROW_COUNT)
+        ])
+        session.add_all([
+            Comment(id=i + 1, user_id=users[i].id, article_id=article.id, thread_id=i + 1, content=f"comment {i}", level=0)
+            for i in range(ROW_COUNT)
+        ])
+        session.add_all([
+            Tag(user_id=users[i].id, article_id=article.id, tagging=f"tag {i}")
+            for i in range(ROW_COUNT)
+        ])
+        session.commit()
+
+    return engine
+
+
+class TestQueryCount:
+
+    def test100_article_list_query_count(self, engine):
+        with Session(engine) as session, QueryCounter(engine) as counter:
+            articles = ArticleRdbRepository(session=session).get_list(page=1, size=ROW_COUNT)
+            usernames = [article.user.username for article in articles]
+            # 댓글 / 첨부파일 / tag 수는 article row 의 집계 column 을 사용하므로 추가 query 가 없다
+            counts = [(article.comment_count, article.attachment_count, article.tag_count) for article in articles]
+
+        assert len(usernames) == len(counts) == ROW_COUNT
+        assert counter.count == 1
+
+    def test110_article_cursor_list_query_count(self, engine):
+        with Session(engine) as session, QueryCounter(engine) as counter:
+            articles = ArticleRdbRepository(session=session).get_list_by_cursor(after_id=None, size=ROW_COUNT)
+            usernames = [article.user.username for article in articles]
+
+        assert len(usernames) == ROW_COUNT
+        assert counter.count == 1
+
+    def test200_article_detail_query_count(self, engine):
+        with Session(engine) as session, QueryCounter(engine) as counter:
+            article = ArticleRdbRepository(session=session).get_detail(article_id=1)
+            tags = TagRdbRepository(session=session).get_list(article_id=article.id)
+            _ = article.user.username
+            usernames = [tag.user.username for tag in tags]
+
+        assert len(usernames) == ROW_COUNT
+        assert counter.count == 2
+
+    def test300_comment_list_query_count(self, engine):
+        with Session(engine) as session, QueryCounter(engine) as counter:
+            comments = CommentRdbRepository(session=session).get_list(article_id=1, page=1, size=ROW_COUNT)
+            usernames = [comment.user.username for comment in comments]
+
+        assert len(usernames) == ROW_COUNT
+        assert counter.count == 1
+
+    def test310_comment_detail_query_count(self, engine):
+        with Session(engine) as session, QueryCounter(engine) as counter:
+            comment = CommentRdbRepository(session=session).get_detail(comment_id=1)
+            _ = comment.user.username
+
+        assert counter.count == 1
@@ -0,0 +1,88 @@
+import pytest
+
+from datetime import datetime
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.databases.rdb import Base
+from app.databases.routing import ReplicaSelector, RoutingSession
+from app.databases.transactions import TransactionManager
+from app.domains.user.models import User
+
+def _make_engine(path, marker: str):
+    """ marker user 한 명을 가진 sqlite engine - 어느 DB 에서 조회했는지 username 으로 구분 """
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        session.add(User(id=1, username=marker, password="pw", created_at=datetime.now()))
+        session.commit()
+    return engine
+
+
+@pytest.fixture(scope="module")
+def engines(tmp_path_factory):
+    base_path = tmp_path_factory.mktemp("routing")
+    return {
+        'primary': _make_engine(base_path / "primary.db", "primary"),
+        'replica1': _make_engine(base_path / "replica1.db", "replica1"),
+        'replica2': _make_engine(base_path / "replica2.db", "replica2")
+    }
+
+
+def _make_session_factory(engines, replicas):
+    return sessionmaker(
+        class_=RoutingSession,
+        autocommit=False,
+        autoflush=False,
+        bind=engines['primary'],
+        replica_selector=ReplicaSelector(engines=[engines[name] for name in replicas])
+    )
+
+
+def _read_marker(session) -> str:
+    return session.execute(select(User.username).where(User.id == 1)).scalar_one()
+
+
+class TestRdbRouting:
+
+    def test100_read_goes_to_replica(self, engines):
+        SessionLocal = _make_session_factory(engines, replicas=["replica1"])
+        with SessionLocal() as session:
+            assert _read_marker(session) == "replica1"
+
+    def test110_read_in_transaction_goes_to_primary(self, engines):
+        SessionLocal = _make_session_factory(engines, replicas=["replica1"])
+        with SessionLocal() as session:
+            with TransactionManager(session=session).transaction():
+                assert _read_marker(session) == "primary"
+
+    def test120_read_after_write_sticks_to_primary(self, engines):
+        SessionLocal = _make_session_factory(engines, replicas=["replica1"])
+        with SessionLocal() as session:
+            assert _read_marker(session) == "replica1"
+
+            session.add(User(username="routing-user", password="pw", created_at=datetime.now()))
+            session.flush()
+            assert _read_marker(session) == "primary"
+            session.rollback()
+
+            # rollback 이후에도 같은 session 의 조회는 primary 유지
+            assert _read_marker(session) == "primary"
+
+    def test200_round_robin_replicas(self, engines):
+        SessionLocal = _make_session_factory(engines, replicas=["replica1", "replica2"])
+        markers = []
+        for _ in range(4):
+            with SessionLocal() as session:
+                markers.append(_read_marker(session))
+
+        assert markers == ["replica1", "replica2", "replica1", "replica2"]
+
+    def test210_least_connections_replica(self, engines):
+        selector = ReplicaSelector(engines=[engines['replica1'], engines['replica2']], policy="least_connections")
+        with engines['replica1'].connect():
+            assert selector.select() is engines['replica2']
+
+    def test220_unsupported_policy(self, engines):
+        with pytest.raises(ValueError):
+            ReplicaSelector(engines=[engines['replica1']], policy="random")
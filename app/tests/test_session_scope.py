@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.databases.scope import get_scope_id, register_scoped_session, request_scope
+from app.middlewares.db_session_middleware import DBSessionMiddleware
+
+@pytest.fixture
+def scoped(tmp_path):
+    """ get_scope_id 를 scopefunc 로 사용하는 sync / async scoped session """
+    engine = create_engine(f"sqlite:///{tmp_path / 'scope.db'}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'scope.db'}", poolclass=NullPool)
+    yield {
+        'session': register_scoped_session(scoped_session(sessionmaker(bind=engine), scopefunc=get_scope_id)),
+        'async_session': register_scoped_session(async_scoped_session(async_sessionmaker(bind=async_engine), scopefunc=get_scope_id))
+    }
+    engine.dispose()
+    asyncio.run(async_engine.dispose())
+
+
+class TestSessionScope:
+
+    def test100_request_scope_isolation(self, scoped):
+        session = scoped['session']
+        middleware_sessions = []
+
+        async def _get_session():
+            await asyncio.sleep(0.01)
+            return session()
+
+        async def _endpoint(scope, receive, send):
+            request_session = session()
+            # 같은 request 의 하위 task 는 같은 session 을 사용한다
+            assert await asyncio.create_task(_get_session()) is request_session
+            middleware_sessions.append(request_session)
+
+        middleware = DBSessionMiddleware(app=_endpoint, session=session, async_session=scoped['async_session'])
+
+        async def _requests():
+            await asyncio.gather(*[middleware({'type': 'http'}, None, None) for _ in range(3)])
+
+        asyncio.run(_requests())
+        # 동시에 처리된 request 는 서로 다른 session 을 사용하며, 종료 후 registry 에 남지 않는다
+        assert len({id(s) for s in middleware_sessions}) == 3
+        assert session.registry.registry == {}
+
+    def test110_request_scope_remove(self, scoped):
+        session = scoped['session']
+
+        async def _request():
+            with request_scope():
+                scope_id = get_scope_id()
+                session().execute(text("select 1"))
+                assert scope_id in session.registry.registry
+                session.remove()
+                assert scope_id not in session.registry.registry
+
+        asyncio.run(_request())
+
+    def test200_task_scope_cleanup(self, scoped):
+        session, async_session = scoped['session'], scoped['async_session']
+        task_sessions = []
+
+        async def _job():
+            session().execute(text("select 1"))
+            await async_session().execute(text("select 1"))
+            task_sessions.append((session(), async_session()))
+
+        async def _run():
+            await asyncio.gather(asyncio.create_task(_job()), asyncio.create_task(_job()))
+            # done callback 이후 session 이 정리된다
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert session.registry.registry == {}
+            assert async_session.registry.registry == {}
+
+        asyncio.run(_run())
+        (sync_a, async_a), (sync_b, async_b) = task_sessions
+        assert sync_a is not sync_b and async_a is not async_b
+        assert not sync_a.in_transaction() and not async_a.in_transaction()
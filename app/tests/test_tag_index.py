@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+
+from datetime import date, datetime, timedelta
+from sqlalchemy import select
+
+from app.domains.board.exceptions import InvalidCursor
+from app.domains.board.handlers import (
+    ArticleHandler,
+    ArticleSearchHandler,
+    AttachedFileHandler,
+    CommentHandler,
+    TagHandler
+)
+from app.domains.board.models import Article, Tag, TagCount, TagDictionary
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import ArticleService, TagService
+from app.domains.user.models import User
+from app.storages.memory_storage import MemoryStorageBackend
+
+@pytest.fixture
+def board(board_db):
+    """ SQLite 로 구성한 article / tag service """
+    session = board_db.session
+    user = User(username="tag-user", password="pw", created_at=datetime.now())
+    session.add(user)
+    session.commit()
+
+    article_handler = ArticleHandler(article_repository=board_db.article_repository)
+    tag_handler = TagHandler(tag_repository=board_db.tag_repository)
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    return {
+        'session': session,
+        'user_id': user.id,
+        'article_service': ArticleService(
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            attached_file_handler=AttachedFileHandler(attached_file_repository=board_db.attached_file_repository, storage=MemoryStorageBackend()),
+            comment_handler=CommentHandler(comment_repository=board_db.comment_repository),
+            tag_handler=tag_handler,
+            article_search_handler=article_search_handler,
+            transaction_manager=board_db.transaction_manager
+        ),
+        'tag_service': TagService(
+            tag_handler=tag_handler,
+            article_handler=article_handler,
+            article_cache_handler=_NoCacheHandler(),
+            article_search_handler=article_search_handler,
+            transaction_manager=board_db.transaction_manager
+        )
+    }
+
+class _NoCacheHandler:
+
+    async def delete_detail(self, article_id: int):
+        pass
+
+
+def _create_article(board, title: str, tags: list):
+    asyncio.run(board['article_service'].create_article(
+        insert_article=Article(user_id=board['user_id'], title=title, content="content"),
+        tag_data=tags
+    ))
+
+def _trending(board, days: int = 7) -> dict:
+    return {t['tagging']: t['article_count'] for t in asyncio.run(board['tag_service'].get_trending_list(days=days, size=10))}
+
+
+class TestTagIndex:
+
+    def test100_article_list_by_tag(self, board):
+        for i in range(1, 6):
+            _create_article(board, title=f"article {i}", tags=["all", "odd" if i % 2 else "even"])
+
+        tag_service = board['tag_service']
+        articles, cursor = asyncio.run(tag_service.get_article_cursor_list(tagging="all", size=2))
+        titles = [a.title for a in articles]
+        while cursor is not None:
+            articles, cursor = asyncio.run(tag_service.get_article_cursor_list(tagging="all", size=2, cursor=cursor))
+            titles += [a.title for a in articles]
+        assert titles == [f"article {i}" for i in range(5, 0, -1)]
+
+        articles, cursor = asyncio.run(tag_service.get_article_cursor_list(tagging="odd", size=10))
+        assert ([a.title for a in articles], cursor) == (["article 5", "article 3", "article 1"], None)
+        assert asyncio.run(tag_service.get_article_cursor_list(tagging="none", size=10)) == ([], None)
+        with pytest.raises(InvalidCursor):
+            asyncio.run(tag_service.get_article_cursor_list(tagging="all", size=10, cursor="invalid"))
+
+    def test200_tag_count(self, board):
+        _create_article(board, title="a", tags=["python", "api", "python"])
+        _create_article(board, title="b", tags=["python"])
+        # 같은 이름의 tag 는 tag 사전에서 하나의 id 를 공유하고, article 에 중복된 tag 는 한 번만 등록된다
+        assert board['session'].scalars(select(TagDictionary.tagging).order_by(TagDictionary.tagging)).all() == ["api", "python"]
+        assert _trending(board) == {'python': 2, 'api': 1}
+
+        tag = board['session'].scalars(select(Tag).where(Tag.article_id == 2)).one()
+        asyncio.run(board['tag_service'].delete(tag_id=tag.id, article_id=2, user_id=board['user_id']))
+        assert _trending(board) == {'python': 1, 'api': 1}
+
+        asyncio.run(board['article_service'].delete_article(article_id=1, user_id=board['user_id']))
+        assert _trending(board) == {}
+        assert asyncio.run(board['tag_service'].get_article_cursor_list(tagging="python", size=10)) == ([], None)
+
+    def test201_skip_attached_tag(self, board):
+        _create_article(board, title="a", tags=["python"])
+        tag_handler = board['article_service'].tag_handler
+        transaction_manager = board['article_service'].transaction_manager
+
+        async def _create_tags():
+            async with transaction_manager.async_transaction():
+                return await tag_handler.create(tags=[
+                    {'article_id': 1, 'user_id': board['user_id'], 'tagging': tagging} for tagging in ("python", "api")
+                ])
+
+        # 이미 등록된 tag 는 다시 등록하지 않으며 tag 수도 증가하지 않는다
+        assert asyncio.run(_create_tags()) == 1
+        assert sorted(board['session'].scalars(select(Tag.tagging).where(Tag.article_id == 1)).all()) == ["api", "python"]
+        assert _trending(board) == {'python': 1, 'api': 1}
+
+    def test210_trending_period(self, board):
+        _create_article(board, title="a", tags=["new"])
+        session = board['session']
+        session.add_all([
+            Tag(article_id=1, user_id=board['user_id'], tagging="legacy"), # tag 사전 migration 이전 tag
+            TagCount(count_date=date.today() - timedelta(days=10), tag_id=1, article_count=5)
+        ])
+        session.commit()
+        assert _trending(board, days=7) == {'new': 1}
+        assert _trending(board, days=30) == {'new': 6}
+
+        asyncio.run(board['tag_service'].delete_all(article_id=1))
+        assert _trending(board, days=30) == {'new': 5}
@@ -1,71 +1,124 @@
 import base64
-import boto3
 import orjson
 
-from botocore.config import Config
 from fastapi import File
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator
+from starlette.concurrency import run_in_threadpool
 
 from app.common.constants import AWS_REGION
 
-def get_aws_secret_value(secret_name: str):
+# boto3 / botocore import 는 100ms 이상 걸리므로 client 를 만들 때 import 한다
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+
+@lru_cache(maxsize=1)
+def get_secretsmanager_client():
     """
-    Get secrets manager value
-    :param secret_name:
+    Secrets manager client (process 에서 공유)
+    Secret 조회가 application 시작을 오래 막지 않도록 timeout 을 짧게 설정한다.
     :return:
     """
+    import boto3
+    from botocore.config import Config
 
     session = boto3.session.Session()
-    client = session.client(
+    return session.client(
         service_name="secretsmanager",
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(connect_timeout=2, read_timeout=5, retries={'max_attempts': 3, 'mode': 'standard'})
     )
 
-    secret_string = None
+def get_aws_secret_value(secret_name: str):
+    """
+    Get secrets manager value
+    (cache 를 거치지 않으므로 application 에서는 secret_utils.get_secret_value 를 사용한다)
+    :param secret_name:
+    :return: secret 이 없으면 None, 그 외 조회 오류는 예외를 전파한다
+    """
+    from botocore.exceptions import ClientError
+
     try:
-        get_secret_value = client.get_secret_value(SecretId=secret_name)
-        secret_string = get_secret_value['SecretString'] if "SecretString" in get_secret_value \
-            else base64.b64decode(get_secret_value['SecretBinary'])
-    except Exception as e:
-        print("[EX] aws_utils.get_secret : ", str(e.args))
+        get_secret_value = get_secretsmanager_client().get_secret_value(SecretId=secret_name)
+    except ClientError as ex:
+        if ex.response.get('Error', {}).get('Code') == 'ResourceNotFoundException':
+            return None
+        print("[EX] aws_utils.get_aws_secret_value : ", str(ex.args))
+        raise ex
+
+    secret_string = get_secret_value['SecretString'] if "SecretString" in get_secret_value \
+        else base64.b64decode(get_secret_value['SecretBinary'])
 
     try:
-        secret_value = orjson.loads(secret_string) if secret_string is not None else None
+        secret_value = orjson.loads(secret_string)
     except:
         secret_value = secret_string
 
     return secret_value
 
-def get_s3():
-    s3 = boto3.resource(
+def get_s3_client(
+        max_pool_connections: int = 10,
+        max_attempts: int = 3,
+        connect_timeout: float = 5,
+        read_timeout: float = 60
+):
+    """
+    S3 client 생성
+    Client 생성은 service model parsing 및 connection pool 생성 비용이 크므로
+    process 에서 하나를 만들어 재사용한다 (Container.s3_client, boto3 client 는 thread-safe)
+    :param max_pool_connections: 동시 요청 수 (upload/download 동시 수 이상으로 설정)
+    :param max_attempts: 재시도 포함 최대 시도 횟수
+    :param connect_timeout: 연결 timeout(초)
+    :param read_timeout: 응답 대기 timeout(초)
+    :return:
+    """
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.session.Session()
+    return session.client(
         's3',
         endpoint_url="https://s3.ap-northeast-2.amazonaws.com",
-        config=Config(signature_version='s3v4'),
-        region_name=AWS_REGION
+        region_name=AWS_REGION,
+        config=Config(
+            signature_version='s3v4',
+            max_pool_connections=max_pool_connections,
+            retries={'max_attempts': max_attempts, 'mode': 'standard'},
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout
+        )
     )
-    return s3, s3.meta.client
 
 async def s3_upload_file(
+        s3_client,
         upload_file_obj: File,
         s3_bucket_name: str,
-        s3_key: str
+        s3_key: str,
+        transfer_config: "TransferConfig" = None
 ):
     """
     S3 file upload
+    File 전체를 memory 로 읽지 않고 file object 를 chunk 단위로 전송하며,
+    multipart_threshold 이상인 file 은 multipart upload 로 처리한다.
+    boto3 호출은 blocking 이므로 thread pool 에서 실행한다.
+    :param s3_client:
     :param upload_file_obj:
     :param s3_bucket_name:
     :param s3_key:
+    :param transfer_config: multipart threshold / chunk size / part 동시 전송 수
     :return:
     """
-    _, s3_client = get_s3()
 
     file_upload_result = False
     try:
-        file_content = await upload_file_obj.read()
-        s3_client.put_object(
+        await upload_file_obj.seek(0)
+        await run_in_threadpool(
+            s3_client.upload_fileobj,
+            Fileobj=upload_file_obj.file,
             Bucket=s3_bucket_name,
             Key=s3_key,
-            Body=file_content,
-            ContentType=upload_file_obj.content_type
+            ExtraArgs={'ContentType': upload_file_obj.content_type} if upload_file_obj.content_type else None,
+            Config=transfer_config
         )
         file_upload_result = True
     except Exception as ex:
@@ -73,16 +126,95 @@ async def s3_upload_file(
 
     return file_upload_result
 
-async def s3_read_file(s3_bucket_name: str, s3_key: str):
+async def s3_read_file(s3_client, s3_bucket_name: str, s3_key: str):
     """
     Read and return s3 object body
+    :param s3_client:
     :param s3_bucket_name:
     :param s3_key:
     :return:
     """
-    s3, _ = get_s3()
     try:
-        return s3.Object(bucket_name=s3_bucket_name, key=s3_key).get()['Body'].read()
+        s3_object = await run_in_threadpool(s3_client.get_object, Bucket=s3_bucket_name, Key=s3_key)
+        return await run_in_threadpool(s3_object['Body'].read)
     except Exception as ex:
         print("[EX] aws_utils.s3_read_file : ", str(ex.args))
         raise ex
+
+async def s3_get_object(s3_client, s3_bucket_name: str, s3_key: str, byte_range: str = None) -> dict:
+    """
+    S3 object 조회 (body 는 읽지 않은 StreamingBody 로 반환)
+    :param s3_client:
+    :param s3_bucket_name:
+    :param s3_key:
+    :param byte_range: HTTP Range header 형식 (ex. bytes=0-1023)
+    :return: get_object 응답
+    """
+    params = {'Bucket': s3_bucket_name, 'Key': s3_key}
+    if byte_range is not None:
+        params['Range'] = byte_range
+    return await run_in_threadpool(s3_client.get_object, **params)
+
+async def s3_iter_body(body, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    """
+    S3 object body 를 chunk 단위로 읽는다 - download 당 memory 사용량은 chunk_size 로 제한된다
+    :param body: get_object 응답의 StreamingBody
+    :param chunk_size:
+    :return:
+    """
+    try:
+        while True:
+            chunk = await run_in_threadpool(body.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+def s3_generate_presigned_url(s3_client, client_method: str, params: dict, expires_in: int) -> str:
+    """
+    Presigned URL 생성 (local 서명 - S3 호출 없음)
+    :param s3_client:
+    :param client_method: put_object / get_object
+    :param params: client_method 의 parameter (Bucket, Key, ContentType, ResponseContentDisposition 등)
+    :param expires_in: URL 유효 시간(초)
+    :return:
+    """
+    return s3_client.generate_presigned_url(
+        ClientMethod=client_method,
+        Params=params,
+        ExpiresIn=expires_in
+    )
+
+async def s3_head_object(s3_client, s3_bucket_name: str, s3_key: str):
+    """
+    S3 object metadata 조회
+    :param s3_client:
+    :param s3_bucket_name:
+    :param s3_key:
+    :return: head_object 응답, object 가 없으면 None
+    """
+    from botocore.exceptions import ClientError
+
+    try:
+        return await run_in_threadpool(s3_client.head_object, Bucket=s3_bucket_name, Key=s3_key)
+    except ClientError as ex:
+        if ex.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        print("[EX] aws_utils.s3_head_object : ", str(ex.args))
+        raise ex
+
+async def s3_delete_object(s3_client, s3_bucket_name: str, s3_key: str) -> bool:
+    """
+    S3 object 삭제
+    :param s3_client:
+    :param s3_bucket_name:
+    :param s3_key:
+    :return:
+    """
+    try:
+        await run_in_threadpool(s3_client.delete_object, Bucket=s3_bucket_name, Key=s3_key)
+        return True
+    except Exception as ex:
+        print("[EX] aws_utils.s3_delete_object : ", str(ex.args))
+        return False
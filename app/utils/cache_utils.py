@@ -0,0 +1,84 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class LRUTTLCache:
+    """
+    In-process cache (LRU + TTL)
+     - maxsize 를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+     - 항목별 만료 시각이 지나면 조회 시 제거
+    Process 단위 cache 이므로 worker 간에는 공유되지 않는다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        :param key:
+        :param value:
+        :param ttl: 항목별 유지 시간(초), 기본 ttl 보다 길게 설정할 수 없다
+        :return:
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_if(self, predicate: Callable[[Any], bool]) -> int:
+        """
+        value 가 조건에 맞는 항목 모두 삭제
+        :param predicate:
+        :return: 삭제 건수
+        """
+        with self._lock:
+            keys = [key for key, (value, _) in self._data.items() if predicate(value)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hit': self.hits,
+            'miss': self.misses
+        }
@@ -1,3 +1,4 @@
+import inspect
 import os
 import time
 import uuid
@@ -27,6 +28,17 @@ def get_uuid():
 def get_api_env():
     return os.getenv("API_ENV", "DEV")
 
+async def resolve_awaitable(value):
+    """
+    동기/비동기 repository 결과를 동일하게 다루기 위해 awaitable인 경우에만 await 한다
+    동기 repository(rdb mode)는 호출 시점에 event loop 에서 query 가 실행되므로 non-blocking 이 아니다.
+    :param value:
+    :return:
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
 def encode_json(o):
     """객체들을 json 호환 가능한 형태로 변경한다."""
     if isinstance(o, dict):
@@ -1,6 +1,8 @@
 import base64
 import hashlib
 
+from functools import lru_cache
+
 from app.common.config import get_config
 from app.utils.common_utils import (
     get_api_env,
@@ -18,4 +20,7 @@ class CryptoHandler:
     def encrypt_hash(self, plain_text: str) -> str:
         return base64.b64encode(hashlib.sha256((self.salt + plain_text).encode('utf-8')).digest()).decode('utf-8')
 
-crypto_handler = CryptoHandler()
+@lru_cache(maxsize=1)
+def get_crypto_handler() -> CryptoHandler:
+    """ 처음 사용할 때 생성 (import 시점에 config 를 읽지 않는다) """
+    return CryptoHandler()
@@ -0,0 +1,61 @@
+import csv
+import io
+import orjson
+
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from app.utils.import_utils import get_import_format
+
+EXPORT_MEDIA_TYPES = {
+    'ndjson': "application/x-ndjson",
+    'csv': "text/csv; charset=utf-8"
+}
+
+# 대량 등록(import_utils.iter_csv)과 같은 column 이름을 사용하여 export 한 file 을 그대로 등록할 수 있다
+EXPORT_CSV_FIELDS = ["id", "user_id", "username", "title", "content", "tags", "comments", "created_at", "updated_at"]
+
+def get_export_format(filename: Optional[str], file_format: Optional[str] = None) -> Optional[str]:
+    """ 확장자 규칙은 대량 등록과 같다 (ndjson / csv) """
+    return get_import_format(filename=filename, file_format=file_format)
+
+async def encode_ndjson(batches: AsyncIterator[List[dict]]) -> AsyncIterator[bytes]:
+    """
+    NDJSON (1 line = 1 article)
+    :param batches: batch 단위 record list
+    :return: batch 단위 chunk
+    """
+    async for batch in batches:
+        yield b"".join(orjson.dumps(record) + b"\n" for record in batch)
+
+def _to_csv_row(record: dict) -> dict:
+    """ tag 는 ',' 로 연결하고, 댓글은 JSON 문자열로 저장한다 """
+    row = {k: v.isoformat() if isinstance(v, datetime) else v for k, v in record.items()}
+    row['tags'] = ",".join(record.get('tags', []))
+    row['comments'] = orjson.dumps(record.get('comments', [])).decode()
+    return row
+
+async def encode_csv(batches: AsyncIterator[List[dict]]) -> AsyncIterator[bytes]:
+    """
+    CSV (첫 line 은 header)
+    :param batches: batch 단위 record list
+    :return: batch 단위 chunk
+    """
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    async for batch in batches:
+        writer.writerows(_to_csv_row(record) for record in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if buffer.tell() > 0: # export 할 article 이 없으면 header 만 보낸다
+        yield buffer.getvalue().encode()
+
+def encode_export(batches: AsyncIterator[List[dict]], file_format: str) -> AsyncIterator[bytes]:
+    if file_format == "ndjson":
+        return encode_ndjson(batches)
+    if file_format == "csv":
+        return encode_csv(batches)
+    raise ValueError(f"Unsupported export format : {file_format}")
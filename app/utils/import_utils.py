@@ -0,0 +1,71 @@
+import csv
+import orjson
+import os
+
+from typing import Iterator, Optional, TextIO, Tuple
+
+class ImportRecordError(Exception):
+    """ 읽을 수 없는 record (line 번호 포함) """
+
+    def __init__(self, line: int, reason: str):
+        self.line = line
+        self.reason = reason
+        super().__init__(f"line {line} : {reason}")
+
+IMPORT_FORMATS = {
+    '.ndjson': "ndjson",
+    '.jsonl': "ndjson",
+    '.csv': "csv"
+}
+
+def get_import_format(filename: Optional[str], file_format: Optional[str] = None) -> Optional[str]:
+    """
+    대량 등록 file 형식 (지정하지 않으면 확장자로 판단)
+    :param filename:
+    :param file_format: ndjson / csv
+    :return: 지원하지 않는 형식이면 None
+    """
+    if file_format is not None:
+        return file_format if file_format in IMPORT_FORMATS.values() else None
+    if filename is None:
+        return None
+    return IMPORT_FORMATS.get(os.path.splitext(filename)[1].lower())
+
+def iter_ndjson(f: TextIO) -> Iterator[Tuple[int, dict]]:
+    """
+    NDJSON (1 line = 1 JSON object), 빈 line 은 무시한다
+    :param f:
+    :return: (line 번호, record)
+    """
+    for line_no, line in enumerate(f, start=1):
+        if line.strip() == '':
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as ex:
+            raise ImportRecordError(line=line_no, reason=f"invalid json ({ex})")
+        if not isinstance(record, dict):
+            raise ImportRecordError(line=line_no, reason="record must be a json object")
+        yield line_no, record
+
+def iter_csv(f: TextIO) -> Iterator[Tuple[int, dict]]:
+    """
+    CSV (첫 line 은 header), 값이 빈 column 은 제외한다
+    따옴표로 감싼 값은 여러 line 일 수 있으며, line 번호는 record 의 시작 line 이다.
+    :param f: newline='' 로 연 text file
+    :return: (line 번호, record)
+    """
+    reader = csv.DictReader(f)
+    if reader.fieldnames is None: # header 를 읽는다 (빈 file)
+        return
+    line_no = reader.line_num + 1
+    for row in reader:
+        yield line_no, {k: v for k, v in row.items() if k is not None and v not in (None, '')}
+        line_no = reader.line_num + 1
+
+def iter_records(f: TextIO, file_format: str) -> Iterator[Tuple[int, dict]]:
+    if file_format == "ndjson":
+        return iter_ndjson(f)
+    if file_format == "csv":
+        return iter_csv(f)
+    raise ValueError(f"Unsupported import format : {file_format}")
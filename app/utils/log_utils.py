@@ -20,11 +20,14 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
-async def api_logger(request: Request, response=None, error=None):
+async def api_logger(request: Request, response=None, error=None, status_code: int = None):
     api_env = get_api_env()
     time_format = "%Y-%m-%d %H:%M:%S"
     t = time.time() - request.state.start_time
-    status_code = error.status_code if error is not None else response.status_code
+    if error is not None:
+        status_code = error.status_code
+    elif status_code is None:
+        status_code = response.status_code
     error_log = None
     user =  request.state.user if hasattr(request.state, 'user') else None
     if error:
@@ -0,0 +1,32 @@
+import base64
+import orjson
+
+from typing import List, Optional
+
+def encode_cursor(*values) -> str:
+    """
+    Keyset pagination 용 opaque cursor 생성
+    :param values: 마지막 row의 정렬 key 값
+    :return:
+    """
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode('utf-8').rstrip('=')
+
+def decode_cursor(cursor: Optional[str], size: int = 1) -> Optional[List]:
+    """
+    Opaque cursor 해석
+    :param cursor:
+    :param size: cursor에 포함된 key 갯수
+    :return: 정렬 key 값 list (cursor가 없으면 None)
+    :raise ValueError: cursor 형식이 잘못되었거나 정수가 아닌 key 가 포함된 경우
+    """
+    if cursor is None or cursor == '':
+        return None
+
+    padded = cursor + '=' * (-len(cursor) % 4)
+    values = orjson.loads(base64.urlsafe_b64decode(padded.encode('utf-8')))
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor : {cursor}")
+    # 정렬 key 는 모두 정수(일련 번호) - DB 가 문자열 등을 암묵적으로 변환하지 않도록 검증한다
+    if any(type(value) is not int for value in values):
+        raise ValueError(f"Invalid cursor : {cursor}")
+    return values
@@ -0,0 +1,38 @@
+import math
+import re
+
+from typing import List
+
+# 문자 / 숫자 연속을 term 으로 사용한다 (SQLite FTS5 unicode61 tokenizer 와 같은 기준)
+TOKEN_REGEX = re.compile(r"[^\W_]+")
+
+# SQLite FTS5 bm25() 와 같은 상수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 검색 field 가중치 - title, content, tags 순서 (SQLite FTS5 column 순서와 같다)
+SEARCH_FIELD_WEIGHTS = (2.0, 1.0, 2.0)
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색 term 목록 (대소문자 구분 없음)
+    :param text:
+    :return: 등장 순서대로 (중복 포함)
+    """
+    return TOKEN_REGEX.findall(text.casefold()) if text else []
+
+def bm25_idf(total_docs: int, doc_freq: int) -> float:
+    """ 문서 절반 이상에 등장하는 term 은 idf 가 0 이하가 되므로 아주 작은 양수로 대체한다 (FTS5 와 동일) """
+    idf = math.log((total_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+    return idf if idf > 0 else 1e-6
+
+def bm25_score(idf: float, term_freq: float, doc_length: int, avg_doc_length: float) -> float:
+    """
+    Term 하나의 BM25 점수
+    :param idf:
+    :param term_freq: field 가중치를 적용한 term 등장 횟수
+    :param doc_length: 문서 전체(모든 field) token 수
+    :param avg_doc_length:
+    :return:
+    """
+    return idf * term_freq * (BM25_K1 + 1) / (term_freq + BM25_K1 * (1 - BM25_B + BM25_B * doc_length / avg_doc_length))
@@ -0,0 +1,177 @@
+import orjson
+import os
+import re
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.aws_utils import get_aws_secret_value
+
+class SecretProvider(ABC):
+
+    @abstractmethod
+    def get(self, secret_name: str) -> Optional[Any]:
+        """
+        :param secret_name:
+        :return: secret 이 없으면 None, 조회 오류는 예외를 전파한다
+        """
+        pass
+
+
+class EnvSecretProvider(SecretProvider):
+    """
+    환경변수 stand-in - secret 이름을 대문자/underscore 로 바꾼 환경변수의 JSON 값
+    (ex. diboard/db/cache -> SECRET_DIBOARD_DB_CACHE)
+    """
+
+    @staticmethod
+    def get_env_name(secret_name: str) -> str:
+        return "SECRET_" + re.sub(r"[^A-Za-z0-9]", "_", secret_name).upper()
+
+    def get(self, secret_name: str) -> Optional[Any]:
+        value = os.getenv(self.get_env_name(secret_name))
+        if value is None:
+            return None
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+
+class FileSecretProvider(SecretProvider):
+    """
+    Local file stand-in - {secret 이름: 값} 형식의 JSON file (file 이 변경되면 다시 읽는다)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._mtime = None
+        self._secrets: Dict[str, Any] = {}
+
+    def get(self, secret_name: str) -> Optional[Any]:
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime != self._mtime:
+            with open(self.path, 'rb') as f:
+                self._secrets = orjson.loads(f.read())
+            self._mtime = mtime
+        return self._secrets.get(secret_name)
+
+
+class AwsSecretProvider(SecretProvider):
+
+    def get(self, secret_name: str) -> Optional[Any]:
+        return get_aws_secret_value(secret_name=secret_name)
+
+
+class SecretCache:
+    """
+    Secret 조회 cache
+     - 처음 조회할 때만 provider 를 동기 호출하고, 이후에는 cache 된 값을 반환한다
+     - ttl 이 지난 값은 그대로 반환하면서 background thread 에서 갱신한다 (credential rotation 반영)
+     - 갱신에 실패하면 기존 값을 계속 사용한다
+    Provider 는 순서대로 조회하여 처음 찾은 값을 사용한다.
+    """
+
+    def __init__(self, providers: List[SecretProvider], ttl: float = 300):
+        self.providers = providers
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[Any, float]] = {} # secret 이름 -> (값, 조회 시각)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refresh_failures = 0
+
+    def _fetch(self, secret_name: str) -> Optional[Any]:
+        error = None
+        for provider in self.providers:
+            try:
+                value = provider.get(secret_name)
+            except Exception as ex:
+                print(f"[EX] SecretCache._fetch({provider.__class__.__name__}) : ", str(ex.args))
+                error = ex
+                continue
+            if value is not None:
+                return value
+
+        if error is not None:
+            raise error
+        return None
+
+    def _refresh(self, secret_name: str):
+        try:
+            value = self._fetch(secret_name)
+            with self._lock:
+                self._entries[secret_name] = (value, time.monotonic())
+        except Exception:
+            # 기존 값을 유지하고 ttl 이후 다시 시도
+            with self._lock:
+                self.refresh_failures += 1
+                if secret_name in self._entries:
+                    self._entries[secret_name] = (self._entries[secret_name][0], time.monotonic())
+        finally:
+            with self._lock:
+                self._refreshing.discard(secret_name)
+
+    def get(self, secret_name: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(secret_name)
+            if entry is not None:
+                self.hits += 1
+                if time.monotonic() - entry[1] >= self.ttl and secret_name not in self._refreshing:
+                    self._refreshing.add(secret_name)
+                    threading.Thread(target=self._refresh, args=(secret_name,), daemon=True).start()
+                return entry[0]
+            self.misses += 1
+
+        value = self._fetch(secret_name)
+        with self._lock:
+            self._entries[secret_name] = (value, time.monotonic())
+        return value
+
+    def invalidate(self, secret_name: Optional[str] = None):
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(secret_name, None)
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._entries),
+            'ttl': self.ttl,
+            'hit': self.hits,
+            'miss': self.misses,
+            'refresh_failure': self.refresh_failures
+        }
+
+
+def make_secret_providers() -> List[SecretProvider]:
+    """
+    환경변수로 provider 구성
+     - SECRET_PROVIDERS : 조회 순서 (기본 env,file,aws), offline 환경에서는 env,file 로 설정
+     - SECRETS_FILE : file provider 가 읽을 JSON file 경로 (없으면 file provider 를 사용하지 않음)
+    :return:
+    """
+    providers = []
+    for name in os.getenv("SECRET_PROVIDERS", "env,file,aws").split(","):
+        name = name.strip()
+        if name == "env":
+            providers.append(EnvSecretProvider())
+        elif name == "file" and os.getenv("SECRETS_FILE"):
+            providers.append(FileSecretProvider(path=os.getenv("SECRETS_FILE")))
+        elif name == "aws":
+            providers.append(AwsSecretProvider())
+    return providers
+
+secret_cache = SecretCache(providers=make_secret_providers(), ttl=float(os.getenv("SECRETS_CACHE_TTL", 300)))
+
+def get_secret_value(secret_name: str) -> Optional[Any]:
+    """
+    Secret 조회 (cache 사용)
+    :param secret_name:
+    :return:
+    """
+    return secret_cache.get(secret_name)
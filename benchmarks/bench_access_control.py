@@ -0,0 +1,91 @@
+"""
+AccessControl middleware - 인증 사용자 cache 사용 전/후 request 당 overhead 비교
+
+    $ python -m benchmarks.bench_access_control --requests 2000 --latency-ms 1
+
+인증이 필요한 빈 endpoint 를 호출하여 middleware 처리 시간(JWT decode, redis 조회, user 조회)을 측정한다.
+(SQLite 에 SQL 실행마다 latency 를 추가해 MySQL round trip 을 흉내내고, redis 는 fakeredis 를 사용한다)
+"""
+import argparse
+import fakeredis
+import logging
+import statistics
+import time
+
+from datetime import datetime, timedelta
+from fastapi import FastAPI
+from fastapi.logger import logger
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.databases.rdb import Base
+from app.domains.auth.handlers import AuthHandler
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+from app.domains.user.handlers import UserHandler
+from app.domains.user.models import User
+from app.domains.user.repositories.rdb.rdb_repository import UserRdbRepository
+from app.middlewares.token_validator_middleware import AccessControl
+from app.utils.cache_utils import LRUTTLCache
+
+def _make_app(latency: float, cache_size: int):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': datetime.now()}])
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(*args):
+        time.sleep(latency)
+
+    auth_handler = AuthHandler(auth_repository=AuthCacheRepository(redis_client=fakeredis.FakeRedis(decode_responses=True)))
+    auth_handler.auth_user_cache = LRUTTLCache(maxsize=cache_size, ttl=auth_handler.config.AUTH_USER_CACHE_TTL)
+    session = scoped_session(sessionmaker(bind=engine))
+    user_handler = UserHandler(user_repository=UserRdbRepository(session=session))
+
+    access_token = auth_handler.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+    auth_handler.set_token(key=access_token, value="1", exp=3600)
+
+    app = FastAPI()
+
+    @app.get("/bench", response_class=PlainTextResponse)
+    async def bench_api():
+        session.remove()
+        return "OK"
+
+    app.add_middleware(AccessControl, auth_handler=auth_handler, user_handler=user_handler)
+    return app, access_token
+
+def _run(requests: int, latency: float, cache_size: int) -> list:
+    app, access_token = _make_app(latency=latency, cache_size=cache_size)
+    headers = {'authorization': f'Bearer {access_token}'}
+    elapsed = []
+    with TestClient(app) as client:
+        for _ in range(requests):
+            start = time.perf_counter()
+            resp = client.get("/bench", headers=headers)
+            elapsed.append((time.perf_counter() - start) * 1000)
+            assert resp.status_code == 200
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--latency-ms', type=float, default=1)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    print(f"requests={args.requests} latency={args.latency_ms}ms")
+    print(f"{'user cache':>12} {'mean(ms)':>10} {'p50(ms)':>10} {'p99(ms)':>10}")
+    for label, cache_size in (("off", 0), ("on", 10000)):
+        elapsed = sorted(_run(requests=args.requests, latency=args.latency_ms / 1000, cache_size=cache_size))
+        print(f"{label:>12} {statistics.mean(elapsed):>10.3f} {elapsed[len(elapsed) // 2]:>10.3f} {elapsed[int(len(elapsed) * 0.99)]:>10.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Article 목록의 댓글 / 첨부파일 / tag 수 - article 마다 COUNT(*) / 목록 id 로 GROUP BY / 집계 column 비교
+
+    $ python -m benchmarks.bench_article_counts --articles 20000 --size 50 --latency-ms 1
+
+목록 1 page(size 건) 응답 시간(ms, p50)과 query 수, reconcile_counts 의 article/sec 를 측정한다.
+(SQLite 에 SQL 실행마다 latency 를 추가해 MySQL round trip 을 흉내낸다)
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.databases.rdb import Base
+from app.databases.transactions import TransactionManager
+from app.domains.board.handlers import ArticleHandler
+from app.domains.board.models import Article, AttachedFile, Comment, Tag
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository
+from app.domains.board.services import ArticleService
+from app.domains.user.models import User
+
+def _build(articles: int, rng: random.Random):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (User, Article, Comment, Tag, AttachedFile)])
+    now = datetime.now()
+    rows = {Article: [], Comment: [], Tag: [], AttachedFile: []}
+    for article_id in range(1, articles + 1):
+        comments, files, tags = rng.randrange(20), rng.randrange(3), rng.randrange(4)
+        rows[Article].append({
+            'id': article_id, 'user_id': 1, 'title': f"title {article_id}", 'content': "content",
+            'comment_count': comments, 'attachment_count': files, 'tag_count': tags, 'created_at': now, 'updated_at': now
+        })
+        rows[Comment] += [
+            {'id': comment_id, 'article_id': article_id, 'user_id': 1, 'thread_id': comment_id, 'content': "comment", 'level': 0}
+            for comment_id in range(len(rows[Comment]) + 1, len(rows[Comment]) + comments + 1)
+        ]
+        rows[AttachedFile] += [
+            {'article_id': article_id, 'user_id': 1, 's3_bucket_name': "b", 's3_key': "k", 'filename': "f", 'file_type': "t"} for _ in range(files)
+        ]
+        rows[Tag] += [{'article_id': article_id, 'user_id': 1, 'tagging': f"tag{i}"} for i in range(tags)]
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        for model, values in rows.items():
+            conn.execute(model.__table__.insert(), values)
+        # 운영 DB 와 같이 FK column 에 index 가 있는 조건
+        for model in (Comment, Tag, AttachedFile):
+            conn.exec_driver_sql(f"CREATE INDEX ix_{model.__tablename__}_article_id ON {model.__tablename__} (article_id)")
+    return engine
+
+def _measure(engine, run, pages: list) -> tuple:
+    statements, latencies = [0], []
+
+    def _on_execute(*args):
+        statements[0] += 1
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    for page in pages:
+        start = time.perf_counter()
+        run(page)
+        latencies.append((time.perf_counter() - start) * 1000)
+    event.remove(engine, "before_cursor_execute", _on_execute)
+    return statistics.median(latencies), statements[0] / len(pages)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=20000)
+    parser.add_argument('--size', type=int, default=50)
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    engine = _build(articles=args.articles, rng=rng)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(*args_):
+        time.sleep(args.latency_ms / 1000)
+
+    session = Session(engine)
+    repository = ArticleRdbRepository(session=session)
+    pages = [rng.randrange(1, args.articles // args.size) for _ in range(args.pages)]
+    models = (Comment, AttachedFile, Tag)
+
+    def _count_each(page: int):
+        for article in repository.get_list(page=page, size=args.size):
+            for model in models:
+                session.scalar(select(func.count()).select_from(model).where(model.article_id == article.id))
+
+    def _count_grouped(page: int):
+        article_ids = [article.id for article in repository.get_list(page=page, size=args.size)]
+        for model in models:
+            session.execute(select(model.article_id, func.count()).where(model.article_id.in_(article_ids)).group_by(model.article_id)).all()
+
+    def _count_column(page: int):
+        [(a.comment_count, a.attachment_count, a.tag_count) for a in repository.get_list(page=page, size=args.size)]
+
+    results = [
+        ("COUNT(*) each", ) + _measure(engine, _count_each, pages),
+        ("GROUP BY ids", ) + _measure(engine, _count_grouped, pages),
+        ("count column", ) + _measure(engine, _count_column, pages),
+    ]
+
+    article_service = ArticleService(
+        article_handler=ArticleHandler(article_repository=repository),
+        article_cache_handler=None,
+        attached_file_handler=None,
+        comment_handler=None,
+        tag_handler=None,
+        article_search_handler=None,
+        transaction_manager=TransactionManager(session=session)
+    )
+    start = time.perf_counter()
+    reconcile = asyncio.run(article_service.reconcile_counts(batch_size=1000))
+    reconcile_elapsed = time.perf_counter() - start
+    session.close()
+
+    print(f"articles={args.articles} size={args.size} latency={args.latency_ms}ms")
+    print(f"{'method':<14} {'p50(ms)':>9} {'queries':>8}")
+    for name, p50, queries in results:
+        print(f"{name:<14} {p50:>9.2f} {queries:>8.0f}")
+    print(f"reconcile_counts : {reconcile.articles / reconcile_elapsed:.0f} articles/sec (fixed {reconcile.fixed})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Article export - 목록 API page 반복(ORM 조회 + JSON buffer) / streaming export(server-side cursor) 비교
+
+    $ python -m benchmarks.bench_article_export --rows 20000 --batch-size 1000
+
+SQLite file DB 에 article(tag 2개, 댓글 1개)을 적재한 뒤 전체를 export 하는 시간과 peak memory(tracemalloc)를 측정한다.
+"""
+import argparse
+import asyncio
+import orjson
+import os
+import tempfile
+import time
+import tracemalloc
+
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.databases.rdb import Base
+from app.databases.transactions import TransactionManager
+from app.domains.board.handlers import ArticleHandler, ArticleSearchHandler, CommentHandler, TagHandler
+from app.domains.board.models import Article, Comment, Tag
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository, CommentRdbRepository, TagRdbRepository
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import ArticleService
+from app.domains.user.models import User
+from app.utils.export_utils import encode_export
+
+def _load(engine, rows: int):
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (User, Article, Tag, Comment)])
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        conn.execute(Article.__table__.insert(), [
+            {'id': i, 'user_id': 1, 'title': f"title {i}", 'content': f"content {i} " * 20, 'is_deleted': False, 'created_at': now, 'updated_at': now}
+            for i in range(1, rows + 1)
+        ])
+        conn.execute(Tag.__table__.insert(), [
+            {'article_id': i, 'user_id': 1, 'tagging': tagging, 'created_at': now, 'updated_at': now}
+            for i in range(1, rows + 1) for tagging in (f"tag{i % 50}", "bench")
+        ])
+        conn.execute(Comment.__table__.insert(), [
+            {'id': i, 'article_id': i, 'user_id': 1, 'thread_id': i, 'level': 0, 'content': "comment", 'is_deleted': False, 'created_at': now, 'updated_at': now}
+            for i in range(1, rows + 1)
+        ])
+
+def _make_service(session: Session) -> ArticleService:
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    return ArticleService(
+        article_handler=ArticleHandler(article_repository=ArticleRdbRepository(session=session)),
+        article_cache_handler=None,
+        attached_file_handler=None,
+        comment_handler=CommentHandler(comment_repository=CommentRdbRepository(session=session)),
+        tag_handler=TagHandler(tag_repository=TagRdbRepository(session=session)),
+        article_search_handler=article_search_handler,
+        transaction_manager=TransactionManager(session=session)
+    )
+
+async def _run_paging(session: Session, batch_size: int) -> int:
+    """ 목록 API 와 같이 page 마다 ORM object 를 조회(tag / 댓글은 selectinload)하고, 전체 응답을 list 에 모은 뒤 JSON 으로 변환 """
+    records, after_id = [], None
+    while True:
+        query = session.query(Article) \
+            .options(joinedload(Article.user), selectinload(Article.tags), selectinload(Article.comments)) \
+            .filter(Article.is_deleted == False)
+        if after_id is not None:
+            query = query.filter(Article.id > after_id)
+        articles = query.order_by(Article.id).limit(batch_size).all()
+        if len(articles) == 0:
+            break
+        for article in articles:
+            records.append({
+                'id': article.id,
+                'user_id': article.user_id,
+                'username': article.user.username,
+                'title': article.title,
+                'content': article.content,
+                'tags': [tag.tagging for tag in article.tags],
+                'comments': [{'id': c.id, 'content': c.content} for c in article.comments],
+                'created_at': article.created_at,
+                'updated_at': article.updated_at
+            })
+        after_id = articles[-1].id
+    body = orjson.dumps(records)
+    return len(body)
+
+async def _run_stream(session: Session, batch_size: int) -> int:
+    """ Streaming export - chunk 를 받는 즉시 버린다 (응답 전송) """
+    size = 0
+    batches = _make_service(session=session).iter_export(batch_size=batch_size)
+    async for chunk in encode_export(batches=batches, file_format="ndjson"):
+        size += len(chunk)
+    return size
+
+def _measure(engine, method, batch_size: int):
+    with Session(engine) as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = asyncio.run(method(session=session, batch_size=batch_size))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, size
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        _load(engine, rows=args.rows)
+
+        print(f"rows={args.rows} batch_size={args.batch_size}")
+        print(f"{'method':<10} {'elapsed(s)':>10} {'rows/sec':>10} {'peak(MB)':>10} {'bytes':>12}")
+        for name, method in (("paging", _run_paging), ("stream", _run_stream)):
+            elapsed, peak, size = _measure(engine, method, batch_size=args.batch_size)
+            print(f"{name:<10} {elapsed:>10.2f} {args.rows / elapsed:>10.0f} {peak:>10.1f} {size:>12}")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
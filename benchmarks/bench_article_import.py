@@ -0,0 +1,92 @@
+"""
+Article 대량 등록 - create_article 반복(건별 INSERT + commit) / import_articles(batch multi-row INSERT) 처리량 비교
+
+    $ python -m benchmarks.bench_article_import --rows 5000 --batch-size 500 --latency-ms 1
+
+NDJSON record(tag 2개)를 등록하여 rows/sec 를 측정한다.
+(SQLite 에 SQL 실행마다 latency 를 추가해 MySQL round trip 을 흉내낸다)
+"""
+import argparse
+import asyncio
+import io
+import orjson
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.databases.rdb import Base
+from app.databases.transactions import TransactionManager
+from app.domains.board.handlers import ArticleHandler, ArticleSearchHandler, TagHandler
+from app.domains.board.models import Article, Tag, TagCount, TagDictionary
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository, TagRdbRepository
+from app.domains.board.repositories.search.search_repository import ArticleSearchMemoryRepository
+from app.domains.board.services import ArticleService
+from app.domains.user.models import User
+from app.utils.import_utils import iter_ndjson
+
+def _make_service(latency: float) -> ArticleService:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (User, Article, TagDictionary, Tag, TagCount)])
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': datetime.now()}])
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(*args):
+        time.sleep(latency)
+
+    session = Session(engine)
+    article_search_handler = ArticleSearchHandler(article_search_repository=ArticleSearchMemoryRepository())
+    return ArticleService(
+        article_handler=ArticleHandler(article_repository=ArticleRdbRepository(session=session)),
+        article_cache_handler=None,
+        attached_file_handler=None,
+        comment_handler=None,
+        tag_handler=TagHandler(tag_repository=TagRdbRepository(session=session)),
+        article_search_handler=article_search_handler,
+        transaction_manager=TransactionManager(session=session)
+    )
+
+def _make_ndjson(rows: int) -> str:
+    return "\n".join(
+        orjson.dumps({'title': f"title {i}", 'content': f"content {i} " * 20, 'tags': [f"tag{i % 50}", "import"]}).decode()
+        for i in range(rows)
+    )
+
+async def _run_each(rows: int, latency: float) -> float:
+    article_service = _make_service(latency=latency)
+    records = iter_ndjson(io.StringIO(_make_ndjson(rows=rows)))
+    start = time.perf_counter()
+    for _, record in records:
+        await article_service.create_article(
+            insert_article=Article(user_id=1, title=record['title'], content=record['content']),
+            tag_data=record['tags']
+        )
+    return rows / (time.perf_counter() - start)
+
+async def _run_import(rows: int, batch_size: int, latency: float) -> float:
+    article_service = _make_service(latency=latency)
+    records = iter_ndjson(io.StringIO(_make_ndjson(rows=rows)))
+    result = await article_service.import_articles(records=records, user_id=1, batch_size=batch_size)
+    assert result.rows == rows
+    return result.rows_per_sec
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=1)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    print(f"rows={args.rows} batch_size={args.batch_size} latency={args.latency_ms}ms")
+    each = asyncio.run(_run_each(rows=args.rows, latency=latency))
+    bulk = asyncio.run(_run_import(rows=args.rows, batch_size=args.batch_size, latency=latency))
+    print(f"{'method':<16} {'rows/sec':>10}")
+    print(f"{'create_article':<16} {each:>10.0f}")
+    print(f"{'import_articles':<16} {bulk:>10.0f} (x{bulk / each:.1f})")
+
+if __name__ == "__main__":
+    main()
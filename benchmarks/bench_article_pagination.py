@@ -0,0 +1,81 @@
+"""
+Article 목록 조회 - OFFSET pagination vs Keyset(cursor) pagination 비교 benchmark
+
+    $ python -m benchmarks.bench_article_pagination --rows 1000000 --size 50
+
+SQLite file DB에 article을 적재한 뒤 page 깊이별로 두 방식의 조회 latency를 측정한다.
+OFFSET 방식은 page 깊이에 비례해 느려지고, cursor 방식은 깊이와 무관하게 일정해야 한다.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.databases.rdb import Base
+from app.domains.board.models import Article
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository
+from app.domains.user.models import User
+
+def _populate(engine, rows: int):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        batch = []
+        for i in range(1, rows + 1):
+            batch.append({
+                'id': i,
+                'user_id': 1,
+                'title': f'title {i}',
+                'content': f'content {i}',
+                'is_deleted': False,
+                'created_at': now,
+                'updated_at': now
+            })
+            if len(batch) >= 10000:
+                conn.execute(insert(Article), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Article), batch)
+        conn.exec_driver_sql("create index idx_article_is_deleted_id on tb_article (is_deleted, id)")
+
+def _measure(func, repeat: int) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return sorted(elapsed)[len(elapsed) // 2] * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(engine, tables=[User.__table__, Article.__table__])
+        _populate(engine, rows=args.rows)
+
+        max_page = args.rows // args.size
+        pages = sorted({1, 10, 100, max_page // 10, max_page // 2, max_page})
+
+        print(f"rows={args.rows} size={args.size} (median of {args.repeat}, ms)")
+        print(f"{'page':>10} {'offset':>10} {'cursor':>10}")
+        with Session(engine) as session:
+            repository = ArticleRdbRepository(session=session)
+            for page in pages:
+                # page N의 cursor는 직전 page 마지막 id와 같다 (id가 연속이므로 계산 가능)
+                after_id = args.rows - (page - 1) * args.size + 1 if page > 1 else None
+                offset_ms = _measure(lambda: repository.get_list(page=page, size=args.size), args.repeat)
+                cursor_ms = _measure(lambda: repository.get_list_by_cursor(after_id=after_id, size=args.size), args.repeat)
+                session.expunge_all()
+                print(f"{page:>10} {offset_ms:>10.2f} {cursor_ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Article 검색 - LIKE '%term%' 전체 scan / memory 역색인 / SQLite FTS5 역색인 query latency 비교
+
+    $ python -m benchmarks.bench_article_search --rows 50000 --queries 200
+
+Zipf 분포 단어로 만든 article 을 index 한 뒤 1~2 단어 query 의 p50 / p95 latency(ms)를 측정한다.
+(LIKE 는 DynamicFilter 의 like 조건과 같이 title / content 를 '%term%' 로 검색한다)
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from datetime import datetime
+from sqlalchemy import and_, create_engine, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.databases.rdb import Base
+from app.domains.board.models import Article
+from app.domains.board.repositories.search.search_repository import (
+    ArticleSearchMemoryRepository,
+    ArticleSearchSqliteRepository
+)
+from app.domains.user.models import User
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+WEIGHTS = [1 / (i + 1) for i in range(len(VOCABULARY))]
+
+def _make_documents(rows: int, rng: random.Random) -> list:
+    return [
+        {
+            'article_id': i,
+            'title': " ".join(rng.choices(VOCABULARY, weights=WEIGHTS, k=6)),
+            'content': " ".join(rng.choices(VOCABULARY, weights=WEIGHTS, k=80)),
+            'tags': [f"tag{i % 50}"]
+        }
+        for i in range(1, rows + 1)
+    ]
+
+def _make_queries(count: int, rng: random.Random) -> list:
+    # 흔한 단어 ~ 드문 단어가 섞이도록 상위 500 개 단어에서 고른다
+    return [" ".join(rng.sample(VOCABULARY[10:500], k=rng.choice((1, 2)))) for _ in range(count)]
+
+def _measure(search, queries: list) -> tuple:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies), statistics.quantiles(latencies, n=20)[18]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--size', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    documents = _make_documents(rows=args.rows, rng=rng)
+    queries = _make_queries(count=args.queries, rng=rng)
+    workdir = tempfile.mkdtemp()
+    results = []
+
+    engine = create_engine(f"sqlite:///{workdir}/like.db")
+    Base.metadata.create_all(engine, tables=[User.__table__, Article.__table__])
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        now = datetime.now()
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        conn.execute(Article.__table__.insert(), [
+            {'id': d['article_id'], 'user_id': 1, 'title': d['title'], 'content': d['content'], 'created_at': now, 'updated_at': now}
+            for d in documents
+        ])
+    build = time.perf_counter() - start
+
+    def _like(query: str):
+        conditions = [or_(Article.title.like(f"%{term}%"), Article.content.like(f"%{term}%")) for term in query.split()]
+        with Session(engine) as session:
+            session.scalar(select(func.count()).select_from(Article).where(and_(*conditions)))
+            session.execute(select(Article.id).where(and_(*conditions)).order_by(Article.id.desc()).limit(args.size)).all()
+    results.append(("LIKE", build) + _measure(_like, queries))
+
+    for name, repository in (
+        ("memory", ArticleSearchMemoryRepository()),
+        ("sqlite fts5", ArticleSearchSqliteRepository(path=f"{workdir}/search.db"))
+    ):
+        start = time.perf_counter()
+        for i in range(0, len(documents), 1000):
+            repository.bulk_index(documents=documents[i:i + 1000])
+        build = time.perf_counter() - start
+        results.append((name, build) + _measure(lambda query: repository.search(query=query, tags=[], offset=0, size=args.size), queries))
+
+    print(f"rows={args.rows} queries={args.queries} size={args.size}")
+    print(f"{'method':<12} {'build(s)':>9} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for name, build, p50, p95 in results:
+        print(f"{name:<12} {build:>9.2f} {p50:>9.2f} {p95:>9.2f}")
+
+if __name__ == "__main__":
+    main()
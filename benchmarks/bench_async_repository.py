@@ -0,0 +1,121 @@
+"""
+동기 repository vs async repository 동시 처리량 benchmark
+
+    $ python -m benchmarks.bench_async_repository --requests 200 --concurrency 20 --latency-ms 20
+
+async route 에서 동기 repository 를 호출하면 query 가 실행되는 동안 event loop 전체가 멈춘다.
+SQLite(aiosqlite) 를 MySQL 대신 사용하고, 모든 SQL 실행에 latency 를 인위적으로 추가해
+동시 요청 처리량(requests/sec)을 비교한다.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.databases.rdb import Base
+from app.databases.scope import get_scope_id, request_scope
+from app.domains.board.handlers import ArticleHandler
+from app.domains.board.models import Article
+from app.domains.board.repositories.async_rdb.async_rdb_repository import ArticleAsyncRdbRepository
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository
+from app.domains.user.models import User
+
+def _add_latency(engine, latency: float):
+    """ SQL 실행마다 latency 만큼 대기 - SQL을 실행하는 thread(aiosqlite는 connection 전용 thread)에서 대기한다 """
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        raw_connection = getattr(dbapi_connection, 'driver_connection', dbapi_connection)
+        raw_connection = getattr(raw_connection, '_conn', raw_connection) # aiosqlite.Connection -> sqlite3.Connection
+        raw_connection.set_trace_callback(lambda statement: time.sleep(latency))
+
+def _populate(engine, rows: int):
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        conn.execute(insert(Article), [
+            {'id': i, 'user_id': 1, 'title': f'title {i}', 'content': f'content {i}', 'is_deleted': False}
+            for i in range(1, rows + 1)
+        ])
+
+async def _run(handler: ArticleHandler, remove_session, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request():
+        async with semaphore:
+            with request_scope():
+                try:
+                    await handler.get_list(page=1, size=20)
+                finally:
+                    await remove_session()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_request() for _ in range(requests)])
+    return requests / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=20)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--pool-size', type=int, default=20)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'bench.db')
+        sync_engine = create_engine(
+            f"sqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            pool_size=args.pool_size
+        )
+        Base.metadata.create_all(sync_engine, tables=[User.__table__, Article.__table__])
+        _populate(sync_engine, rows=1000)
+        sync_engine.dispose() # 적재에 사용한 connection 은 latency 없이 생성되었으므로 정리
+        _add_latency(sync_engine, latency=latency)
+
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=args.pool_size
+        )
+        _add_latency(async_engine.sync_engine, latency=latency)
+
+        sync_session = scoped_session(sessionmaker(bind=sync_engine), scopefunc=get_scope_id)
+        async_session = async_scoped_session(async_sessionmaker(bind=async_engine), scopefunc=get_scope_id)
+
+        async def _remove_sync():
+            sync_session.remove()
+
+        async def _bench():
+            sync_rps = await _run(
+                handler=ArticleHandler(article_repository=ArticleRdbRepository(session=sync_session)),
+                remove_session=_remove_sync,
+                requests=args.requests,
+                concurrency=args.concurrency
+            )
+            async_rps = await _run(
+                handler=ArticleHandler(article_repository=ArticleAsyncRdbRepository(session=async_session)),
+                remove_session=async_session.remove,
+                requests=args.requests,
+                concurrency=args.concurrency
+            )
+            await async_engine.dispose()
+            return sync_rps, async_rps
+
+        sync_rps, async_rps = asyncio.run(_bench())
+        sync_engine.dispose()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} latency={args.latency_ms}ms pool_size={args.pool_size}")
+    print(f"{'rdb (sync)':>16} {sync_rps:>10.1f} req/s")
+    print(f"{'async_rdb':>16} {async_rps:>10.1f} req/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+첨부파일 upload 전송량 비교 - file 이름 key(이전 방식) / 내용(sha256) 기준 key 와 중복 제거(현재 방식)
+
+    $ python -m benchmarks.bench_attachment_dedup --files 50 --distinct 5 --size-mb 4 --bandwidth-mbps 100
+
+distinct 종류의 file 을 files 번 첨부할 때 저장소로 전송되는 byte 수와 소요 시간을 측정한다.
+(memory 저장소에 전송 byte 수만큼 대기 시간을 추가해 S3 upload 를 흉내낸다)
+"""
+import argparse
+import asyncio
+import io
+import os
+import time
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.common.constants import S3_BUCKET, S3_KEY_PREFIX
+from app.domains.board.handlers import AttachedFileHandler
+from app.domains.user.models import User # AttachedFileBlob mapper 구성 시 필요
+from app.storages.memory_storage import MemoryStorageBackend
+
+class _ThrottledStorage(MemoryStorageBackend):
+
+    def __init__(self, bandwidth_mbps: float):
+        super().__init__()
+        self.bandwidth = bandwidth_mbps * 1024 * 1024 / 8
+        self.transferred = 0
+
+    async def upload(self, upload_file_obj: UploadFile, bucket: str, key: str) -> bool:
+        self.transferred += upload_file_obj.size
+        await asyncio.sleep(upload_file_obj.size / self.bandwidth)
+        return await super().upload(upload_file_obj=upload_file_obj, bucket=bucket, key=key)
+
+def _make_upload_files(count: int, contents):
+    return [
+        UploadFile(
+            file=io.BytesIO(contents[i % len(contents)]),
+            filename=f"document-{i}.pdf",
+            size=len(contents[i % len(contents)]),
+            headers=Headers({'content-type': 'application/pdf'})
+        )
+        for i in range(count)
+    ]
+
+async def _upload_by_filename(handler: AttachedFileHandler, f: UploadFile):
+    return await handler.storage.upload(upload_file_obj=f, bucket=S3_BUCKET['BOARD'], key=f"{S3_KEY_PREFIX['BOARD']}/{f.filename}")
+
+async def _upload_by_content(handler: AttachedFileHandler, f: UploadFile):
+    return await handler.upload(f=f)
+
+def _run(func, files, bandwidth_mbps: float):
+    handler = AttachedFileHandler(attached_file_repository=None, storage=_ThrottledStorage(bandwidth_mbps=bandwidth_mbps))
+
+    async def _upload_sequentially():
+        # 같은 file 을 여러 게시물에 첨부하는 경우 - 요청마다 1건씩 upload
+        for f in files:
+            assert await func(handler, f)
+
+    start = time.perf_counter()
+    asyncio.run(_upload_sequentially())
+    return handler.storage.transferred, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=50)
+    parser.add_argument('--distinct', type=int, default=5)
+    parser.add_argument('--size-mb', type=int, default=4)
+    parser.add_argument('--bandwidth-mbps', type=float, default=100)
+    args = parser.parse_args()
+
+    contents = [os.urandom(args.size_mb * 1024 * 1024) for _ in range(args.distinct)]
+
+    print(f"files={args.files} distinct={args.distinct} size={args.size_mb}MB bandwidth={args.bandwidth_mbps}Mbps")
+    print(f"{'key':>10} {'transferred(MB)':>16} {'elapsed(s)':>11}")
+    for label, func in (("filename", _upload_by_filename), ("content", _upload_by_content)):
+        transferred, elapsed = _run(func=func, files=_make_upload_files(count=args.files, contents=contents), bandwidth_mbps=args.bandwidth_mbps)
+        print(f"{label:>10} {transferred / 1024 / 1024:>16.1f} {elapsed:>11.2f}")
+
+if __name__ == "__main__":
+    main()
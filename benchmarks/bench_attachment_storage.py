@@ -0,0 +1,76 @@
+"""
+첨부파일 pipeline(AttachedFileHandler upload_all / open_content) 처리량 측정 - AWS 없이 local / memory 저장소 사용
+
+    $ python -m benchmarks.bench_attachment_storage --files 16 --size-mb 8
+
+files 개의 첨부파일을 동시 upload 한 뒤 모두 download(streaming) 하는 데 걸린 시간으로 처리량(MB/s)을 계산한다.
+"""
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from app.common.constants import S3_BUCKET, S3_KEY_PREFIX
+from app.domains.board.handlers import AttachedFileHandler
+from app.domains.board.models import AttachedFile
+from app.domains.user.models import User # AttachedFile mapper 구성 시 필요
+from app.storages.local_storage import LocalStorageBackend
+from app.storages.memory_storage import MemoryStorageBackend
+
+def _make_upload_files(count: int, content: bytes):
+    return [
+        UploadFile(
+            file=io.BytesIO(content),
+            filename=f"bench-{i}.bin",
+            size=len(content),
+            headers=Headers({'content-type': 'application/octet-stream'})
+        )
+        for i in range(count)
+    ]
+
+async def _download(handler: AttachedFileHandler, filename: str) -> int:
+    attached_file = AttachedFile(s3_bucket_name=S3_BUCKET['BOARD'], s3_key=f"{S3_KEY_PREFIX['BOARD']}/{filename}", filename=filename)
+    attached_file_content = await handler.open_content(attached_file=attached_file)
+    received = 0
+    async for chunk in attached_file_content.content:
+        received += len(chunk)
+    return received
+
+async def _run(handler: AttachedFileHandler, count: int, content: bytes):
+    files = _make_upload_files(count=count, content=content)
+
+    start = time.perf_counter()
+    assert all(await handler.upload_all(files=files))
+    upload_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    received = await asyncio.gather(*[_download(handler=handler, filename=f.filename) for f in files])
+    download_elapsed = time.perf_counter() - start
+    assert sum(received) == count * len(content)
+
+    return upload_elapsed, download_elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=16)
+    parser.add_argument('--size-mb', type=int, default=8)
+    args = parser.parse_args()
+
+    content = os.urandom(args.size_mb * 1024 * 1024)
+    total_mb = args.files * args.size_mb
+
+    print(f"files={args.files} size={args.size_mb}MB")
+    print(f"{'storage':>10} {'upload(MB/s)':>13} {'download(MB/s)':>15}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, storage in (("memory", MemoryStorageBackend()), ("local", LocalStorageBackend(root_dir=tmp_dir))):
+            handler = AttachedFileHandler(attached_file_repository=None, storage=storage)
+            upload_elapsed, download_elapsed = asyncio.run(_run(handler=handler, count=args.files, content=content))
+            print(f"{label:>10} {total_mb / upload_elapsed:>13.1f} {total_mb / download_elapsed:>15.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+인증 redis round trip 비교 - 개별 명령(이전 방식) / pipeline, GETEX(현재 방식)
+
+    $ python -m benchmarks.bench_auth_redis --requests 1000 --latency-ms 0.5
+
+signin 의 token 저장(3건)과 request 마다의 access token 검증(조회 + 만료 갱신)에서
+발생하는 round trip 수와 소요 시간을 측정한다.
+(fakeredis connection 에 명령 전송마다 latency 를 추가해 네트워크 round trip 을 흉내낸다)
+"""
+import argparse
+import fakeredis
+import redis
+import time
+
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+
+EXP = 3600
+
+class _RoundTripCounter:
+    count = 0
+    latency = 0.0
+
+class _CountingConnection(fakeredis.FakeConnection):
+    def send_packed_command(self, *args, **kwargs):
+        _RoundTripCounter.count += 1
+        time.sleep(_RoundTripCounter.latency)
+        return super().send_packed_command(*args, **kwargs)
+
+def _signin_legacy(repository: AuthCacheRepository, i: int):
+    repository.set_cache(key=f"refresh-{i}", value="1", exp=EXP)
+    repository.set_cache(key=f"access-{i}", value="1", exp=EXP)
+    repository.set_cache(key="RT-1", value="1", exp=EXP)
+
+def _signin_pipeline(repository: AuthCacheRepository, i: int):
+    repository.set_cache_many(items=[
+        (f"refresh-{i}", "1", EXP),
+        (f"access-{i}", "1", EXP),
+        ("RT-1", "1", EXP)
+    ])
+
+def _validate_legacy(repository: AuthCacheRepository, i: int):
+    if repository.get_cache(key=f"access-{i}") is not None:
+        repository.set_expire(key=f"access-{i}", expired_at=EXP)
+
+def _validate_getex(repository: AuthCacheRepository, i: int):
+    repository.get_cache_and_expire(key=f"access-{i}", exp=EXP)
+
+def _run(repository: AuthCacheRepository, func, requests: int):
+    _RoundTripCounter.count = 0
+    start = time.perf_counter()
+    for i in range(requests):
+        func(repository, i)
+    elapsed = time.perf_counter() - start
+    return _RoundTripCounter.count / requests, elapsed / requests * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--latency-ms', type=float, default=0.5)
+    args = parser.parse_args()
+
+    connection_pool = redis.ConnectionPool(
+        connection_class=_CountingConnection,
+        server=fakeredis.FakeServer(),
+        decode_responses=True
+    )
+    repository = AuthCacheRepository(redis_client=redis.Redis(connection_pool=connection_pool))
+    repository.set_cache(key="warmup", value="1") # connection 생성(handshake)은 측정에서 제외
+    _RoundTripCounter.latency = args.latency_ms / 1000
+
+    print(f"requests={args.requests} latency={args.latency_ms}ms")
+    print(f"{'operation':>20} {'round trips':>12} {'ms/request':>12}")
+    for label, func in (
+        ("signin (legacy)", _signin_legacy),
+        ("signin (pipeline)", _signin_pipeline),
+        ("validate (legacy)", _validate_legacy),
+        ("validate (GETEX)", _validate_getex)
+    ):
+        round_trips, ms = _run(repository=repository, func=func, requests=args.requests)
+        print(f"{label:>20} {round_trips:>12.1f} {ms:>12.3f}")
+
+if __name__ == "__main__":
+    main()
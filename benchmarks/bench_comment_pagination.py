@@ -0,0 +1,112 @@
+"""
+Comment 목록 조회 benchmark - 전체 조회 vs thread 순서 page 조회
+
+    $ python -m benchmarks.bench_comment_pagination --comments 100000 --size 50
+
+하나의 article에 최상위 댓글과 대댓글이 섞인 댓글을 적재한 뒤
+기존 방식(article 전체 댓글 조회)과 offset / cursor page 조회의 latency를 비교한다.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.databases.rdb import Base
+from app.domains.board.models import Article, Comment
+from app.domains.board.repositories.rdb.rdb_repository import CommentRdbRepository
+from app.domains.user.models import User
+
+def _populate(engine, comments: int, reply_ratio: float):
+    now = datetime.now()
+    random.seed(0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        conn.execute(insert(Article), [{'id': 1, 'user_id': 1, 'title': 'hot article', 'content': 'content'}])
+
+        roots = []
+        batch = []
+        for comment_id in range(1, comments + 1):
+            row = {
+                'id': comment_id,
+                'user_id': 1,
+                'article_id': 1,
+                'content': f'comment {comment_id}',
+                'is_deleted': False,
+                'created_at': now,
+                'updated_at': now
+            }
+            if roots and random.random() < reply_ratio:
+                parent_id = random.choice(roots)
+                row.update({'comment_id': parent_id, 'thread_id': parent_id, 'level': 1})
+            else:
+                roots.append(comment_id)
+                row.update({'comment_id': None, 'thread_id': comment_id, 'level': 0})
+            batch.append(row)
+            if len(batch) >= 10000:
+                conn.execute(insert(Comment), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Comment), batch)
+        conn.exec_driver_sql(
+            "create index idx_article_comment_thread on tb_article_comment (article_id, is_deleted, thread_id, id)"
+        )
+
+def _measure(func, repeat: int) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return sorted(elapsed)[len(elapsed) // 2] * 1000
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--comments', type=int, default=100000)
+    parser.add_argument('--size', type=int, default=50)
+    parser.add_argument('--reply-ratio', type=float, default=0.7)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(engine, tables=[User.__table__, Article.__table__, Comment.__table__])
+        _populate(engine, comments=args.comments, reply_ratio=args.reply_ratio)
+
+        print(f"comments={args.comments} size={args.size} (median of {args.repeat}, ms)")
+        with Session(engine) as session:
+            repository = CommentRdbRepository(session=session)
+
+            def fetch_all():
+                # 기존 get_list 동작 - page/size를 무시하고 article의 전체 댓글을 조회
+                session.query(Comment).filter(Comment.article_id == 1, Comment.is_deleted == False).all()
+                session.expunge_all()
+
+            def fetch_page(page):
+                repository.get_list(article_id=1, page=page, size=args.size)
+                session.expunge_all()
+
+            def fetch_cursor(after):
+                repository.get_list_by_cursor(article_id=1, after=after, size=args.size)
+                session.expunge_all()
+
+            print(f"{'full list':>24} {_measure(fetch_all, args.repeat):>10.2f}")
+
+            max_page = args.comments // args.size
+            for page in sorted({1, max_page // 2, max_page}):
+                # 같은 위치를 cursor로 조회하기 위해 직전 page 마지막 댓글의 key를 구한다
+                after = None
+                if page > 1:
+                    last = repository.get_list(article_id=1, page=page - 1, size=args.size)[-1]
+                    after = [last.thread_id, last.id]
+                offset_ms = _measure(lambda: fetch_page(page), args.repeat)
+                cursor_ms = _measure(lambda: fetch_cursor(after), args.repeat)
+                print(f"{'offset page ' + str(page):>24} {offset_ms:>10.2f}")
+                print(f"{'cursor page ' + str(page):>24} {cursor_ms:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Application import 시간 측정 - python -X importtime 결과에서 module 별 누적 import 시간(median)을 집계한다
+
+    $ python -m benchmarks.bench_import_time --runs 5 --top 15
+
+새 interpreter 에서 매번 import 하며, secret 조회 없이 import 되는지 확인하도록 SECRET_PROVIDERS 를 비워서 실행한다.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+def measure_import_time(module: str) -> dict:
+    """
+    :param module:
+    :return: {module 이름: 누적 import 시간(us)}
+    """
+    env = dict(os.environ, SECRET_PROVIDERS="", PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default="app.main")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure_import_time(args.module) for _ in range(args.runs)]
+    medians = {
+        name: statistics.median(run.get(name, 0) for run in runs)
+        for name in runs[0]
+    }
+
+    print(f"module={args.module} runs={args.runs}")
+    print(f"{'module':<60} {'cumulative(ms)':>15}")
+    for name, us in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{name:<60} {us / 1000:>15.1f}")
+
+    # import 이후 어떤 무거운 module 이 load 되었는지
+    for name in ("boto3", "redis", "sqlalchemy.ext.asyncio", "aiomysql", "pymysql"):
+        print(f"{name:<60} {'loaded' if name in runs[0] else '-':>15}")
+
+if __name__ == "__main__":
+    main()
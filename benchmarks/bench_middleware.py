@@ -0,0 +1,139 @@
+"""
+AccessControl middleware 처리량 비교 - BaseHTTPMiddleware(이전 방식) / pure ASGI middleware(현재 방식)
+
+    $ python -m benchmarks.bench_middleware --requests 5000
+
+HTTP client / server 없이 ASGI app 을 직접 호출하여 /health 와 인증이 필요한 board route 의 requests/sec 를 측정한다.
+(인증 사용자 cache 가 채워진 상태 - redis 는 fakeredis 를 사용한다)
+"""
+import argparse
+import asyncio
+import fakeredis
+import logging
+import re
+import time
+
+from datetime import datetime, timedelta
+from fastapi import FastAPI, Request
+from fastapi.logger import logger
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.common.exceptions import exception_handler, APIException
+from app.domains.auth.handlers import AuthHandler
+from app.domains.auth.repositories.cache.cache_repository import AuthCacheRepository
+from app.domains.user.models import User
+from app.middlewares.except_paths import EXCEPT_PATH_REGEX
+from app.middlewares.token_validator_middleware import AccessControl
+from app.utils.log_utils import api_logger
+
+class _LegacyAccessControl(BaseHTTPMiddleware):
+    """ 이전 방식 - BaseHTTPMiddleware + request 마다 re.match """
+
+    def __init__(self, app, access_control: AccessControl):
+        super().__init__(app)
+        self.access_control = access_control
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.start_time = time.time()
+        ip = request.headers['x-forwarded-for'] if "x-forwarded-for" in request.headers.keys() else request.client.host
+        request.state.ip = ip.split(",")[0] if "," in ip else ip
+
+        try:
+            if not re.match(EXCEPT_PATH_REGEX, request.url.path):
+                request.state.user = self.access_control.authenticate(headers=request.headers)
+            response = await call_next(request)
+            await api_logger(request=request, response=response)
+        except Exception as ex:
+            error = await exception_handler(ex) if type(ex) is not APIException else ex
+            response = JSONResponse(status_code=error.status_code, content=error.detail)
+            await api_logger(request=request, error=error)
+        return response
+
+class _StubUserHandler:
+
+    def get_detail(self, user_id: str):
+        return User(id=int(user_id), username="bench", created_at=datetime.now())
+
+def _make_app(legacy: bool):
+    auth_handler = AuthHandler(auth_repository=AuthCacheRepository(redis_client=fakeredis.FakeRedis(decode_responses=True)))
+    access_token = auth_handler.create_access_token(subject="1", expires_at=datetime.now() + timedelta(hours=1))
+    auth_handler.set_token(key=access_token, value="1", exp=3600)
+
+    app = FastAPI()
+
+    @app.get("/health", response_class=PlainTextResponse)
+    async def health_api():
+        return "OK"
+
+    @app.get("/board/articles/{article_id}")
+    async def article_api(article_id: int, request: Request):
+        return {'id': article_id, 'user_id': request.state.user.id, 'title': "title", 'content': "content"}
+
+    access_control = AccessControl(app=None, auth_handler=auth_handler, user_handler=_StubUserHandler())
+    if legacy:
+        app.add_middleware(_LegacyAccessControl, access_control=access_control)
+    else:
+        app.add_middleware(AccessControl, auth_handler=auth_handler, user_handler=_StubUserHandler())
+    return app, access_token
+
+async def _request(app, path: str, headers: list) -> int:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': headers,
+        'client': ('127.0.0.1', 50000),
+        'server': ('testserver', 80)
+    }
+    request_sent = False
+    status_code = None
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await asyncio.Event().wait() # client disconnect 없음
+
+    async def send(message):
+        nonlocal status_code
+        if message['type'] == 'http.response.start':
+            status_code = message['status']
+
+    await app(scope, receive, send)
+    return status_code
+
+async def _run(legacy: bool, path: str, requests: int) -> float:
+    app, access_token = _make_app(legacy=legacy)
+    headers = [(b'host', b'testserver'), (b'authorization', f"Bearer {access_token}".encode())]
+    for _ in range(100): # warm-up (middleware stack 생성, 인증 사용자 cache)
+        assert await _request(app, path, headers) == 200
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await _request(app, path, headers)
+    return requests / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+    print(f"requests={args.requests}")
+    print(f"{'path':<20} {'BaseHTTPMiddleware(req/s)':>26} {'ASGI(req/s)':>12} {'ratio':>6}")
+    for path in ("/health", "/board/articles/1"):
+        legacy = asyncio.run(_run(legacy=True, path=path, requests=args.requests))
+        current = asyncio.run(_run(legacy=False, path=path, requests=args.requests))
+        print(f"{path:<20} {legacy:>26.0f} {current:>12.0f} {current / legacy:>6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+S3 client 호출 당 overhead 비교 - 호출마다 resource 생성(이전 방식) / process 공유 client(현재 방식)
+
+    $ python -m benchmarks.bench_s3_client --calls 200
+
+Network 영향을 제외하기 위해 presigned URL 생성(local 서명)으로 호출 당 소요 시간과 memory 할당량을 측정한다.
+"""
+import argparse
+import boto3
+import time
+import tracemalloc
+
+from botocore.config import Config
+
+from app.common.constants import AWS_REGION
+from app.utils.aws_utils import get_s3_client, s3_generate_presigned_url
+
+PARAMS = {'Bucket': 'bench-bucket', 'Key': 'bench/file.bin'}
+
+def _call_legacy(_):
+    s3 = boto3.resource(
+        's3',
+        endpoint_url="https://s3.ap-northeast-2.amazonaws.com",
+        config=Config(signature_version='s3v4'),
+        region_name=AWS_REGION
+    )
+    s3_generate_presigned_url(s3_client=s3.meta.client, client_method='get_object', params=PARAMS, expires_in=600)
+
+def _call_shared(s3_client):
+    s3_generate_presigned_url(s3_client=s3_client, client_method='get_object', params=PARAMS, expires_in=600)
+
+def _measure(func, arg, calls: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(arg)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / calls * 1000, peak
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=200)
+    args = parser.parse_args()
+
+    s3_client = get_s3_client()
+    _call_shared(s3_client) # warm-up
+
+    print(f"calls={args.calls}")
+    print(f"{'client':>10} {'ms/call':>10} {'peak memory(KB)':>16}")
+    for label, func, arg in (("per-call", _call_legacy, None), ("shared", _call_shared, s3_client)):
+        ms, peak = _measure(func=func, arg=arg, calls=args.calls)
+        print(f"{label:>10} {ms:>10.3f} {peak / 1024:>16.1f}")
+
+if __name__ == "__main__":
+    main()
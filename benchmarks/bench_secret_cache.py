@@ -0,0 +1,62 @@
+"""
+Secret 조회 비용 비교 - 호출마다 session/client 생성 후 조회(이전 방식) / SecretCache(현재 방식)
+
+    $ python -m benchmarks.bench_secret_cache --calls 50 --latency-ms 30
+
+moto 로 Secrets Manager 를 흉내내며, 조회마다 latency 를 추가해 API 호출 비용을 반영한다.
+"""
+import argparse
+import boto3
+import orjson
+import os
+import time
+
+from moto import mock_aws
+
+from app.common.constants import AWS_REGION
+from app.utils.secret_utils import AwsSecretProvider, SecretCache
+
+SECRET_NAME = "bench/db"
+
+def _get_legacy(latency: float):
+    session = boto3.session.Session()
+    client = session.client(service_name="secretsmanager", region_name=AWS_REGION)
+    time.sleep(latency)
+    return orjson.loads(client.get_secret_value(SecretId=SECRET_NAME)['SecretString'])
+
+class _SlowAwsSecretProvider(AwsSecretProvider):
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def get(self, secret_name: str):
+        time.sleep(self.latency)
+        return super().get(secret_name=secret_name)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=50)
+    parser.add_argument('--latency-ms', type=float, default=30)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+    with mock_aws():
+        boto3.client("secretsmanager", region_name=AWS_REGION).create_secret(
+            Name=SECRET_NAME,
+            SecretString=orjson.dumps({'HOST': 'localhost', 'PORT': 3306}).decode()
+        )
+        secret_cache = SecretCache(providers=[_SlowAwsSecretProvider(latency=latency)], ttl=300)
+
+        print(f"calls={args.calls} latency={args.latency_ms}ms")
+        print(f"{'lookup':>8} {'ms/call':>10} {'total(s)':>9}")
+        for label, func in (("legacy", lambda: _get_legacy(latency)), ("cached", lambda: secret_cache.get(SECRET_NAME))):
+            start = time.perf_counter()
+            for _ in range(args.calls):
+                func()
+            elapsed = time.perf_counter() - start
+            print(f"{label:>8} {elapsed / args.calls * 1000:>10.3f} {elapsed:>9.3f}")
+
+if __name__ == "__main__":
+    main()
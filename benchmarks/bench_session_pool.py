@@ -0,0 +1,139 @@
+"""
+Request 단위 session - RDB_MODE / connection pool 크기별 처리량 load test
+
+    $ python -m benchmarks.bench_session_pool --concurrency 16 --requests 400 --latency-ms 10
+
+Application 과 같이 하나의 event loop 에서 request 마다 task 를 만들고, request scope 안에서
+scoped session 으로 조회한 뒤 session 을 반환한다. (DBSessionMiddleware 와 동일)
+ - async_rdb : request 별로 별도의 pooled connection 을 사용하므로 처리량이 pool 크기에 비례해 증가한다.
+ - rdb       : 동기 query 가 event loop 를 막으므로 pool 크기와 무관하게 worker 당 한 번에 하나의 query 만 실행된다.
+               (rdb mode 의 처리량은 worker process 수로 늘린다)
+(SQLite file DB 에 SQL 실행마다 latency 를 추가해 MySQL round trip 을 흉내낸다)
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from datetime import datetime
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.databases.rdb import Base
+from app.databases.scope import get_scope_id, request_scope
+from app.domains.board.handlers import ArticleHandler
+from app.domains.board.models import Article
+from app.domains.board.repositories.async_rdb.async_rdb_repository import ArticleAsyncRdbRepository
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository
+from app.domains.user.models import User
+
+def _populate(db_path: str, rows: int):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine, tables=[User.__table__, Article.__table__])
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': datetime.now()}])
+        conn.execute(insert(Article), [
+            {'id': i, 'user_id': 1, 'title': f'title {i}', 'content': f'content {i}', 'is_deleted': False}
+            for i in range(1, rows + 1)
+        ])
+    engine.dispose()
+
+def _add_latency(engine, latency: float):
+    """ SQL 실행마다 latency 만큼 대기 - SQL을 실행하는 thread(aiosqlite는 connection 전용 thread)에서 대기한다 """
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        raw_connection = getattr(dbapi_connection, 'driver_connection', dbapi_connection)
+        raw_connection = getattr(raw_connection, '_conn', raw_connection) # aiosqlite.Connection -> sqlite3.Connection
+        raw_connection.set_trace_callback(lambda statement: time.sleep(latency))
+
+async def _run(handler: ArticleHandler, remove_session, concurrency: int, requests: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request():
+        async with semaphore:
+            with request_scope():
+                try:
+                    await handler.get_list(page=1, size=20)
+                finally:
+                    await remove_session()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[asyncio.create_task(_request()) for _ in range(requests)])
+    return requests / (time.perf_counter() - start)
+
+def _run_sync(db_path: str, pool_size: int, concurrency: int, requests: int, latency: float) -> float:
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=60
+    )
+    _add_latency(engine, latency=latency)
+    session = scoped_session(sessionmaker(bind=engine), scopefunc=get_scope_id)
+
+    async def _remove_session():
+        session.remove()
+
+    rps = asyncio.run(_run(
+        handler=ArticleHandler(article_repository=ArticleRdbRepository(session=session)),
+        remove_session=_remove_session,
+        concurrency=concurrency,
+        requests=requests
+    ))
+    engine.dispose()
+    return rps
+
+def _run_async(db_path: str, pool_size: int, concurrency: int, requests: int, latency: float) -> float:
+    async def _bench():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{db_path}",
+            connect_args={"check_same_thread": False},
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=0,
+            pool_timeout=60
+        )
+        _add_latency(engine.sync_engine, latency=latency)
+        session = async_scoped_session(async_sessionmaker(bind=engine), scopefunc=get_scope_id)
+        rps = await _run(
+            handler=ArticleHandler(article_repository=ArticleAsyncRdbRepository(session=session)),
+            remove_session=session.remove,
+            concurrency=concurrency,
+            requests=requests
+        )
+        await engine.dispose()
+        return rps
+
+    return asyncio.run(_bench())
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--latency-ms', type=float, default=10)
+    parser.add_argument('--pool-sizes', type=str, default='1,2,4,8,16')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'bench.db')
+        _populate(db_path=db_path, rows=1000)
+
+        print(f"concurrency={args.concurrency} requests={args.requests} latency={args.latency_ms}ms")
+        print(f"{'pool_size':>10} {'rdb req/s':>12} {'async_rdb req/s':>16}")
+        for pool_size in [int(v) for v in args.pool_sizes.split(',')]:
+            options = dict(
+                db_path=db_path,
+                pool_size=pool_size,
+                concurrency=args.concurrency,
+                requests=args.requests,
+                latency=args.latency_ms / 1000
+            )
+            print(f"{pool_size:>10} {_run_sync(**options):>12.1f} {_run_async(**options):>16.1f}")
+
+if __name__ == "__main__":
+    main()
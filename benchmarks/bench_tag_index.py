@@ -0,0 +1,123 @@
+"""
+Tag 별 article 목록 / 인기 tag 조회 - tb_article_tag 전체 scan(tagging 조건, GROUP BY) / tag 사전 index + 일자별 tag 수 비교
+
+    $ python -m benchmarks.bench_tag_index --articles 100000 --queries 50
+
+Article 마다 Zipf 분포 tag 3개를 붙이고 (최근 30일에 분산) 다음 query 의 p50 latency(ms)를 측정한다.
+ - tag 별 목록 : 첫 page / 100 page 째 (scan 은 OFFSET, index 는 keyset cursor)
+ - 인기 tag : 최근 7일 상위 20개
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+
+from collections import Counter
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, desc, func, select
+from sqlalchemy.orm import Session, joinedload
+
+from app.databases.rdb import Base
+from app.domains.board.models import Article, Tag, TagCount, TagDictionary
+from app.domains.board.repositories.rdb.rdb_repository import ArticleRdbRepository, TagRdbRepository
+from app.domains.user.models import User
+
+TAGS = [f"tag{i}" for i in range(1000)]
+WEIGHTS = [1 / (i + 1) for i in range(len(TAGS))]
+
+def _build(path: str, articles: int, rng: random.Random):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine, tables=[t.__table__ for t in (User, Article, TagDictionary, Tag, TagCount)])
+    now = datetime.now()
+    tag_rows, counts = [], Counter()
+    for article_id in range(1, articles + 1):
+        created_at = now - timedelta(days=rng.randrange(30))
+        for tagging in set(rng.choices(TAGS, weights=WEIGHTS, k=3)):
+            tag_id = TAGS.index(tagging) + 1
+            tag_rows.append({'article_id': article_id, 'user_id': 1, 'tag_id': tag_id, 'tagging': tagging, 'created_at': created_at})
+            counts[(created_at.date(), tag_id)] += 1
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [{'id': 1, 'username': 'bench', 'password': 'bench', 'created_at': now}])
+        conn.execute(Article.__table__.insert(), [
+            {'id': i, 'user_id': 1, 'title': f"title {i}", 'content': "content", 'created_at': now, 'updated_at': now}
+            for i in range(1, articles + 1)
+        ])
+        conn.execute(TagDictionary.__table__.insert(), [{'id': i + 1, 'tagging': t, 'created_at': now} for i, t in enumerate(TAGS)])
+        conn.execute(Tag.__table__.insert(), tag_rows)
+        conn.execute(TagCount.__table__.insert(), [
+            {'count_date': count_date, 'tag_id': tag_id, 'article_count': count} for (count_date, tag_id), count in counts.items()
+        ])
+    return engine
+
+def _p50(run, queries: list) -> float:
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        run(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return statistics.median(latencies)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--articles', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--size', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    engine = _build(path=f"{tempfile.mkdtemp()}/tag.db", articles=args.articles, rng=rng)
+    taggings = rng.sample(TAGS[:50], k=min(args.queries, 50))
+    session = Session(engine)
+    article_repository = ArticleRdbRepository(session=session)
+    tag_repository = TagRdbRepository(session=session)
+    size, deep = args.size, 100
+
+    def _scan_list(tagging: str, page: int):
+        query = (
+            session.query(Article).options(joinedload(Article.user))
+            .join(Tag, Tag.article_id == Article.id)
+            .filter(Tag.tagging == tagging, Article.is_deleted == False)
+            .order_by(desc(Tag.article_id))
+        )
+        return query.offset((page - 1) * size).limit(size).all()
+
+    def _index_list(tagging: str, page: int):
+        tag_id = tag_repository.get_tag_id(tagging=tagging)
+        after_id = None
+        for _ in range(page - 1): # 이전 page 의 마지막 id 를 cursor 로 전달받은 것과 같다
+            after_id = session.execute(
+                select(Tag.article_id).where(Tag.tag_id == tag_id, *([Tag.article_id < after_id] if after_id else []))
+                .order_by(desc(Tag.article_id)).offset(size - 1).limit(1)
+            ).scalar()
+        start = time.perf_counter()
+        article_repository.get_list_by_tag(tag_id=tag_id, after_id=after_id, size=size)
+        return time.perf_counter() - start
+
+    since = date.today() - timedelta(days=6)
+
+    def _scan_trending(_):
+        count = func.count().label('article_count')
+        session.execute(
+            select(Tag.tagging, count).where(Tag.created_at >= datetime.combine(since, datetime.min.time()))
+            .group_by(Tag.tagging).order_by(desc(count)).limit(size)
+        ).all()
+
+    results = [
+        ("scan", "list page 1", _p50(lambda t: _scan_list(t, page=1), taggings)),
+        ("index", "list page 1", _p50(lambda t: _index_list(t, page=1), taggings)),
+        ("scan", f"list page {deep}", _p50(lambda t: _scan_list(t, page=deep), taggings)),
+        # cursor 를 구하는 시간은 제외하고 마지막 page 조회 시간만 측정한다
+        ("index", f"list page {deep}", statistics.median([_index_list(t, page=deep) * 1000 for t in taggings])),
+        ("scan", "trending 7d", _p50(_scan_trending, range(args.queries))),
+        ("count", "trending 7d", _p50(lambda _: tag_repository.get_trending_list(since=since, size=size), range(args.queries))),
+    ]
+    session.close()
+
+    print(f"articles={args.articles} queries={len(taggings)} size={size}")
+    print(f"{'method':<8} {'query':<16} {'p50(ms)':>9}")
+    for method, query, p50 in results:
+        print(f"{method:<8} {query:<16} {p50:>9.2f}")
+
+if __name__ == "__main__":
+    main()
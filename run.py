@@ -4,6 +4,15 @@ import uvicorn
 from app.common import config
 from app.utils.common_utils import get_ttl_hash
 
+def get_workers(conf) -> int:
+    """
+    운영 mode worker process 수 (WORKERS 환경변수 > config, 0 이면 CPU 수)
+    :param conf:
+    :return:
+    """
+    workers = int(os.environ.get("WORKERS", conf.SERVER_WORKERS))
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
 if __name__ == "__main__":
     api_env = os.environ.get("API_ENV", "DEV")
     ttl_hash = get_ttl_hash()
@@ -12,10 +21,26 @@ if __name__ == "__main__":
         api_env=api_env
     )
 
-    uvicorn.run(
-        "app.main:create_app",
-        host="0.0.0.0",
-        port=8088,
-        factory=True,
-        reload=conf.PROJECT_RELOAD
-    )
+    if conf.PROJECT_RELOAD:
+        # 개발 mode - 단일 process, code 변경 시 reload
+        uvicorn.run(
+            "app.main:create_app",
+            host="0.0.0.0",
+            port=8088,
+            factory=True,
+            reload=True
+        )
+    else:
+        # 운영 mode - multi worker
+        # DB engine / Redis pool 은 import 시점이 아니라 각 worker 의 lifespan 에서 생성한다
+        # (fork 이전에 만든 connection 을 worker 간에 공유하지 않도록)
+        uvicorn.run(
+            "app.main:create_app",
+            host="0.0.0.0",
+            port=8088,
+            factory=True,
+            workers=get_workers(conf),
+            loop="auto", # uvloop 이 설치되어 있으면 사용
+            http="auto", # httptools 가 설치되어 있으면 사용
+            timeout_graceful_shutdown=conf.SERVER_GRACEFUL_SHUTDOWN_TIMEOUT
+        )